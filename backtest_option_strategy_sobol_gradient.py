@@ -2,10 +2,12 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
-from dataclasses import asdict, dataclass
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
 import numpy as np
 import pandas as pd
@@ -16,6 +18,8 @@ from weekly_option_backtest_common import summarize_trades
 
 
 PRICING_VOL_FALLBACK = 0.20
+DEFAULT_TRIGGER_CACHE_SIZE = 4096
+FRAME_CACHE_SIZE = 32
 REQUIRED_METRIC_KEYS = [
     "total",
     "wins",
@@ -74,6 +78,139 @@ class BacktestEvaluation:
     resolved_knobs: Dict[str, float]
 
 
+@dataclass(frozen=True)
+class EntryPlan:
+    """Entry/exit row pairs a knob set would trade, plus a hash identifying that trade set.
+
+    Two knob sets with the same signature produce identical trades (apart from the recorded
+    signal values), so their metrics are interchangeable. Passing the plan back to ``evaluate``
+    prices it without preparing the signals again.
+    """
+
+    entries: tuple[tuple[int, int], ...]
+    signature: str
+    # Process-local state for ``evaluate(plan=...)``; not part of the plan's identity.
+    _knobs: Optional["StrategyKnobs"] = field(default=None, repr=False, compare=False)
+    _prepared: Optional["_PreparedSignals"] = field(default=None, repr=False, compare=False)
+    _trigger_set: Optional["_TriggerSet"] = field(default=None, repr=False, compare=False)
+
+
+@dataclass(frozen=True)
+class TradeLedger:
+    """Full-history trades for one knob set, as row indices into the symbol's feature history.
+
+    ``evaluate_ledger`` derives any sub-window's trades and metrics from it without re-pricing.
+    """
+
+    entry_idx: np.ndarray
+    exit_idx: np.ndarray
+    premium: np.ndarray
+    history_rows: int
+    risk_free_rate: float
+    min_pricing_vol_annualized: float
+
+
+@dataclass
+class _SymbolFrame:
+    sdf: pd.DataFrame
+    days_to_friday: np.ndarray
+    week_last_idx: np.ndarray
+    pricing_vol_raw: np.ndarray
+
+
+@dataclass
+class _PreparedSignals:
+    sdf: pd.DataFrame
+    trigger_mask: np.ndarray
+    week_last_idx: np.ndarray
+    days_to_friday: np.ndarray
+    roc: np.ndarray
+    trend_vol: np.ndarray
+    pricing_vol_raw: np.ndarray
+
+    def select_entries(self) -> List[tuple[int, int]]:
+        # At most one entry per week: the first trigger that still has a later session to exit on.
+        entries = []
+        next_entry_idx = 0
+        for i in np.flatnonzero(self.trigger_mask):
+            if i < next_entry_idx:
+                continue
+            exit_idx = int(self.week_last_idx[i])
+            if exit_idx >= len(self.sdf) or exit_idx <= i:
+                continue
+            entries.append((int(i), exit_idx))
+            next_entry_idx = exit_idx + 1
+        return entries
+
+    def entry_premium(self, pricer: BlackScholesPricer, side: str, i: int) -> float:
+        return pricer.price(
+            side=side,
+            spot=float(self.close[i]),
+            strike=float(self.close[i]),
+            time_to_expiry_years=float(int(self.days_to_friday[i])) / 365.25,
+            sigma=float(self.pricing_vol_raw[i]),
+        )
+
+    @property
+    def close(self) -> np.ndarray:
+        return pd.to_numeric(self.sdf["close"], errors="coerce").to_numpy(dtype=float, copy=False)
+
+    def trades_frame(
+        self,
+        *,
+        side: str,
+        pricer: BlackScholesPricer,
+        contract_size: int,
+        entries: List[tuple[int, int]],
+        premiums: List[float],
+    ) -> pd.DataFrame:
+        close = self.close
+        all_dates = self.sdf["date"].to_numpy()
+        trades = []
+        for (i, exit_idx), premium in zip(entries, premiums):
+            d2f = int(self.days_to_friday[i])
+            entry_close = float(close[i])
+            entry_date = pd.Timestamp(all_dates[i])
+            strike = entry_close
+            scheduled_expiry_date = (entry_date + pd.Timedelta(days=d2f)).normalize()
+            used_sigma = pricer.effective_sigma(float(self.pricing_vol_raw[i]))
+
+            exit_close = float(close[exit_idx])
+            intrinsic = pricer.intrinsic_value(side=side, strike=strike, spot=exit_close)
+            expired_itm = intrinsic > 0.0
+            pnl_per_share = premium - intrinsic
+
+            trades.append(
+                {
+                    "side": side,
+                    "entry_date": pd.Timestamp(all_dates[i]),
+                    "exit_date": pd.Timestamp(all_dates[exit_idx]),
+                    "scheduled_expiry_date": scheduled_expiry_date,
+                    "time_to_expiry_days": d2f,
+                    "entry_close": entry_close,
+                    "exit_close": exit_close,
+                    "strike": strike,
+                    "premium": premium,
+                    "intrinsic_at_expiry": intrinsic,
+                    "expired_itm": expired_itm,
+                    "pnl_per_share": pnl_per_share,
+                    "pnl_per_contract": pnl_per_share * contract_size,
+                    "roc_signal": float(self.roc[i]),
+                    "trend_vol_signal": float(self.trend_vol[i]),
+                    "pricing_vol": float(used_sigma),
+                }
+            )
+        return _ensure_trade_columns(pd.DataFrame(trades))
+
+
+@dataclass
+class _TriggerSet:
+    entries: List[tuple[int, int]]
+    signature: str
+    # (risk_free_rate, min_pricing_vol, contract_size) -> (trades_df, metrics)
+    priced: Dict[tuple, tuple[pd.DataFrame, Dict[str, float]]]
+
+
 def _empty_metrics() -> Dict[str, float]:
     return {
         "total": 0.0,
@@ -135,6 +272,25 @@ def _apply_rule(
     return values <= float(threshold)
 
 
+def _clamp_range_knobs(knobs: StrategyKnobs, roc_values: pd.Series, vol_values: pd.Series) -> bool:
+    """Clamp enabled range bounds into the observed feature range, in place.
+
+    Returns False when the clamp changes which rows trigger, i.e. a range lying entirely outside the data.
+    """
+    exact = True
+    if knobs.roc_range_enabled == 1:
+        roc_lo, roc_hi = _safe_feature_bounds(roc_values)
+        exact = exact and knobs.roc_range_low <= roc_hi and knobs.roc_range_high >= roc_lo
+        knobs.roc_range_low = max(roc_lo, min(roc_hi, knobs.roc_range_low))
+        knobs.roc_range_high = max(roc_lo, min(roc_hi, knobs.roc_range_high))
+    if knobs.vol_range_enabled == 1:
+        vol_lo, vol_hi = _safe_feature_bounds(vol_values)
+        exact = exact and knobs.vol_range_low <= vol_hi and knobs.vol_range_high >= vol_lo
+        knobs.vol_range_low = max(vol_lo, min(vol_hi, knobs.vol_range_low))
+        knobs.vol_range_high = max(vol_lo, min(vol_hi, knobs.vol_range_high))
+    return exact
+
+
 def _coerce_knobs(raw: Dict[str, object]) -> StrategyKnobs:
     return StrategyKnobs(
         side=str(raw.get("side", "put")).strip().lower(),
@@ -154,7 +310,14 @@ def _coerce_knobs(raw: Dict[str, object]) -> StrategyKnobs:
 
 
 class PrecomputedFeatureBacktester:
-    def __init__(self, features_df: pd.DataFrame, feature_data_version: str = "unknown") -> None:
+    def __init__(
+        self,
+        features_df: pd.DataFrame,
+        feature_data_version: str = "unknown",
+        trigger_cache_size: int = DEFAULT_TRIGGER_CACHE_SIZE,
+    ) -> None:
+        if int(trigger_cache_size) < 0:
+            raise ValueError("trigger_cache_size must be >= 0")
         if "symbol" not in features_df.columns or "date" not in features_df.columns:
             raise ValueError("Expected precomputed features to include 'symbol' and 'date'.")
         required_price_cols = {"open", "high", "low", "close"}
@@ -172,9 +335,18 @@ class PrecomputedFeatureBacktester:
             ["symbol", "date"]
         )
         self.feature_data_version = str(feature_data_version)
+        # LRU of entry sets (and their priced trades) keyed by the exact trigger bitmap; 0 disables it.
+        self.trigger_cache_size = int(trigger_cache_size)
+        self.trigger_cache_hits = 0
+        self.trigger_cache_misses = 0
+        self._trigger_cache: "OrderedDict[tuple, _TriggerSet]" = OrderedDict()
+        # Sliced frames with their calendar columns, keyed by (symbol, start_date, end_date).
+        self._frames: "OrderedDict[tuple, _SymbolFrame]" = OrderedDict()
 
     @classmethod
-    def from_parquet(cls, path: str) -> "PrecomputedFeatureBacktester":
+    def from_parquet(
+        cls, path: str, trigger_cache_size: int = DEFAULT_TRIGGER_CACHE_SIZE
+    ) -> "PrecomputedFeatureBacktester":
         p = Path(path)
         df = pd.read_parquet(p)
         version = "unknown"
@@ -182,7 +354,7 @@ class PrecomputedFeatureBacktester:
         if meta_path.exists():
             loaded = json.loads(meta_path.read_text())
             version = str(loaded.get("feature_version", "unknown"))
-        return cls(features_df=df, feature_data_version=version)
+        return cls(features_df=df, feature_data_version=version, trigger_cache_size=trigger_cache_size)
 
     def _slice_symbol(self, symbol: str, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
         sdf = self.df[self.df["symbol"] == symbol.upper()].copy()
@@ -192,107 +364,106 @@ class PrecomputedFeatureBacktester:
             sdf = sdf[sdf["date"] <= pd.to_datetime(end_date)]
         return sdf.sort_values("date").reset_index(drop=True)
 
-    def evaluate(
+    def _frame(self, symbol: str, start_date: Optional[str], end_date: Optional[str]) -> _SymbolFrame:
+        key = (symbol.upper(), start_date, end_date)
+        frame = self._frames.get(key)
+        if frame is not None:
+            self._frames.move_to_end(key)
+            return frame
+
+        sdf = self._slice_symbol(symbol=symbol, start_date=start_date, end_date=end_date)
+        pricing_vol_col = _resolve_pricing_vol_column(sdf)
+        if pricing_vol_col is None:
+            sdf["__pricing_vol"] = PRICING_VOL_FALLBACK
+            pricing_vol_col = "__pricing_vol"
+        dates = sdf["date"]
+        weekday = dates.dt.weekday.to_numpy(dtype=int, copy=False)
+        week_key = dates.dt.isocalendar()["year"].astype(int) * 100 + dates.dt.isocalendar()["week"].astype(int)
+        week_last_idx = (
+            pd.Series(sdf.index, index=sdf.index).groupby(week_key).transform("max").to_numpy(dtype=int, copy=False)
+        )
+        frame = _SymbolFrame(
+            sdf=sdf,
+            days_to_friday=4 - weekday,
+            week_last_idx=week_last_idx,
+            pricing_vol_raw=pd.to_numeric(sdf[pricing_vol_col], errors="coerce").to_numpy(dtype=float, copy=False),
+        )
+        self._frames[key] = frame
+        while len(self._frames) > FRAME_CACHE_SIZE:
+            self._frames.popitem(last=False)
+        return frame
+
+    def _trigger_set(
         self,
+        prepared: _PreparedSignals,
+        knobs: StrategyKnobs,
         *,
-        knobs_input: Dict[str, object],
         symbol: str,
-        start_date: Optional[str] = None,
-        end_date: Optional[str] = None,
-        risk_free_rate: float = 0.04,
-        min_pricing_vol_annualized: float = 0.10,
-        contract_size: int = 100,
-    ) -> BacktestEvaluation:
-        knobs = _coerce_knobs(knobs_input)
-        if knobs.side not in {"put", "call"}:
-            return BacktestEvaluation(
-                feasible=False,
-                infeasible_reason=f"Invalid side '{knobs.side}' (expected 'put' or 'call').",
-                metrics=_empty_metrics(),
-                trades_df=_ensure_trade_columns(pd.DataFrame()),
-                resolved_knobs=asdict(knobs),
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> _TriggerSet:
+        key = None
+        if self.trigger_cache_size > 0:
+            bitmap = np.packbits(prepared.trigger_mask)
+            key = (
+                symbol.upper(),
+                start_date,
+                end_date,
+                knobs.side,
+                len(prepared.trigger_mask),
+                hashlib.sha1(bitmap.tobytes()).hexdigest(),
             )
+            cached = self._trigger_cache.get(key)
+            if cached is not None:
+                self._trigger_cache.move_to_end(key)
+                self.trigger_cache_hits += 1
+                return cached
+            self.trigger_cache_misses += 1
+
+        entries = prepared.select_entries()
+        digest = hashlib.sha1(f"{symbol.upper()}|{start_date}|{end_date}|{knobs.side}|".encode("utf-8"))
+        digest.update(np.asarray(entries, dtype=np.int64).tobytes())
+        trigger_set = _TriggerSet(entries=entries, signature=digest.hexdigest(), priced={})
+        if key is not None:
+            self._trigger_cache[key] = trigger_set
+            while len(self._trigger_cache) > self.trigger_cache_size:
+                self._trigger_cache.popitem(last=False)
+        return trigger_set
+
+    def _prepare_signals(
+        self,
+        knobs: StrategyKnobs,
+        *,
+        symbol: str,
+        start_date: Optional[str],
+        end_date: Optional[str],
+    ) -> tuple[Optional[str], Optional[_PreparedSignals]]:
+        if knobs.side not in {"put", "call"}:
+            return f"Invalid side '{knobs.side}' (expected 'put' or 'call').", None
         if knobs.roc_comparator not in {"above", "below"}:
-            return BacktestEvaluation(
-                feasible=False,
-                infeasible_reason=f"Invalid roc comparator '{knobs.roc_comparator}'.",
-                metrics=_empty_metrics(),
-                trades_df=_ensure_trade_columns(pd.DataFrame()),
-                resolved_knobs=asdict(knobs),
-            )
+            return f"Invalid roc comparator '{knobs.roc_comparator}'.", None
         if knobs.vol_comparator not in {"above", "below"}:
-            return BacktestEvaluation(
-                feasible=False,
-                infeasible_reason=f"Invalid vol comparator '{knobs.vol_comparator}'.",
-                metrics=_empty_metrics(),
-                trades_df=_ensure_trade_columns(pd.DataFrame()),
-                resolved_knobs=asdict(knobs),
-            )
+            return f"Invalid vol comparator '{knobs.vol_comparator}'.", None
         if knobs.roc_range_enabled == 1 and knobs.roc_range_low > knobs.roc_range_high:
-            return BacktestEvaluation(
-                feasible=False,
-                infeasible_reason="Invalid ROC range: roc_range_low > roc_range_high.",
-                metrics=_empty_metrics(),
-                trades_df=_ensure_trade_columns(pd.DataFrame()),
-                resolved_knobs=asdict(knobs),
-            )
+            return "Invalid ROC range: roc_range_low > roc_range_high.", None
         if knobs.vol_range_enabled == 1 and knobs.vol_range_low > knobs.vol_range_high:
-            return BacktestEvaluation(
-                feasible=False,
-                infeasible_reason="Invalid vol range: vol_range_low > vol_range_high.",
-                metrics=_empty_metrics(),
-                trades_df=_ensure_trade_columns(pd.DataFrame()),
-                resolved_knobs=asdict(knobs),
-            )
+            return "Invalid vol range: vol_range_low > vol_range_high.", None
 
-        sdf = self._slice_symbol(symbol=symbol, start_date=start_date, end_date=end_date)
+        frame = self._frame(symbol, start_date, end_date)
+        sdf = frame.sdf
         if sdf.empty:
-            return BacktestEvaluation(
-                feasible=False,
-                infeasible_reason=f"No rows for symbol={symbol.upper()} in requested date range.",
-                metrics=_empty_metrics(),
-                trades_df=_ensure_trade_columns(pd.DataFrame()),
-                resolved_knobs=asdict(knobs),
-            )
+            return f"No rows for symbol={symbol.upper()} in requested date range.", None
 
         roc_col, vol_col = _build_signal_column_names(knobs)
         missing_cols = [c for c in (roc_col, vol_col) if c not in sdf.columns]
         if missing_cols:
-            return BacktestEvaluation(
-                feasible=False,
-                infeasible_reason=f"Missing precomputed signal columns: {missing_cols}",
-                metrics=_empty_metrics(),
-                trades_df=_ensure_trade_columns(pd.DataFrame()),
-                resolved_knobs=asdict(knobs),
-            )
-
-        pricing_vol_col = _resolve_pricing_vol_column(sdf)
-        if pricing_vol_col is None:
-            sdf["__pricing_vol"] = PRICING_VOL_FALLBACK
-            pricing_vol_col = "__pricing_vol"
-
-        roc_lo, roc_hi = _safe_feature_bounds(sdf[roc_col])
-        vol_lo, vol_hi = _safe_feature_bounds(sdf[vol_col])
-        if knobs.roc_range_enabled == 1:
-            knobs.roc_range_low = max(roc_lo, min(roc_hi, knobs.roc_range_low))
-            knobs.roc_range_high = max(roc_lo, min(roc_hi, knobs.roc_range_high))
-        if knobs.vol_range_enabled == 1:
-            knobs.vol_range_low = max(vol_lo, min(vol_hi, knobs.vol_range_low))
-            knobs.vol_range_high = max(vol_lo, min(vol_hi, knobs.vol_range_high))
-
-        pricer = BlackScholesPricer(risk_free_rate=risk_free_rate, min_sigma=min_pricing_vol_annualized)
-
-        dates = sdf["date"]
-        weekday = dates.dt.weekday.to_numpy(dtype=int, copy=False)
-        days_to_friday = 4 - weekday
-        week_key = dates.dt.isocalendar()["year"].astype(int) * 100 + dates.dt.isocalendar()["week"].astype(int)
-        week_last_idx = (
-            pd.Series(sdf.index, index=sdf.index).groupby(week_key).transform("max").to_numpy(dtype=int, copy=False)
-        )
+            return f"Missing precomputed signal columns: {missing_cols}", None
 
+        _clamp_range_knobs(knobs, sdf[roc_col], sdf[vol_col])
+        days_to_friday = frame.days_to_friday
+        pricing_vol_raw = frame.pricing_vol_raw
         roc = pd.to_numeric(sdf[roc_col], errors="coerce").to_numpy(dtype=float, copy=False)
         trend_vol = pd.to_numeric(sdf[vol_col], errors="coerce").to_numpy(dtype=float, copy=False)
-        pricing_vol_raw = pd.to_numeric(sdf[pricing_vol_col], errors="coerce").to_numpy(dtype=float, copy=False)
 
         base_mask = (~np.isnan(roc)) & (~np.isnan(trend_vol)) & (~np.isnan(pricing_vol_raw)) & (days_to_friday > 0)
         roc_trigger = _apply_rule(
@@ -311,66 +482,218 @@ class PrecomputedFeatureBacktester:
             range_low=knobs.vol_range_low,
             range_high=knobs.vol_range_high,
         )
-        trigger_mask = base_mask & roc_trigger & vol_trigger
+        return None, _PreparedSignals(
+            sdf=sdf,
+            trigger_mask=base_mask & roc_trigger & vol_trigger,
+            week_last_idx=frame.week_last_idx,
+            days_to_friday=days_to_friday,
+            roc=roc,
+            trend_vol=trend_vol,
+            pricing_vol_raw=pricing_vol_raw,
+        )
 
-        close = pd.to_numeric(sdf["close"], errors="coerce").to_numpy(dtype=float, copy=False)
-        all_dates = dates.to_numpy()
-        next_entry_idx = 0
-        trades = []
-        for i in np.flatnonzero(trigger_mask):
-            if i < next_entry_idx:
-                continue
-            exit_idx = int(week_last_idx[i])
-            if exit_idx >= len(sdf) or exit_idx <= i:
-                continue
-            d2f = int(days_to_friday[i])
-            entry_close = float(close[i])
-            entry_date = pd.Timestamp(all_dates[i])
-            strike = entry_close
-            time_to_expiry_days = d2f
-            time_to_expiry_years = float(time_to_expiry_days) / 365.25
-            scheduled_expiry_date = (entry_date + pd.Timedelta(days=d2f)).normalize()
+    def entry_plan(
+        self,
+        *,
+        knobs_input: Dict[str, object],
+        symbol: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Optional[EntryPlan]:
+        """Return the entries ``evaluate`` would trade without pricing them, or None if infeasible."""
+        knobs = _coerce_knobs(knobs_input)
+        _, prepared = self._prepare_signals(knobs, symbol=symbol, start_date=start_date, end_date=end_date)
+        if prepared is None:
+            return None
+        trigger_set = self._trigger_set(prepared, knobs, symbol=symbol, start_date=start_date, end_date=end_date)
+        return EntryPlan(
+            entries=tuple(trigger_set.entries),
+            signature=trigger_set.signature,
+            _knobs=knobs,
+            _prepared=prepared,
+            _trigger_set=trigger_set,
+        )
 
-            raw_sigma = float(pricing_vol_raw[i])
-            used_sigma = pricer.effective_sigma(raw_sigma)
-            premium = pricer.price(
-                side=knobs.side,
-                spot=entry_close,
-                strike=strike,
-                time_to_expiry_years=time_to_expiry_years,
-                sigma=raw_sigma,
-            )
+    def count_trades(
+        self,
+        *,
+        knobs_input: Dict[str, object],
+        symbol: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Optional[int]:
+        """Return the trade count ``evaluate`` would produce without pricing, or None if infeasible."""
+        plan = self.entry_plan(knobs_input=knobs_input, symbol=symbol, start_date=start_date, end_date=end_date)
+        return None if plan is None else len(plan.entries)
 
-            exit_close = float(close[exit_idx])
-            intrinsic = pricer.intrinsic_value(side=knobs.side, strike=strike, spot=exit_close)
-            expired_itm = intrinsic > 0.0
-            pnl_per_share = premium - intrinsic
+    def history_rows(self, symbol: str) -> int:
+        """Row count of the symbol's full feature history; ledgers built on another count are stale."""
+        return len(self._frame(symbol, None, None).sdf)
 
-            trades.append(
-                {
-                    "side": knobs.side,
-                    "entry_date": pd.Timestamp(all_dates[i]),
-                    "exit_date": pd.Timestamp(all_dates[exit_idx]),
-                    "scheduled_expiry_date": scheduled_expiry_date,
-                    "time_to_expiry_days": time_to_expiry_days,
-                    "entry_close": entry_close,
-                    "exit_close": exit_close,
-                    "strike": strike,
-                    "premium": premium,
-                    "intrinsic_at_expiry": intrinsic,
-                    "expired_itm": expired_itm,
-                    "pnl_per_share": pnl_per_share,
-                    "pnl_per_contract": pnl_per_share * contract_size,
-                    "roc_signal": float(roc[i]),
-                    "trend_vol_signal": float(trend_vol[i]),
-                    "pricing_vol": float(used_sigma),
-                }
+    def trade_ledger(
+        self,
+        *,
+        knobs_input: Dict[str, object],
+        symbol: str,
+        risk_free_rate: float = 0.04,
+        min_pricing_vol_annualized: float = 0.10,
+    ) -> Optional[TradeLedger]:
+        """Price the knob set once over the symbol's full history, or return None if infeasible."""
+        knobs = _coerce_knobs(knobs_input)
+        _, prepared = self._prepare_signals(knobs, symbol=symbol, start_date=None, end_date=None)
+        if prepared is None:
+            return None
+        pricer = BlackScholesPricer(risk_free_rate=risk_free_rate, min_sigma=min_pricing_vol_annualized)
+        entries = prepared.select_entries()
+        return TradeLedger(
+            entry_idx=np.asarray([i for i, _ in entries], dtype=np.int32),
+            exit_idx=np.asarray([exit_idx for _, exit_idx in entries], dtype=np.int32),
+            premium=np.asarray([prepared.entry_premium(pricer, knobs.side, i) for i, _ in entries], dtype=float),
+            history_rows=len(prepared.sdf),
+            risk_free_rate=float(risk_free_rate),
+            min_pricing_vol_annualized=float(min_pricing_vol_annualized),
+        )
+
+    def evaluate_ledger(
+        self,
+        ledger: TradeLedger,
+        *,
+        knobs_input: Dict[str, object],
+        symbol: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        contract_size: int = 100,
+    ) -> Optional[BacktestEvaluation]:
+        """Slice a full-history ledger to ``[start_date, end_date]``; same result as ``evaluate``.
+
+        Returns None when the ledger cannot stand in for the window (stale history, or a range knob
+        whose per-window clamp changes the trigger set); callers then fall back to ``evaluate``.
+        """
+        knobs = _coerce_knobs(knobs_input)
+        _, full = self._prepare_signals(_coerce_knobs(knobs_input), symbol=symbol, start_date=None, end_date=None)
+        if full is None or len(full.sdf) != ledger.history_rows:
+            return None
+
+        dates = full.sdf["date"].to_numpy()
+        start = int(np.searchsorted(dates, np.datetime64(pd.to_datetime(start_date)), "left")) if start_date else 0
+        end = len(dates) - 1
+        if end_date:
+            end = int(np.searchsorted(dates, np.datetime64(pd.to_datetime(end_date)), "right")) - 1
+        if start > end:
+            return BacktestEvaluation(
+                feasible=False,
+                infeasible_reason=f"No rows for symbol={symbol.upper()} in requested date range.",
+                metrics=_empty_metrics(),
+                trades_df=_ensure_trade_columns(pd.DataFrame()),
+                resolved_knobs=asdict(knobs),
+            )
+        roc_col, vol_col = _build_signal_column_names(knobs)
+        window = full.sdf.iloc[start : end + 1]
+        if not _clamp_range_knobs(knobs, window[roc_col], window[vol_col]):
+            return None
+
+        # The window end can only truncate a week, which moves its exit to the last in-window session.
+        exits = np.minimum(ledger.exit_idx, end)
+        keep = (ledger.entry_idx >= start) & (ledger.entry_idx <= end) & (exits > ledger.entry_idx)
+        entries = [(int(i), int(exit_idx)) for i, exit_idx in zip(ledger.entry_idx[keep], exits[keep])]
+        premiums = [float(p) for p in ledger.premium[keep]]
+
+        pricer = BlackScholesPricer(
+            risk_free_rate=ledger.risk_free_rate,
+            min_sigma=ledger.min_pricing_vol_annualized,
+        )
+        # The window start can cut a week whose full-history entry precedes it; the window then trades
+        # that week's first trigger at or after the start, which the ledger never priced.
+        cut_week = (ledger.entry_idx < start) & (ledger.exit_idx >= start)
+        if cut_week.any():
+            week_exit = min(int(full.week_last_idx[start]), end)
+            for i in range(start, week_exit):
+                if full.trigger_mask[i]:
+                    entries.insert(0, (i, week_exit))
+                    premiums.insert(0, full.entry_premium(pricer, knobs.side, i))
+                    break
+
+        trades_df = full.trades_frame(
+            side=knobs.side,
+            pricer=pricer,
+            contract_size=contract_size,
+            entries=entries,
+            premiums=premiums,
+        )
+        metrics = summarize_trades(trades_df)
+        metrics = _empty_metrics() if metrics is None else {k: float(metrics.get(k, 0.0)) for k in REQUIRED_METRIC_KEYS}
+        return BacktestEvaluation(
+            feasible=True,
+            infeasible_reason=None,
+            metrics=metrics,
+            trades_df=trades_df,
+            resolved_knobs=asdict(knobs),
+        )
+
+    def evaluate(
+        self,
+        *,
+        knobs_input: Dict[str, object],
+        symbol: str,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        risk_free_rate: float = 0.04,
+        min_pricing_vol_annualized: float = 0.10,
+        contract_size: int = 100,
+        plan: Optional[EntryPlan] = None,
+    ) -> BacktestEvaluation:
+        """Backtest the knob set; ``plan`` from ``entry_plan`` on the same inputs skips the trigger pass."""
+        if plan is not None and plan._prepared is not None:
+            knobs, prepared, trigger_set = plan._knobs, plan._prepared, plan._trigger_set
+        else:
+            knobs = _coerce_knobs(knobs_input)
+            infeasible_reason, prepared = self._prepare_signals(
+                knobs,
+                symbol=symbol,
+                start_date=start_date,
+                end_date=end_date,
+            )
+            if prepared is None:
+                return BacktestEvaluation(
+                    feasible=False,
+                    infeasible_reason=infeasible_reason,
+                    metrics=_empty_metrics(),
+                    trades_df=_ensure_trade_columns(pd.DataFrame()),
+                    resolved_knobs=asdict(knobs),
+                )
+            trigger_set = self._trigger_set(prepared, knobs, symbol=symbol, start_date=start_date, end_date=end_date)
+
+        pricing_key = (float(risk_free_rate), float(min_pricing_vol_annualized), int(contract_size))
+        priced = trigger_set.priced.get(pricing_key)
+        if priced is not None:
+            # Same trades and metrics; only the recorded signal values depend on the knob windows.
+            cached_trades, cached_metrics = priced
+            entry_idx = np.asarray([i for i, _ in trigger_set.entries], dtype=int)
+            trades_df = cached_trades.copy()
+            trades_df["roc_signal"] = prepared.roc[entry_idx]
+            trades_df["trend_vol_signal"] = prepared.trend_vol[entry_idx]
+            return BacktestEvaluation(
+                feasible=True,
+                infeasible_reason=None,
+                metrics=dict(cached_metrics),
+                trades_df=trades_df,
+                resolved_knobs=asdict(knobs),
             )
-            next_entry_idx = exit_idx + 1
 
-        trades_df = _ensure_trade_columns(pd.DataFrame(trades))
+        pricer = BlackScholesPricer(risk_free_rate=risk_free_rate, min_sigma=min_pricing_vol_annualized)
+
+        premiums = [prepared.entry_premium(pricer, knobs.side, i) for i, _ in trigger_set.entries]
+        trades_df = prepared.trades_frame(
+            side=knobs.side,
+            pricer=pricer,
+            contract_size=contract_size,
+            entries=trigger_set.entries,
+            premiums=premiums,
+        )
         metrics = summarize_trades(trades_df)
         metrics = _empty_metrics() if metrics is None else {k: float(metrics.get(k, 0.0)) for k in REQUIRED_METRIC_KEYS}
+        if self.trigger_cache_size > 0:
+            trigger_set.priced[pricing_key] = (trades_df.copy(), dict(metrics))
         return BacktestEvaluation(
             feasible=True,
             infeasible_reason=None,
@@ -1,5 +1,5 @@
 from .constrained_bo import ConstrainedBayesianOptimizer, ParamSpec, TrialResult, extract_region_summary, write_region_summary
-from .goal_registry import build_goals, evaluate_goals
+from .goal_registry import GoalEngine, build_goals, evaluate_goals, evaluate_goals_batch
 from .goals import Goal
 
 __all__ = [
@@ -8,7 +8,9 @@ __all__ = [
     "TrialResult",
     "extract_region_summary",
     "write_region_summary",
+    "GoalEngine",
     "build_goals",
     "evaluate_goals",
+    "evaluate_goals_batch",
     "Goal",
 ]
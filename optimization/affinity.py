@@ -0,0 +1,174 @@
+from __future__ import annotations
+
+import bisect
+import hashlib
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Deque, Hashable, List, Optional, Tuple
+
+_Task = Tuple[Future, Callable[..., Any], Tuple[Any, ...], dict]
+
+
+def _stable_hash(text: str) -> int:
+    return int.from_bytes(hashlib.blake2b(text.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """Consistent hashing of routing keys onto ``slots``, with ``replicas`` virtual nodes per slot."""
+
+    def __init__(self, slots: int, *, replicas: int = 64) -> None:
+        if int(slots) <= 0:
+            raise ValueError("slots must be > 0")
+        points = sorted(
+            (_stable_hash(f"{slot}:{replica}"), slot) for slot in range(int(slots)) for replica in range(int(replicas))
+        )
+        self._hashes = [point for point, _ in points]
+        self._slots = [slot for _, slot in points]
+
+    def slot(self, key: Hashable) -> int:
+        index = bisect.bisect(self._hashes, _stable_hash(repr(key))) % len(self._hashes)
+        return self._slots[index]
+
+
+class AffinityExecutor(Executor):
+    """Process pool that runs tasks with the same routing key on the same worker process.
+
+    Every worker is a single-process pool fed from its own queue of per-key buckets, drained one
+    bucket at a time so consecutive tasks share a key and the worker's caches stay warm. Keys map
+    to workers by consistent hashing. A worker whose queue runs dry steals the newest bucket from
+    the longest queue (or half of it, if that is all the victim has). Tasks without a key go to
+    the least-loaded worker.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        *,
+        mp_context: Any = None,
+        initializer: Optional[Callable[..., None]] = None,
+        initargs: Tuple[Any, ...] = (),
+        depth: int = 2,
+    ) -> None:
+        if int(workers) <= 0:
+            raise ValueError("workers must be > 0")
+        if int(depth) <= 0:
+            raise ValueError("depth must be > 0")
+        self.workers = int(workers)
+        self.depth = int(depth)
+        self._pools = [
+            ProcessPoolExecutor(max_workers=1, mp_context=mp_context, initializer=initializer, initargs=initargs)
+            for _ in range(self.workers)
+        ]
+        # Fork every worker up front, from this thread, rather than lazily from a pool's manager thread.
+        for started in [pool.submit(os.getpid) for pool in self._pools]:
+            started.result()
+        self._ring = HashRing(self.workers)
+        self._queues: List["OrderedDict[Hashable, Deque[_Task]]"] = [OrderedDict() for _ in range(self.workers)]
+        self._queued = [0] * self.workers
+        self._in_flight = [0] * self.workers
+        self._cond = threading.Condition()
+        self._closed = False
+        self.dispatched = [0] * self.workers
+        self.stolen = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        return self.submit_routed(None, fn, *args, **kwargs)
+
+    def submit_routed(self, key: Optional[Hashable], fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            if key is None:
+                slot = min(range(self.workers), key=lambda s: (self._queued[s] + self._in_flight[s], s))
+            else:
+                slot = self._ring.slot(key)
+            self._queues[slot].setdefault(key, deque()).append((future, fn, args, kwargs))
+            self._queued[slot] += 1
+            ready = self._take_ready()
+        self._dispatch(ready)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._cond:
+            self._closed = True
+            if cancel_futures:
+                for slot, queue in enumerate(self._queues):
+                    for bucket in queue.values():
+                        for future, *_ in bucket:
+                            future.cancel()
+                    queue.clear()
+                    self._queued[slot] = 0
+            if wait:
+                self._cond.wait_for(lambda: not any(self._queued) and not any(self._in_flight))
+        for pool in self._pools:
+            pool.shutdown(wait=wait, cancel_futures=cancel_futures)
+
+    def _next_task(self, slot: int, *, steal: bool) -> Optional[_Task]:
+        queue = self._queues[slot]
+        if not queue and steal and self._in_flight[slot] == 0:
+            self._steal(slot)
+        if not queue:
+            return None
+        key, bucket = next(iter(queue.items()))
+        task = bucket.popleft()
+        if not bucket:
+            del queue[key]
+        self._queued[slot] -= 1
+        return task
+
+    def _steal(self, thief: int) -> None:
+        victim = max(range(self.workers), key=lambda s: self._queued[s])
+        if victim == thief or self._queued[victim] == 0:
+            return
+        queue = self._queues[victim]
+        key, bucket = queue.popitem(last=True)
+        if not queue and len(bucket) > 1:
+            keep = deque(bucket.popleft() for _ in range(len(bucket) // 2))
+            queue[key] = keep
+        self._queues[thief][key] = bucket
+        self._queued[victim] -= len(bucket)
+        self._queued[thief] += len(bucket)
+        self.stolen += len(bucket)
+
+    def _take_ready(self) -> List[Tuple[int, _Task]]:
+        ready: List[Tuple[int, _Task]] = []
+        # Owners fill their own pipelines before an idle worker may steal what is left.
+        for steal in (False, True):
+            for slot in range(self.workers):
+                while self._in_flight[slot] < self.depth:
+                    task = self._next_task(slot, steal=steal)
+                    if task is None:
+                        break
+                    self._in_flight[slot] += 1
+                    ready.append((slot, task))
+        return ready
+
+    def _dispatch(self, ready: List[Tuple[int, _Task]]) -> None:
+        while ready:
+            slot, (future, fn, args, kwargs) = ready.pop()
+            if future.set_running_or_notify_cancel():
+                inner = self._pools[slot].submit(fn, *args, **kwargs)
+                inner.add_done_callback(partial(self._finished, slot, future))
+                continue
+            with self._cond:
+                self._in_flight[slot] -= 1
+                ready.extend(self._take_ready())
+                self._cond.notify_all()
+
+    def _finished(self, slot: int, future: Future, inner: Future) -> None:
+        with self._cond:
+            self._in_flight[slot] -= 1
+            self.dispatched[slot] += 1
+            ready = self._take_ready()
+            self._cond.notify_all()
+        self._dispatch(ready)
+        if inner.cancelled():
+            future.set_exception(RuntimeError("worker task was cancelled"))
+        elif inner.exception() is not None:
+            future.set_exception(inner.exception())
+        else:
+            future.set_result(inner.result())
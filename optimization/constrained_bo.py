@@ -1,19 +1,53 @@
 from __future__ import annotations
 
 import json
+import multiprocessing as mp
+import signal
+import threading
 import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import contextmanager
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Callable, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union, overload
 
 import numpy as np
 import pandas as pd
+from scipy.sparse.csgraph import connected_components
 from sklearn.gaussian_process import GaussianProcessRegressor
 from sklearn.gaussian_process.kernels import ConstantKernel, Matern, WhiteKernel
-from sklearn.neighbors import NearestNeighbors
+from sklearn.neighbors import kneighbors_graph
 
-from .goal_registry import GoalEvaluation, evaluate_goals
+from .goal_registry import GoalBatch, GoalEngine, GoalEvaluation, evaluate_goals_batch
 from .goals import Goal
+from .incremental_gp import IncrementalGP
+from .part_store import ParquetPartStore
+from .telemetry import RunTelemetry, summary_line
+
+# Set before the evaluation pool forks, so workers inherit the evaluator (and the data it closes over) by fork.
+_WORKER_EVALUATOR: Optional[Callable[[Dict[str, float]], Dict[str, float]]] = None
+
+
+def _evaluate_in_worker(params: Dict[str, float]) -> Dict[str, float]:
+    return _WORKER_EVALUATOR(params)
+
+
+@contextmanager
+def _sigterm_as_exit() -> Iterator[None]:
+    """Raise SystemExit on SIGTERM inside the block, so ``finally`` clauses still get to flush."""
+    if threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def _terminate(signum: int, frame: object) -> None:
+        raise SystemExit(128 + signum)
+
+    previous = signal.signal(signal.SIGTERM, _terminate)
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGTERM, previous)
 
 
 @dataclass
@@ -32,6 +66,204 @@ class TrialResult:
     penalized_score: float
 
 
+TRIAL_METRICS = (
+    "total",
+    "wins",
+    "win_rate",
+    "itm_expiries",
+    "itm_rate",
+    "total_pnl",
+    "avg_pnl",
+    "median_pnl",
+    "avg_return_on_spot",
+    "max_drawdown",
+)
+
+
+def _float_column(df: pd.DataFrame, column: str, *, fill_nan: Optional[float] = None) -> np.ndarray:
+    if column not in df.columns:
+        return np.zeros(len(df), dtype=float)
+    values = pd.to_numeric(df[column], errors="coerce").to_numpy(dtype=float)
+    if fill_nan is not None:
+        values = np.where(np.isnan(values), fill_nan, values)
+    return values
+
+
+def eval_cache_from_frame(df: pd.DataFrame) -> Dict[str, Dict[str, float]]:
+    """Eval-cache entries from a ``cache_key`` + ``metric__*`` frame, read column by column."""
+    if "cache_key" not in df.columns or df.empty:
+        return {}
+    keys = df["cache_key"].astype(str).tolist()
+    rows = np.column_stack([_float_column(df, f"metric__{name}") for name in TRIAL_METRICS]).tolist()
+    return {key: dict(zip(TRIAL_METRICS, row)) for key, row in zip(keys, rows) if key}
+
+
+class TrialTable(Sequence[TrialResult]):
+    """Trials read column-wise from a trials parquet; :class:`TrialResult` objects are built on first access.
+
+    Loaded rows stay as arrays (``trial_ids``, ``params``, ``metrics``, ``goals``, ``penalized``), so
+    resuming a large run only pays per row for the rows something indexes. :meth:`append` adds live
+    trials after the loaded ones.
+    """
+
+    def __init__(
+        self,
+        *,
+        trial_ids: np.ndarray,
+        param_names: List[str],
+        params: np.ndarray,
+        metrics: Dict[str, np.ndarray],
+        goals: GoalBatch,
+        penalized: np.ndarray,
+    ) -> None:
+        self.trial_ids = trial_ids
+        self.param_names = list(param_names)
+        self.params = params
+        self.metrics = metrics
+        self.goals = goals
+        self.penalized = penalized
+        self._built: List[Optional[TrialResult]] = [None] * len(trial_ids)
+        self._appended: List[TrialResult] = []
+
+    @classmethod
+    def empty(cls, param_names: List[str]) -> "TrialTable":
+        return cls(
+            trial_ids=np.zeros(0, dtype=int),
+            param_names=param_names,
+            params=np.zeros((0, len(param_names)), dtype=float),
+            metrics={},
+            goals=GoalBatch(values={}, violations={}, feasible=np.zeros(0, dtype=bool), objective_score=np.zeros(0)),
+            penalized=np.zeros(0, dtype=float),
+        )
+
+    @classmethod
+    def from_frame(
+        cls, df: pd.DataFrame, *, param_names: List[str], goals: List[Goal], stored_goals: bool = False
+    ) -> "TrialTable":
+        """Columns of a trials frame; goals are re-evaluated from the metrics unless ``stored_goals``.
+
+        With ``stored_goals`` the goal__/viol__/feasible/objective_score columns are taken as written
+        and NaN outside the params reads as 0, as the Sobol optimizer stores them.
+        """
+        fill = 0.0 if stored_goals else None
+        if "trial_id" in df.columns:
+            trial_ids = df["trial_id"].to_numpy(dtype=np.int64)
+        else:
+            trial_ids = np.arange(len(df), dtype=np.int64)
+        params = np.zeros((len(df), len(param_names)), dtype=float)
+        for column, name in enumerate(param_names):
+            params[:, column] = _float_column(df, f"param__{name}")
+        metrics = {name: _float_column(df, f"metric__{name}", fill_nan=fill) for name in TRIAL_METRICS}
+        if stored_goals:
+            goal_batch = GoalBatch(
+                values={goal.name: _float_column(df, f"goal__{goal.name}", fill_nan=0.0) for goal in goals},
+                violations={goal.name: _float_column(df, f"viol__{goal.name}", fill_nan=0.0) for goal in goals},
+                feasible=_float_column(df, "feasible", fill_nan=0.0).astype(int).astype(bool),
+                objective_score=_float_column(df, "objective_score", fill_nan=0.0),
+            )
+        else:
+            goal_batch = evaluate_goals_batch(goals, metrics)
+        return cls(
+            trial_ids=trial_ids,
+            param_names=param_names,
+            params=params,
+            metrics=metrics,
+            goals=goal_batch,
+            penalized=_float_column(df, "penalized_score", fill_nan=fill),
+        )
+
+    @property
+    def loaded_count(self) -> int:
+        return len(self._built)
+
+    @property
+    def built_count(self) -> int:
+        return sum(trial is not None for trial in self._built)
+
+    def __len__(self) -> int:
+        return len(self._built) + len(self._appended)
+
+    @overload
+    def __getitem__(self, index: int) -> TrialResult: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[TrialResult]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[TrialResult, List[TrialResult]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("trial index out of range")
+        if index >= len(self._built):
+            return self._appended[index - len(self._built)]
+        trial = self._built[index]
+        if trial is None:
+            trial = TrialResult(
+                trial_id=int(self.trial_ids[index]),
+                params=dict(zip(self.param_names, self.params[index].tolist())),
+                metrics={name: float(values[index]) for name, values in self.metrics.items()},
+                goals=self.goals.row(index),
+                penalized_score=float(self.penalized[index]),
+            )
+            self._built[index] = trial
+        return trial
+
+    def __iter__(self) -> Iterator[TrialResult]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def append(self, trial: TrialResult) -> None:
+        self._appended.append(trial)
+
+    def drop(self, trial_ids: Iterable[int]) -> None:
+        """Remove the trials with these ids, loaded or appended."""
+        ids = np.fromiter((int(trial_id) for trial_id in trial_ids), dtype=np.int64)
+        keep = np.flatnonzero(~np.isin(self.trial_ids, ids))
+        self.trial_ids = self.trial_ids[keep]
+        self.params = self.params[keep]
+        self.metrics = {name: values[keep] for name, values in self.metrics.items()}
+        self.goals = self.goals.take(keep)
+        self.penalized = self.penalized[keep]
+        self._built = [self._built[i] for i in keep.tolist()]
+        dropped = set(ids.tolist())
+        self._appended = [trial for trial in self._appended if trial.trial_id not in dropped]
+
+    def trial_id_array(self) -> np.ndarray:
+        if not self._appended:
+            return self.trial_ids
+        return np.concatenate([self.trial_ids, [t.trial_id for t in self._appended]]).astype(np.int64)
+
+    def metric_values(self, name: str) -> np.ndarray:
+        loaded = self.metrics.get(name, np.zeros(len(self.trial_ids), dtype=float))
+        if not self._appended:
+            return loaded
+        return np.concatenate([loaded, [float(t.metrics.get(name, 0.0)) for t in self._appended]])
+
+    def param_matrix(self) -> np.ndarray:
+        if not self._appended:
+            return self.params
+        extra = np.asarray([[float(t.params[name]) for name in self.param_names] for t in self._appended])
+        return np.vstack([self.params, extra])
+
+    def penalized_scores(self) -> np.ndarray:
+        if not self._appended:
+            return self.penalized
+        return np.concatenate([self.penalized, [t.penalized_score for t in self._appended]])
+
+    def feasible_flags(self) -> np.ndarray:
+        if not self._appended:
+            return self.goals.feasible
+        return np.concatenate([self.goals.feasible, [bool(t.goals.feasible) for t in self._appended]])
+
+    def objective_scores(self) -> np.ndarray:
+        if not self._appended:
+            return self.goals.objective_score
+        return np.concatenate([self.goals.objective_score, [t.goals.objective_score for t in self._appended]])
+
+
 class ConstrainedBayesianOptimizer:
     def __init__(
         self,
@@ -48,9 +280,25 @@ class ConstrainedBayesianOptimizer:
         force_rebuild: bool = False,
         param_name_aliases: Optional[Dict[str, str]] = None,
         logger: Optional[Callable[[str], None]] = None,
+        telemetry_path: Optional[str] = None,
+        telemetry_interval_seconds: float = 5.0,
+        gp_mode: str = "full",
+        gp_max_active: int = 256,
+        gp_refit_every: int = 10,
+        workers: int = 1,
+        batch_size: int = 0,
+        checkpoint_seconds: float = 5.0,
+        checkpoint_trials: int = 0,
     ) -> None:
+        if gp_mode not in ("full", "incremental"):
+            raise ValueError(f"unknown gp_mode: {gp_mode!r}")
+        if int(gp_refit_every) <= 0:
+            raise ValueError("gp_refit_every must be > 0")
+        if int(workers) <= 0:
+            raise ValueError("workers must be > 0")
         self.search_space = search_space
         self.goals = goals
+        self._goal_engine = GoalEngine(goals)
         self.evaluator = evaluator
         self.trials_parquet = Path(trials_parquet)
         self.eval_cache_parquet = Path(eval_cache_parquet) if eval_cache_parquet else None
@@ -62,12 +310,32 @@ class ConstrainedBayesianOptimizer:
         self.force_rebuild = bool(force_rebuild)
         self.param_name_aliases = dict(param_name_aliases or {})
         self.logger = logger or (lambda message: print(message, flush=True))
+        self.telemetry = RunTelemetry(
+            telemetry_path,
+            run=self.trials_parquet.stem,
+            interval_seconds=telemetry_interval_seconds,
+        )
+
+        self.checkpoint_seconds = float(checkpoint_seconds)
+        self.checkpoint_trials = int(checkpoint_trials)
+        self.workers = int(workers)
+        self.batch_size = int(batch_size) if int(batch_size) > 0 else self.workers
+        self.gp_mode = gp_mode
+        self.gp_refit_every = int(gp_refit_every)
+        self._gp = IncrementalGP(max_active=gp_max_active, n_restarts_optimizer=2, random_state=self.seed)
+        self._gp_observed = 0
+        self._gp_refit_at = 0
 
         self.rng = np.random.default_rng(self.seed)
         self.param_names = list(search_space)
+        # Rows not yet appended to the trials store; _persisted_rows counts the ones that were.
         self._trial_rows: List[Dict[str, object]] = []
         self._eval_cache: Dict[str, Dict[str, float]] = {}
-        self._cache_dirty = False
+        self._trials_store = ParquetPartStore(self.trials_parquet)
+        self._cache_store = ParquetPartStore(self.eval_cache_parquet) if self.eval_cache_parquet else None
+        self._persisted_rows = 0
+        self._cache_pending: List[str] = []
+        self._last_checkpoint_at = time.monotonic()
         if not self.force_rebuild:
             self._load_eval_cache()
 
@@ -104,6 +372,16 @@ class ConstrainedBayesianOptimizer:
                 out.append((float(params[name]) - spec.low) / width)
         return np.asarray(out, dtype=float)
 
+    def _normalize_matrix(self, values: np.ndarray) -> np.ndarray:
+        """:meth:`_normalize` for a (trials, params) matrix in ``param_names`` order."""
+        out = np.zeros(values.shape, dtype=float)
+        for column, name in enumerate(self.param_names):
+            spec = self.search_space[name]
+            width = spec.high - spec.low
+            if width > 0:
+                out[:, column] = (values[:, column] - spec.low) / width
+        return out
+
     def _denormalize(self, x: np.ndarray) -> Dict[str, float]:
         params: Dict[str, float] = {}
         for i, name in enumerate(self.param_names):
@@ -119,15 +397,11 @@ class ConstrainedBayesianOptimizer:
         x = self.rng.uniform(0.0, 1.0, len(self.param_names))
         return self._denormalize(x)
 
-    def _penalized(self, objective_score: float, violations: Dict[str, float]) -> float:
-        total_violation = float(sum(max(0.0, v) for v in violations.values()))
-        return objective_score - self.constraint_penalty * total_violation
-
-    def _fit_gp(self, trials: List[TrialResult]) -> Optional[GaussianProcessRegressor]:
+    def _fit_gp(self, trials: TrialTable) -> Optional[GaussianProcessRegressor]:
         if len(trials) < max(5, len(self.param_names) + 1):
             return None
-        X = np.vstack([self._normalize(t.params) for t in trials])
-        y = np.asarray([t.penalized_score for t in trials], dtype=float)
+        X = self._normalize_matrix(trials.param_matrix())
+        y = trials.penalized_scores()
 
         kernel = ConstantKernel(1.0, (1e-3, 1e3)) * Matern(nu=2.5) + WhiteKernel(noise_level=1e-4)
         model = GaussianProcessRegressor(
@@ -139,7 +413,20 @@ class ConstrainedBayesianOptimizer:
         model.fit(X, y)
         return model
 
-    def _propose_via_gp(self, model: GaussianProcessRegressor) -> Dict[str, float]:
+    def _incremental_gp(self, trials: TrialTable) -> Optional[IncrementalGP]:
+        """Surrogate for ``gp_mode="incremental"``: refit every ``gp_refit_every`` trials, rank-one updates between."""
+        if len(trials) < max(5, len(self.param_names) + 1):
+            return None
+        if not self._gp.fitted or len(trials) - self._gp_refit_at >= self.gp_refit_every:
+            self._gp.refit(self._normalize_matrix(trials.param_matrix()), trials.penalized_scores())
+            self._gp_refit_at = len(trials)
+        else:
+            for t in trials[self._gp_observed :]:
+                self._gp.add(self._normalize(t.params), t.penalized_score)
+        self._gp_observed = len(trials)
+        return self._gp
+
+    def _propose_via_gp(self, model: Union[GaussianProcessRegressor, IncrementalGP]) -> Dict[str, float]:
         X_cand = self.rng.uniform(0.0, 1.0, size=(self.candidate_pool_size, len(self.param_names)))
         mu, std = model.predict(X_cand, return_std=True)
         # UCB with gentle exploration.
@@ -147,23 +434,77 @@ class ConstrainedBayesianOptimizer:
         best_idx = int(np.argmax(ucb))
         return self._denormalize(X_cand[best_idx])
 
+    def _propose_batch_via_gp(
+        self, model: Union[GaussianProcessRegressor, IncrementalGP], size: int
+    ) -> List[Dict[str, float]]:
+        """``size`` proposals by Kriging believer over the UCB acquisition.
+
+        Each pick is treated as observed at its predicted mean. That leaves the posterior mean
+        unchanged and only shrinks the covariance, so later picks are pushed away from earlier ones.
+        """
+        if size <= 1:
+            return [self._propose_via_gp(model)]
+        X_cand = self.rng.uniform(0.0, 1.0, size=(self.candidate_pool_size, len(self.param_names)))
+        mu, cov = model.predict(X_cand, return_cov=True)
+        picks: List[int] = []
+        for _ in range(min(size, len(X_cand))):
+            ucb = mu + 1.5 * np.sqrt(np.clip(np.diag(cov), 0.0, None))
+            ucb[picks] = -np.inf
+            best_idx = int(np.argmax(ucb))
+            picks.append(best_idx)
+            column = cov[:, best_idx].copy()
+            if column[best_idx] > 0:
+                cov = cov - np.outer(column, column) / column[best_idx]
+        return [self._denormalize(X_cand[idx]) for idx in picks]
+
+    @contextmanager
+    def _evaluation_pool(self) -> Iterator[Optional[Executor]]:
+        if self.workers <= 1:
+            yield None
+            return
+        global _WORKER_EVALUATOR
+        _WORKER_EVALUATOR = self.evaluator
+        try:
+            with ProcessPoolExecutor(max_workers=self.workers, mp_context=mp.get_context("fork")) as executor:
+                yield executor
+        finally:
+            _WORKER_EVALUATOR = None
+
+    def _evaluate_batch(
+        self, batch: List[Dict[str, float]], executor: Optional[Executor]
+    ) -> List[Tuple[Dict[str, float], bool]]:
+        """``(metrics, cache_hit)`` per proposal; misses run on ``executor`` when there is one."""
+        keys = [self._params_cache_key(params) for params in batch]
+        misses: Dict[str, Dict[str, float]] = {}
+        for key, params in zip(keys, batch):
+            if key not in self._eval_cache:
+                misses.setdefault(key, params)
+        fresh: Dict[str, Dict[str, float]] = {}
+        if misses:
+            self.telemetry.set_dispatch(len(misses))
+            if executor is None:
+                fresh = {key: self.evaluator(params) for key, params in misses.items()}
+            else:
+                futures = {key: executor.submit(_evaluate_in_worker, params) for key, params in misses.items()}
+                fresh = {key: future.result() for key, future in futures.items()}
+            self.telemetry.set_dispatch(0)
+            self.telemetry.record_evaluations(len(fresh))
+        results: List[Tuple[Dict[str, float], bool]] = []
+        for key in keys:
+            if key in self._eval_cache:
+                results.append((dict(self._eval_cache[key]), True))
+                self.telemetry.record_cache_hits()
+            else:
+                metrics = fresh[key]
+                self._eval_cache[key] = dict(metrics)
+                self._cache_pending.append(key)
+                results.append((metrics, False))
+        return results
+
     def _trials_header(self) -> List[str]:
         columns = ["trial_id", "penalized_score", "feasible", "objective_score"]
         columns.extend(f"param__{name}" for name in self.param_names)
-        metric_cols = sorted(
-            {
-                "total",
-                "wins",
-                "win_rate",
-                "itm_expiries",
-                "itm_rate",
-                "total_pnl",
-                "avg_pnl",
-                "median_pnl",
-                "avg_return_on_spot",
-                "max_drawdown",
-            }
-        )
+        metric_cols = sorted(TRIAL_METRICS)
         columns.extend(f"metric__{name}" for name in metric_cols)
         columns.extend(f"goal__{goal.name}" for goal in self.goals)
         columns.extend(f"viol__{goal.name}" for goal in self.goals)
@@ -177,7 +518,7 @@ class ConstrainedBayesianOptimizer:
             "objective_score": trial.goals.objective_score,
         }
         row.update({f"param__{k}": v for k, v in trial.params.items()})
-        for k in {"total", "wins", "win_rate", "itm_expiries", "itm_rate", "total_pnl", "avg_pnl", "median_pnl", "avg_return_on_spot", "max_drawdown"}:
+        for k in TRIAL_METRICS:
             row[f"metric__{k}"] = trial.metrics.get(k)
         for goal in self.goals:
             row[f"goal__{goal.name}"] = trial.goals.values.get(goal.name)
@@ -185,61 +526,65 @@ class ConstrainedBayesianOptimizer:
         return row
 
     def _persist_trials(self) -> None:
-        self.trials_parquet.parent.mkdir(parents=True, exist_ok=True)
+        """Append the rows added since the last call as one part file."""
+        if not self._trial_rows:
+            return
         header = self._trials_header()
         df = pd.DataFrame(self._trial_rows)
         for col in header:
             if col not in df.columns:
                 df[col] = np.nan
         df = df[header]
-        df.to_parquet(self.trials_parquet, index=False)
+        self._trials_store.append(df)
+        self._persisted_rows += len(self._trial_rows)
+        self._trial_rows = []
 
     def _persist_eval_cache(self) -> None:
-        if self.eval_cache_parquet is None:
+        """Append the cache entries added since the last call as one part file."""
+        if self._cache_store is None or not self._cache_pending:
+            self._cache_pending = []
             return
-        self.eval_cache_parquet.parent.mkdir(parents=True, exist_ok=True)
         rows = []
-        for key, metrics in self._eval_cache.items():
+        for key in self._cache_pending:
+            metrics = self._eval_cache[key]
             row = {"cache_key": key}
-            for metric_name in [
-                "total",
-                "wins",
-                "win_rate",
-                "itm_expiries",
-                "itm_rate",
-                "total_pnl",
-                "avg_pnl",
-                "median_pnl",
-                "avg_return_on_spot",
-                "max_drawdown",
-            ]:
+            for metric_name in TRIAL_METRICS:
                 row[f"metric__{metric_name}"] = metrics.get(metric_name)
             rows.append(row)
-        pd.DataFrame(rows).to_parquet(self.eval_cache_parquet, index=False)
-        self._cache_dirty = False
+        self._cache_store.append(pd.DataFrame(rows))
+        self._cache_pending = []
+
+    def _maybe_checkpoint(self, *, force: bool = False) -> None:
+        pending_rows = len(self._trial_rows)
+        if not pending_rows and not self._cache_pending:
+            return
+        now = time.monotonic()
+        due = (self.checkpoint_seconds > 0 and now - self._last_checkpoint_at >= self.checkpoint_seconds) or (
+            self.checkpoint_trials > 0 and pending_rows >= self.checkpoint_trials
+        )
+        if not (force or due):
+            return
+        self._persist_trials()
+        self._persist_eval_cache()
+        self._last_checkpoint_at = time.monotonic()
+        self.telemetry.record_checkpoint(self._last_checkpoint_at - now)
+
+    @contextmanager
+    def _run_scope(self) -> Iterator[Optional[Executor]]:
+        """Evaluation pool for :meth:`run`; pending rows are flushed however the run ends, SIGTERM included."""
+        with _sigterm_as_exit(), self._evaluation_pool() as executor:
+            try:
+                yield executor
+            finally:
+                self._maybe_checkpoint(force=True)
 
     def _load_eval_cache(self) -> None:
-        if self.eval_cache_parquet is None or not self.eval_cache_parquet.exists():
+        if self._cache_store is None:
             return
-        df = pd.read_parquet(self.eval_cache_parquet)
-        out: Dict[str, Dict[str, float]] = {}
-        for _, row in df.iterrows():
-            key = str(row.get("cache_key", ""))
-            if not key:
-                continue
-            out[key] = {
-                "total": float(row.get("metric__total", 0.0)),
-                "wins": float(row.get("metric__wins", 0.0)),
-                "win_rate": float(row.get("metric__win_rate", 0.0)),
-                "itm_expiries": float(row.get("metric__itm_expiries", 0.0)),
-                "itm_rate": float(row.get("metric__itm_rate", 0.0)),
-                "total_pnl": float(row.get("metric__total_pnl", 0.0)),
-                "avg_pnl": float(row.get("metric__avg_pnl", 0.0)),
-                "median_pnl": float(row.get("metric__median_pnl", 0.0)),
-                "avg_return_on_spot": float(row.get("metric__avg_return_on_spot", 0.0)),
-                "max_drawdown": float(row.get("metric__max_drawdown", 0.0)),
-            }
-        self._eval_cache = out
+        df = self._cache_store.read()
+        if df is None:
+            return
+        self._eval_cache = eval_cache_from_frame(df)
 
     def _params_cache_key(self, params: Dict[str, float]) -> str:
         stable: Dict[str, float] = {}
@@ -252,161 +597,185 @@ class ConstrainedBayesianOptimizer:
                 stable[name] = float(round(value, 12))
         return json.dumps(stable, sort_keys=True)
 
-    def load_existing_trials(self) -> List[TrialResult]:
+    def load_existing_trials(self) -> TrialTable:
         self._trial_rows = []
+        self._persisted_rows = 0
         if self.force_rebuild:
-            return []
-        if not self.trials_parquet.exists():
-            return []
-        df = pd.read_parquet(self.trials_parquet)
-        trials: List[TrialResult] = []
-        for _, row in df.iterrows():
-            params = {name: float(row[f"param__{name}"]) for name in self.param_names if f"param__{name}" in row}
-            metrics = {
-                "total": float(row.get("metric__total", 0.0)),
-                "wins": float(row.get("metric__wins", 0.0)),
-                "win_rate": float(row.get("metric__win_rate", 0.0)),
-                "itm_expiries": float(row.get("metric__itm_expiries", 0.0)),
-                "itm_rate": float(row.get("metric__itm_rate", 0.0)),
-                "total_pnl": float(row.get("metric__total_pnl", 0.0)),
-                "avg_pnl": float(row.get("metric__avg_pnl", 0.0)),
-                "median_pnl": float(row.get("metric__median_pnl", 0.0)),
-                "avg_return_on_spot": float(row.get("metric__avg_return_on_spot", 0.0)),
-                "max_drawdown": float(row.get("metric__max_drawdown", 0.0)),
-            }
-            goals_eval = evaluate_goals(self.goals, metrics)
-            trials.append(
-                TrialResult(
-                    trial_id=int(row.get("trial_id", len(trials))),
-                    params=params,
-                    metrics=metrics,
-                    goals=goals_eval,
-                    penalized_score=float(row.get("penalized_score", 0.0)),
-                )
-            )
-            self._trial_rows.append(self._trial_to_row(trials[-1]))
-        return trials
+            return TrialTable.empty(self.param_names)
+        df = self._trials_store.read()
+        if df is None:
+            return TrialTable.empty(self.param_names)
+        return TrialTable.from_frame(df, param_names=self.param_names, goals=self.goals)
 
-    def run(self, n_trials: int) -> List[TrialResult]:
+    def run(self, n_trials: int) -> TrialTable:
         trials = self.load_existing_trials()
         if self.force_rebuild:
             self._eval_cache = {}
-            self._cache_dirty = False
+            self._cache_pending = []
+            self._trials_store.clear()
+            if self._cache_store is not None:
+                self._cache_store.clear()
         start_id = len(trials)
-        if not self._eval_cache:
-            for trial in trials:
-                self._eval_cache[self._params_cache_key(trial.params)] = dict(trial.metrics)
+        if not self._eval_cache and len(trials):
+            metric_rows = np.column_stack([trials.metrics[name] for name in TRIAL_METRICS]).tolist()
+            for values, metric_row in zip(trials.params.tolist(), metric_rows):
+                key = self._params_cache_key(dict(zip(self.param_names, values)))
+                if key not in self._eval_cache:
+                    self._cache_pending.append(key)
+                self._eval_cache[key] = dict(zip(TRIAL_METRICS, metric_row))
         start_time = time.monotonic()
         last_progress_time = start_time
         cache_hits = 0
-        feasible = [t for t in trials if t.goals.feasible]
-        best_feasible = max(feasible, key=lambda t: t.goals.objective_score) if feasible else None
-        best_overall = max(trials, key=lambda t: t.penalized_score) if trials else None
+        window_iterations = 0
+        window_iteration_seconds = 0.0
+        window_surrogate_seconds = 0.0
+        # Resume bookkeeping reads the loaded columns; only the best trials become TrialResult objects.
+        feasible_count = int(np.count_nonzero(trials.goals.feasible))
+        best_feasible = None
+        if feasible_count:
+            objective = np.where(trials.goals.feasible, trials.goals.objective_score, -np.inf)
+            best_feasible = trials[int(np.argmax(objective))]
+        best_overall = trials[int(np.argmax(trials.penalized))] if len(trials) else None
         best_near_feasible = None
         best_near_feasible_violation = float("inf")
-        for t in trials:
-            total_violation = float(sum(max(0.0, v) for v in t.goals.violations.values()))
-            if total_violation < best_near_feasible_violation or (
-                np.isclose(total_violation, best_near_feasible_violation)
-                and (best_near_feasible is None or t.goals.objective_score > best_near_feasible.goals.objective_score)
-            ):
-                best_near_feasible = t
-                best_near_feasible_violation = total_violation
-
-        for i in range(start_id, n_trials):
-            model = self._fit_gp(trials)
-            phase = "random"
-            if model is None or i < self.n_random_init:
-                params = self._random_candidate()
-            else:
-                phase = "gp"
-                params = self._propose_via_gp(model)
-
-            cache_key = self._params_cache_key(params)
-            if cache_key in self._eval_cache:
-                metrics = dict(self._eval_cache[cache_key])
-                cache_hits += 1
-            else:
-                metrics = self.evaluator(params)
-                self._eval_cache[cache_key] = dict(metrics)
-                self._cache_dirty = True
-            goals_eval = evaluate_goals(self.goals, metrics)
-            penalized = self._penalized(goals_eval.objective_score, goals_eval.violations)
-            trial = TrialResult(
-                trial_id=i,
-                params=params,
-                metrics=metrics,
-                goals=goals_eval,
-                penalized_score=penalized,
+        best_near_index = -1
+        best_near_objective = 0.0
+        violations = trials.goals.total_violation().tolist()
+        for index, (total_violation, objective_score) in enumerate(
+            zip(violations, trials.goals.objective_score.tolist())
+        ):
+            # Inline np.isclose (rtol=1e-5, atol=1e-8): this loop can run over every loaded trial.
+            close = total_violation == best_near_feasible_violation or (
+                best_near_feasible_violation != np.inf
+                and abs(total_violation - best_near_feasible_violation)
+                <= 1e-8 + 1e-5 * abs(best_near_feasible_violation)
             )
-            trials.append(trial)
-            self._trial_rows.append(self._trial_to_row(trial))
-            self._persist_trials()
-            if self._cache_dirty:
-                self._persist_eval_cache()
-
-            total_violation = float(sum(max(0.0, v) for v in goals_eval.violations.values()))
-            if best_overall is None or trial.penalized_score > best_overall.penalized_score:
-                best_overall = trial
             if total_violation < best_near_feasible_violation or (
-                np.isclose(total_violation, best_near_feasible_violation)
-                and (best_near_feasible is None or trial.goals.objective_score > best_near_feasible.goals.objective_score)
+                close and (best_near_index < 0 or objective_score > best_near_objective)
             ):
-                best_near_feasible = trial
+                best_near_index = index
+                best_near_objective = objective_score
                 best_near_feasible_violation = total_violation
-
-            if trial.goals.feasible and (best_feasible is None or trial.goals.objective_score > best_feasible.goals.objective_score):
-                best_feasible = trial
-                self._log(
-                    "[bo] improvement "
-                    f"trial={i + 1}/{n_trials} objective={trial.goals.objective_score:.6f} "
-                    f"total={trial.metrics.get('total', float('nan')):.1f} "
-                    f"avg_pnl={trial.metrics.get('avg_pnl', float('nan')):.2f} "
-                    f"itm={trial.metrics.get('itm_expiries', float('nan')):.1f} "
-                    f"max_drawdown={trial.metrics.get('max_drawdown', float('nan')):.2f} "
-                    f"params={self._format_params_for_log(trial.params)}"
+        if best_near_index >= 0:
+            best_near_feasible = trials[best_near_index]
+
+        # (params, metrics, cached, goals, penalized score, total violation); goals are scored per batch.
+        ready: Deque[Tuple[Dict[str, float], Dict[str, float], bool, GoalEvaluation, float, float]] = deque()
+        with self._run_scope() as executor:
+            for i in range(start_id, n_trials):
+                iteration_started = time.monotonic()
+                if not ready:
+                    model = None
+                    if i >= self.n_random_init:
+                        model = self._fit_gp(trials) if self.gp_mode == "full" else self._incremental_gp(trials)
+                    window_surrogate_seconds += time.monotonic() - iteration_started
+                    batch_size = min(self.batch_size, n_trials - i)
+                    if model is None:
+                        phase = "random"
+                        if i < self.n_random_init:
+                            batch_size = min(batch_size, self.n_random_init - i)
+                        batch = [self._random_candidate() for _ in range(batch_size)]
+                    else:
+                        phase = "gp"
+                        batch = self._propose_batch_via_gp(model, batch_size)
+                    self.telemetry.set_phase(phase)
+                    evaluated = self._evaluate_batch(batch, executor)
+                    scored = self._goal_engine.evaluate_records([metrics for metrics, _cached in evaluated])
+                    penalized_batch = scored.penalized(self.constraint_penalty).tolist()
+                    violation_batch = scored.total_violation().tolist()
+                    ready.extend(
+                        (params, metrics, cached, scored.row(k), penalized_batch[k], violation_batch[k])
+                        for k, (params, (metrics, cached)) in enumerate(zip(batch, evaluated))
+                    )
+
+                params, metrics, cached, goals_eval, penalized, total_violation = ready.popleft()
+                if cached:
+                    cache_hits += 1
+                trial = TrialResult(
+                    trial_id=i,
+                    params=params,
+                    metrics=metrics,
+                    goals=goals_eval,
+                    penalized_score=penalized,
                 )
-
-            if self.progress_interval_seconds > 0:
-                now = time.monotonic()
-                if now - last_progress_time >= self.progress_interval_seconds:
-                    elapsed = now - start_time
-                    feasible_count = sum(1 for t in trials if t.goals.feasible)
-                    if best_feasible is None:
-                        if best_near_feasible is None:
-                            self._log(
-                                "[bo] progress "
-                                f"t+{elapsed:.1f}s trial={i + 1}/{n_trials} phase={phase} "
-                                f"feasible=0 cache_hits={cache_hits}"
-                            )
+                trials.append(trial)
+                self._trial_rows.append(self._trial_to_row(trial))
+                feasible_count += int(trial.goals.feasible)
+                self._maybe_checkpoint()
+                self.telemetry.maybe_write()
+
+                if best_overall is None or trial.penalized_score > best_overall.penalized_score:
+                    best_overall = trial
+                if total_violation < best_near_feasible_violation or (
+                    np.isclose(total_violation, best_near_feasible_violation)
+                    and (best_near_feasible is None or trial.goals.objective_score > best_near_feasible.goals.objective_score)
+                ):
+                    best_near_feasible = trial
+                    best_near_feasible_violation = total_violation
+
+                if trial.goals.feasible and (best_feasible is None or trial.goals.objective_score > best_feasible.goals.objective_score):
+                    best_feasible = trial
+                    self._log(
+                        "[bo] improvement "
+                        f"trial={i + 1}/{n_trials} objective={trial.goals.objective_score:.6f} "
+                        f"total={trial.metrics.get('total', float('nan')):.1f} "
+                        f"avg_pnl={trial.metrics.get('avg_pnl', float('nan')):.2f} "
+                        f"itm={trial.metrics.get('itm_expiries', float('nan')):.1f} "
+                        f"max_drawdown={trial.metrics.get('max_drawdown', float('nan')):.2f} "
+                        f"params={self._format_params_for_log(trial.params)}"
+                    )
+
+                window_iterations += 1
+                window_iteration_seconds += time.monotonic() - iteration_started
+                if self.progress_interval_seconds > 0:
+                    now = time.monotonic()
+                    if now - last_progress_time >= self.progress_interval_seconds:
+                        elapsed = now - start_time
+                        # Mean wall clock per iteration (and its surrogate share) since the last progress line.
+                        timing = (
+                            f"iter_ms={1000.0 * window_iteration_seconds / window_iterations:.1f} "
+                            f"gp_ms={1000.0 * window_surrogate_seconds / window_iterations:.1f}"
+                        )
+                        if best_feasible is None:
+                            if best_near_feasible is None:
+                                self._log(
+                                    "[bo] progress "
+                                    f"t+{elapsed:.1f}s trial={i + 1}/{n_trials} phase={phase} {timing} "
+                                    f"feasible=0 cache_hits={cache_hits}"
+                                )
+                            else:
+                                self._log(
+                                    "[bo] progress "
+                                    f"t+{elapsed:.1f}s trial={i + 1}/{n_trials} phase={phase} {timing} "
+                                    f"feasible=0 cache_hits={cache_hits} "
+                                    f"best_violation={best_near_feasible_violation:.6f} "
+                                    f"best_objective={best_near_feasible.goals.objective_score:.6f} "
+                                    f"best_total={best_near_feasible.metrics.get('total', float('nan')):.1f} "
+                                    f"best_avg_pnl={best_near_feasible.metrics.get('avg_pnl', float('nan')):.2f} "
+                                    f"best_itm={best_near_feasible.metrics.get('itm_expiries', float('nan')):.1f} "
+                                    f"best_max_drawdown={best_near_feasible.metrics.get('max_drawdown', float('nan')):.2f} "
+                                    f"best_params={self._format_params_for_log(best_near_feasible.params)}"
+                                )
                         else:
                             self._log(
                                 "[bo] progress "
-                                f"t+{elapsed:.1f}s trial={i + 1}/{n_trials} phase={phase} "
-                                f"feasible=0 cache_hits={cache_hits} "
-                                f"best_violation={best_near_feasible_violation:.6f} "
-                                f"best_objective={best_near_feasible.goals.objective_score:.6f} "
-                                f"best_total={best_near_feasible.metrics.get('total', float('nan')):.1f} "
-                                f"best_avg_pnl={best_near_feasible.metrics.get('avg_pnl', float('nan')):.2f} "
-                                f"best_itm={best_near_feasible.metrics.get('itm_expiries', float('nan')):.1f} "
-                                f"best_max_drawdown={best_near_feasible.metrics.get('max_drawdown', float('nan')):.2f} "
-                                f"best_params={self._format_params_for_log(best_near_feasible.params)}"
+                                f"t+{elapsed:.1f}s trial={i + 1}/{n_trials} phase={phase} {timing} "
+                                f"feasible={feasible_count} cache_hits={cache_hits} "
+                                f"best_objective={best_feasible.goals.objective_score:.6f} "
+                                f"best_total={best_feasible.metrics.get('total', float('nan')):.1f} "
+                                f"best_avg_pnl={best_feasible.metrics.get('avg_pnl', float('nan')):.2f} "
+                                f"best_itm={best_feasible.metrics.get('itm_expiries', float('nan')):.1f} "
+                                f"best_max_drawdown={best_feasible.metrics.get('max_drawdown', float('nan')):.2f} "
+                                f"best_params={self._format_params_for_log(best_feasible.params)}"
                             )
-                    else:
-                        self._log(
-                            "[bo] progress "
-                            f"t+{elapsed:.1f}s trial={i + 1}/{n_trials} phase={phase} "
-                            f"feasible={feasible_count} cache_hits={cache_hits} "
-                            f"best_objective={best_feasible.goals.objective_score:.6f} "
-                            f"best_total={best_feasible.metrics.get('total', float('nan')):.1f} "
-                            f"best_avg_pnl={best_feasible.metrics.get('avg_pnl', float('nan')):.2f} "
-                            f"best_itm={best_feasible.metrics.get('itm_expiries', float('nan')):.1f} "
-                            f"best_max_drawdown={best_feasible.metrics.get('max_drawdown', float('nan')):.2f} "
-                            f"best_params={self._format_params_for_log(best_feasible.params)}"
-                        )
-                    last_progress_time = now
-        if self._cache_dirty:
-            self._persist_eval_cache()
+                        last_progress_time = now
+                        window_iterations = 0
+                        window_iteration_seconds = 0.0
+                        window_surrogate_seconds = 0.0
+        self._trials_store.compact()
+        if self._cache_store is not None:
+            self._cache_store.compact()
+        self._log(f"[bo] telemetry {summary_line(self.telemetry.finish())}")
         return trials
 
 
@@ -416,93 +785,81 @@ def extract_region_summary(
     performance_tolerance_pct: float,
     min_component_fraction: float,
 ) -> Dict[str, object]:
-    trial_list = list(trials)
-    feasible = [t for t in trial_list if t.goals.feasible]
-    if not feasible:
+    param_names = list(search_space)
+    if isinstance(trials, TrialTable):
+        # Straight from the loaded columns, without building a TrialResult per row.
+        order = [trials.param_names.index(name) for name in param_names]
+        params = trials.param_matrix()[:, order]
+        feasible_flags = trials.feasible_flags()
+        objective = trials.objective_scores()
+    else:
+        trial_list = list(trials)
+        params = np.asarray([[float(t.params[name]) for name in param_names] for t in trial_list], dtype=float)
+        feasible_flags = np.asarray([bool(t.goals.feasible) for t in trial_list], dtype=bool)
+        objective = np.asarray([t.goals.objective_score for t in trial_list], dtype=float)
+    feasible = np.flatnonzero(feasible_flags)
+    if not len(feasible):
         return {
             "selected_component": None,
             "components": [],
             "note": "No feasible trials found.",
         }
 
-    best_obj = max(t.goals.objective_score for t in feasible)
+    best_obj = float(objective[feasible].max())
     tolerance = abs(best_obj) * (performance_tolerance_pct / 100.0)
-    kept = [t for t in feasible if t.goals.objective_score >= best_obj - tolerance]
-    if not kept:
+    kept = feasible[objective[feasible] >= best_obj - tolerance]
+    if not len(kept):
         kept = feasible
+    kept_params = params[kept]
+    kept_objective = objective[kept]
 
-    param_names = list(search_space)
-    X = []
-    for t in kept:
-        vec = []
-        for name in param_names:
-            spec = search_space[name]
-            width = spec.high - spec.low
-            if width <= 0:
-                vec.append(0.0)
-            else:
-                vec.append((float(t.params[name]) - spec.low) / width)
-        X.append(vec)
-    X_arr = np.asarray(X, dtype=float)
+    lows = np.asarray([search_space[name].low for name in param_names], dtype=float)
+    spans = np.asarray([search_space[name].high - search_space[name].low for name in param_names], dtype=float)
+    safe_spans = np.where(spans > 0, spans, 1.0)
+    X_arr = np.where(spans > 0, (kept_params - lows) / safe_spans, 0.0)
 
     if len(kept) == 1:
-        components = [np.array([0], dtype=int)]
+        labels = np.zeros(1, dtype=int)
     else:
         k = min(10, len(kept) - 1)
-        nbrs = NearestNeighbors(n_neighbors=k + 1).fit(X_arr)
-        indices = nbrs.kneighbors(X_arr, return_distance=False)
-        graph = {i: set() for i in range(len(kept))}
-        for i in range(len(kept)):
-            for j in indices[i][1:]:
-                graph[i].add(int(j))
-                graph[int(j)].add(i)
-
-        visited = set()
-        components = []
-        for i in range(len(kept)):
-            if i in visited:
-                continue
-            stack = [i]
-            comp = []
-            visited.add(i)
-            while stack:
-                cur = stack.pop()
-                comp.append(cur)
-                for nxt in graph[cur]:
-                    if nxt not in visited:
-                        visited.add(nxt)
-                        stack.append(nxt)
-            components.append(np.asarray(sorted(comp), dtype=int))
+        graph = kneighbors_graph(X_arr, n_neighbors=k, mode="connectivity", include_self=False)
+        _count, labels = connected_components(graph, directed=False)
+        # Number components by their first trial, as a scan in trial order would.
+        _unique, first = np.unique(labels, return_index=True)
+        renumber = np.empty(len(first), dtype=int)
+        renumber[np.argsort(first)] = np.arange(len(first))
+        labels = renumber[labels]
+
+    # Grouped reductions: sort trials by component, then reduce each contiguous run at once.
+    order = np.argsort(labels, kind="stable")
+    sizes = np.bincount(labels)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    widths = np.maximum.reduceat(X_arr[order], starts, axis=0) - np.minimum.reduceat(X_arr[order], starts, axis=0)
+    lower = np.minimum.reduceat(kept_params[order], starts, axis=0)
+    upper = np.maximum.reduceat(kept_params[order], starts, axis=0)
+    objective_mean = np.bincount(labels, weights=kept_objective) / sizes
+    objective_best = np.maximum.reduceat(kept_objective[order], starts)
+    objective_drift = np.sqrt(np.bincount(labels, weights=(kept_objective - objective_mean[labels]) ** 2) / sizes)
+    active_dim_count = np.sum(widths < 0.15, axis=1)
+    flat_volume_proxy = np.prod(np.clip(widths, 1e-12, None), axis=1)
 
     min_size = max(1, int(np.ceil(len(kept) * min_component_fraction)))
     rows = []
-    for comp_id, comp_idx in enumerate(components):
-        if len(comp_idx) < min_size:
-            continue
-        comp_X = X_arr[comp_idx]
-        comp_trials = [kept[int(i)] for i in comp_idx]
-        widths = comp_X.max(axis=0) - comp_X.min(axis=0)
-        local_width_by_dim = {name: float(widths[idx]) for idx, name in enumerate(param_names)}
-        active_dim_count = int(np.sum(widths < 0.15))
-        flat_volume_proxy = float(np.prod(np.clip(widths, 1e-12, None)))
-        objective_values = np.asarray([t.goals.objective_score for t in comp_trials], dtype=float)
-
-        bounds: Dict[str, Dict[str, float]] = {}
-        for idx, name in enumerate(param_names):
-            vals = np.asarray([t.params[name] for t in comp_trials], dtype=float)
-            bounds[name] = {"min": float(vals.min()), "max": float(vals.max())}
-
+    for comp_id in np.flatnonzero(sizes >= min_size).tolist():
         rows.append(
             {
                 "component_id": comp_id,
-                "size": int(len(comp_trials)),
-                "objective_mean": float(objective_values.mean()),
-                "objective_best": float(objective_values.max()),
-                "objective_drift_within_component": float(objective_values.std(ddof=0)),
-                "local_width_by_dim": local_width_by_dim,
-                "active_dim_count": active_dim_count,
-                "flat_volume_proxy": flat_volume_proxy,
-                "bounds": bounds,
+                "size": int(sizes[comp_id]),
+                "objective_mean": float(objective_mean[comp_id]),
+                "objective_best": float(objective_best[comp_id]),
+                "objective_drift_within_component": float(objective_drift[comp_id]),
+                "local_width_by_dim": {name: float(widths[comp_id, idx]) for idx, name in enumerate(param_names)},
+                "active_dim_count": int(active_dim_count[comp_id]),
+                "flat_volume_proxy": float(flat_volume_proxy[comp_id]),
+                "bounds": {
+                    name: {"min": float(lower[comp_id, idx]), "max": float(upper[comp_id, idx])}
+                    for idx, name in enumerate(param_names)
+                },
             }
         )
 
@@ -511,15 +868,15 @@ def extract_region_summary(
             {
                 "component_id": 0,
                 "size": len(kept),
-                "objective_mean": float(np.mean([t.goals.objective_score for t in kept])),
-                "objective_best": float(np.max([t.goals.objective_score for t in kept])),
-                "objective_drift_within_component": float(np.std([t.goals.objective_score for t in kept], ddof=0)),
+                "objective_mean": float(np.mean(kept_objective)),
+                "objective_best": float(np.max(kept_objective)),
+                "objective_drift_within_component": float(np.std(kept_objective, ddof=0)),
                 "local_width_by_dim": {name: 0.0 for name in param_names},
                 "active_dim_count": len(param_names),
                 "flat_volume_proxy": 0.0,
                 "bounds": {
-                    name: {"min": float(min(t.params[name] for t in kept)), "max": float(max(t.params[name] for t in kept))}
-                    for name in param_names
+                    name: {"min": float(kept_params[:, idx].min()), "max": float(kept_params[:, idx].max())}
+                    for idx, name in enumerate(param_names)
                 },
             }
         ]
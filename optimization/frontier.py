@@ -0,0 +1,54 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+class ThresholdFrontier:
+    """Minimal points per (windows, comparators) group known to stay at or below ``floor`` trades.
+
+    Tightening a threshold or narrowing a range only shrinks the trigger set, and the one-entry-per-week
+    trade count with it, so every point at least as strict as a recorded one is dominated.
+    """
+
+    def __init__(self, floor: float) -> None:
+        self.floor = float(floor)
+        self._minimal: Dict[Tuple[Any, ...], List[np.ndarray]] = {}
+
+    @property
+    def size(self) -> int:
+        return sum(len(points) for points in self._minimal.values())
+
+    @staticmethod
+    def _split(knobs: Dict[str, Any]) -> Tuple[Tuple[Any, ...], np.ndarray]:
+        group = (
+            int(knobs["roc_window_size"]),
+            int(knobs["vol_window_size"]),
+            str(knobs["roc_comparator"]),
+            str(knobs["vol_comparator"]),
+            int(knobs["roc_range_enabled"]),
+            int(knobs["vol_range_enabled"]),
+        )
+        strictness: List[float] = []
+        for metric in ("roc", "vol"):
+            if int(knobs[f"{metric}_range_enabled"]) == 1:
+                strictness.extend([float(knobs[f"{metric}_range_low"]), -float(knobs[f"{metric}_range_high"])])
+            else:
+                threshold = float(knobs[f"{metric}_threshold"])
+                strictness.extend([threshold if knobs[f"{metric}_comparator"] == "above" else -threshold, 0.0])
+        return group, np.asarray(strictness, dtype=float)
+
+    def observe(self, knobs: Dict[str, Any], total_trades: float) -> None:
+        if not float(total_trades) <= self.floor:
+            return
+        group, point = self._split(knobs)
+        points = self._minimal.setdefault(group, [])
+        if any(np.all(point >= known) for known in points):
+            return
+        points[:] = [known for known in points if not np.all(known >= point)]
+        points.append(point)
+
+    def dominated(self, knobs: Dict[str, Any]) -> bool:
+        group, point = self._split(knobs)
+        return any(np.all(point >= known) for known in self._minimal.get(group, ()))
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-from .goals import BUILTIN_GOAL_FUNCTIONS, Goal
+import numpy as np
+
+from .goals import BUILTIN_GOAL_EXPRESSIONS, Goal
 
 
 DEFAULT_GOALS = [
@@ -21,6 +23,45 @@ class GoalEvaluation:
     objective_score: float
 
 
+@dataclass
+class GoalBatch:
+    """:class:`GoalEvaluation` for many trials, one array entry per trial."""
+
+    values: Dict[str, np.ndarray]
+    violations: Dict[str, np.ndarray]
+    feasible: np.ndarray
+    objective_score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.feasible)
+
+    def total_violation(self) -> np.ndarray:
+        total = np.zeros(len(self.feasible), dtype=float)
+        for violation in self.violations.values():
+            total = total + np.fmax(0.0, violation)
+        return total
+
+    def penalized(self, constraint_penalty: float) -> np.ndarray:
+        """``objective - constraint_penalty * total violation``, as both optimizers score trials."""
+        return self.objective_score - constraint_penalty * self.total_violation()
+
+    def take(self, positions: np.ndarray) -> "GoalBatch":
+        return GoalBatch(
+            values={name: values[positions] for name, values in self.values.items()},
+            violations={name: violations[positions] for name, violations in self.violations.items()},
+            feasible=self.feasible[positions],
+            objective_score=self.objective_score[positions],
+        )
+
+    def row(self, index: int) -> GoalEvaluation:
+        return GoalEvaluation(
+            values={name: float(values[index]) for name, values in self.values.items()},
+            violations={name: float(violations[index]) for name, violations in self.violations.items()},
+            feasible=bool(self.feasible[index]),
+            objective_score=float(self.objective_score[index]),
+        )
+
+
 def build_goals(configs: Optional[Iterable[Dict[str, object]]]) -> List[Goal]:
     rows = list(configs or DEFAULT_GOALS)
     if not rows:
@@ -37,16 +78,16 @@ def build_goals(configs: Optional[Iterable[Dict[str, object]]]) -> List[Goal]:
             raise ValueError(f"Unsupported goal kind '{kind}'")
         if direction not in {"min", "max"}:
             raise ValueError(f"Unsupported goal direction '{direction}'")
-        fn = BUILTIN_GOAL_FUNCTIONS.get(name)
-        if fn is None:
-            raise ValueError(f"Unknown goal name '{name}'. Known goals: {sorted(BUILTIN_GOAL_FUNCTIONS)}")
+        expression = BUILTIN_GOAL_EXPRESSIONS.get(name)
+        if expression is None:
+            raise ValueError(f"Unknown goal name '{name}'. Known goals: {sorted(BUILTIN_GOAL_EXPRESSIONS)}")
         target = row.get("target")
         goals.append(
             Goal(
                 name=name,
                 kind=kind,
                 direction=direction,
-                value_fn=fn,
+                expression=expression,
                 target=None if target is None else float(target),
             )
         )
@@ -75,3 +116,72 @@ def evaluate_goals(goals: List[Goal], metrics: Dict[str, float]) -> GoalEvaluati
 
     objective_score = float(sum(objective_terms) / max(1, len(objective_terms)))
     return GoalEvaluation(values=values, violations=violations, feasible=feasible, objective_score=objective_score)
+
+
+class GoalEngine:
+    """Evaluates a goal list over a (trials x metric columns) matrix in a few array operations.
+
+    Each goal is a column expression, so the engine resolves every goal to a column index once and
+    then computes values, violations, feasibility and objective scores for all rows together. Row
+    for row the numbers match :func:`evaluate_goals`.
+    """
+
+    def __init__(self, goals: List[Goal]) -> None:
+        self.goals = list(goals)
+        self.columns: Tuple[str, ...] = tuple(dict.fromkeys(goal.expression.column for goal in self.goals))
+        targets = [np.nan if goal.target is None else goal.target for goal in self.goals]
+        constrained = np.asarray([goal.kind == "constraint" and goal.target is not None for goal in self.goals])
+        directions = np.asarray([goal.direction for goal in self.goals])
+        for direction in directions:
+            if direction not in ("min", "max"):
+                raise ValueError(f"Unsupported direction '{direction}'")
+        self._targets = np.asarray(targets, dtype=float)
+        self._upper = constrained & (directions == "min")
+        self._lower = constrained & (directions == "max")
+        self._objectives = [
+            (index, -1.0 if goal.direction == "min" else 1.0)
+            for index, goal in enumerate(self.goals)
+            if goal.kind == "objective"
+        ]
+
+    def evaluate(self, matrix: np.ndarray, columns: Sequence[str]) -> GoalBatch:
+        """Goals for every row of ``matrix``, whose columns are the metrics named by ``columns``."""
+        matrix = np.asarray(matrix, dtype=float).reshape(-1, len(columns))
+        position = {name: index for index, name in enumerate(columns)}
+        values = np.zeros((len(matrix), len(self.goals)), dtype=float)
+        for index, goal in enumerate(self.goals):
+            column = position.get(goal.expression.column)
+            if column is not None:
+                values[:, index] = goal.expression.apply(matrix[:, column])
+
+        violations = np.zeros_like(values)
+        violations[:, self._upper] = np.fmax(0.0, values[:, self._upper] - self._targets[self._upper])
+        violations[:, self._lower] = np.fmax(0.0, self._targets[self._lower] - values[:, self._lower])
+        feasible = ~np.any(violations > 0, axis=1)
+
+        objective_score = np.zeros(len(matrix), dtype=float)
+        for index, sign in self._objectives:
+            objective_score = objective_score + sign * values[:, index]
+        objective_score = objective_score / max(1, len(self._objectives))
+        return GoalBatch(
+            values={goal.name: values[:, index] for index, goal in enumerate(self.goals)},
+            violations={goal.name: violations[:, index] for index, goal in enumerate(self.goals)},
+            feasible=feasible,
+            objective_score=objective_score,
+        )
+
+    def evaluate_records(self, records: Sequence[Mapping[str, float]]) -> GoalBatch:
+        """Goals for a batch of metric dicts, e.g. the results of one evaluation batch."""
+        matrix = [[float(record.get(column, 0.0)) for column in self.columns] for record in records]
+        return self.evaluate(np.asarray(matrix, dtype=float), self.columns)
+
+
+def evaluate_goals_batch(goals: List[Goal], metrics: Mapping[str, np.ndarray]) -> GoalBatch:
+    """:func:`evaluate_goals` over metric columns (one array per metric name)."""
+    size = len(next(iter(metrics.values()))) if metrics else 0
+    engine = GoalEngine(goals)
+    matrix = np.zeros((size, len(engine.columns)), dtype=float)
+    for index, column in enumerate(engine.columns):
+        if column in metrics:
+            matrix[:, index] = metrics[column]
+    return engine.evaluate(matrix, engine.columns)
@@ -1,30 +1,42 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Mapping, Optional
 
+import numpy as np
 
-MetricFn = Callable[[Dict[str, float]], float]
+
+_TRANSFORMS: Dict[str, Callable[[np.ndarray], np.ndarray]] = {
+    "identity": lambda values: values,
+    "abs": np.abs,
+}
 
 
-def goal_itm(metrics: Dict[str, float]) -> float:
-    return float(metrics.get("itm_expiries", 0.0))
+@dataclass(frozen=True)
+class GoalExpression:
+    """A goal value as a column expression, ``transform(metrics[column])``; a missing metric reads as 0."""
 
+    column: str
+    transform: str = "identity"
 
-def goal_drawdown(metrics: Dict[str, float]) -> float:
-    return abs(float(metrics.get("max_drawdown", 0.0)))
+    def __post_init__(self) -> None:
+        if self.transform not in _TRANSFORMS:
+            raise ValueError(f"Unsupported goal transform '{self.transform}'. Known: {sorted(_TRANSFORMS)}")
 
+    def value(self, metrics: Mapping[str, float]) -> float:
+        return float(_TRANSFORMS[self.transform](float(metrics.get(self.column, 0.0))))
 
-def goal_avg_pnl(metrics: Dict[str, float]) -> float:
-    return float(metrics.get("avg_pnl", 0.0))
+    def apply(self, column: np.ndarray) -> np.ndarray:
+        """The expression over one metric column (one entry per trial)."""
+        return _TRANSFORMS[self.transform](np.asarray(column, dtype=float))
 
 
-BUILTIN_GOAL_FUNCTIONS: Dict[str, MetricFn] = {
-    "itm_expiries": goal_itm,
-    "max_drawdown_abs": goal_drawdown,
-    "avg_pnl": goal_avg_pnl,
-    "total_pnl": lambda m: float(m.get("total_pnl", 0.0)),
-    "win_rate": lambda m: float(m.get("win_rate", 0.0)),
+BUILTIN_GOAL_EXPRESSIONS: Dict[str, GoalExpression] = {
+    "itm_expiries": GoalExpression("itm_expiries"),
+    "max_drawdown_abs": GoalExpression("max_drawdown", "abs"),
+    "avg_pnl": GoalExpression("avg_pnl"),
+    "total_pnl": GoalExpression("total_pnl"),
+    "win_rate": GoalExpression("win_rate"),
 }
 
 
@@ -33,11 +45,11 @@ class Goal:
     name: str
     direction: str  # min|max
     kind: str  # constraint|objective
-    value_fn: MetricFn
+    expression: GoalExpression
     target: Optional[float] = None
 
     def value(self, metrics: Dict[str, float]) -> float:
-        return float(self.value_fn(metrics))
+        return self.expression.value(metrics)
 
     def is_satisfied(self, metrics: Dict[str, float]) -> bool:
         if self.kind != "constraint" or self.target is None:
@@ -6,6 +6,7 @@ from typing import Callable, Dict, List
 import numpy as np
 
 from .constrained_bo import ParamSpec
+from .local_search import central_difference_stencil, spec_lattice
 
 
 @dataclass(frozen=True)
@@ -43,7 +44,9 @@ class FiniteDifferenceGradientDescent:
 
         self.param_names = list(self.search_space)
         self.dim = len(self.param_names)
+        self.lattice = spec_lattice([self.search_space[name] for name in self.param_names])
         self.rng = np.random.default_rng(self.seed)
+        self.saved_evaluations = 0
 
     def normalize(self, params: Dict[str, float]) -> np.ndarray:
         values = []
@@ -69,20 +72,15 @@ class FiniteDifferenceGradientDescent:
         return params
 
     def estimate_gradient(self, x_center: np.ndarray) -> np.ndarray:
-        gradient = np.zeros(self.dim, dtype=float)
-        for dim_index in range(self.dim):
-            offset = np.zeros(self.dim, dtype=float)
-            offset[dim_index] = self.gradient_step_size
-
-            x_plus = np.clip(x_center + offset, 0.0, 1.0)
-            x_minus = np.clip(x_center - offset, 0.0, 1.0)
-
-            y_plus = float(self.objective_fn(self.denormalize(x_plus)))
-            y_minus = float(self.objective_fn(self.denormalize(x_minus)))
-
-            denominator = max(2.0 * self.gradient_step_size, 1e-12)
-            gradient[dim_index] = (y_plus - y_minus) / denominator
-        return gradient
+        stencil = central_difference_stencil(
+            x_center,
+            step_size=self.gradient_step_size,
+            lattice=self.lattice,
+            key=lambda x: tuple(self.denormalize(x).values()),
+        )
+        self.saved_evaluations += stencil.saved
+        values = [float(self.objective_fn(self.denormalize(x))) for x in stencil.points]
+        return stencil.gradient(values)
 
     def run(self, *, start_params: Dict[str, float], steps: int) -> List[GradientStepResult]:
         if steps < 0:
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+from typing import Optional, Tuple, Union
+
+import numpy as np
+from scipy.linalg import cho_solve, cholesky, solve_triangular
+from sklearn.gaussian_process import GaussianProcessRegressor
+from sklearn.gaussian_process.kernels import ConstantKernel, Kernel, Matern, WhiteKernel
+
+# Same diagonal jitter sklearn's GaussianProcessRegressor adds by default (its ``alpha``).
+_JITTER = 1e-10
+
+
+def default_kernel() -> Kernel:
+    return ConstantKernel(1.0, (1e-3, 1e3)) * Matern(nu=2.5) + WhiteKernel(noise_level=1e-4)
+
+
+def select_active_set(x: np.ndarray, y: np.ndarray, size: int, *, quality_fraction: float = 0.5) -> np.ndarray:
+    """Indices of at most ``size`` training points: the best by ``y``, then greedy farthest-point coverage.
+
+    ``quality_fraction`` of the set goes to the highest scores so the model stays sharp where the
+    optimizer is looking; the rest repeatedly takes the point farthest from everything chosen so far.
+    """
+    count = len(y)
+    if count <= size:
+        return np.arange(count)
+    order = np.argsort(-np.asarray(y, dtype=float), kind="stable")
+    chosen = list(order[: max(1, int(round(size * quality_fraction)))])
+    gap = np.full(count, np.inf)
+    for index in chosen:
+        gap = np.minimum(gap, np.sum((x - x[index]) ** 2, axis=1))
+    gap[chosen] = -1.0
+    while len(chosen) < size:
+        index = int(np.argmax(gap))
+        chosen.append(index)
+        gap = np.minimum(gap, np.sum((x - x[index]) ** 2, axis=1))
+        gap[index] = -1.0
+    return np.sort(np.asarray(chosen, dtype=int))
+
+
+class IncrementalGP:
+    """Gaussian process over a bounded active set, grown by rank-one Cholesky updates between refits.
+
+    :meth:`refit` picks at most ``max_active`` points with :func:`select_active_set` and fits the
+    kernel hyperparameters there (an O(m^3) sklearn fit with restarts). :meth:`add` keeps those
+    hyperparameters and the target scaling, and extends the Cholesky factor by one row in O(m^2).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_active: int = 256,
+        n_restarts_optimizer: int = 2,
+        random_state: int = 0,
+        kernel: Optional[Kernel] = None,
+    ) -> None:
+        if int(max_active) <= 0:
+            raise ValueError("max_active must be > 0")
+        self.max_active = int(max_active)
+        self.n_restarts_optimizer = int(n_restarts_optimizer)
+        self.random_state = int(random_state)
+        self.kernel = kernel
+        self.kernel_: Optional[Kernel] = None
+        self.refits = 0
+        self.updates = 0
+        self._x = np.zeros((0, 0))
+        self._y = np.zeros(0)
+        self._y_mean = 0.0
+        self._y_std = 1.0
+        self._chol = np.zeros((0, 0))
+        self._alpha = np.zeros(0)
+
+    @property
+    def fitted(self) -> bool:
+        return self.kernel_ is not None
+
+    @property
+    def active_size(self) -> int:
+        return len(self._y)
+
+    def refit(self, x: np.ndarray, y: np.ndarray) -> None:
+        x = np.asarray(x, dtype=float)
+        y = np.asarray(y, dtype=float)
+        active = select_active_set(x, y, self.max_active)
+        model = GaussianProcessRegressor(
+            kernel=self.kernel if self.kernel is not None else default_kernel(),
+            normalize_y=True,
+            n_restarts_optimizer=self.n_restarts_optimizer,
+            random_state=self.random_state,
+        )
+        model.fit(x[active], y[active])
+        self.kernel_ = model.kernel_
+        self._x = x[active].copy()
+        self._y = y[active].copy()
+        std = float(np.std(self._y))
+        self._y_mean = float(np.mean(self._y))
+        self._y_std = std if std > 0 else 1.0
+        gram = self.kernel_(self._x)
+        gram[np.diag_indices_from(gram)] += _JITTER
+        self._chol = cholesky(gram, lower=True)
+        self._solve()
+        self.refits += 1
+
+    def add(self, x: np.ndarray, y: float) -> bool:
+        """Condition on one more observation; returns False (and skips it) if it would make the factor singular."""
+        if not self.fitted:
+            raise RuntimeError("IncrementalGP.add needs a prior refit")
+        point = np.asarray(x, dtype=float).reshape(1, -1)
+        cross = self.kernel_(self._x, point)[:, 0]
+        row = solve_triangular(self._chol, cross, lower=True)
+        pivot = float(self.kernel_.diag(point)[0]) + _JITTER - float(row @ row)
+        if pivot <= 1e-12:
+            return False
+        size = len(self._y)
+        chol = np.zeros((size + 1, size + 1))
+        chol[:size, :size] = self._chol
+        chol[size, :size] = row
+        chol[size, size] = np.sqrt(pivot)
+        self._chol = chol
+        self._x = np.vstack([self._x, point])
+        self._y = np.append(self._y, float(y))
+        self._solve()
+        self.updates += 1
+        return True
+
+    def _solve(self) -> None:
+        self._alpha = cho_solve((self._chol, True), (self._y - self._y_mean) / self._y_std)
+
+    def predict(
+        self, x: np.ndarray, return_std: bool = False, return_cov: bool = False
+    ) -> Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        if not self.fitted:
+            raise RuntimeError("IncrementalGP.predict needs a prior refit")
+        points = np.atleast_2d(np.asarray(x, dtype=float))
+        cross = self.kernel_(points, self._x)
+        mean = cross @ self._alpha * self._y_std + self._y_mean
+        if not (return_std or return_cov):
+            return mean
+        v = solve_triangular(self._chol, cross.T, lower=True)
+        if return_cov:
+            return mean, (self.kernel_(points) - v.T @ v) * self._y_std**2
+        var = self.kernel_.diag(points) - np.einsum("ij,ij->j", v, v)
+        return mean, np.sqrt(np.clip(var, 0.0, None)) * self._y_std
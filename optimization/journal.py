@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+import time
+from pathlib import Path
+from typing import BinaryIO, Callable, List, Optional
+
+import pyarrow as pa
+
+
+class ArrowJournal:
+    """Write-ahead log of record batches, kept as one Arrow IPC stream file.
+
+    Each append is flushed to the OS right away, so a killed process loses nothing. Only a
+    machine crash can lose what was written since the last fsync, and fsyncs are at least
+    ``sync_seconds`` apart. Call :meth:`reset` once the rows are durable elsewhere.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        schema: pa.Schema,
+        *,
+        sync_seconds: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if float(sync_seconds) < 0:
+            raise ValueError("sync_seconds must be >= 0")
+        self.path = Path(path)
+        self.schema = schema
+        self.sync_seconds = float(sync_seconds)
+        self.clock = clock
+        self._file: Optional[BinaryIO] = None
+        self._writer: Optional[pa.ipc.RecordBatchStreamWriter] = None
+        self._synced_at = 0.0
+        self._unsynced = False
+        self.rows = 0
+        self.syncs = 0
+        self.seconds = 0.0
+
+    def append(self, table: pa.Table) -> None:
+        if table.num_rows == 0:
+            return
+        started = self.clock()
+        if self._writer is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "wb")
+            self._writer = pa.ipc.new_stream(self._file, self.schema)
+            self._synced_at = started
+        if not table.schema.equals(self.schema):
+            table = table.cast(self.schema)
+        self._writer.write_table(table)
+        self._file.flush()
+        self._unsynced = True
+        if started - self._synced_at >= self.sync_seconds:
+            self.sync()
+        self.rows += table.num_rows
+        self.seconds += self.clock() - started
+
+    def sync(self) -> None:
+        if self._file is None or not self._unsynced:
+            return
+        os.fsync(self._file.fileno())
+        self._synced_at = self.clock()
+        self._unsynced = False
+        self.syncs += 1
+
+    def reset(self) -> None:
+        """Drop everything journaled so far; the next append starts a new stream."""
+        self._close()
+        self.path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        self.sync()
+        self._close()
+
+    def _close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._file.close()
+        self._writer = None
+        self._file = None
+        self._unsynced = False
+
+
+def read_journal(path: Path) -> Optional[pa.Table]:
+    """Every complete batch in a journal file, or None if there is none to replay.
+
+    A batch torn by a crash mid-write ends the stream; the batches before it are kept.
+    """
+    path = Path(path)
+    if not path.exists():
+        return None
+    batches: List[pa.RecordBatch] = []
+    with pa.OSFile(str(path), "rb") as source:
+        try:
+            reader = pa.ipc.open_stream(source)
+        except (pa.ArrowInvalid, OSError):
+            return None
+        while True:
+            try:
+                batches.append(reader.read_next_batch())
+            except StopIteration:
+                break
+            except (pa.ArrowInvalid, OSError):
+                break
+    return pa.Table.from_batches(batches, schema=reader.schema)
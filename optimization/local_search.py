@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .constrained_bo import ParamSpec
+
+
+def _as_value(value: float) -> float:
+    value = float(value)
+    return value if math.isfinite(value) else -math.inf
+
+
+class LocalOptimizer:
+    """Ask/tell maximizer over the normalized unit cube.
+
+    ``ask`` returns the next batch of points (empty once ``done``); ``tell`` takes one objective
+    value per point of that batch, in order. Batches can be evaluated in parallel, and repeated
+    points within a batch are allowed (callers deduplicate through their evaluation cache).
+    ``saved_evaluations`` counts proposals the optimizer itself recognized as repeats and dropped.
+    """
+
+    def __init__(self) -> None:
+        self.done = False
+        self.saved_evaluations = 0
+        self.best_x: Optional[np.ndarray] = None
+        self.best_value = -math.inf
+
+    def ask(self) -> List[np.ndarray]:
+        raise NotImplementedError
+
+    def tell(self, values: Sequence[float]) -> None:
+        raise NotImplementedError
+
+    def _observe(self, points: Sequence[np.ndarray], values: Sequence[float]) -> None:
+        for point, value in zip(points, values):
+            value = _as_value(value)
+            if value > self.best_value:
+                self.best_value = value
+                self.best_x = np.array(point, dtype=float)
+
+
+def snap_to_lattice(x: np.ndarray, lattice: np.ndarray) -> np.ndarray:
+    """Round each coordinate with a positive lattice spacing onto ``k * spacing``, inside [0, 1]."""
+    out = np.clip(np.asarray(x, dtype=float), 0.0, 1.0)
+    gridded = lattice > 0
+    if gridded.any():
+        spacing = lattice[gridded]
+        top = np.floor(1.0 / spacing + 1e-9)
+        out[gridded] = np.minimum(np.round(out[gridded] / spacing), top) * spacing
+    return out
+
+
+def spec_lattice(specs: Sequence[ParamSpec]) -> np.ndarray:
+    """Normalized spacing of integer dimensions (``1 / width``); 0 for continuous or zero-width ones."""
+    out = np.zeros(len(specs), dtype=float)
+    for i, spec in enumerate(specs):
+        width = float(spec.high - spec.low)
+        if spec.is_int and width > 0:
+            out[i] = 1.0 / width
+    return out
+
+
+def _point_key(point: np.ndarray) -> Hashable:
+    return tuple(np.round(point, 12))
+
+
+@dataclass(frozen=True)
+class CentralDifferenceStencil:
+    """Deduplicated central-difference probes around a lattice-snapped ``center``.
+
+    ``pairs`` holds ``(dim_index, plus_index, minus_index, distance)`` into ``points``, where
+    ``distance`` is the actual normalized gap between the two probes. Dimensions whose probes
+    resolve to the same parameters are left out and get a zero gradient.
+    """
+
+    center: np.ndarray
+    points: List[np.ndarray]
+    pairs: List[Tuple[int, int, int, float]]
+    requested: int
+
+    @property
+    def saved(self) -> int:
+        return self.requested - len(self.points)
+
+    def gradient(self, values: Sequence[float]) -> np.ndarray:
+        gradient = np.zeros(self.center.size, dtype=float)
+        for dim_index, plus_index, minus_index, distance in self.pairs:
+            gradient[dim_index] = (float(values[plus_index]) - float(values[minus_index])) / distance
+        return gradient
+
+
+def central_difference_stencil(
+    center: np.ndarray,
+    *,
+    step_size: float,
+    lattice: Optional[np.ndarray] = None,
+    key: Optional[Callable[[np.ndarray], Hashable]] = None,
+    include_center: bool = False,
+) -> CentralDifferenceStencil:
+    """Build ``center +/- h_i * e_i`` probes that are distinct once mapped to parameters.
+
+    Lattice dimensions move by at least one lattice step, so an integer probe never rounds back
+    onto the center. ``key`` maps a normalized point to whatever identifies an evaluation (for
+    example the denormalized parameters); probes sharing a key are evaluated once.
+    """
+    center = np.asarray(center, dtype=float)
+    lattice = np.zeros(center.size, dtype=float) if lattice is None else np.asarray(lattice, dtype=float)
+    key = key or _point_key
+    center = snap_to_lattice(center, lattice)
+    steps = np.maximum(float(step_size), lattice)
+
+    points: List[np.ndarray] = []
+    index: Dict[Hashable, int] = {}
+
+    def add(point: np.ndarray, point_key: Hashable) -> int:
+        if point_key not in index:
+            index[point_key] = len(points)
+            points.append(point)
+        return index[point_key]
+
+    if include_center:
+        add(center, key(center))
+    pairs: List[Tuple[int, int, int, float]] = []
+    for dim_index in range(center.size):
+        plus = center.copy()
+        plus[dim_index] += steps[dim_index]
+        plus = snap_to_lattice(plus, lattice)
+        minus = center.copy()
+        minus[dim_index] -= steps[dim_index]
+        minus = snap_to_lattice(minus, lattice)
+        plus_key, minus_key = key(plus), key(minus)
+        distance = float(plus[dim_index] - minus[dim_index])
+        if plus_key == minus_key or distance <= 0:
+            continue
+        pairs.append((dim_index, add(plus, plus_key), add(minus, minus_key), distance))
+    return CentralDifferenceStencil(
+        center=center,
+        points=points,
+        pairs=pairs,
+        requested=2 * center.size + int(include_center),
+    )
+
+
+class FiniteDifferenceAscent(LocalOptimizer):
+    """Central-difference ascent with a unit-length move per step.
+
+    Probes come from :func:`central_difference_stencil`, so probes that collapse onto another
+    point of the same batch are asked for once.
+    """
+
+    def __init__(
+        self,
+        x0: np.ndarray,
+        *,
+        step_size: float,
+        learning_rate: float,
+        max_steps: int,
+        lattice: Optional[np.ndarray] = None,
+        key: Optional[Callable[[np.ndarray], Hashable]] = None,
+    ) -> None:
+        super().__init__()
+        self.x = np.asarray(x0, dtype=float)
+        self.step_size = float(step_size)
+        self.learning_rate = float(learning_rate)
+        self.max_steps = int(max_steps)
+        self.lattice = lattice
+        self.key = key
+        self.step_index = 0
+        self._stencil: Optional[CentralDifferenceStencil] = None
+        self._batch: List[np.ndarray] = []
+
+    def ask(self) -> List[np.ndarray]:
+        if self.done:
+            return []
+        if self.step_index < self.max_steps:
+            self._stencil = central_difference_stencil(
+                self.x,
+                step_size=self.step_size,
+                lattice=self.lattice,
+                key=self.key,
+                include_center=True,
+            )
+            self.saved_evaluations += self._stencil.saved
+            self._batch = list(self._stencil.points)
+        else:
+            self._stencil = None
+            self._batch = [self.x.copy()]
+        return list(self._batch)
+
+    def tell(self, values: Sequence[float]) -> None:
+        self._observe(self._batch, values)
+        if self._stencil is None:
+            self.done = True
+            return
+        gradient = self._stencil.gradient(values)
+        gradient_norm = float(np.linalg.norm(gradient))
+        if not gradient_norm > 0:
+            self.done = True
+            return
+        self.x = np.clip(self.x + self.learning_rate * (gradient / gradient_norm), 0.0, 1.0)
+        self.step_index += 1
+
+
+class CompassSearch(LocalOptimizer):
+    """Integer-aware compass (pattern) search.
+
+    Each iteration polls ``center +/- step_i * e_i`` for every dimension. Steps never drop below
+    the dimension's lattice spacing, and polls are snapped to the lattice and skipped when they
+    land on an already-visited point, so every proposal is a distinct, new parameter set. The
+    center moves to the best improving poll; otherwise all steps halve. Dimensions without a
+    lattice stop halving at ``min_step``.
+    """
+
+    def __init__(
+        self,
+        x0: np.ndarray,
+        *,
+        lattice: np.ndarray,
+        initial_step: float,
+        max_iterations: int,
+        min_step: float = 1e-3,
+        x0_value: Optional[float] = None,
+    ) -> None:
+        super().__init__()
+        self.lattice = np.asarray(lattice, dtype=float)
+        self.floor = np.where(self.lattice > 0, self.lattice, float(min_step))
+        self.steps = np.maximum(float(initial_step), self.floor)
+        self.center = snap_to_lattice(x0, self.lattice)
+        self.center_value = None if x0_value is None else _as_value(x0_value)
+        if self.center_value is not None:
+            self._observe([self.center], [self.center_value])
+        self.max_iterations = int(max_iterations)
+        self.iteration = 0
+        self.visited = {self._key(self.center)}
+        self._batch: List[np.ndarray] = []
+        self.done = self.max_iterations <= 0
+
+    @staticmethod
+    def _key(point: np.ndarray) -> tuple:
+        return tuple(np.round(point, 9))
+
+    def _polls(self) -> List[np.ndarray]:
+        polls: List[np.ndarray] = []
+        for dim_index in range(self.center.size):
+            for sign in (1.0, -1.0):
+                point = self.center.copy()
+                point[dim_index] += sign * self.steps[dim_index]
+                point = snap_to_lattice(point, self.lattice)
+                key = self._key(point)
+                if key in self.visited:
+                    self.saved_evaluations += 1
+                    continue
+                self.visited.add(key)
+                polls.append(point)
+        return polls
+
+    def _shrink(self) -> bool:
+        shrunk = np.maximum(self.steps / 2.0, self.floor)
+        changed = bool(np.any(shrunk < self.steps))
+        self.steps = shrunk
+        return changed
+
+    def ask(self) -> List[np.ndarray]:
+        if self.done:
+            return []
+        if self.center_value is None:
+            self._batch = [self.center.copy()]
+            return list(self._batch)
+        polls = self._polls()
+        # Everything around the center was already visited: refine the mesh until something is new.
+        while not polls and self._shrink():
+            polls = self._polls()
+        if not polls:
+            self.done = True
+        self._batch = polls
+        return list(polls)
+
+    def tell(self, values: Sequence[float]) -> None:
+        self._observe(self._batch, values)
+        if self.center_value is None:
+            self.center_value = _as_value(values[0])
+            return
+        scores = [_as_value(v) for v in values]
+        best = int(np.argmax(scores)) if scores else -1
+        if best >= 0 and scores[best] > self.center_value:
+            self.center = self._batch[best]
+            self.center_value = scores[best]
+        elif not self._shrink():
+            self.done = True
+        self.iteration += 1
+        if self.iteration >= self.max_iterations:
+            self.done = True
+
+
+class BatchCMAES(LocalOptimizer):
+    """(mu/mu_w, lambda)-CMA-ES whose whole generation is one parallel batch.
+
+    Samples are snapped to the lattice before evaluation and the update uses the snapped steps.
+    On lattice dimensions the per-coordinate standard deviation is kept at or above half a lattice
+    spacing, so integer dimensions never freeze onto one value, and duplicate samples within a
+    generation are redrawn.
+    """
+
+    def __init__(
+        self,
+        x0: np.ndarray,
+        *,
+        lattice: np.ndarray,
+        sigma0: float,
+        max_generations: int,
+        popsize: Optional[int] = None,
+        seed: int = 0,
+        min_sigma: float = 1e-4,
+    ) -> None:
+        super().__init__()
+        self.lattice = np.asarray(lattice, dtype=float)
+        dim = self.lattice.size
+        self.dim = dim
+        self.mean = snap_to_lattice(x0, self.lattice)
+        self.sigma = float(sigma0)
+        self.min_sigma = float(min_sigma)
+        self.max_generations = int(max_generations)
+        self.generation = 0
+        self.rng = np.random.default_rng(seed)
+
+        self.popsize = int(popsize) if popsize else 4 + int(3 * math.log(max(dim, 1)))
+        self.mu = self.popsize // 2
+        weights = math.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = weights / weights.sum()
+        self.mueff = 1.0 / float(np.sum(self.weights**2))
+        self.cc = (4.0 + self.mueff / dim) / (dim + 4.0 + 2.0 * self.mueff / dim)
+        self.cs = (self.mueff + 2.0) / (dim + self.mueff + 5.0)
+        self.c1 = 2.0 / ((dim + 1.3) ** 2 + self.mueff)
+        self.cmu = min(1.0 - self.c1, 2.0 * (self.mueff - 2.0 + 1.0 / self.mueff) / ((dim + 2.0) ** 2 + self.mueff))
+        self.damps = 1.0 + 2.0 * max(0.0, math.sqrt((self.mueff - 1.0) / (dim + 1.0)) - 1.0) + self.cs
+        self.chi_n = math.sqrt(dim) * (1.0 - 1.0 / (4.0 * dim) + 1.0 / (21.0 * dim * dim))
+
+        self.cov = np.eye(dim)
+        self.pc = np.zeros(dim)
+        self.ps = np.zeros(dim)
+        self._eig()
+        self._batch: List[np.ndarray] = []
+        self.done = self.max_generations <= 0
+
+    def _eig(self) -> None:
+        self.cov = np.triu(self.cov) + np.triu(self.cov, 1).T
+        eigvals, self.basis = np.linalg.eigh(self.cov)
+        self.scales = np.sqrt(np.maximum(eigvals, 1e-20))
+        self.inv_sqrt = self.basis @ np.diag(1.0 / self.scales) @ self.basis.T
+
+    def _sample(self) -> np.ndarray:
+        z = self.rng.standard_normal(self.dim)
+        return snap_to_lattice(self.mean + self.sigma * (self.basis @ (self.scales * z)), self.lattice)
+
+    def ask(self) -> List[np.ndarray]:
+        if self.done:
+            return []
+        seen: set[tuple] = set()
+        batch: List[np.ndarray] = []
+        for _ in range(self.popsize):
+            point = self._sample()
+            for _retry in range(10):
+                if tuple(np.round(point, 9)) not in seen:
+                    break
+                point = self._sample()
+            seen.add(tuple(np.round(point, 9)))
+            batch.append(point)
+        self._batch = batch
+        return list(batch)
+
+    def tell(self, values: Sequence[float]) -> None:
+        self._observe(self._batch, values)
+        scores = np.array([_as_value(v) for v in values], dtype=float)
+        order = np.argsort(-scores, kind="stable")[: self.mu]
+        steps = np.vstack([(self._batch[i] - self.mean) / self.sigma for i in order])
+
+        old_mean = self.mean
+        self.mean = old_mean + self.sigma * (self.weights @ steps)
+        mean_step = (self.mean - old_mean) / self.sigma
+        self.ps = (1.0 - self.cs) * self.ps + math.sqrt(self.cs * (2.0 - self.cs) * self.mueff) * (
+            self.inv_sqrt @ mean_step
+        )
+        ps_norm = float(np.linalg.norm(self.ps))
+        threshold = (1.4 + 2.0 / (self.dim + 1.0)) * self.chi_n
+        hsig = ps_norm / math.sqrt(1.0 - (1.0 - self.cs) ** (2 * (self.generation + 1))) < threshold
+        pc_scale = float(hsig) * math.sqrt(self.cc * (2.0 - self.cc) * self.mueff)
+        self.pc = (1.0 - self.cc) * self.pc + pc_scale * mean_step
+        rank_mu = (steps.T * self.weights) @ steps
+        self.cov = (
+            (1.0 - self.c1 - self.cmu) * self.cov
+            + self.c1 * (np.outer(self.pc, self.pc) + (not hsig) * self.cc * (2.0 - self.cc) * self.cov)
+            + self.cmu * rank_mu
+        )
+        self.sigma *= math.exp((self.cs / self.damps) * (ps_norm / self.chi_n - 1.0))
+
+        # Integer margin: keep at least half a lattice spacing of spread on lattice dimensions.
+        floor = (0.5 * self.lattice / self.sigma) ** 2
+        diag = np.diag(self.cov)
+        self.cov[np.diag_indices(self.dim)] = np.where(self.lattice > 0, np.maximum(diag, floor), diag)
+        self._eig()
+
+        self.generation += 1
+        if self.generation >= self.max_generations or self.sigma * float(self.scales.max()) < self.min_sigma:
+            self.done = True
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from typing import Optional
+
+import numpy as np
+from scipy.spatial import cKDTree
+
+
+class TrialNeighborhoodIndex:
+    """Chebyshev (p=inf) neighborhood queries over normalized trial params.
+
+    The KD-tree covers trials persisted at the last checkpoint; rows appended since then are
+    passed in as ``extra`` and scanned densely, so the tree is only rebuilt when the trials
+    frame changes.
+    """
+
+    def __init__(self, dim: int) -> None:
+        self.dim = int(dim)
+        self.tree: Optional[cKDTree] = None
+        self.size = 0
+
+    def rebuild(self, points: np.ndarray) -> None:
+        self.size = int(points.shape[0])
+        self.tree = cKDTree(points) if self.size else None
+
+    def count_within(self, center: np.ndarray, radius: float, extra: Optional[np.ndarray] = None) -> int:
+        count = 0
+        if self.tree is not None:
+            count += int(self.tree.query_ball_point(center, r=radius, p=np.inf, return_length=True))
+        if extra is not None and extra.shape[0]:
+            count += int(np.sum(np.max(np.abs(extra - center[None, :]), axis=1) <= radius))
+        return count
+
+    def mask_within(self, centers: np.ndarray, radius: float) -> np.ndarray:
+        keep = np.zeros(self.size, dtype=bool)
+        if self.tree is None or centers.shape[0] == 0:
+            return keep
+        for hits in self.tree.query_ball_point(centers, r=radius, p=np.inf):
+            keep[hits] = True
+        return keep
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import os
+import shutil
+from pathlib import Path
+from typing import List, Optional
+
+import pandas as pd
+
+
+class ParquetPartStore:
+    """A parquet file that grows through append-only part files kept next to it.
+
+    :meth:`append` writes only the new rows, as ``<name>.parts/part-<n>.parquet``, so a checkpoint
+    costs O(new rows). :meth:`read` returns the base file followed by the parts in write order;
+    :meth:`compact` folds the parts back into the base file so other readers see one parquet.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.parts_dir = self.path.with_name(self.path.name + ".parts")
+        self.parts_written = 0
+
+    def _parts(self) -> List[Path]:
+        if not self.parts_dir.exists():
+            return []
+        return sorted(self.parts_dir.glob("part-*.parquet"))
+
+    def append(self, df: pd.DataFrame) -> None:
+        if df.empty:
+            return
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        parts = self._parts()
+        index = int(parts[-1].stem.split("-")[1]) + 1 if parts else 0
+        target = self.parts_dir / f"part-{index:06d}.parquet"
+        tmp = target.with_name(target.name + ".tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, target)
+        self.parts_written += 1
+
+    def read(self) -> Optional[pd.DataFrame]:
+        frames = [pd.read_parquet(self.path)] if self.path.exists() else []
+        frames.extend(pd.read_parquet(part) for part in self._parts())
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return pd.read_parquet(self.path) if self.path.exists() else None
+        return pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+    def compact(self, unique: Optional[str] = None) -> None:
+        """Fold the parts into the base file; with ``unique``, keep only the last row per value of that column."""
+        if not self._parts():
+            return
+        df = self.read()
+        if unique is not None:
+            df = df.drop_duplicates(unique, keep="last").reset_index(drop=True)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(self.path.name + ".tmp")
+        df.to_parquet(tmp, index=False)
+        os.replace(tmp, self.path)
+        shutil.rmtree(self.parts_dir)
+
+    def clear(self) -> None:
+        self.path.unlink(missing_ok=True)
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+from .work_queue import WorkQueueExecutor
+
+
+def delta_entry(pair: str, cache: str, sequence: int) -> str:
+    """Work-queue state name for the ``sequence``-th batch of new entries in one of ``pair``'s caches."""
+    return f"{pair}/{cache}/{int(sequence)}"
+
+
+def split_entry(name: str) -> Tuple[str, Optional[str]]:
+    """``(pair, cache)`` for a :func:`delta_entry` name, ``(pair, None)`` for a bare pair state entry."""
+    pair, _, delta = name.partition("/")
+    if not delta:
+        return pair, None
+    return pair, delta.rpartition("/")[0]
+
+
+class RemotePairPublisher:
+    """Coordinator side of one pair's state on a :class:`WorkQueueExecutor`.
+
+    Remote workers cannot inherit state by fork, so the pair's state is published once and its
+    caches follow as numbered deltas; workers apply them in publish order with :func:`apply_entries`.
+    """
+
+    def __init__(self, pair: str) -> None:
+        self.pair = str(pair)
+        self.state_published = False
+        self.deltas_published = 0
+        self._sent: Dict[str, int] = {}
+
+    def publish_state(self, executor: WorkQueueExecutor, state: Any) -> None:
+        if self.state_published:
+            return
+        executor.publish(self.pair, state)
+        self.state_published = True
+
+    def publish_delta(self, executor: WorkQueueExecutor, cache: str, entries: Mapping[str, Any]) -> None:
+        if not entries:
+            return
+        executor.publish(delta_entry(self.pair, cache, self.deltas_published), dict(entries))
+        self.deltas_published += 1
+
+    def publish_grown(self, executor: WorkQueueExecutor, cache: str, entries: Mapping[str, Any]) -> None:
+        """Send the entries of an insert-only mapping added since the previous call for ``cache``."""
+        sent = self._sent.get(cache, 0)
+        self.publish_delta(executor, cache, dict(islice(entries.items(), sent, None)))
+        self._sent[cache] = len(entries)
+
+
+def apply_entries(
+    entries: Mapping[str, Any],
+    *,
+    install_state: Callable[[str, Any], None],
+    extend_cache: Callable[[str, str, Dict[str, Any]], None],
+) -> None:
+    """Worker side: route published entries, in order, to the pair state or cache delta callbacks."""
+    for name, value in entries.items():
+        pair, cache = split_entry(name)
+        if cache is None:
+            install_state(pair, value)
+        else:
+            extend_cache(pair, cache, value)
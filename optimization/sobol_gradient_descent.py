@@ -13,9 +13,11 @@ import numpy as np
 import pandas as pd
 from scipy.stats import qmc
 
-from .constrained_bo import ParamSpec, TrialResult
-from .goal_registry import GoalEvaluation, evaluate_goals
+from .constrained_bo import TRIAL_METRICS, ParamSpec, TrialResult, TrialTable, eval_cache_from_frame
+from .goal_registry import GoalEngine
 from .goals import Goal
+from .local_search import central_difference_stencil, spec_lattice
+from .telemetry import RunTelemetry, summary_line
 
 _SOBOL_BALANCE_WARNING = r"The balance properties of Sobol' points require n to be a power of 2\."
 
@@ -72,6 +74,8 @@ class ConstrainedSobolGradientOptimizer:
         parallel_backend: str = "thread",
         workers: int = 1,
         logger: Optional[Callable[[str], None]] = None,
+        telemetry_path: Optional[str] = None,
+        telemetry_interval_seconds: float = 5.0,
     ) -> None:
         if sobol_samples <= 0:
             raise ValueError("sobol_samples must be > 0")
@@ -88,6 +92,7 @@ class ConstrainedSobolGradientOptimizer:
 
         self.search_space = search_space
         self.goals = goals
+        self._goal_engine = GoalEngine(goals)
         self.evaluator = evaluator
         self.trials_parquet = Path(trials_parquet)
         self.eval_cache_parquet = Path(eval_cache_parquet) if eval_cache_parquet else None
@@ -109,15 +114,23 @@ class ConstrainedSobolGradientOptimizer:
         self.parallel_backend = str(parallel_backend).strip().lower()
         if self.parallel_backend not in {"thread", "process"}:
             raise ValueError("parallel_backend must be one of: thread, process")
-        if self.parallel_backend == "process" and self.eval_cache_enabled:
-            raise ValueError("Process backend requires eval cache disabled (set max_eval_cache_entries=0).")
         self.workers = max(1, int(workers))
         self.logger = logger or (lambda message: print(message, flush=True))
+        self.telemetry = RunTelemetry(
+            telemetry_path,
+            run=self.trials_parquet.stem,
+            workers=self.workers,
+            interval_seconds=telemetry_interval_seconds,
+        )
 
         self.param_names = list(search_space)
         self.dim = len(self.param_names)
+        self.lattice = spec_lattice([search_space[name] for name in self.param_names])
         self.rng = np.random.default_rng(self.seed)
+        self.stencil_saved_evaluations = 0
 
+        # Trials read back from trials_parquet stay a frame; rows produced by this run are appended after them.
+        self._loaded_trials_df = pd.DataFrame()
         self._trial_rows: List[Dict[str, object]] = []
         self._eval_cache: Dict[str, Dict[str, float]] = {}
         self._eval_cache_lock = Lock()
@@ -156,10 +169,6 @@ class ConstrainedSobolGradientOptimizer:
                 params[name] = float(raw)
         return params
 
-    def _penalized(self, objective_score: float, violations: Dict[str, float]) -> float:
-        total_violation = float(sum(max(0.0, v) for v in violations.values()))
-        return objective_score - self.constraint_penalty * total_violation
-
     def _params_cache_key(self, params: Dict[str, float]) -> str:
         stable: Dict[str, float] = {}
         for name in self.param_names:
@@ -183,20 +192,7 @@ class ConstrainedSobolGradientOptimizer:
         ]
         columns.extend(f"param__{name}" for name in self.param_names)
 
-        metric_cols = sorted(
-            {
-                "total",
-                "wins",
-                "win_rate",
-                "itm_expiries",
-                "itm_rate",
-                "total_pnl",
-                "avg_pnl",
-                "median_pnl",
-                "avg_return_on_spot",
-                "max_drawdown",
-            }
-        )
+        metric_cols = sorted(TRIAL_METRICS)
         columns.extend(f"metric__{name}" for name in metric_cols)
         columns.extend(f"goal__{goal.name}" for goal in self.goals)
         columns.extend(f"viol__{goal.name}" for goal in self.goals)
@@ -220,18 +216,7 @@ class ConstrainedSobolGradientOptimizer:
             "objective_score": trial.goals.objective_score,
         }
         row.update({f"param__{k}": v for k, v in trial.params.items()})
-        for key in {
-            "total",
-            "wins",
-            "win_rate",
-            "itm_expiries",
-            "itm_rate",
-            "total_pnl",
-            "avg_pnl",
-            "median_pnl",
-            "avg_return_on_spot",
-            "max_drawdown",
-        }:
+        for key in TRIAL_METRICS:
             row[f"metric__{key}"] = trial.metrics.get(key)
         for goal in self.goals:
             row[f"goal__{goal.name}"] = trial.goals.values.get(goal.name)
@@ -241,7 +226,8 @@ class ConstrainedSobolGradientOptimizer:
     def _persist_trials(self) -> None:
         self.trials_parquet.parent.mkdir(parents=True, exist_ok=True)
         header = self._trials_header()
-        df = pd.DataFrame(self._trial_rows)
+        frames = [df for df in (self._loaded_trials_df, pd.DataFrame(self._trial_rows)) if not df.empty]
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else (frames[0] if frames else pd.DataFrame())
         for col in header:
             if col not in df.columns:
                 df[col] = np.nan
@@ -257,18 +243,7 @@ class ConstrainedSobolGradientOptimizer:
         rows = []
         for key, metrics in self._eval_cache.items():
             row = {"cache_key": key}
-            for metric_name in [
-                "total",
-                "wins",
-                "win_rate",
-                "itm_expiries",
-                "itm_rate",
-                "total_pnl",
-                "avg_pnl",
-                "median_pnl",
-                "avg_return_on_spot",
-                "max_drawdown",
-            ]:
+            for metric_name in TRIAL_METRICS:
                 row[f"metric__{metric_name}"] = metrics.get(metric_name)
             rows.append(row)
         pd.DataFrame(rows).to_parquet(self.eval_cache_parquet, index=False)
@@ -280,24 +255,78 @@ class ConstrainedSobolGradientOptimizer:
         if self.eval_cache_parquet is None or not self.eval_cache_parquet.exists():
             return
         df = pd.read_parquet(self.eval_cache_parquet)
-        out: Dict[str, Dict[str, float]] = {}
-        for _, row in df.iterrows():
-            key = str(row.get("cache_key", ""))
-            if not key:
-                continue
-            out[key] = {
-                "total": float(row.get("metric__total", 0.0)),
-                "wins": float(row.get("metric__wins", 0.0)),
-                "win_rate": float(row.get("metric__win_rate", 0.0)),
-                "itm_expiries": float(row.get("metric__itm_expiries", 0.0)),
-                "itm_rate": float(row.get("metric__itm_rate", 0.0)),
-                "total_pnl": float(row.get("metric__total_pnl", 0.0)),
-                "avg_pnl": float(row.get("metric__avg_pnl", 0.0)),
-                "median_pnl": float(row.get("metric__median_pnl", 0.0)),
-                "avg_return_on_spot": float(row.get("metric__avg_return_on_spot", 0.0)),
-                "max_drawdown": float(row.get("metric__max_drawdown", 0.0)),
-            }
-        self._eval_cache = out
+        self._eval_cache = eval_cache_from_frame(df)
+
+    def _evaluate_metrics(self, params: Dict[str, float]) -> tuple[Dict[str, float], bool]:
+        if not self.eval_cache_enabled:
+            return self.evaluator(params), False
+
+        cache_key = self._params_cache_key(params)
+        with self._eval_cache_lock:
+            cached = self._eval_cache.get(cache_key)
+        if cached is not None:
+            return dict(cached), True
+        metrics = self.evaluator(params)
+        with self._eval_cache_lock:
+            existing = self._eval_cache.get(cache_key)
+            if existing is not None:
+                return dict(existing), True
+            if self.max_eval_cache_entries < 0 or len(self._eval_cache) < self.max_eval_cache_entries:
+                self._eval_cache[cache_key] = dict(metrics)
+                self._cache_dirty = True
+        return metrics, False
+
+    def _evaluate_in_processes(self, params_list: List[Dict[str, float]]) -> List[tuple[Dict[str, float], bool]]:
+        """Process-backend batch: the cache stays in the parent and only distinct misses go to workers."""
+        if not self.eval_cache_enabled:
+            return [(metrics, False) for metrics in self._executor.map(_process_eval_params, params_list)]
+
+        keys = [self._params_cache_key(params) for params in params_list]
+        evaluated: List[Optional[tuple[Dict[str, float], bool]]] = [None] * len(params_list)
+        misses: Dict[str, int] = {}
+        with self._eval_cache_lock:
+            for i, key in enumerate(keys):
+                cached = self._eval_cache.get(key)
+                if cached is not None:
+                    evaluated[i] = (dict(cached), True)
+                elif key not in misses:
+                    misses[key] = i
+        fresh = dict(zip(misses, self._executor.map(_process_eval_params, [params_list[i] for i in misses.values()])))
+        with self._eval_cache_lock:
+            for key, metrics in fresh.items():
+                if key in self._eval_cache:
+                    continue
+                if self.max_eval_cache_entries < 0 or len(self._eval_cache) < self.max_eval_cache_entries:
+                    self._eval_cache[key] = dict(metrics)
+                    self._cache_dirty = True
+        for i, key in enumerate(keys):
+            if evaluated[i] is None:
+                # Repeats of a key within the batch reuse the first evaluation and count as cache hits.
+                first = misses[key] == i
+                evaluated[i] = (fresh[key] if first else dict(fresh[key]), not first)
+        return evaluated
+
+    def _trials_from_metrics(
+        self,
+        items: Sequence[tuple[int, Dict[str, float]]],
+        evaluated: Sequence[tuple[Dict[str, float], bool]],
+    ) -> List[tuple[TrialResult, bool]]:
+        """Score a whole batch of evaluations with one goal-engine call."""
+        batch = self._goal_engine.evaluate_records([metrics for metrics, _cache_hit in evaluated])
+        penalized = batch.penalized(self.constraint_penalty)
+        return [
+            (
+                TrialResult(
+                    trial_id=trial_id,
+                    params=dict(params),
+                    metrics=metrics,
+                    goals=batch.row(i),
+                    penalized_score=float(penalized[i]),
+                ),
+                cache_hit,
+            )
+            for i, ((trial_id, params), (metrics, cache_hit)) in enumerate(zip(items, evaluated))
+        ]
 
     def _evaluate_trial(
         self,
@@ -305,45 +334,13 @@ class ConstrainedSobolGradientOptimizer:
         trial_id: int,
         params: Dict[str, float],
     ) -> tuple[TrialResult, bool]:
-        if not self.eval_cache_enabled:
-            metrics = self.evaluator(params)
-            goals_eval = evaluate_goals(self.goals, metrics)
-            trial = TrialResult(
-                trial_id=trial_id,
-                params=dict(params),
-                metrics=metrics,
-                goals=goals_eval,
-                penalized_score=self._penalized(goals_eval.objective_score, goals_eval.violations),
-            )
-            return trial, False
+        return self._trials_from_metrics([(trial_id, params)], [self._evaluate_metrics(params)])[0]
 
-        cache_key = self._params_cache_key(params)
-        with self._eval_cache_lock:
-            cached = self._eval_cache.get(cache_key)
-        cache_hit = cached is not None
-        if cache_hit:
-            metrics = dict(cached)
-        else:
-            metrics = self.evaluator(params)
-            with self._eval_cache_lock:
-                existing = self._eval_cache.get(cache_key)
-                if existing is None:
-                    if self.max_eval_cache_entries < 0 or len(self._eval_cache) < self.max_eval_cache_entries:
-                        self._eval_cache[cache_key] = dict(metrics)
-                        self._cache_dirty = True
-                else:
-                    metrics = dict(existing)
-                    cache_hit = True
-
-        goals_eval = evaluate_goals(self.goals, metrics)
-        trial = TrialResult(
-            trial_id=trial_id,
-            params=dict(params),
-            metrics=metrics,
-            goals=goals_eval,
-            penalized_score=self._penalized(goals_eval.objective_score, goals_eval.violations),
-        )
-        return trial, cache_hit
+    def _observe_evaluations(self, evaluated: Sequence[tuple[TrialResult, bool]]) -> None:
+        cache_hits = sum(1 for _trial, cache_hit in evaluated if cache_hit)
+        self.telemetry.record_evaluations(len(evaluated) - cache_hits)
+        self.telemetry.record_cache_hits(cache_hits)
+        self.telemetry.maybe_write()
 
     def _evaluate_batch(
         self,
@@ -351,6 +348,25 @@ class ConstrainedSobolGradientOptimizer:
         trial_id_start: int,
         params_batch: Sequence[Dict[str, float]],
         max_workers: Optional[int] = None,
+    ) -> tuple[List[tuple[TrialResult, bool]], int]:
+        worker_count = max(1, int(max_workers if max_workers is not None else self.workers))
+        batch_size = len(params_batch)
+        self.telemetry.set_dispatch(min(worker_count, batch_size), queued=max(0, batch_size - worker_count))
+        out, next_trial_id = self._dispatch_batch(
+            trial_id_start=trial_id_start,
+            params_batch=params_batch,
+            max_workers=max_workers,
+        )
+        self.telemetry.set_dispatch(0)
+        self._observe_evaluations(out)
+        return out, next_trial_id
+
+    def _dispatch_batch(
+        self,
+        *,
+        trial_id_start: int,
+        params_batch: Sequence[Dict[str, float]],
+        max_workers: Optional[int] = None,
     ) -> tuple[List[tuple[TrialResult, bool]], int]:
         params_list = list(params_batch)
         if not params_list:
@@ -359,8 +375,8 @@ class ConstrainedSobolGradientOptimizer:
         items = [(trial_id_start + i, params) for i, params in enumerate(params_list)]
 
         if worker_count <= 1 or len(items) <= 1:
-            out = [self._evaluate_trial(trial_id=item[0], params=item[1]) for item in items]
-            return out, trial_id_start + len(items)
+            evaluated = [self._evaluate_metrics(params) for params in params_list]
+            return self._trials_from_metrics(items, evaluated), trial_id_start + len(items)
 
         if self.parallel_backend == "process":
             if self._executor is None:
@@ -369,31 +385,13 @@ class ConstrainedSobolGradientOptimizer:
                     initializer=_process_init,
                     initargs=(self.evaluator,),
                 )
-            metrics_batch = list(self._executor.map(_process_eval_params, params_list))
-            out = []
-            for i, metrics in enumerate(metrics_batch):
-                trial_id = trial_id_start + i
-                params = params_list[i]
-                goals_eval = evaluate_goals(self.goals, metrics)
-                trial = TrialResult(
-                    trial_id=trial_id,
-                    params=dict(params),
-                    metrics=metrics,
-                    goals=goals_eval,
-                    penalized_score=self._penalized(goals_eval.objective_score, goals_eval.violations),
-                )
-                out.append((trial, False))
-            return out, trial_id_start + len(items)
+            evaluated = self._evaluate_in_processes(params_list)
+            return self._trials_from_metrics(items, evaluated), trial_id_start + len(items)
 
         if self._executor is None:
             self._executor = ThreadPoolExecutor(max_workers=worker_count)
-        out = list(
-            self._executor.map(
-                lambda item: self._evaluate_trial(trial_id=item[0], params=item[1]),
-                items,
-            )
-        )
-        return out, trial_id_start + len(items)
+        evaluated = list(self._executor.map(self._evaluate_metrics, params_list))
+        return self._trials_from_metrics(items, evaluated), trial_id_start + len(items)
 
     def _sobol_points(self, n: int) -> np.ndarray:
         sampler = qmc.Sobol(d=self.dim, scramble=True, seed=self.seed)
@@ -417,94 +415,121 @@ class ConstrainedSobolGradientOptimizer:
         noise = local_rng.normal(loc=0.0, scale=self.local_probe_radius, size=(n, self.dim))
         return np.clip(center[None, :] + noise, 0.0, 1.0)
 
-    def _trial_from_row(self, row: Dict[str, object]) -> TrialResult:
-        trial_id = int(row["trial_id"])
-        params: Dict[str, float] = {}
-        for name in self.param_names:
-            params[name] = float(row.get(f"param__{name}", 0.0))
-
-        metrics: Dict[str, float] = {}
-        for key in {
-            "total",
-            "wins",
-            "win_rate",
-            "itm_expiries",
-            "itm_rate",
-            "total_pnl",
-            "avg_pnl",
-            "median_pnl",
-            "avg_return_on_spot",
-            "max_drawdown",
-        }:
-            value = row.get(f"metric__{key}", 0.0)
-            metrics[key] = float(0.0 if pd.isna(value) else value)
-
-        values: Dict[str, float] = {}
-        violations: Dict[str, float] = {}
-        for goal in self.goals:
-            v = row.get(f"goal__{goal.name}", 0.0)
-            d = row.get(f"viol__{goal.name}", 0.0)
-            values[goal.name] = float(0.0 if pd.isna(v) else v)
-            violations[goal.name] = float(0.0 if pd.isna(d) else d)
-
-        feasible_raw = row.get("feasible", 0)
-        feasible = bool(int(feasible_raw)) if not pd.isna(feasible_raw) else False
-        objective_raw = row.get("objective_score", 0.0)
-        objective_score = float(0.0 if pd.isna(objective_raw) else objective_raw)
-        penalized_raw = row.get("penalized_score", 0.0)
-        penalized = float(0.0 if pd.isna(penalized_raw) else penalized_raw)
-
-        goals_eval = GoalEvaluation(
-            values=values,
-            violations=violations,
-            feasible=feasible,
-            objective_score=objective_score,
-        )
-        return TrialResult(
-            trial_id=trial_id,
-            params=params,
-            metrics=metrics,
-            goals=goals_eval,
-            penalized_score=penalized,
-        )
-
-    def _load_trials_state(self) -> tuple[List[TrialResult], Dict[int, int]]:
+    def _load_trials_state(self) -> tuple[TrialTable, Dict[int, int]]:
+        empty = TrialTable.empty(self.param_names)
         if not self.trials_parquet.exists():
-            return [], {}
+            return empty, {}
         df = pd.read_parquet(self.trials_parquet)
         if df.empty:
-            return [], {}
+            return empty, {}
 
         if "trial_id" not in df.columns:
-            return [], {}
+            return empty, {}
         df = df.sort_values("trial_id").reset_index(drop=True)
-        rows = df.to_dict(orient="records")
 
-        self._trial_rows = rows
-        self._last_persisted_trials_rows = int(len(rows))
+        self._loaded_trials_df = df
+        self._trial_rows = []
+        self._last_persisted_trials_rows = int(len(df))
         self._trials_parquet_write_count = max(1, self._trials_parquet_write_count)
 
-        all_trials: List[TrialResult] = []
-        lineage: Dict[int, int] = {}
-        for row in rows:
-            trial = self._trial_from_row(row)
-            all_trials.append(trial)
-            parent_raw = row.get("parent_trial_id")
-            if parent_raw is None or pd.isna(parent_raw):
-                lineage[trial.trial_id] = trial.trial_id
-            else:
-                lineage[trial.trial_id] = int(parent_raw)
-
-        return all_trials, lineage
+        table = TrialTable.from_frame(df, param_names=self.param_names, goals=self.goals, stored_goals=True)
+        trial_ids = table.trial_ids
+        if "parent_trial_id" in df.columns:
+            parents = pd.to_numeric(df["parent_trial_id"], errors="coerce").to_numpy(dtype=float)
+            roots = np.where(np.isnan(parents), trial_ids, parents).astype(np.int64)
+        else:
+            roots = trial_ids
+        lineage = dict(zip(trial_ids.tolist(), roots.tolist()))
+        return table, lineage
 
-    def _drop_trials_by_ids(self, trial_ids: set[int], all_trials: List[TrialResult], lineage: Dict[int, int]) -> None:
+    def _drop_trials_by_ids(self, trial_ids: set[int], all_trials: TrialTable, lineage: Dict[int, int]) -> None:
         if not trial_ids:
             return
-        all_trials[:] = [t for t in all_trials if t.trial_id not in trial_ids]
+        all_trials.drop(trial_ids)
+        loaded = self._loaded_trials_df
+        if not loaded.empty:
+            keep = ~loaded["trial_id"].isin(list(trial_ids)).to_numpy(dtype=bool)
+            self._loaded_trials_df = loaded[keep].reset_index(drop=True)
         self._trial_rows = [r for r in self._trial_rows if int(r.get("trial_id", -1)) not in trial_ids]
-        for tid in list(lineage.keys()):
-            if tid in trial_ids:
-                del lineage[tid]
+        for tid in trial_ids:
+            lineage.pop(tid, None)
+
+    def _trial_lineage_columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """trial_id, phase and parent_trial_id (NaN for roots) of every trial row, loaded rows first."""
+        loaded = self._loaded_trials_df
+        rows = self._trial_rows
+        ids = np.concatenate(
+            [
+                pd.to_numeric(loaded.get("trial_id", pd.Series(dtype=float)), errors="coerce").to_numpy(dtype=float),
+                np.asarray([float(r.get("trial_id", -1)) for r in rows], dtype=float),
+            ]
+        )
+        phases = np.concatenate(
+            [
+                loaded["phase"].astype(str).to_numpy(dtype=object)
+                if "phase" in loaded.columns
+                else np.full(len(loaded), "", dtype=object),
+                np.asarray([str(r.get("phase", "")) for r in rows], dtype=object),
+            ]
+        )
+        parents = np.concatenate(
+            [
+                pd.to_numeric(loaded.get("parent_trial_id", pd.Series(np.nan, index=loaded.index)), errors="coerce")
+                .to_numpy(dtype=float),
+                np.asarray(
+                    [np.nan if r.get("parent_trial_id") is None else float(r["parent_trial_id"]) for r in rows],
+                    dtype=float,
+                ),
+            ]
+        )
+        return np.nan_to_num(ids, nan=-1.0).astype(np.int64), phases, parents
+
+    @staticmethod
+    def _next_trial_id(all_trials: TrialTable) -> int:
+        trial_ids = all_trials.trial_id_array()
+        return int(trial_ids.max()) + 1 if trial_ids.size else 0
+
+    @staticmethod
+    def _trials_at(all_trials: TrialTable, trial_ids: np.ndarray) -> List[TrialResult]:
+        """The trials with these ids, in trial_id order; only they are built."""
+        table_ids = all_trials.trial_id_array()
+        positions = np.flatnonzero(np.isin(table_ids, trial_ids))
+        positions = positions[np.argsort(table_ids[positions], kind="stable")]
+        return [all_trials[i] for i in positions.tolist()]
+
+    @staticmethod
+    def _related_trials(
+        all_trials: TrialTable,
+        lineage: Dict[int, int],
+        seed_ids: Sequence[int],
+    ) -> Dict[int, List[TrialResult]]:
+        """Trials whose lineage root is one of ``seed_ids``, grouped by seed in table order."""
+        related: Dict[int, List[TrialResult]] = {int(seed_id): [] for seed_id in seed_ids}
+        table_ids = all_trials.trial_id_array()
+        roots = np.fromiter((lineage.get(tid, tid) for tid in table_ids.tolist()), dtype=np.int64, count=len(table_ids))
+        for position in np.flatnonzero(np.isin(roots, list(related))).tolist():
+            related[int(roots[position])].append(all_trials[position])
+        return related
+
+    @staticmethod
+    def _best_positions(all_trials: TrialTable) -> List[int]:
+        """Positions of the trials ``run``'s best-trial trackers settle on, in table order."""
+        if not len(all_trials):
+            return []
+        positions = {int(np.argmax(all_trials.penalized_scores()))}
+        feasible = np.flatnonzero(all_trials.feasible_flags())
+        if feasible.size:
+            positions.add(int(feasible[np.argmax(all_trials.objective_scores()[feasible])]))
+            # np.lexsort is stable and its primary key is the last: itm, then |drawdown|, then -avg_pnl.
+            itm_rank = np.lexsort(
+                (
+                    -all_trials.metric_values("avg_pnl")[feasible],
+                    np.abs(all_trials.metric_values("max_drawdown")[feasible]),
+                    all_trials.metric_values("itm_expiries")[feasible],
+                )
+            )
+            positions.add(int(feasible[itm_rank[0]]))
+        return sorted(positions)
 
     def _estimate_gradient(
         self,
@@ -514,43 +539,37 @@ class ConstrainedSobolGradientOptimizer:
         parent_trial_id: int,
         seed_rank: int,
     ) -> tuple[np.ndarray, List[tuple[TrialResult, str, Optional[int], Optional[int], bool]], int]:
-        grad = np.zeros(self.dim, dtype=float)
-        emitted: List[tuple[TrialResult, str, Optional[int], Optional[int], bool]] = []
-        params_batch: List[Dict[str, float]] = []
-        for j in range(self.dim):
-            step_vec = np.zeros(self.dim, dtype=float)
-            step_vec[j] = self.gradient_step_size
-            x_plus = np.clip(x_center + step_vec, 0.0, 1.0)
-            x_minus = np.clip(x_center - step_vec, 0.0, 1.0)
-            params_batch.append(self._denormalize(x_plus))
-            params_batch.append(self._denormalize(x_minus))
-
+        stencil = central_difference_stencil(
+            x_center,
+            step_size=self.gradient_step_size,
+            lattice=self.lattice,
+            key=lambda x: self._params_cache_key(self._denormalize(x)),
+        )
+        self.stencil_saved_evaluations += stencil.saved
+        params_batch = [self._denormalize(x) for x in stencil.points]
         evaluated, next_trial_id = self._evaluate_batch(trial_id_start=trial_id_start, params_batch=params_batch)
+        emitted: List[tuple[TrialResult, str, Optional[int], Optional[int], bool]] = []
         for trial, cache_hit in evaluated:
             emitted.append((trial, "gradient_probe", parent_trial_id, seed_rank, cache_hit))
-
-        for j in range(self.dim):
-            trial_plus = evaluated[2 * j][0]
-            trial_minus = evaluated[2 * j + 1][0]
-            diff = float(trial_plus.penalized_score - trial_minus.penalized_score)
-            grad[j] = diff / max(2.0 * self.gradient_step_size, 1e-12)
-
+        grad = stencil.gradient([trial.penalized_score for trial, _cache_hit in evaluated])
         return grad, emitted, next_trial_id
 
     def _build_seed_summaries(
         self,
-        all_trials: Sequence[TrialResult],
+        all_trials: TrialTable,
         lineage: Dict[int, int],
         top_seeds: Sequence[TrialResult],
     ) -> List[SobolSeedSummary]:
-        best_obj = max((t.goals.objective_score for t in all_trials if t.goals.feasible), default=None)
+        feasible_flags = all_trials.feasible_flags()
+        best_obj = float(all_trials.objective_scores()[feasible_flags].max()) if feasible_flags.any() else None
         tolerance_abs = 0.0
         if best_obj is not None:
             tolerance_abs = abs(best_obj) * (self.objective_tolerance_pct / 100.0)
 
         summaries: List[SobolSeedSummary] = []
+        related_by_seed = self._related_trials(all_trials, lineage, [seed.trial_id for seed in top_seeds])
         for seed_trial in top_seeds:
-            related = [t for t in all_trials if lineage.get(t.trial_id, t.trial_id) == seed_trial.trial_id]
+            related = related_by_seed[int(seed_trial.trial_id)]
             if not related:
                 continue
             best_local = max(related, key=lambda t: t.penalized_score)
@@ -602,9 +621,11 @@ class ConstrainedSobolGradientOptimizer:
         return summaries
 
     def _checkpoint(self, *, force: bool = False) -> None:
+        started = time.monotonic()
         self._persist_trials()
         if self._cache_dirty:
             self._persist_eval_cache()
+        self.telemetry.record_checkpoint(time.monotonic() - started)
         self._log(
             "[sobol] parquet checkpoint "
             f"trials_parquet_rows={self._last_persisted_trials_rows} "
@@ -627,14 +648,15 @@ class ConstrainedSobolGradientOptimizer:
         if self.force_rebuild:
             self._eval_cache = {}
             self._cache_dirty = False
+            self._loaded_trials_df = pd.DataFrame()
             self._trial_rows = []
 
-        all_trials: List[TrialResult] = []
+        all_trials = TrialTable.empty(self.param_names)
         lineage: Dict[int, int] = {}
         if not self.force_rebuild:
             all_trials, lineage = self._load_trials_state()
 
-        trial_id = (max((t.trial_id for t in all_trials), default=-1) + 1)
+        trial_id = self._next_trial_id(all_trials)
         cache_hits = 0
         start_time = time.monotonic()
         last_progress_time = start_time
@@ -693,11 +715,7 @@ class ConstrainedSobolGradientOptimizer:
             if not top_seeds:
                 return "region_seed_id=na good_region_dims=0 flatness=na region_radius_linf=0.000 top_dim_spread01=na"
 
-            related_by_seed: Dict[int, List[TrialResult]] = {int(seed.trial_id): [] for seed in top_seeds}
-            for t in all_trials:
-                root = int(lineage.get(t.trial_id, t.trial_id))
-                if root in related_by_seed:
-                    related_by_seed[root].append(t)
+            related_by_seed = self._related_trials(all_trials, lineage, [seed.trial_id for seed in top_seeds])
 
             best_obj = float(best_feasible_trial.goals.objective_score) if best_feasible_trial is not None else None
             tolerance_abs = abs(best_obj) * (self.objective_tolerance_pct / 100.0) if best_obj is not None else 0.0
@@ -772,21 +790,14 @@ class ConstrainedSobolGradientOptimizer:
             )
             last_progress_time = now
 
-        for t in all_trials:
-            update_best_itm(t)
-            update_best_trials(t)
+        # Only the trials the trackers would settle on are built; the rest of a resumed table stays columnar.
+        for position in self._best_positions(all_trials):
+            update_best_itm(all_trials[position])
+            update_best_trials(all_trials[position])
 
         try:
-            phase_by_trial_id: Dict[int, str] = {}
-            for row in self._trial_rows:
-                tid = int(row.get("trial_id", -1))
-                if tid < 0:
-                    continue
-                phase_by_trial_id[tid] = str(row.get("phase", ""))
-
-            sobol_trials = [t for t in all_trials if phase_by_trial_id.get(t.trial_id) == "sobol"]
-            sobol_trials.sort(key=lambda t: t.trial_id)
-            sobol_completed = len(sobol_trials)
+            _row_ids, row_phases, _row_parents = self._trial_lineage_columns()
+            sobol_completed = int(np.count_nonzero(row_phases == "sobol"))
             sobol_points = self._sobol_points(self.sobol_samples)
             self._log(f"[sobol] sampling n={len(sobol_points)} dim={self.dim}")
             sobol_chunk_size = max(1, min(len(sobol_points), self.workers * 8))
@@ -805,6 +816,7 @@ class ConstrainedSobolGradientOptimizer:
                 )
                 sobol_resume_start = len(sobol_points)
 
+            self.telemetry.set_phase("sobol")
             for start in range(sobol_resume_start, len(sobol_points), sobol_chunk_size):
                 chunk = sobol_points[start : start + sobol_chunk_size]
                 params_batch = [self._denormalize(x) for x in chunk]
@@ -820,8 +832,8 @@ class ConstrainedSobolGradientOptimizer:
 
                 now = time.monotonic()
                 if self.progress_interval_seconds > 0 and now - last_progress_time >= self.progress_interval_seconds:
-                    feasible_count = sum(1 for t in all_trials if t.goals.feasible)
-                    best_penalized = max(t.penalized_score for t in all_trials)
+                    feasible_count = int(np.count_nonzero(all_trials.feasible_flags()))
+                    best_penalized = float(all_trials.penalized_scores().max())
                     elapsed_seconds = now - start_time
                     if best_itm_value is None:
                         best_itm_part = (
@@ -847,15 +859,8 @@ class ConstrainedSobolGradientOptimizer:
                     last_progress_time = now
                 last_checkpoint_time = self._maybe_checkpoint(now=now, last_checkpoint_time=last_checkpoint_time)
 
-            sobol_trial_ids = {
-                int(row.get("trial_id", -1))
-                for row in self._trial_rows
-                if str(row.get("phase", "")) == "sobol"
-            }
-            sobol_trial_ids = {tid for tid in sobol_trial_ids if tid >= 0}
-            sobol_trials = [t for t in all_trials if t.trial_id in sobol_trial_ids]
-            sobol_trials.sort(key=lambda t: t.trial_id)
-            sobol_trials = sobol_trials[: self.sobol_samples]
+            row_ids, row_phases, _row_parents = self._trial_lineage_columns()
+            sobol_trials = self._trials_at(all_trials, row_ids[row_phases == "sobol"])[: self.sobol_samples]
 
             # Seed selection criteria:
             # - At least 4 trades (metric__total > 3)
@@ -875,35 +880,34 @@ class ConstrainedSobolGradientOptimizer:
             )
             _maybe_log_phase2_progress(now=time.monotonic(), seed_rank=0, stage="seed_selection", force=True)
 
-            seed_expected_trials = self.local_probe_per_seed + self.gradient_steps * (2 * self.dim + 1)
+            # Gradient probes are deduplicated, so completeness is judged by the fixed-size phases only.
+            seed_expected_trials = self.local_probe_per_seed + self.gradient_steps
+            counted_phases = ["local_probe", "gradient_step"]
+            row_ids, row_phases, row_parents = self._trial_lineage_columns()
+            row_counted = np.isin(row_phases, counted_phases)
             for seed_trial in top_seeds:
                 seed_id = seed_trial.trial_id
-                child_ids = [
-                    int(row.get("trial_id", -1))
-                    for row in self._trial_rows
-                    if (row.get("parent_trial_id") is not None and not pd.isna(row.get("parent_trial_id")))
-                    and int(row.get("parent_trial_id")) == seed_id
-                ]
-                child_ids = [tid for tid in child_ids if tid >= 0]
-                if 0 < len(child_ids) < seed_expected_trials:
+                children = row_parents == seed_id
+                child_ids = [tid for tid in row_ids[children].tolist() if tid >= 0]
+                counted = int(np.count_nonzero(children & row_counted))
+                if child_ids and counted < seed_expected_trials:
                     self._log(
                         f"[sobol] resume partial seed seed_trial_id={seed_id} "
-                        f"existing={len(child_ids)} expected={seed_expected_trials}; recomputing seed"
+                        f"existing={counted} expected={seed_expected_trials}; recomputing seed"
                     )
                     self._drop_trials_by_ids(set(child_ids), all_trials, lineage)
-                    trial_id = max((t.trial_id for t in all_trials), default=-1) + 1
+                    trial_id = self._next_trial_id(all_trials)
 
+            # A seed's children are only appended while that seed is processed, so counts taken here hold.
+            row_ids, row_phases, row_parents = self._trial_lineage_columns()
+            row_counted = np.isin(row_phases, counted_phases)
             for seed_rank, seed_trial in enumerate(top_seeds, start=1):
                 seed_id = seed_trial.trial_id
-                existing_child_count = sum(
-                    1
-                    for row in self._trial_rows
-                    if (row.get("parent_trial_id") is not None and not pd.isna(row.get("parent_trial_id")))
-                    and int(row.get("parent_trial_id")) == seed_id
-                )
+                existing_child_count = int(np.count_nonzero((row_parents == seed_id) & row_counted))
                 if existing_child_count >= seed_expected_trials:
                     continue
 
+                self.telemetry.set_phase("local_probe")
                 x_seed = self._normalize(seed_trial.params)
                 probe_points = self._local_probe_points_for_seed(x_seed, self.local_probe_per_seed, seed_trial.trial_id)
                 probe_params = [self._denormalize(x_probe) for x_probe in probe_points]
@@ -929,6 +933,7 @@ class ConstrainedSobolGradientOptimizer:
                     last_checkpoint_time=last_checkpoint_time,
                 )
 
+                self.telemetry.set_phase("gradient")
                 x_current = np.copy(x_seed)
                 for _ in range(self.gradient_steps):
                     grad, emitted, trial_id = self._estimate_gradient(
@@ -950,6 +955,7 @@ class ConstrainedSobolGradientOptimizer:
                     if grad_norm > 0:
                         x_current = np.clip(x_current + self.gradient_learning_rate * (grad / grad_norm), 0.0, 1.0)
                     trial_step, cache_hit = self._evaluate_trial(trial_id=trial_id, params=self._denormalize(x_current))
+                    self._observe_evaluations([(trial_step, cache_hit)])
                     all_trials.append(trial_step)
                     lineage[trial_step.trial_id] = seed_trial.trial_id
                     self._trial_rows.append(
@@ -981,15 +987,20 @@ class ConstrainedSobolGradientOptimizer:
 
         self._checkpoint(force=True)
 
-        feasible = [t for t in all_trials if t.goals.feasible]
-        best_feasible = max(feasible, key=lambda t: t.goals.objective_score) if feasible else None
-        best_penalized = max(all_trials, key=lambda t: t.penalized_score) if all_trials else None
+        feasible = np.flatnonzero(all_trials.feasible_flags())
+        best_feasible = (
+            all_trials[int(feasible[np.argmax(all_trials.objective_scores()[feasible])])] if feasible.size else None
+        )
+        best_penalized = all_trials[int(np.argmax(all_trials.penalized_scores()))] if len(all_trials) else None
         seed_summaries = self._build_seed_summaries(all_trials, lineage, top_seeds)
 
         elapsed = time.monotonic() - start_time
         self._log(
-            f"[sobol] done total_trials={len(all_trials)} feasible={len(feasible)} cache_hits={cache_hits} elapsed={elapsed:.1f}s"
+            f"[sobol] done total_trials={len(all_trials)} feasible={feasible.size} cache_hits={cache_hits} "
+            f"stencil_saved={self.stencil_saved_evaluations} elapsed={elapsed:.1f}s"
         )
+        telemetry = self.telemetry.finish()
+        self._log(f"[sobol] telemetry {summary_line(telemetry)}")
 
         return {
             "trials": all_trials,
@@ -999,6 +1010,8 @@ class ConstrainedSobolGradientOptimizer:
             "best_feasible": best_feasible,
             "best_penalized": best_penalized,
             "cache_hits": cache_hits,
+            "stencil_saved_evaluations": self.stencil_saved_evaluations,
+            "telemetry": telemetry,
         }
 
 
@@ -55,6 +55,27 @@ class SobolSampler:
             warnings.filterwarnings("ignore", message=_SOBOL_BALANCE_WARNING, category=UserWarning)
             return sampler.random(n=n_samples)
 
+    def sample_unit_range(self, start: int, n_samples: int) -> np.ndarray:
+        """Return points ``[start, start + n_samples)`` of the scrambled sequence.
+
+        Uses ``fast_forward`` so any slice matches ``sample_unit(start + n_samples)[start:]``
+        without generating the prefix.
+        """
+        if start < 0:
+            raise ValueError("start must be >= 0")
+        if n_samples <= 0:
+            raise ValueError("n_samples must be > 0")
+        sampler = qmc.Sobol(d=self.dim, scramble=True, seed=self.seed)
+        if start:
+            sampler.fast_forward(int(start))
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore", message=_SOBOL_BALANCE_WARNING, category=UserWarning)
+            return sampler.random(n=n_samples)
+
+    def sample_params_range(self, start: int, n_samples: int) -> List[Dict[str, float]]:
+        points = self.sample_unit_range(start, n_samples)
+        return [self._denormalize(point) for point in points]
+
     def sample_params(self, n_samples: int) -> List[Dict[str, float]]:
         points = self.sample_unit(n_samples)
         return [self._denormalize(point) for point in points]
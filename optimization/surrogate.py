@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import zlib
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingClassifier
+
+
+@dataclass
+class SurrogateStats:
+    """Confusion counts for candidates whose true label became known after scoring.
+
+    Predicted negatives are only evaluated through the exploration quota, so recall scales the
+    observed false negatives by ``1 / explore_rate``.
+    """
+
+    fits: int = 0
+    scored: int = 0
+    deferred: int = 0
+    explored: int = 0
+    true_positive: int = 0
+    false_positive: int = 0
+    true_negative: int = 0
+    false_negative: int = 0
+
+    def record(self, *, predicted: bool, actual: bool) -> None:
+        if predicted and actual:
+            self.true_positive += 1
+        elif predicted:
+            self.false_positive += 1
+        elif actual:
+            self.false_negative += 1
+        else:
+            self.true_negative += 1
+
+    def precision(self) -> float:
+        predicted = self.true_positive + self.false_positive
+        return self.true_positive / predicted if predicted else float("nan")
+
+    def recall(self, explore_rate: float) -> float:
+        if explore_rate <= 0:
+            return float("nan")
+        missed = self.false_negative / float(explore_rate)
+        found = self.true_positive + missed
+        return self.true_positive / found if found else float("nan")
+
+
+class SeedSurrogate:
+    """Gradient-boosted classifier for P(candidate ends up seed-eligible) from normalized params."""
+
+    def __init__(self, *, cutoff: float, explore_rate: float, random_state: int = 0) -> None:
+        if not (0.0 <= float(cutoff) <= 1.0):
+            raise ValueError("cutoff must be in [0, 1]")
+        if not (0.0 <= float(explore_rate) <= 1.0):
+            raise ValueError("explore_rate must be in [0, 1]")
+        self.cutoff = float(cutoff)
+        self.explore_rate = float(explore_rate)
+        self.random_state = int(random_state)
+        self.model: Optional[HistGradientBoostingClassifier] = None
+
+    @property
+    def fitted(self) -> bool:
+        return self.model is not None
+
+    def fit(self, x: np.ndarray, y: np.ndarray) -> bool:
+        """Refit on all labeled trials; returns False (keeping the old model) if only one class is present."""
+        labels = np.asarray(y, dtype=int)
+        if np.unique(labels).size < 2:
+            return False
+        model = HistGradientBoostingClassifier(
+            max_iter=100,
+            learning_rate=0.1,
+            class_weight="balanced",
+            random_state=self.random_state,
+        )
+        model.fit(np.asarray(x, dtype=float), labels)
+        self.model = model
+        return True
+
+    def predict_proba(self, x: np.ndarray) -> np.ndarray:
+        points = np.atleast_2d(np.asarray(x, dtype=float))
+        if self.model is None:
+            return np.ones(points.shape[0], dtype=float)
+        return self.model.predict_proba(points)[:, 1]
+
+    def should_explore(self, key: str) -> bool:
+        """Deterministic per-key draw, so every worker makes the same exploration choice."""
+        return zlib.crc32(key.encode("utf-8")) / float(2**32) < self.explore_rate
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+
+@dataclass
+class PhaseCounters:
+    evaluations: int = 0
+    cache_hits: int = 0
+    started_at: Optional[float] = None
+    last_at: Optional[float] = None
+
+
+class RunTelemetry:
+    """Throughput counters for one optimizer run, periodically rewritten to a file.
+
+    The file is JSON, or Prometheus text exposition format when ``path`` ends in ``.prom``, and is
+    replaced atomically so readers never see a partial write. Without a path the counters are
+    still kept, so :meth:`finish` can return (and callers can log) the final summary.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str],
+        *,
+        run: str,
+        workers: int = 1,
+        interval_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+        cpu_clock: Callable[[], float] = time.process_time,
+    ) -> None:
+        self.path = Path(path) if path else None
+        self.run = str(run)
+        self.workers = max(1, int(workers))
+        self.interval_seconds = max(0.0, float(interval_seconds))
+        self.clock = clock
+        self.cpu_clock = cpu_clock
+
+        self.started_at = clock()
+        self.cpu_started_at = cpu_clock()
+        self.phases: Dict[str, PhaseCounters] = {}
+        self.current_phase = "run"
+        self.counters: Dict[str, float] = {}
+        self.in_flight = 0
+        self.queued = 0
+        self.max_in_flight = 0
+        self.busy_worker_seconds = 0.0
+        self._dispatch_at = self.started_at
+        self.checkpoints = 0
+        self.checkpoint_seconds_total = 0.0
+        self.checkpoint_seconds_max = 0.0
+        self.checkpoint_seconds_last = 0.0
+        self.last_write_at: Optional[float] = None
+        self.writes = 0
+
+    def _phase(self, name: Optional[str]) -> PhaseCounters:
+        name = name or self.current_phase
+        counters = self.phases.get(name)
+        if counters is None:
+            counters = PhaseCounters()
+            self.phases[name] = counters
+        return counters
+
+    def set_phase(self, name: str) -> None:
+        self.current_phase = str(name)
+
+    def record_evaluations(self, count: int = 1, *, phase: Optional[str] = None) -> None:
+        counters = self._phase(phase)
+        now = self.clock()
+        if counters.started_at is None:
+            counters.started_at = now
+        counters.last_at = now
+        counters.evaluations += int(count)
+
+    def record_cache_hits(self, count: int = 1, *, phase: Optional[str] = None) -> None:
+        self._phase(phase).cache_hits += int(count)
+
+    def set_counter(self, name: str, value: float) -> None:
+        self.counters[name] = float(value)
+
+    def set_dispatch(self, in_flight: int, *, queued: int = 0) -> None:
+        """Report the current number of running and waiting evaluations; integrates worker busy time."""
+        now = self.clock()
+        self.busy_worker_seconds += min(self.in_flight, self.workers) * max(0.0, now - self._dispatch_at)
+        self._dispatch_at = now
+        self.in_flight = int(in_flight)
+        self.queued = int(queued)
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+    def record_checkpoint(self, seconds: float) -> None:
+        seconds = float(seconds)
+        self.checkpoints += 1
+        self.checkpoint_seconds_total += seconds
+        self.checkpoint_seconds_last = seconds
+        self.checkpoint_seconds_max = max(self.checkpoint_seconds_max, seconds)
+
+    def snapshot(self, *, final: bool = False) -> Dict[str, object]:
+        now = self.clock()
+        elapsed = max(now - self.started_at, 1e-9)
+        busy = self.busy_worker_seconds + min(self.in_flight, self.workers) * max(0.0, now - self._dispatch_at)
+        evaluations = sum(c.evaluations for c in self.phases.values())
+        cache_hits = sum(c.cache_hits for c in self.phases.values())
+        phases: Dict[str, Dict[str, float]] = {}
+        for name, counters in self.phases.items():
+            lookups = counters.evaluations + counters.cache_hits
+            active = (
+                (counters.last_at - counters.started_at)
+                if counters.started_at is not None and counters.last_at is not None
+                else 0.0
+            )
+            phases[name] = {
+                "evaluations": counters.evaluations,
+                "cache_hits": counters.cache_hits,
+                "cache_hit_ratio": counters.cache_hits / lookups if lookups else 0.0,
+                "evals_per_sec": counters.evaluations / active if active > 0 else 0.0,
+            }
+        return {
+            "run": self.run,
+            "final": bool(final),
+            "timestamp": time.time(),
+            "elapsed_seconds": elapsed,
+            "evaluations": evaluations,
+            "cache_hits": cache_hits,
+            "cache_hit_ratio": cache_hits / (evaluations + cache_hits) if evaluations + cache_hits else 0.0,
+            "evals_per_sec": evaluations / elapsed,
+            "workers": self.workers,
+            "worker_utilization": busy / (self.workers * elapsed),
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "queue_depth": self.queued,
+            "parent_cpu_share": (self.cpu_clock() - self.cpu_started_at) / elapsed,
+            "checkpoints": self.checkpoints,
+            "checkpoint_seconds_total": self.checkpoint_seconds_total,
+            "checkpoint_seconds_max": self.checkpoint_seconds_max,
+            "checkpoint_seconds_last": self.checkpoint_seconds_last,
+            "phase": self.current_phase,
+            "phases": phases,
+            "counters": dict(self.counters),
+        }
+
+    def maybe_write(self, *, force: bool = False) -> None:
+        if self.path is None:
+            return
+        now = self.clock()
+        if not force and self.last_write_at is not None and now - self.last_write_at < self.interval_seconds:
+            return
+        self._write(self.path, self.snapshot())
+        self.last_write_at = now
+
+    def finish(self) -> Dict[str, object]:
+        self.set_dispatch(0)
+        snapshot = self.snapshot(final=True)
+        if self.path is not None:
+            self._write(self.path, snapshot)
+        return snapshot
+
+    def _write(self, path: Path, snapshot: Dict[str, object]) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if path.suffix == ".prom":
+            text = format_prometheus(snapshot)
+        else:
+            text = json.dumps(snapshot, indent=2, sort_keys=True)
+        tmp = path.with_name(f"{path.name}.tmp")
+        tmp.write_text(text)
+        os.replace(tmp, path)
+        self.writes += 1
+
+
+def _label(value: object) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_prometheus(snapshot: Dict[str, object]) -> str:
+    run = _label(snapshot["run"])
+    lines: List[str] = []
+    for name, value in snapshot.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        lines.append(f'optimizer_{name}{{run="{run}"}} {float(value):.12g}')
+    lines.append(f'optimizer_final{{run="{run}"}} {int(bool(snapshot["final"]))}')
+    for phase, values in dict(snapshot["phases"]).items():
+        for name, value in values.items():
+            lines.append(f'optimizer_phase_{name}{{run="{run}",phase="{_label(phase)}"}} {float(value):.12g}')
+    for name, value in dict(snapshot["counters"]).items():
+        lines.append(f'optimizer_counter{{run="{run}",name="{_label(name)}"}} {float(value):.12g}')
+    return "\n".join(lines) + "\n"
+
+
+def summary_line(snapshot: Dict[str, object]) -> str:
+    return (
+        f"evaluations={snapshot['evaluations']} evals_per_sec={float(snapshot['evals_per_sec']):.2f} "
+        f"worker_utilization={float(snapshot['worker_utilization']):.2f} "
+        f"parent_cpu_share={float(snapshot['parent_cpu_share']):.2f} "
+        f"cache_hit_ratio={float(snapshot['cache_hit_ratio']):.3f} "
+        f"checkpoints={snapshot['checkpoints']} checkpoint_max={float(snapshot['checkpoint_seconds_max']):.3f}s"
+    )
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+
+
+class TrialColumnBuffer:
+    """Trial rows appended since the last checkpoint, held in preallocated columns.
+
+    Numeric columns share one structured array and string columns are object arrays; both grow
+    by doubling. Rows are appended a batch at a time and persisted through :meth:`to_arrow`, so
+    only rows that are explicitly looked up are ever materialized as dicts.
+    """
+
+    STRING_COLUMNS = ("cache_key", "phase", "fidelity", "fidelity_start_date", "prune_reason", "trigger_hash")
+    INT_COLUMNS = ("trial_id", "feasible")
+
+    def __init__(self, columns: Sequence[str], *, constants: Dict[str, str], capacity: int = 1024) -> None:
+        self.columns = list(columns)
+        self.constants = dict(constants)
+        numeric = [c for c in self.columns if c not in self.constants and c not in self.STRING_COLUMNS]
+        self.dtype = np.dtype([(c, np.int64 if c in self.INT_COLUMNS else np.float64) for c in numeric])
+        self.size = 0
+        self._numeric = np.zeros(max(1, int(capacity)), dtype=self.dtype)
+        self._strings = {c: np.full(len(self._numeric), None, dtype=object) for c in self.STRING_COLUMNS}
+        self.schema = pa.schema(
+            [
+                (c, pa.string() if c in self.constants or c in self._strings else pa.from_numpy_dtype(self.dtype[c]))
+                for c in self.columns
+            ]
+        )
+
+    def __len__(self) -> int:
+        return self.size
+
+    def _reserve(self, extra: int) -> None:
+        needed = self.size + int(extra)
+        capacity = len(self._numeric)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        numeric = np.zeros(capacity, dtype=self.dtype)
+        numeric[: self.size] = self._numeric[: self.size]
+        self._numeric = numeric
+        for name, values in self._strings.items():
+            grown = np.full(capacity, None, dtype=object)
+            grown[: self.size] = values[: self.size]
+            self._strings[name] = grown
+
+    def append(self, columns: Dict[str, Any], count: int) -> np.ndarray:
+        """Write ``count`` rows from per-column arrays; returns their buffer positions."""
+        self._reserve(count)
+        start, stop = self.size, self.size + int(count)
+        for name, values in columns.items():
+            target = self._strings[name] if name in self._strings else self._numeric[name]
+            target[start:stop] = values
+        self.size = stop
+        return np.arange(start, stop)
+
+    def column(self, name: str) -> np.ndarray:
+        if name in self.constants:
+            return np.full(self.size, self.constants[name], dtype=object)
+        if name in self._strings:
+            return self._strings[name][: self.size]
+        return self._numeric[name][: self.size]
+
+    def row(self, position: int) -> Dict[str, Any]:
+        record = self._numeric[int(position)]
+        out: Dict[str, Any] = {}
+        for name in self.columns:
+            if name in self.constants:
+                out[name] = self.constants[name]
+            elif name in self._strings:
+                out[name] = self._strings[name][int(position)]
+            elif name in self.INT_COLUMNS:
+                out[name] = int(record[name])
+            else:
+                out[name] = float(record[name])
+        return out
+
+    def find(self, trial_id: int) -> Optional[int]:
+        # Trial ids are handed out consecutively, so a buffered id sits at a fixed offset from the first.
+        if not self.size:
+            return None
+        position = int(trial_id) - int(self._numeric["trial_id"][0])
+        if 0 <= position < self.size and int(self._numeric["trial_id"][position]) == int(trial_id):
+            return position
+        return None
+
+    def to_arrow(self, start: int = 0, stop: Optional[int] = None) -> pa.Table:
+        arrays = [pa.array(self.column(f.name)[start:stop], type=f.type) for f in self.schema]
+        return pa.Table.from_arrays(arrays, schema=self.schema)
+
+    def clear(self) -> None:
+        for values in self._strings.values():
+            values[: self.size] = None
+        self.size = 0
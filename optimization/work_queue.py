@@ -0,0 +1,408 @@
+from __future__ import annotations
+
+import hmac
+import ipaddress
+import os
+import pickle
+import socket
+import struct
+import threading
+import time
+from collections import deque
+from concurrent.futures import Executor, Future
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+_HEADER = struct.Struct("!Q")
+
+# Handshake frames are raw bytes, so nothing a peer sends is unpickled before it has proven the authkey.
+_CHALLENGE = b"#CHALLENGE#"
+_WELCOME = b"#WELCOME#"
+_FAILURE = b"#FAILURE#"
+_NONCE_BYTES = 32
+_MAX_HANDSHAKE_FRAME = 256
+
+Address = Tuple[str, int]
+
+
+def parse_address(text: str) -> Address:
+    host, sep, port = str(text).strip().rpartition(":")
+    if not sep or not port.isdigit():
+        raise ValueError(f"Expected HOST:PORT, got '{text}'.")
+    return host or "127.0.0.1", int(port)
+
+
+class AuthenticationError(ConnectionError):
+    """The peer did not prove that it holds the shared authkey."""
+
+
+def is_loopback(host: str) -> bool:
+    """True if ``host`` resolves to a loopback address, so only this machine can reach a port bound to it."""
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except (OSError, ValueError):
+        return False
+
+
+def authkey_from_env(name: str) -> Optional[bytes]:
+    """The shared authkey held in environment variable ``name``; None when it is unset or empty."""
+    value = os.environ.get(str(name), "")
+    return value.encode("utf-8") if value else None
+
+
+def encode_message(message: Any) -> bytes:
+    payload = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    return _HEADER.pack(len(payload)) + payload
+
+
+def send_message(sock: socket.socket, message: Any) -> None:
+    sock.sendall(encode_message(message))
+
+
+def _recv_exact(sock: socket.socket, size: int) -> bytes:
+    buf = bytearray()
+    while len(buf) < size:
+        chunk = sock.recv(min(size - len(buf), 1 << 20))
+        if not chunk:
+            raise ConnectionError("connection closed")
+        buf += chunk
+    return bytes(buf)
+
+
+def recv_message(sock: socket.socket) -> Any:
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    return pickle.loads(_recv_exact(sock, size))
+
+
+def _send_frame(sock: socket.socket, data: bytes) -> None:
+    sock.sendall(_HEADER.pack(len(data)) + data)
+
+
+def _recv_frame(sock: socket.socket) -> bytes:
+    (size,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size))
+    if size > _MAX_HANDSHAKE_FRAME:
+        raise AuthenticationError("oversized handshake frame")
+    return _recv_exact(sock, size)
+
+
+def _digest(authkey: bytes, nonce: bytes) -> bytes:
+    return hmac.new(authkey, nonce, "sha256").digest()
+
+
+def _deliver_challenge(sock: socket.socket, authkey: bytes) -> None:
+    nonce = os.urandom(_NONCE_BYTES)
+    _send_frame(sock, _CHALLENGE + nonce)
+    if not hmac.compare_digest(_recv_frame(sock), _digest(authkey, nonce)):
+        _send_frame(sock, _FAILURE)
+        raise AuthenticationError("peer answered the challenge with the wrong digest")
+    _send_frame(sock, _WELCOME)
+
+
+def _answer_challenge(sock: socket.socket, authkey: bytes) -> None:
+    message = _recv_frame(sock)
+    if not message.startswith(_CHALLENGE):
+        raise AuthenticationError("expected an authentication challenge")
+    _send_frame(sock, _digest(authkey, message[len(_CHALLENGE) :]))
+    if _recv_frame(sock) != _WELCOME:
+        raise AuthenticationError("peer rejected the authkey")
+
+
+def authenticate(sock: socket.socket, authkey: bytes, *, server: bool, timeout: float = 30.0) -> None:
+    """Mutual HMAC challenge/response, as ``multiprocessing.connection`` does with ``authkey``."""
+    previous = sock.gettimeout()
+    sock.settimeout(float(timeout))
+    try:
+        if server:
+            _deliver_challenge(sock, authkey)
+            _answer_challenge(sock, authkey)
+        else:
+            _answer_challenge(sock, authkey)
+            _deliver_challenge(sock, authkey)
+    except socket.timeout as exc:
+        raise AuthenticationError("authentication handshake timed out") from exc
+    finally:
+        sock.settimeout(previous)
+
+
+@dataclass
+class _Task:
+    task_id: int
+    fn: Callable[..., Any]
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any]
+    future: Future
+    attempts: int = 0
+
+
+class WorkQueueExecutor(Executor):
+    """Executor whose tasks are pulled one at a time by remote workers over TCP.
+
+    Messages are length-prefixed pickles. Before its next task each worker receives the
+    :meth:`publish`ed state entries that changed since it last asked. A task is leased to the
+    worker that pulled it; when the lease runs out, or the connection still holding it drops, the
+    task is queued again for another worker and a late duplicate result is ignored.
+
+    Every connection must first pass the :func:`authenticate` handshake for ``authkey``. Without
+    one, any peer that reaches the port can run code here, so only loopback addresses are accepted
+    unless ``allow_unauthenticated`` is set.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        *,
+        lease_seconds: float = 600.0,
+        clock: Callable[[], float] = time.monotonic,
+        authkey: Optional[bytes] = None,
+        allow_unauthenticated: bool = False,
+    ) -> None:
+        if float(lease_seconds) <= 0:
+            raise ValueError("lease_seconds must be > 0")
+        if authkey is not None and not authkey:
+            raise ValueError("authkey must not be empty")
+        if authkey is None and not allow_unauthenticated and not is_loopback(host):
+            raise ValueError(f"Refusing to listen on non-loopback address '{host}' without an authkey.")
+        self.authkey = authkey
+        self.lease_seconds = float(lease_seconds)
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._queue: Deque[int] = deque()
+        self._tasks: Dict[int, _Task] = {}
+        # task_id -> (owning connection id, expiry); a dropped connection only requeues its own leases.
+        self._leases: Dict[int, Tuple[int, float]] = {}
+        self._next_task_id = 0
+        self._next_conn_id = 0
+        self._state: Dict[str, Tuple[int, bytes]] = {}
+        self._state_version = 0
+        self._closed = False
+        self._threads: List[threading.Thread] = []
+        self._connections: Set[socket.socket] = set()
+        self.connected = 0
+        self.completed = 0
+        self.reissued = 0
+
+        self._server = socket.create_server((host, int(port)))
+        # Polled so shutdown never depends on close() waking a blocked accept().
+        self._server.settimeout(0.2)
+        self.address: Address = self._server.getsockname()[:2]
+        self._acceptor = threading.Thread(target=self._accept_loop, name="work-queue-accept", daemon=True)
+        self._acceptor.start()
+
+    def publish(self, name: str, value: Any) -> None:
+        """Snapshot ``value`` under ``name``; later mutations of it are not seen by workers."""
+        payload = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._cond:
+            self._state_version += 1
+            self._state[str(name)] = (self._state_version, payload)
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:
+        future: Future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            task = _Task(self._next_task_id, fn, args, kwargs, future)
+            self._next_task_id += 1
+            self._tasks[task.task_id] = task
+            self._queue.append(task.task_id)
+            self._cond.notify()
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        with self._cond:
+            if cancel_futures:
+                for task_id in self._queue:
+                    task = self._tasks.get(task_id)
+                    if task is not None and task.attempts == 0:
+                        del self._tasks[task_id]
+                        task.future.cancel()
+                self._queue = deque(task_id for task_id in self._queue if task_id in self._tasks)
+            if wait:
+                self._cond.wait_for(lambda: not self._tasks)
+            self._closed = True
+            self._cond.notify_all()
+        self._acceptor.join()
+        self._server.close()
+        if wait:
+            for thread in list(self._threads):
+                thread.join(timeout=1.0)
+            # Workers still busy with a stale, already-answered lease are cut off rather than awaited.
+            with self._cond:
+                connections = list(self._connections)
+            for conn in connections:
+                try:
+                    conn.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+            for thread in list(self._threads):
+                thread.join()
+
+    def _accept_loop(self) -> None:
+        while not self._closed:
+            try:
+                conn, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            conn.settimeout(None)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            thread = threading.Thread(target=self._serve, args=(conn,), name="work-queue-conn", daemon=True)
+            with self._cond:
+                self._threads.append(thread)
+            thread.start()
+
+    def _reclaim_expired(self) -> None:
+        now = self.clock()
+        for task_id, (_owner, expires) in list(self._leases.items()):
+            if expires <= now:
+                self._requeue(task_id)
+
+    def _requeue(self, task_id: int) -> None:
+        self._leases.pop(task_id, None)
+        if task_id in self._tasks:
+            self._queue.appendleft(task_id)
+            self.reissued += 1
+            self._cond.notify()
+
+    def _release(self, task_id: int, owner: int) -> None:
+        """Requeue ``task_id`` for a dropped connection, unless its lease already moved to another one."""
+        lease = self._leases.get(task_id)
+        if lease is not None and lease[0] == owner:
+            self._requeue(task_id)
+
+    def _lease(self, owner: int) -> Optional[_Task]:
+        with self._cond:
+            while True:
+                self._reclaim_expired()
+                while self._queue:
+                    task = self._tasks.get(self._queue.popleft())
+                    if task is None:
+                        continue
+                    if task.attempts == 0 and not task.future.set_running_or_notify_cancel():
+                        del self._tasks[task.task_id]
+                        continue
+                    task.attempts += 1
+                    self._leases[task.task_id] = (owner, self.clock() + self.lease_seconds)
+                    return task
+                if self._closed:
+                    return None
+                timeout = None
+                if self._leases:
+                    next_expiry = min(expires for _owner, expires in self._leases.values())
+                    timeout = min(1.0, max(0.01, next_expiry - self.clock()))
+                self._cond.wait(timeout)
+
+    def _complete(self, task_id: int, ok: bool, value: Any) -> None:
+        with self._cond:
+            self._leases.pop(task_id, None)
+            task = self._tasks.pop(task_id, None)
+            if task is None:
+                return
+            self.completed += 1
+            self._cond.notify_all()
+        if ok:
+            task.future.set_result(value)
+        else:
+            task.future.set_exception(value)
+
+    def _serve(self, conn: socket.socket) -> None:
+        installed = 0
+        task: Optional[_Task] = None
+        with self._cond:
+            self._connections.add(conn)
+            self.connected += 1
+            conn_id = self._next_conn_id
+            self._next_conn_id += 1
+        try:
+            if self.authkey is not None:
+                authenticate(conn, self.authkey, server=True)
+            recv_message(conn)  # hello
+            while True:
+                _, result = recv_message(conn)
+                if result is not None:
+                    self._complete(*result)
+                task = None
+                while task is None:
+                    task = self._lease(conn_id)
+                    if task is None:
+                        send_message(conn, ("shutdown",))
+                        return
+                    try:
+                        message = encode_message(("task", task.task_id, task.fn, task.args, task.kwargs))
+                    except Exception as exc:  # noqa: BLE001 - surfaced on the caller's future
+                        self._complete(task.task_id, False, exc)
+                        task = None
+                with self._cond:
+                    version = self._state_version
+                    changed = {name: payload for name, (stamp, payload) in self._state.items() if stamp > installed}
+                if changed:
+                    send_message(conn, ("state", changed))
+                installed = version
+                conn.sendall(message)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            if task is not None:
+                with self._cond:
+                    self._release(task.task_id, conn_id)
+        finally:
+            conn.close()
+            with self._cond:
+                self._connections.discard(conn)
+                self.connected -= 1
+
+
+def _connect(address: Address, timeout: float) -> socket.socket:
+    deadline = time.monotonic() + float(timeout)
+    while True:
+        try:
+            sock = socket.create_connection(address)
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(0.2)
+            continue
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return sock
+
+
+def run_worker(
+    address: Address,
+    *,
+    install_state: Callable[[Dict[str, Any]], None],
+    name: Optional[str] = None,
+    connect_timeout: float = 30.0,
+    authkey: Optional[bytes] = None,
+) -> int:
+    """Pull and run tasks from a :class:`WorkQueueExecutor` until it shuts down; returns tasks run.
+
+    ``install_state`` receives the published entries that changed since the previous task. With
+    ``authkey`` both ends authenticate before anything is unpickled; a mismatch raises
+    :class:`AuthenticationError`.
+    """
+    completed = 0
+    result: Optional[Tuple[int, bool, Any]] = None
+    with _connect(address, connect_timeout) as sock:
+        if authkey is not None:
+            authenticate(sock, authkey, server=False, timeout=connect_timeout)
+        send_message(sock, ("hello", name or f"{socket.gethostname()}:{os.getpid()}"))
+        while True:
+            try:
+                message = encode_message(("ready", result))
+            except Exception as exc:  # noqa: BLE001 - the result itself could not be pickled
+                message = encode_message(("ready", (result[0], False, RuntimeError(f"unpicklable result: {exc!r}"))))
+            try:
+                sock.sendall(message)
+                reply = recv_message(sock)
+                if reply[0] == "state":
+                    install_state({name: pickle.loads(payload) for name, payload in reply[1].items()})
+                    reply = recv_message(sock)
+            except ConnectionError:
+                return completed
+            if reply[0] == "shutdown":
+                return completed
+            _, task_id, fn, args, kwargs = reply
+            try:
+                result = (task_id, True, fn(*args, **kwargs))
+            except Exception as exc:  # noqa: BLE001 - returned to the coordinator
+                result = (task_id, False, exc)
+            completed += 1
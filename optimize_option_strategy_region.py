@@ -337,6 +337,49 @@ def parse_args() -> argparse.Namespace:
         default=5.0,
         help="How often to emit BO progress logs in seconds. Set <=0 to disable periodic logs.",
     )
+    parser.add_argument(
+        "--telemetry-path",
+        default="",
+        help="Rewrite BO telemetry to this file (JSON, or Prometheus text format for a .prom suffix).",
+    )
+    parser.add_argument("--telemetry-seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--gp-mode",
+        choices=["full", "incremental"],
+        default="full",
+        help="full refits the GP on every trial; incremental keeps a bounded active set with rank-one updates.",
+    )
+    parser.add_argument("--gp-max-active", type=int, default=256, help="Active-set size for --gp-mode incremental.")
+    parser.add_argument(
+        "--gp-refit-every",
+        type=int,
+        default=10,
+        help="Trials between GP hyperparameter refits for --gp-mode incremental.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Backtest processes; each BO step evaluates a batch on a forked pool that shares the features.",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=0,
+        help="Proposals per BO step (Kriging believer over UCB). 0 uses --workers.",
+    )
+    parser.add_argument(
+        "--checkpoint-seconds",
+        type=float,
+        default=5.0,
+        help="Append new trials and cache entries as part files at most this often; <=0 flushes only on exit.",
+    )
+    parser.add_argument(
+        "--checkpoint-trials",
+        type=int,
+        default=0,
+        help="Also checkpoint once this many trials are pending (0 disables).",
+    )
 
     args = parser.parse_args()
     _apply_window_bounds_from_yaml(args)
@@ -388,6 +431,15 @@ def main() -> None:
         progress_interval_seconds=args.bo_progress_seconds,
         force_rebuild=args.force_rebuild,
         param_name_aliases=param_name_aliases,
+        telemetry_path=args.telemetry_path or None,
+        telemetry_interval_seconds=args.telemetry_seconds,
+        gp_mode=args.gp_mode,
+        gp_max_active=args.gp_max_active,
+        gp_refit_every=args.gp_refit_every,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        checkpoint_seconds=args.checkpoint_seconds,
+        checkpoint_trials=args.checkpoint_trials,
     )
     trials = optimizer.run(n_trials=args.trials)
 
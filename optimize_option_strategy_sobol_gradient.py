@@ -2,23 +2,45 @@
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import math
 import multiprocessing as mp
 import os
+import threading
 import time
-from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
-from dataclasses import dataclass
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from typing import Any, Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pandas as pd
 import yaml
 
-from backtest_option_strategy_sobol_gradient import PrecomputedFeatureBacktester
+from backtest_option_strategy_sobol_gradient import (
+    DEFAULT_TRIGGER_CACHE_SIZE,
+    EntryPlan,
+    PrecomputedFeatureBacktester,
+    TradeLedger,
+)
+from optimization.affinity import AffinityExecutor
 from optimization.constrained_bo import ParamSpec
+from optimization.frontier import ThresholdFrontier
+from optimization.journal import ArrowJournal, read_journal
+from optimization.local_search import BatchCMAES, CompassSearch, FiniteDifferenceAscent, LocalOptimizer
+from optimization.neighborhood import TrialNeighborhoodIndex
+from optimization.part_store import ParquetPartStore
+from optimization.remote_state import RemotePairPublisher, apply_entries
 from optimization.sobol_sampling import SobolSampler
+from optimization.telemetry import RunTelemetry, summary_line
+from optimization.trial_buffer import TrialColumnBuffer
+from optimization.surrogate import SeedSurrogate, SurrogateStats
+from optimization.work_queue import WorkQueueExecutor, authkey_from_env, is_loopback, parse_address, run_worker
+from option_signal_config import load_signal_strategy_dicts
 
 METRIC_KEYS: Tuple[str, ...] = (
     "total",
@@ -45,6 +67,24 @@ DIMENSION_ALIASES = {
     "vol_window": "vol_window_size",
 }
 
+# Fidelity of a stored trial. Only "full" rows carry complete metrics; the others record where
+# phase-1 screening stopped so the point is not re-screened on the next run.
+FIDELITY_FULL = "full"
+FIDELITY_TRIGGER_COUNT = "trigger_count"
+FIDELITY_RECENT_WINDOW = "recent_window"
+FIDELITY_PRUNED = "pruned"
+FIDELITY_SURROGATE_DEFERRED = "surrogate_deferred"
+
+PRUNE_REASON_TRADE_FLOOR = "dominated_trade_floor"
+PRUNE_REASON_SURROGATE = "surrogate_low_probability"
+
+# Work-queue state entry checked by remote workers against their own feature store; the other
+# entries are WorkerPairState snapshots keyed by pair label.
+REMOTE_FEATURE_VERSION_ENTRY = "feature_data_version"
+
+# Full-history ledgers kept in memory per process under --ledger-cache on; older ones stay on disk.
+DEFAULT_LEDGER_CACHE_SIZE = 4096
+
 
 @dataclass(frozen=True)
 class DimensionSpec:
@@ -52,6 +92,7 @@ class DimensionSpec:
     low: float
     high: float
     kind: str
+    step: Optional[float] = None
 
     @property
     def is_int(self) -> bool:
@@ -65,6 +106,10 @@ class RunContext:
     start_date: Optional[str]
     end_date: Optional[str]
 
+    @property
+    def label(self) -> str:
+        return f"{self.side}.{self.symbol}"
+
 
 @dataclass(frozen=True)
 class CandidateRun:
@@ -84,13 +129,173 @@ class Phase2CandidateStats:
     cache_or_duplicate_skips: int = 0
     candidate_shortfall: int = 0
     draws_attempted: int = 0
+    seeds_skipped_dense: int = 0
+    probes_shrunk_dense: int = 0
+
+
+@dataclass(frozen=True)
+class ScreeningPlan:
+    """Phase-1 screening settings shared with pool workers.
+
+    ``window_starts`` holds the start date of each successive-halving rung, shortest window first.
+    """
+
+    mode: str
+    min_trades: float
+    window_starts: Tuple[str, ...] = ()
+
+
+@dataclass
+class ScreeningStats:
+    trigger_screened: int = 0
+    window_demoted: int = 0
+    window_pruned_itm: int = 0
+    window_evaluations: int = 0
+    promoted_full: int = 0
+
+
+@dataclass
+class HalvingRung:
+    """Points screened on one successive-halving window: cache keys, trial ids and rank metric columns.
+
+    The trial rows themselves are already ingested; promoted points read their params back from them.
+    """
+
+    RANK_METRICS = ("total", "max_drawdown", "itm_expiries", "total_pnl")
+
+    keys: List[str] = field(default_factory=list)
+    trial_ids: List[int] = field(default_factory=list)
+    ranks: Dict[str, List[float]] = field(default_factory=lambda: {k: [] for k in HalvingRung.RANK_METRICS})
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def add(self, key: str, trial_id: int, metrics: Dict[str, float]) -> None:
+        self.keys.append(key)
+        self.trial_ids.append(int(trial_id))
+        for name, values in self.ranks.items():
+            values.append(float(metrics.get(name, np.nan)))
+
+    def column(self, column: str, default: float) -> np.ndarray:
+        """``metric__<name>`` rank column, with ``default`` for missing values."""
+        values = np.asarray(self.ranks[column.removeprefix("metric__")], dtype=float)
+        return np.nan_to_num(values, nan=default)
+
+
+@dataclass(frozen=True)
+class WorkerEvaluation:
+    feasible: bool
+    metrics: Dict[str, float]
+    # _trigger_metrics_key of the entry set; equal hashes mean equal metrics.
+    trigger_hash: Optional[str] = None
+    reused: bool = False
+    # Trigger-bitmap cache lookups this task made in the worker's backtester, and that worker's pid.
+    backtest_cache_hits: int = 0
+    backtest_cache_misses: int = 0
+    worker_pid: int = 0
+    # Set when the metrics were sliced from a full-history ledger; ``ledger`` only when newly built.
+    ledger_key: Optional[str] = None
+    ledger: Optional[TradeLedger] = None
+    ledger_read: bool = False
+
+
+@dataclass(frozen=True)
+class Phase1Result:
+    params: Dict[str, float]
+    key: str
+    evaluation: WorkerEvaluation
+    fidelity: str
+    surrogate_prob: Optional[float] = None
+
+
+@dataclass(frozen=True)
+class TrialRecord:
+    """One result headed for the pending trial buffer; a None ``objective_score`` is derived from metrics."""
+
+    params: Dict[str, float]
+    cache_key: str
+    phase: str
+    feasible: bool
+    metrics: Dict[str, float]
+    parent_trial_id: Optional[int] = None
+    seed_rank: Optional[int] = None
+    objective_score: Optional[float] = None
+    fidelity: str = FIDELITY_FULL
+    fidelity_start_date: Optional[str] = None
+    trigger_hash: Optional[str] = None
+    reused: bool = False
+
+
+@dataclass
+class GradientSeedState:
+    """One seed's local optimizer, advanced batch by batch as its probe results arrive."""
+
+    seed_rank: int
+    seed_trial_id: int
+    optimizer: LocalOptimizer
+    keys: List[str] = field(default_factory=list)
+    rows: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    pending: set[str] = field(default_factory=set)
+    done: bool = False
+    # Distinct points told so far, and the count at which the optimizer's best last improved.
+    evaluations: int = 0
+    evaluations_to_best: int = 0
+
+
+@dataclass
+class WorkerPairState:
+    """Per-(symbol, side) state forked into pool workers."""
+
+    dim_specs: Dict[str, DimensionSpec]
+    base_knobs: Dict[str, Any]
+    context: RunContext
+    eval_kwargs: Dict[str, Any]
+    sobol: Optional[SobolSampler] = None
+    screening: Optional[ScreeningPlan] = None
+    frontier: Optional[ThresholdFrontier] = None
+    known_keys: frozenset[str] = frozenset()
+    trigger_metrics: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    # None unless --ledger-cache is on; an LRU of at most ledger_cache_size entries.
+    ledgers: Optional["OrderedDict[str, TradeLedger]"] = None
+    ledger_cache_size: int = DEFAULT_LEDGER_CACHE_SIZE
+    # --routing window_pair: backtest each phase-1 chunk grouped by integer window pair.
+    route_windows: bool = False
+
+
+class PoolFairShare:
+    """Split a shared pool's in-flight budget evenly across the runs that are still active."""
+
+    def __init__(self, budget: int, active: int) -> None:
+        self.budget = max(1, int(budget))
+        self.active = max(1, int(active))
+        self._lock = threading.Lock()
+
+    def cap(self) -> int:
+        with self._lock:
+            return max(1, int(math.ceil(self.budget / max(1, self.active))))
+
+    def release(self) -> None:
+        with self._lock:
+            self.active = max(1, self.active - 1)
 
 
 _WORKER_BACKTESTER: Optional[PrecomputedFeatureBacktester] = None
-_WORKER_DIM_SPECS: Dict[str, DimensionSpec] = {}
-_WORKER_BASE_KNOBS: Dict[str, Any] = {}
-_WORKER_CONTEXT: Optional[RunContext] = None
-_WORKER_EVAL_KWARGS: Dict[str, Any] = {}
+_WORKER_PAIRS: Dict[str, WorkerPairState] = {}
+
+
+def _snap_params_from_specs(dim_specs: Dict[str, DimensionSpec], params: Dict[str, float]) -> Dict[str, float]:
+    """Snap each dimension onto its ``low + k * step`` grid inside the bounds, then apply int rounding."""
+    out = dict(params)
+    for name, spec in dim_specs.items():
+        if name not in params:
+            continue
+        value = float(params[name])
+        if spec.step:
+            max_steps = math.floor((spec.high - spec.low) / spec.step + 1e-9)
+            steps = min(max(round((value - spec.low) / spec.step), 0), max_steps)
+            value = round(spec.low + steps * spec.step, 12)
+        out[name] = float(int(round(value))) if spec.is_int else float(value)
+    return out
 
 
 def _compose_knobs_from_specs(
@@ -99,7 +304,7 @@ def _compose_knobs_from_specs(
     params: Dict[str, float],
 ) -> Dict[str, Any]:
     knobs = dict(base_knobs)
-    for name, value in params.items():
+    for name, value in _snap_params_from_specs(dim_specs, params).items():
         spec = dim_specs[name]
         if spec.is_int:
             knobs[name] = int(round(float(value)))
@@ -113,6 +318,89 @@ def _compose_knobs_from_specs(
     return knobs
 
 
+def _cache_key_from_specs(
+    context: RunContext,
+    dim_specs: Dict[str, DimensionSpec],
+    params: Dict[str, float],
+) -> str:
+    payload: Dict[str, Any] = {
+        "symbol": context.symbol,
+        "side": context.side,
+        "start_date": context.start_date,
+        "end_date": context.end_date,
+    }
+    params = _snap_params_from_specs(dim_specs, params)
+    for name in sorted(dim_specs):
+        spec = dim_specs[name]
+        value = float(params[name])
+        payload[name] = int(round(value)) if spec.is_int else round(value, 12)
+    return json.dumps(payload, sort_keys=True)
+
+
+def _ledger_key_from_specs(
+    context: RunContext,
+    dim_specs: Dict[str, DimensionSpec],
+    params: Dict[str, float],
+    eval_kwargs: Dict[str, Any],
+    feature_data_version: str,
+) -> str:
+    """Date-agnostic cache key: one full-history ledger serves every backtest window."""
+    payload = json.loads(_cache_key_from_specs(context, dim_specs, params))
+    payload.pop("start_date")
+    payload.pop("end_date")
+    payload["risk_free_rate"] = float(eval_kwargs["risk_free_rate"])
+    payload["min_pricing_vol_annualized"] = float(eval_kwargs["min_pricing_vol_annualized"])
+    payload["feature_data_version"] = str(feature_data_version)
+    return json.dumps(payload, sort_keys=True)
+
+
+def _trigger_metrics_key(entries: EntryPlan, eval_kwargs: Dict[str, Any], feature_data_version: str) -> str:
+    """Entry-set signature plus everything else the priced metrics depend on, as stored in trigger_hash.
+
+    A run resumed with other pricing settings or rebuilt features never matches the old rows' hashes.
+    """
+    payload = "|".join(
+        [
+            entries.signature,
+            repr(float(eval_kwargs["risk_free_rate"])),
+            repr(float(eval_kwargs["min_pricing_vol_annualized"])),
+            str(int(eval_kwargs["contract_size"])),
+            str(feature_data_version),
+        ]
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def _remember_ledger(ledgers: "OrderedDict[str, TradeLedger]", key: str, ledger: TradeLedger, size: int) -> None:
+    ledgers[key] = ledger
+    ledgers.move_to_end(key)
+    while len(ledgers) > size:
+        ledgers.popitem(last=False)
+
+
+def _ledger_to_record(key: str, ledger: TradeLedger) -> Dict[str, Any]:
+    return {
+        "ledger_key": key,
+        "history_rows": int(ledger.history_rows),
+        "risk_free_rate": float(ledger.risk_free_rate),
+        "min_pricing_vol_annualized": float(ledger.min_pricing_vol_annualized),
+        "entry_idx": np.asarray(ledger.entry_idx, dtype=np.int32).tobytes(),
+        "exit_idx": np.asarray(ledger.exit_idx, dtype=np.int32).tobytes(),
+        "premium": np.asarray(ledger.premium, dtype=np.float64).tobytes(),
+    }
+
+
+def _ledger_from_record(record: Dict[str, Any]) -> TradeLedger:
+    return TradeLedger(
+        entry_idx=np.frombuffer(record["entry_idx"], dtype=np.int32),
+        exit_idx=np.frombuffer(record["exit_idx"], dtype=np.int32),
+        premium=np.frombuffer(record["premium"], dtype=np.float64),
+        history_rows=int(record["history_rows"]),
+        risk_free_rate=float(record["risk_free_rate"]),
+        min_pricing_vol_annualized=float(record["min_pricing_vol_annualized"]),
+    )
+
+
 def _install_process_worker_state(
     *,
     backtester: PrecomputedFeatureBacktester,
@@ -120,43 +408,326 @@ def _install_process_worker_state(
     base_knobs: Dict[str, Any],
     context: RunContext,
     eval_kwargs: Dict[str, Any],
+    sobol: Optional[SobolSampler] = None,
+    screening: Optional[ScreeningPlan] = None,
+    frontier: Optional[ThresholdFrontier] = None,
+    route_windows: bool = False,
 ) -> None:
-    global _WORKER_BACKTESTER, _WORKER_DIM_SPECS, _WORKER_BASE_KNOBS, _WORKER_CONTEXT, _WORKER_EVAL_KWARGS
+    global _WORKER_BACKTESTER
     _WORKER_BACKTESTER = backtester
-    _WORKER_DIM_SPECS = dim_specs
-    _WORKER_BASE_KNOBS = base_knobs
-    _WORKER_CONTEXT = context
-    _WORKER_EVAL_KWARGS = eval_kwargs
+    _WORKER_PAIRS[context.label] = WorkerPairState(
+        dim_specs=dim_specs,
+        base_knobs=base_knobs,
+        context=context,
+        eval_kwargs=eval_kwargs,
+        sobol=sobol,
+        screening=screening,
+        frontier=frontier,
+        route_windows=route_windows,
+    )
+
+
+def _install_worker_known_keys(pair: str, keys: Iterable[str]) -> None:
+    """Publish a read-only snapshot of cached keys; forked workers inherit it copy-on-write."""
+    _WORKER_PAIRS[pair].known_keys = frozenset(keys)
+
+
+def _install_worker_trigger_metrics(pair: str, trigger_metrics: Dict[str, Dict[str, float]]) -> None:
+    """Share the parent's entry-signature cache; each pool forked later starts from its current contents."""
+    _WORKER_PAIRS[pair].trigger_metrics = trigger_metrics
+
+
+def _install_worker_ledgers(
+    pair: str, ledgers: Optional["OrderedDict[str, TradeLedger]"], size: int = DEFAULT_LEDGER_CACHE_SIZE
+) -> None:
+    """Share the parent's ledger cache the same way as the entry-signature cache."""
+    _WORKER_PAIRS[pair].ledgers = ledgers
+    _WORKER_PAIRS[pair].ledger_cache_size = size
+
+
+def _worker_pair_state(pair: str) -> WorkerPairState:
+    state = _WORKER_PAIRS.get(pair)
+    if _WORKER_BACKTESTER is None or state is None:
+        raise RuntimeError(f"Multiprocessing worker state is unavailable for {pair}.")
+    return state
 
 
 def _process_worker_initializer() -> None:
-    if _WORKER_BACKTESTER is None or _WORKER_CONTEXT is None:
+    if _WORKER_BACKTESTER is None or not _WORKER_PAIRS:
         raise RuntimeError("Multiprocessing worker state not initialized before fork.")
 
 
-def _process_worker_backtest(params: Dict[str, float]) -> Tuple[bool, Dict[str, float]]:
-    if _WORKER_BACKTESTER is None or _WORKER_CONTEXT is None:
-        raise RuntimeError("Multiprocessing worker state is unavailable.")
-    knobs = _compose_knobs_from_specs(_WORKER_BASE_KNOBS, _WORKER_DIM_SPECS, params)
+def _install_remote_worker_state(backtester: PrecomputedFeatureBacktester, entries: Dict[str, Any]) -> None:
+    """Apply state published by a --coordinator-listen run to this --worker-connect process.
+
+    A pair's :class:`WorkerPairState` arrives once; its trigger-metrics and ledger deltas follow.
+    """
+    global _WORKER_BACKTESTER
+    version = entries.pop(REMOTE_FEATURE_VERSION_ENTRY, None)
+    if version is not None and str(version) != backtester.feature_data_version:
+        raise ValueError(
+            f"Coordinator feature data version {version} does not match local {backtester.feature_data_version}."
+        )
+    _WORKER_BACKTESTER = backtester
+    apply_entries(entries, install_state=_WORKER_PAIRS.__setitem__, extend_cache=_extend_remote_worker_cache)
+
+
+def _extend_remote_worker_cache(pair: str, cache: str, entries: Dict[str, Any]) -> None:
+    state = _WORKER_PAIRS[pair]
+    if cache == "trigger_metrics":
+        state.trigger_metrics.update(entries)
+    elif state.ledgers is not None:
+        for key, ledger in entries.items():
+            _remember_ledger(state.ledgers, key, ledger, state.ledger_cache_size)
+
+
+def _worker_cache_counters() -> Tuple[int, int]:
+    return _WORKER_BACKTESTER.trigger_cache_hits, _WORKER_BACKTESTER.trigger_cache_misses
+
+
+def _with_cache_delta(evaluation: WorkerEvaluation, before: Tuple[int, int]) -> WorkerEvaluation:
+    hits, misses = _worker_cache_counters()
+    return replace(
+        evaluation,
+        backtest_cache_hits=hits - before[0],
+        backtest_cache_misses=misses - before[1],
+        worker_pid=os.getpid(),
+    )
+
+
+def _window_pair_from_specs(dim_specs: Dict[str, DimensionSpec], params: Dict[str, float]) -> Tuple[int, ...]:
+    """Routing key: the integer (window size) dimensions, which select the feature columns a backtest reads."""
+    return tuple(int(round(float(params[name]))) for name, spec in dim_specs.items() if spec.is_int)
+
+
+def _process_worker_backtest(
+    pair: str,
+    params: Dict[str, float],
+    start_date: Optional[str] = None,
+    entries: Optional[EntryPlan] = None,
+) -> WorkerEvaluation:
+    state = _worker_pair_state(pair)
+    knobs = _compose_knobs_from_specs(state.base_knobs, state.dim_specs, params)
+    start_date = start_date or state.context.start_date
+    counters = _worker_cache_counters()
+    if state.ledgers is not None:
+        evaluation = _process_worker_ledger_backtest(state, params, knobs, start_date)
+        if evaluation is not None:
+            return _with_cache_delta(evaluation, counters)
+    if entries is None:
+        entries = _WORKER_BACKTESTER.entry_plan(
+            knobs_input=knobs,
+            symbol=state.context.symbol,
+            start_date=start_date,
+            end_date=state.context.end_date,
+        )
+    signature = None
+    if entries is not None:
+        signature = _trigger_metrics_key(entries, state.eval_kwargs, _WORKER_BACKTESTER.feature_data_version)
+    if signature is not None and signature in state.trigger_metrics:
+        evaluation = WorkerEvaluation(True, dict(state.trigger_metrics[signature]), signature, reused=True)
+        return _with_cache_delta(evaluation, counters)
+
     evaluation = _WORKER_BACKTESTER.evaluate(
         knobs_input=knobs,
-        symbol=_WORKER_CONTEXT.symbol,
-        start_date=_WORKER_CONTEXT.start_date,
-        end_date=_WORKER_CONTEXT.end_date,
-        risk_free_rate=float(_WORKER_EVAL_KWARGS["risk_free_rate"]),
-        min_pricing_vol_annualized=float(_WORKER_EVAL_KWARGS["min_pricing_vol_annualized"]),
-        contract_size=int(_WORKER_EVAL_KWARGS["contract_size"]),
+        symbol=state.context.symbol,
+        start_date=start_date,
+        end_date=state.context.end_date,
+        risk_free_rate=float(state.eval_kwargs["risk_free_rate"]),
+        min_pricing_vol_annualized=float(state.eval_kwargs["min_pricing_vol_annualized"]),
+        contract_size=int(state.eval_kwargs["contract_size"]),
+        plan=entries,
     )
     metrics = {k: float(evaluation.metrics.get(k, 0.0)) for k in METRIC_KEYS}
-    return bool(evaluation.feasible), metrics
+    if signature is not None and evaluation.feasible:
+        state.trigger_metrics[signature] = metrics
+    return _with_cache_delta(WorkerEvaluation(bool(evaluation.feasible), metrics, signature), counters)
+
+
+def _process_worker_ledger_backtest(
+    state: WorkerPairState,
+    params: Dict[str, float],
+    knobs: Dict[str, Any],
+    start_date: Optional[str],
+) -> Optional[WorkerEvaluation]:
+    """Slice the knob set's full-history ledger to the window, building it first on a miss."""
+    key = _ledger_key_from_specs(
+        state.context,
+        state.dim_specs,
+        params,
+        state.eval_kwargs,
+        _WORKER_BACKTESTER.feature_data_version,
+    )
+    ledger = state.ledgers.get(key)
+    built = ledger is None
+    if not built:
+        state.ledgers.move_to_end(key)
+    else:
+        ledger = _WORKER_BACKTESTER.trade_ledger(
+            knobs_input=knobs,
+            symbol=state.context.symbol,
+            risk_free_rate=float(state.eval_kwargs["risk_free_rate"]),
+            min_pricing_vol_annualized=float(state.eval_kwargs["min_pricing_vol_annualized"]),
+        )
+        if ledger is None:
+            return None
+        _remember_ledger(state.ledgers, key, ledger, state.ledger_cache_size)
+    evaluation = _WORKER_BACKTESTER.evaluate_ledger(
+        ledger,
+        knobs_input=knobs,
+        symbol=state.context.symbol,
+        start_date=start_date,
+        end_date=state.context.end_date,
+        contract_size=int(state.eval_kwargs["contract_size"]),
+    )
+    if evaluation is None:
+        return None
+    metrics = {k: float(evaluation.metrics.get(k, 0.0)) for k in METRIC_KEYS}
+    return WorkerEvaluation(
+        bool(evaluation.feasible),
+        metrics,
+        ledger_key=key,
+        ledger=ledger if built else None,
+        ledger_read=not built,
+    )
+
+
+def _pruned_metrics() -> Dict[str, float]:
+    return {k: float("nan") for k in METRIC_KEYS}
+
+
+def _process_worker_screened_backtest(pair: str, params: Dict[str, float]) -> Tuple[WorkerEvaluation, str]:
+    """Backtest at the lowest fidelity that can still rule the point out as a seed."""
+    state = _worker_pair_state(pair)
+    knobs = _compose_knobs_from_specs(state.base_knobs, state.dim_specs, params)
+    frontier = state.frontier
+    if frontier is not None and frontier.dominated(knobs):
+        return WorkerEvaluation(True, _pruned_metrics()), FIDELITY_PRUNED
+    counters = _worker_cache_counters()
+    evaluation, fidelity = _process_worker_screen(pair, params, knobs)
+    # Covers the screening entry plan as well as any nested full backtest.
+    evaluation = _with_cache_delta(evaluation, counters)
+    # Each worker process keeps learning from its own results on top of the forked snapshot.
+    if frontier is not None and evaluation.feasible and fidelity != FIDELITY_RECENT_WINDOW:
+        frontier.observe(knobs, evaluation.metrics["total"])
+    return evaluation, fidelity
+
+
+def _process_worker_screen(
+    pair: str,
+    params: Dict[str, float],
+    knobs: Dict[str, Any],
+) -> Tuple[WorkerEvaluation, str]:
+    state = _worker_pair_state(pair)
+    plan = state.screening
+    if plan is None or plan.mode == "off":
+        return _process_worker_backtest(pair, params), FIDELITY_FULL
+
+    entries = _WORKER_BACKTESTER.entry_plan(
+        knobs_input=knobs,
+        symbol=state.context.symbol,
+        start_date=state.context.start_date,
+        end_date=state.context.end_date,
+    )
+    # The trigger pass counts trades exactly, so these points can never pass --min-seed-trades.
+    if entries is not None and len(entries.entries) <= plan.min_trades:
+        metrics = {k: 0.0 for k in METRIC_KEYS}
+        metrics["total"] = float(len(entries.entries))
+        trigger_hash = _trigger_metrics_key(entries, state.eval_kwargs, _WORKER_BACKTESTER.feature_data_version)
+        return WorkerEvaluation(True, metrics, trigger_hash), FIDELITY_TRIGGER_COUNT
+    if entries is not None and plan.mode == "halving" and plan.window_starts:
+        return _process_worker_backtest(pair, params, plan.window_starts[0]), FIDELITY_RECENT_WINDOW
+    return _process_worker_backtest(pair, params, entries=entries), FIDELITY_FULL
+
+
+def _normalized_matrix_from_specs(
+    dim_specs: Dict[str, DimensionSpec],
+    params_rows: Sequence[Dict[str, float]],
+) -> np.ndarray:
+    out = np.zeros((len(params_rows), len(dim_specs)), dtype=float)
+    for i, spec in enumerate(dim_specs.values()):
+        width = float(spec.high - spec.low)
+        if width > 0:
+            out[:, i] = [(float(row[spec.name]) - float(spec.low)) / width for row in params_rows]
+    return np.clip(out, 0.0, 1.0)
+
+
+def _process_worker_sobol_range(
+    pair: str,
+    start: int,
+    count: int,
+    surrogate: Optional[SeedSurrogate] = None,
+) -> Tuple[List[Phase1Result], int]:
+    """Generate Sobol points ``[start, start + count)`` and backtest the ones not already cached.
+
+    With a fitted ``surrogate`` the range is scored in one batch and points below its cutoff are
+    deferred unless drawn for exploration. Returns the new results and the number of points skipped
+    as cache hits or in-range duplicates.
+    """
+    state = _worker_pair_state(pair)
+    if state.sobol is None:
+        raise RuntimeError(f"Sobol sampler is unavailable for {pair}.")
+    pending: List[Tuple[Dict[str, float], str]] = []
+    seen: set[str] = set()
+    skipped = 0
+    for params in state.sobol.sample_params_range(start, count):
+        params = _snap_params_from_specs(state.dim_specs, params)
+        key = _cache_key_from_specs(state.context, state.dim_specs, params)
+        if key in state.known_keys or key in seen:
+            skipped += 1
+            continue
+        seen.add(key)
+        pending.append((params, key))
+    if state.route_windows:
+        # Low-discrepancy order almost never repeats a window pair; grouping keeps the trigger cache warm.
+        pending.sort(key=lambda item: _window_pair_from_specs(state.dim_specs, item[0]))
+
+    probs: List[Optional[float]] = [None] * len(pending)
+    if surrogate is not None and surrogate.fitted and pending:
+        matrix = _normalized_matrix_from_specs(state.dim_specs, [params for params, _ in pending])
+        probs = [float(p) for p in surrogate.predict_proba(matrix)]
+
+    results: List[Phase1Result] = []
+    for (params, key), prob in zip(pending, probs):
+        if prob is not None and prob < surrogate.cutoff and not surrogate.should_explore(key):
+            results.append(
+                Phase1Result(
+                    params=params,
+                    key=key,
+                    evaluation=WorkerEvaluation(True, _pruned_metrics()),
+                    fidelity=FIDELITY_SURROGATE_DEFERRED,
+                    surrogate_prob=prob,
+                )
+            )
+            continue
+        evaluation, fidelity = _process_worker_screened_backtest(pair, params)
+        results.append(Phase1Result(params, key, evaluation, fidelity, surrogate_prob=prob))
+    return results, skipped
 
 
 class Orchestrator:
-    def __init__(self, args: argparse.Namespace) -> None:
+    def __init__(
+        self,
+        args: argparse.Namespace,
+        *,
+        backtester: Optional[PrecomputedFeatureBacktester] = None,
+        fair_share: Optional[PoolFairShare] = None,
+        log_label: Optional[str] = None,
+    ) -> None:
         self.args = args
         self.workers = self._resolve_workers(args.workers)
-
-        self.backtester = PrecomputedFeatureBacktester.from_parquet(args.features_parquet)
+        # Set by run_universe so every (symbol, side) run shares one forked pool, or to the
+        # --coordinator-listen work queue.
+        self.shared_executor: Optional[Executor] = None
+        self.fair_share = fair_share
+        self.log_label = log_label
+
+        if backtester is None:
+            backtester = PrecomputedFeatureBacktester.from_parquet(
+                args.features_parquet,
+                trigger_cache_size=int(args.backtest_cache_size),
+            )
+        self.backtester = backtester
         self.dim_specs = self._resolve_dimensions(args.window_config_yaml, self.backtester.df)
         self.search_space = {
             name: ParamSpec(low=spec.low, high=spec.high, is_int=spec.is_int)
@@ -176,27 +747,166 @@ class Orchestrator:
             "min_pricing_vol_annualized": float(args.min_pricing_vol),
             "contract_size": int(args.contract_size),
         }
+        self.screening = self._build_screening_plan()
+        self.frontier: Optional[ThresholdFrontier] = None
+        if str(args.monotone_pruning) == "on":
+            self.frontier = ThresholdFrontier(floor=float(args.min_seed_trades))
         _install_process_worker_state(
             backtester=self.backtester,
             dim_specs=self.dim_specs,
             base_knobs=self.base_knobs,
             context=self.context,
             eval_kwargs=self.eval_kwargs,
+            sobol=self.sobol,
+            screening=self.screening,
+            frontier=self.frontier,
+            route_windows=str(args.routing) == "window_pair",
         )
 
         self.parquet_path = Path(args.trials_parquet)
-        self.df = self._load_trials_df()
+        # Checkpoints append part files next to the trials parquet; run() compacts them at the end.
+        self.trials_store = ParquetPartStore(self.parquet_path)
+        self.journal_path = self.parquet_path.with_name(f"{self.parquet_path.stem}.journal.arrow")
+        self.df = self._replay_journal(self._load_trials_df())
         self.next_trial_id = self._next_trial_id()
+        # Full-fidelity rows only; screened rows live in screened_keys and never satisfy a cache lookup
+        # that needs metrics.
         self.key_to_trial_id: Dict[str, int] = {}
+        self.screened_keys: Dict[str, int] = {}
+        # Surrogate deferrals are not final: later runs rescore them with a newer model.
+        self.deferred_keys: Dict[str, int] = {}
         self._rebuild_key_index()
-
-        self.pending_rows: List[Dict[str, Any]] = []
+        self._learn_frontier_from_df()
+        _install_worker_known_keys(self.context.label, self._phase1_known_keys())
+        self.trigger_metrics: Dict[str, Dict[str, float]] = {}
+        self.trigger_reuse_count = 0
+        self.backtest_cache_hits = 0
+        self.backtest_cache_misses = 0
+        # pid -> [trigger cache hits, misses] for the evaluations each worker process returned.
+        self.worker_cache_stats: Dict[int, List[int]] = {}
+        self.routing_stolen = 0
+        self._learn_trigger_metrics_from_df()
+        _install_worker_trigger_metrics(self.context.label, self.trigger_metrics)
+        self.ledger_path = self.parquet_path.with_name(f"{self.parquet_path.stem}.ledgers.parquet")
+        # Like the trials, new ledgers are appended as part files at each checkpoint and compacted by run().
+        self.ledger_store = ParquetPartStore(self.ledger_path)
+        self.ledger_cache_size = int(args.ledger_cache_size)
+        self.ledgers: Optional["OrderedDict[str, TradeLedger]"] = None
+        if str(args.ledger_cache) == "on":
+            self.ledgers = self._load_ledgers()
+        # Ledgers built since the last checkpoint; kept even after the LRU evicts them.
+        self.pending_ledgers: Dict[str, TradeLedger] = {}
+        self.ledger_reads = 0
+        _install_worker_ledgers(self.context.label, self.ledgers, self.ledger_cache_size)
+        # --coordinator-listen: the pair state goes out once, then only cache entries added since.
+        self.remote_publisher = RemotePairPublisher(self.context.label)
+        # The ledger LRU evicts and reorders, so remote deltas list the keys observed since the last publish.
+        self.remote_ledger_keys: Optional[List[str]] = None
+        if args.coordinator_listen:
+            self.remote_ledger_keys = list(self.ledgers or ())
+
+        self.pending_trials = TrialColumnBuffer(
+            self._trial_columns(),
+            constants={
+                "symbol": self.context.symbol,
+                "side": self.context.side,
+                "start_date": self.context.start_date,
+                "end_date": self.context.end_date,
+            },
+        )
+        self.journal: Optional[ArrowJournal] = None
+        if str(args.journal) == "on":
+            self.journal = ArrowJournal(
+                self.journal_path,
+                self.pending_trials.schema,
+                sync_seconds=float(args.journal_sync_seconds),
+            )
         self.last_progress_at = 0.0
         self.last_checkpoint_at = time.monotonic()
         self.gradient_submitted = 0
         self.gradient_cache_hits = 0
+        self.gradient_states: List[GradientSeedState] = []
+        self.screening_stats = ScreeningStats()
+        self.pruned_count = 0
+        self.surrogate: Optional[SeedSurrogate] = None
+        if str(args.surrogate) == "on":
+            self.surrogate = SeedSurrogate(
+                cutoff=float(args.surrogate_cutoff),
+                explore_rate=float(args.surrogate_explore),
+                random_state=int(args.seed),
+            )
+        self.surrogate_stats = SurrogateStats()
+        self.surrogate_observed_at_fit = 0
 
         self.best_row: Optional[Dict[str, Any]] = self._compute_best_from_df(self.df)
+        self.neighborhood = TrialNeighborhoodIndex(dim=len(self.dim_specs))
+        self.telemetry = RunTelemetry(
+            args.telemetry_path or None,
+            run=self.context.label,
+            workers=self.workers,
+            interval_seconds=float(args.telemetry_seconds),
+        )
+
+    def _emit(self, message: str) -> None:
+        if self.log_label:
+            message = f"[{self.log_label}] {message}"
+        print(message, flush=True)
+
+    @contextmanager
+    def _executor_scope(self) -> Iterator[Executor]:
+        if self.shared_executor is not None:
+            if isinstance(self.shared_executor, WorkQueueExecutor):
+                self._publish_remote_state(self.shared_executor)
+            yield self.shared_executor
+            return
+        if str(self.args.routing) == "window_pair":
+            with AffinityExecutor(
+                self.workers,
+                mp_context=mp.get_context("fork"),
+                initializer=_process_worker_initializer,
+            ) as executor:
+                try:
+                    yield executor
+                finally:
+                    self.routing_stolen += executor.stolen
+            return
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=mp.get_context("fork"),
+            initializer=_process_worker_initializer,
+        ) as executor:
+            yield executor
+
+    def _publish_remote_state(self, executor: WorkQueueExecutor) -> None:
+        """Remote workers cannot inherit state by fork: publish the pair state once, then cache deltas.
+
+        Like a shared forked pool, remote workers keep the known keys and frontier from the first
+        publish and learn from their own results after that; the parent's trigger-metrics cache only
+        grows, so each scope sends the entries added since the previous one, and the ledgers observed
+        since then that the parent's LRU still holds.
+        """
+        publisher = self.remote_publisher
+        if not publisher.state_published:
+            state = _WORKER_PAIRS[self.context.label]
+            ledgers = None if state.ledgers is None else OrderedDict()
+            publisher.publish_state(executor, replace(state, trigger_metrics={}, ledgers=ledgers))
+        publisher.publish_grown(executor, "trigger_metrics", self.trigger_metrics)
+        ledgers = self.ledgers or {}
+        publisher.publish_delta(
+            executor, "ledgers", {key: ledgers[key] for key in self.remote_ledger_keys or () if key in ledgers}
+        )
+        self.remote_ledger_keys = []
+
+    def _submit_backtest(self, executor: Executor, params: Dict[str, float], *args: Any) -> Future:
+        if isinstance(executor, AffinityExecutor):
+            key = _window_pair_from_specs(self.dim_specs, params)
+            return executor.submit_routed(key, _process_worker_backtest, self.context.label, params, *args)
+        return executor.submit(_process_worker_backtest, self.context.label, params, *args)
+
+    def _inflight_cap(self) -> int:
+        if self.fair_share is not None:
+            return self.fair_share.cap()
+        return self.workers * 2
 
     @staticmethod
     def _resolve_workers(requested_workers: int) -> int:
@@ -280,7 +990,11 @@ class Orchestrator:
             high = float(high_raw)
             if low > high:
                 raise ValueError(f"Invalid bounds for '{name}': {low} > {high}")
-            resolved[name] = DimensionSpec(name=name, low=low, high=high, kind=kind)
+            step_raw = spec.get("step")
+            step = None if step_raw is None else float(step_raw)
+            if step is not None and step <= 0:
+                raise ValueError(f"Invalid step for '{name}': {step} <= 0")
+            resolved[name] = DimensionSpec(name=name, low=low, high=high, kind=kind, step=step)
 
         if not resolved:
             raise ValueError("No optimization dimensions resolved.")
@@ -304,21 +1018,33 @@ class Orchestrator:
             "vol_range_high": float(args.vol_range_high),
         }
 
+    def _build_screening_plan(self) -> ScreeningPlan:
+        mode = str(self.args.phase1_screening)
+        window_starts: List[str] = []
+        if mode == "halving":
+            df = self.backtester.df
+            dates = df.loc[df["symbol"] == self.context.symbol, "date"]
+            if self.context.start_date:
+                dates = dates[dates >= pd.to_datetime(self.context.start_date)]
+            if self.context.end_date:
+                dates = dates[dates <= pd.to_datetime(self.context.end_date)]
+            if not dates.empty:
+                first, last = dates.min(), dates.max()
+                days = float(self.args.screen_window_days)
+                while last - pd.Timedelta(days=int(round(days))) > first:
+                    window_starts.append((last - pd.Timedelta(days=int(round(days)))).strftime("%Y-%m-%d"))
+                    days *= float(self.args.screen_eta)
+        return ScreeningPlan(
+            mode=mode,
+            min_trades=float(self.args.min_seed_trades),
+            window_starts=tuple(window_starts),
+        )
+
     def _compose_knobs(self, params: Dict[str, float]) -> Dict[str, Any]:
         return _compose_knobs_from_specs(self.base_knobs, self.dim_specs, params)
 
     def _cache_key(self, params: Dict[str, float]) -> str:
-        payload: Dict[str, Any] = {
-            "symbol": self.context.symbol,
-            "side": self.context.side,
-            "start_date": self.context.start_date,
-            "end_date": self.context.end_date,
-        }
-        for name in sorted(self.dim_specs):
-            spec = self.dim_specs[name]
-            value = float(params[name])
-            payload[name] = int(round(value)) if spec.is_int else round(value, 12)
-        return json.dumps(payload, sort_keys=True)
+        return _cache_key_from_specs(self.context, self.dim_specs, params)
 
     def _normalize_params(self, params: Dict[str, float]) -> np.ndarray:
         out: List[float] = []
@@ -334,14 +1060,13 @@ class Orchestrator:
         x = np.clip(np.asarray(x01, dtype=float), 0.0, 1.0)
         out: Dict[str, float] = {}
         for i, (name, spec) in enumerate(self.dim_specs.items()):
-            raw = float(spec.low) + float(x[i]) * float(spec.high - spec.low)
-            out[name] = float(int(round(raw))) if spec.is_int else float(raw)
-        return out
+            out[name] = float(spec.low) + float(x[i]) * float(spec.high - spec.low)
+        return _snap_params_from_specs(self.dim_specs, out)
 
     def _load_trials_df(self) -> pd.DataFrame:
-        if not self.parquet_path.exists():
+        loaded = self.trials_store.read()
+        if loaded is None:
             return pd.DataFrame(columns=self._trial_columns())
-        loaded = pd.read_parquet(self.parquet_path)
         for col in self._trial_columns():
             if col not in loaded.columns:
                 loaded[col] = np.nan
@@ -360,6 +1085,10 @@ class Orchestrator:
             "seed_rank",
             "feasible",
             "objective_score",
+            "fidelity",
+            "fidelity_start_date",
+            "prune_reason",
+            "trigger_hash",
         ]
         cols.extend(f"param__{name}" for name in self.dim_specs)
         cols.extend(f"metric__{name}" for name in METRIC_KEYS)
@@ -384,25 +1113,121 @@ class Orchestrator:
 
     def _rebuild_key_index(self) -> None:
         self.key_to_trial_id.clear()
+        self.screened_keys.clear()
+        self.deferred_keys.clear()
         if self.df.empty:
             return
         records = self.df.to_dict(orient="records")
         for row in records:
             trial_id = int(row.get("trial_id", -1))
+            # Stores written before screening existed only hold full backtests.
+            if not isinstance(row.get("fidelity"), str) or not row["fidelity"]:
+                row["fidelity"] = FIDELITY_FULL
             cache_key = row.get("cache_key")
-            if isinstance(cache_key, str) and cache_key:
+            if not (isinstance(cache_key, str) and cache_key):
+                cache_key = self._cache_key(self._row_params(row))
+                row["cache_key"] = cache_key
+            if row["fidelity"] == FIDELITY_FULL:
                 self.key_to_trial_id[cache_key] = trial_id
-                continue
-            params = self._row_params(row)
-            computed = self._cache_key(params)
-            self.key_to_trial_id[computed] = trial_id
-            row["cache_key"] = computed
+                self.screened_keys.pop(cache_key, None)
+            elif row["fidelity"] == FIDELITY_SURROGATE_DEFERRED:
+                self.deferred_keys[cache_key] = trial_id
+            elif cache_key not in self.key_to_trial_id:
+                self.screened_keys[cache_key] = trial_id
         self.df = pd.DataFrame(records)
 
+    def _learn_trigger_metrics_from_df(self) -> None:
+        df = self.df
+        if df.empty or "trigger_hash" not in df.columns:
+            return
+        hashes = df["trigger_hash"]
+        # Window rows hash their own start date, so they never collide with full-range entries.
+        hashed = np.flatnonzero(
+            (hashes.fillna("").astype(str) != "").to_numpy(dtype=bool)
+            & (self._metric_values(df, "feasible", 0.0) == 1)
+            & df["fidelity"].isin([FIDELITY_FULL, FIDELITY_RECENT_WINDOW]).to_numpy(dtype=bool)
+        )
+        metrics = np.column_stack([self._metric_values(df, f"metric__{k}", 0.0)[hashed] for k in METRIC_KEYS])
+        for trigger_hash, values in zip(hashes.to_numpy()[hashed].tolist(), metrics.tolist()):
+            self.trigger_metrics.setdefault(trigger_hash, dict(zip(METRIC_KEYS, values)))
+
+    def _params_rows(self, df: pd.DataFrame, positions: np.ndarray) -> List[Dict[str, float]]:
+        """:meth:`_row_params` for the rows at ``positions``, read column-wise."""
+        names = list(self.dim_specs)
+        values = np.zeros((len(positions), len(names)), dtype=float)
+        for i, (name, spec) in enumerate(self.dim_specs.items()):
+            values[:, i] = self._metric_values(df, f"param__{name}", float(spec.low))[positions]
+            if spec.is_int:
+                values[:, i] = np.round(values[:, i])
+        return [dict(zip(names, row)) for row in values.tolist()]
+
+    def _learn_frontier_from_df(self) -> None:
+        if self.frontier is None or self.df.empty:
+            return
+        df = self.df
+        totals = self._metric_values(df, "metric__total", np.nan)
+        # Only rows that can tighten the frontier: feasible full/trigger-count rows at or below the floor.
+        fidelity = df["fidelity"].isin([FIDELITY_FULL, FIDELITY_TRIGGER_COUNT]).to_numpy(dtype=bool)
+        observed = np.flatnonzero(
+            (self._metric_values(df, "feasible", 0.0) == 1) & fidelity & (totals <= self.frontier.floor)
+        )
+        for params, total in zip(self._params_rows(df, observed), totals[observed].tolist()):
+            self.frontier.observe(self._compose_knobs(params), total)
+
+    def _record_pruned(
+        self,
+        params: Dict[str, float],
+        *,
+        phase: str,
+        parent_trial_id: Optional[int],
+        seed_rank: Optional[int],
+    ) -> None:
+        self.pruned_count += 1
+        key = self._cache_key(params)
+        if key in self.screened_keys:
+            return
+        record = self._pruned_record(params, key, phase=phase, parent_trial_id=parent_trial_id, seed_rank=seed_rank)
+        self._ingest([record])
+
+    @staticmethod
+    def _pruned_record(
+        params: Dict[str, float],
+        key: str,
+        *,
+        phase: str,
+        parent_trial_id: Optional[int],
+        seed_rank: Optional[int],
+    ) -> TrialRecord:
+        return TrialRecord(
+            params=params,
+            cache_key=key,
+            phase=phase,
+            feasible=True,
+            metrics=_pruned_metrics(),
+            parent_trial_id=parent_trial_id,
+            seed_rank=seed_rank,
+            objective_score=float("nan"),
+            fidelity=FIDELITY_PRUNED,
+        )
+
+    def _phase1_known_keys(self) -> List[str]:
+        return [*self.key_to_trial_id.keys(), *self.screened_keys.keys()]
+
+    @staticmethod
+    def _is_full_fidelity(row: Dict[str, Any]) -> bool:
+        fidelity = row.get("fidelity")
+        return not isinstance(fidelity, str) or fidelity in {"", FIDELITY_FULL}
+
+    def _full_fidelity_mask(self, df: pd.DataFrame) -> np.ndarray:
+        if "fidelity" not in df.columns:
+            return np.ones(len(df), dtype=bool)
+        fidelity = df["fidelity"]
+        return (fidelity.isna() | fidelity.isin(["", FIDELITY_FULL])).to_numpy(dtype=bool)
+
     def _find_row_by_trial_id(self, trial_id: int) -> Optional[Dict[str, Any]]:
-        for row in reversed(self.pending_rows):
-            if int(row.get("trial_id", -1)) == int(trial_id):
-                return dict(row)
+        position = self.pending_trials.find(trial_id)
+        if position is not None:
+            return self.pending_trials.row(position)
         if self.df.empty:
             return None
         subset = self.df[pd.to_numeric(self.df["trial_id"], errors="coerce") == int(trial_id)]
@@ -418,6 +1243,17 @@ class Orchestrator:
         total_pnl = float(row.get("metric__total_pnl", -1e12))
         return total_pnl, -itm, drawdown, total
 
+    @staticmethod
+    def _objective_from_matrix(metrics: np.ndarray) -> np.ndarray:
+        """Row-wise :meth:`_objective_from_metrics` over a (rows, METRIC_KEYS) matrix."""
+        column = {name: metrics[:, i] for i, name in enumerate(METRIC_KEYS)}
+        return (
+            (1_000_000.0 * column["total_pnl"])
+            - (10_000.0 * column["itm_expiries"])
+            + (100.0 * column["max_drawdown"])
+            + column["total"]
+        )
+
     @staticmethod
     def _objective_from_metrics(metrics: Dict[str, float]) -> float:
         total = float(metrics.get("total", 0.0))
@@ -426,19 +1262,68 @@ class Orchestrator:
         total_pnl = float(metrics.get("total_pnl", 0.0))
         return (1_000_000.0 * total_pnl) - (10_000.0 * itm) + (100.0 * drawdown) + total
 
+    @staticmethod
+    def _metric_values(df: pd.DataFrame, column: str, default: float) -> np.ndarray:
+        if column not in df.columns:
+            return np.full(len(df), default, dtype=float)
+        return df[column].to_numpy(dtype=float, na_value=np.nan)
+
+    def _rank_order(self, df: pd.DataFrame, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Positions of ``df`` rows (or of ``positions``) in descending ``_rank_tuple`` order.
+
+        np.lexsort is stable, so ties keep their original order, as ``sorted(..., reverse=True)`` does.
+        """
+        if positions is None:
+            positions = np.arange(len(df))
+        return self._lexsort_rank(lambda column, default: self._metric_values(df, column, default), positions)
+
+    @staticmethod
+    def _lexsort_rank(values: Any, positions: np.ndarray) -> np.ndarray:
+        """Sort ``positions`` by ``_rank_tuple``, descending; ``values(column, default)`` yields full columns."""
+        keys = []
+        # lexsort's primary key is the last one: total_pnl, then -itm, drawdown and total.
+        for column, default, sign in (
+            ("metric__total", 0.0, -1.0),
+            ("metric__max_drawdown", -1e12, -1.0),
+            ("metric__itm_expiries", 0.0, 1.0),
+            ("metric__total_pnl", -1e12, -1.0),
+        ):
+            keys.append(sign * np.nan_to_num(values(column, default)[positions], nan=default))
+        return positions[np.lexsort(keys)]
+
+    def _records_at(self, df: pd.DataFrame, positions: np.ndarray) -> List[Dict[str, Any]]:
+        return df.iloc[positions].to_dict(orient="records")
+
     def _compute_best_from_df(self, df: pd.DataFrame) -> Optional[Dict[str, Any]]:
         if df.empty:
             return None
-        best: Optional[Dict[str, Any]] = None
-        for row in df.to_dict(orient="records"):
-            if best is None or self._rank_tuple(row) > self._rank_tuple(best):
-                best = row
-        return best
+        positions = np.flatnonzero(self._full_fidelity_mask(df))
+        if positions.size == 0:
+            return None
+        return self._records_at(df, self._rank_order(df, positions)[:1])[0]
 
     def _update_best(self, row: Dict[str, Any]) -> None:
+        if not self._is_full_fidelity(row):
+            return
         if self.best_row is None or self._rank_tuple(row) > self._rank_tuple(self.best_row):
             self.best_row = dict(row)
 
+    def _backtest_cache_summary(self) -> str:
+        return (
+            f"bt_cache_hits={self.backtest_cache_hits} bt_cache_misses={self.backtest_cache_misses} "
+            f"ledger_reads={self.ledger_reads}"
+        )
+
+    def _worker_cache_summary(self) -> str:
+        rates = []
+        for pid, (hits, misses) in sorted(self.worker_cache_stats.items()):
+            lookups = hits + misses
+            rates.append(f"{pid}:{hits / lookups if lookups else 0.0:.3f}({hits}/{lookups})")
+        return (
+            f"routing={self.args.routing} stolen={self.routing_stolen} "
+            f"bt_cache_hit_rates={','.join(rates) or 'none'}"
+        )
+
     def _log_progress(self, *, force: bool = False, prefix: str = "progress") -> None:
         if self.args.progress_seconds <= 0:
             return
@@ -447,46 +1332,108 @@ class Orchestrator:
             return
         self.last_progress_at = now
         if self.best_row is None:
-            print(f"[{prefix}] trials={len(self.df)} best=none", flush=True)
+            self._emit(
+                f"[{prefix}] trials={len(self.df)} pruned={self.pruned_count} "
+                f"trigger_reuse={self.trigger_reuse_count} {self._backtest_cache_summary()} best=none"
+            )
             return
-        print(
-            f"[{prefix}] trials={len(self.df)} "
-            f"best_trial_id={int(self.best_row['trial_id'])} "
+        self._emit(
+            f"[{prefix}] trials={len(self.df)} pruned={self.pruned_count} trigger_reuse={self.trigger_reuse_count} "
+            f"{self._backtest_cache_summary()} best_trial_id={int(self.best_row['trial_id'])} "
             f"avg_pnl={float(self.best_row.get('metric__avg_pnl', 0.0)):.6f} "
             f"total_pnl={float(self.best_row.get('metric__total_pnl', 0.0)):.6f} "
             f"trades={float(self.best_row.get('metric__total', 0.0)):.0f} "
-            f"itm={float(self.best_row.get('metric__itm_expiries', 0.0)):.6f}",
-            flush=True,
+            f"itm={float(self.best_row.get('metric__itm_expiries', 0.0)):.6f}"
         )
 
+    def _observe_dispatch(self, in_flight: int, *, queued: int = 0) -> None:
+        telemetry = self.telemetry
+        telemetry.set_dispatch(in_flight, queued=queued)
+        telemetry.set_counter("bt_cache_hits", self.backtest_cache_hits)
+        telemetry.set_counter("bt_cache_misses", self.backtest_cache_misses)
+        telemetry.set_counter("ledger_reads", self.ledger_reads)
+        telemetry.set_counter("trigger_reuse", self.trigger_reuse_count)
+        telemetry.set_counter("pruned", self.pruned_count)
+        telemetry.set_counter("routing_stolen", self.routing_stolen)
+        for pid, (hits, misses) in self.worker_cache_stats.items():
+            telemetry.set_counter(f"worker_bt_cache_hit_rate.{pid}", hits / (hits + misses) if hits + misses else 0.0)
+        if self.journal is not None:
+            telemetry.set_counter("journal_rows", self.journal.rows)
+            telemetry.set_counter("journal_seconds", self.journal.seconds)
+        telemetry.maybe_write()
+
+    def _append_trials(self, append_df: pd.DataFrame) -> None:
+        """Store ``append_df`` as a new part file (O(new rows) I/O) and add it to ``self.df``."""
+        append_df = append_df.reindex(columns=self._trial_columns())
+        self.trials_store.append(append_df)
+        self.df = append_df if self.df.empty else pd.concat([self.df, append_df], ignore_index=True)
+
     def _persist_trials(self) -> None:
-        if not self.pending_rows:
+        if not len(self.pending_trials):
             return
-        self.parquet_path.parent.mkdir(parents=True, exist_ok=True)
-        append_df = pd.DataFrame(self.pending_rows)
-        all_df = pd.concat([self.df, append_df], ignore_index=True)
-        for col in self._trial_columns():
-            if col not in all_df.columns:
-                all_df[col] = np.nan
-        all_df = all_df[self._trial_columns()]
-        all_df.to_parquet(self.parquet_path, index=False)
-        self.df = all_df
-        self.pending_rows = []
+        self._append_trials(self.pending_trials.to_arrow().to_pandas())
+        self.pending_trials.clear()
+        if self.journal is not None:
+            self.journal.reset()
+        self._persist_ledgers()
+
+    def _replay_journal(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Fold rows journaled after the last checkpoint of a crashed run into the trials store."""
+        table = read_journal(self.journal_path)
+        if table is None:
+            return df
+        replayed = table.to_pandas()
+        if not df.empty:
+            # A crash between the part write and the journal reset leaves rows that are already stored.
+            replayed = replayed[~replayed["trial_id"].isin(pd.to_numeric(df["trial_id"], errors="coerce"))]
+        self.df = df
+        if not replayed.empty:
+            self._append_trials(replayed.reset_index(drop=True))
+        self.journal_path.unlink()
+        self._emit(f"[journal] replayed rows={len(replayed)} path={self.journal_path}")
+        return self.df
+
+    def _load_ledgers(self) -> "OrderedDict[str, TradeLedger]":
+        """The most recently written ledgers, up to --ledger-cache-size, that match the current history."""
+        ledgers: "OrderedDict[str, TradeLedger]" = OrderedDict()
+        loaded = self.ledger_store.read()
+        if loaded is None or loaded.empty:
+            return ledgers
+        history_rows = self.backtester.history_rows(self.context.symbol)
+        loaded = loaded[loaded["history_rows"].astype(int) == history_rows]
+        loaded = loaded.drop_duplicates("ledger_key", keep="last").tail(self.ledger_cache_size)
+        for record in loaded.to_dict(orient="records"):
+            ledgers[str(record["ledger_key"])] = _ledger_from_record(record)
+        return ledgers
+
+    def _persist_ledgers(self) -> None:
+        """Append the ledgers built since the last checkpoint as one part file."""
+        if not self.pending_ledgers:
+            return
+        records = [_ledger_to_record(key, ledger) for key, ledger in self.pending_ledgers.items()]
+        self.ledger_store.append(pd.DataFrame(records))
+        self.pending_ledgers = {}
 
     def _maybe_checkpoint(self, *, force: bool = False) -> None:
-        if not self.pending_rows:
+        if not len(self.pending_trials):
             return
         if self.args.checkpoint_seconds <= 0:
             if force:
-                self._persist_trials()
+                self._timed_persist_trials()
             return
         now = time.monotonic()
         if force or (now - self.last_checkpoint_at >= self.args.checkpoint_seconds):
-            self._persist_trials()
+            self._timed_persist_trials()
             self.last_checkpoint_at = now
 
+    def _timed_persist_trials(self) -> None:
+        started = time.monotonic()
+        self._persist_trials()
+        self.telemetry.record_checkpoint(time.monotonic() - started)
+
     def _worker_backtest(self, params: Dict[str, float]) -> Tuple[bool, Dict[str, float], Dict[str, float]]:
         knobs = self._compose_knobs(params)
+        hits, misses = self.backtester.trigger_cache_hits, self.backtester.trigger_cache_misses
         evaluation = self.backtester.evaluate(
             knobs_input=knobs,
             symbol=self.context.symbol,
@@ -496,42 +1443,135 @@ class Orchestrator:
             min_pricing_vol_annualized=float(self.eval_kwargs["min_pricing_vol_annualized"]),
             contract_size=int(self.eval_kwargs["contract_size"]),
         )
+        self.backtest_cache_hits += self.backtester.trigger_cache_hits - hits
+        self.backtest_cache_misses += self.backtester.trigger_cache_misses - misses
         metrics = {k: float(evaluation.metrics.get(k, 0.0)) for k in METRIC_KEYS}
         objective = self._objective_from_metrics(metrics)
         return bool(evaluation.feasible), metrics, {"objective_score": float(objective)}
 
-    def _row_from_worker_result(
-        self,
-        *,
+    def _observe_worker_caches(self, evaluation: WorkerEvaluation) -> None:
+        self.backtest_cache_hits += evaluation.backtest_cache_hits
+        self.backtest_cache_misses += evaluation.backtest_cache_misses
+        if evaluation.worker_pid:
+            counts = self.worker_cache_stats.setdefault(evaluation.worker_pid, [0, 0])
+            counts[0] += evaluation.backtest_cache_hits
+            counts[1] += evaluation.backtest_cache_misses
+        self.ledger_reads += int(evaluation.ledger_read)
+        if self.ledgers is not None and evaluation.ledger is not None:
+            key = evaluation.ledger_key
+            _remember_ledger(self.ledgers, key, evaluation.ledger, self.ledger_cache_size)
+            self.pending_ledgers[key] = evaluation.ledger
+            if self.remote_ledger_keys is not None:
+                self.remote_ledger_keys.append(key)
+
+    def _ingest(self, records: Sequence[TrialRecord]) -> np.ndarray:
+        """Append a batch of results to the pending buffer; returns their buffer positions.
+
+        Trial ids, derived objectives and best-row tracking are computed for the whole batch; only
+        the key indexes and the (filtered) trigger and frontier observers still walk single rows.
+        """
+        count = len(records)
+        if count == 0:
+            return np.zeros(0, dtype=int)
+        names = list(self.dim_specs)
+        params = np.array([[float(r.params[name]) for name in names] for r in records], dtype=float)
+        metrics = np.array([[float(r.metrics.get(k, 0.0)) for k in METRIC_KEYS] for r in records], dtype=float)
+        params = params.reshape(count, len(names))
+        metrics = metrics.reshape(count, len(METRIC_KEYS))
+        fidelity = np.array([r.fidelity for r in records], dtype=object)
+        feasible = np.array([bool(r.feasible) for r in records], dtype=bool)
+        objective = self._objective_from_matrix(metrics)
+        for i, record in enumerate(records):
+            if record.objective_score is not None:
+                objective[i] = float(record.objective_score)
+        trial_ids = np.arange(self.next_trial_id, self.next_trial_id + count, dtype=np.int64)
+        self.next_trial_id += count
+
+        prune_reasons = {FIDELITY_PRUNED: PRUNE_REASON_TRADE_FLOOR, FIDELITY_SURROGATE_DEFERRED: PRUNE_REASON_SURROGATE}
+        columns: Dict[str, Any] = {
+            "trial_id": trial_ids,
+            "cache_key": [r.cache_key for r in records],
+            "phase": [r.phase for r in records],
+            "parent_trial_id": [np.nan if r.parent_trial_id is None else float(r.parent_trial_id) for r in records],
+            "seed_rank": [np.nan if r.seed_rank is None else float(r.seed_rank) for r in records],
+            "feasible": feasible.astype(np.int64),
+            "objective_score": objective,
+            "fidelity": fidelity,
+            "fidelity_start_date": [r.fidelity_start_date for r in records],
+            "prune_reason": [prune_reasons.get(r.fidelity) for r in records],
+            "trigger_hash": [r.trigger_hash for r in records],
+        }
+        for i, name in enumerate(names):
+            columns[f"param__{name}"] = params[:, i]
+        for i, name in enumerate(METRIC_KEYS):
+            columns[f"metric__{name}"] = metrics[:, i]
+        positions = self.pending_trials.append(columns, count)
+        if self.journal is not None:
+            self.journal.append(self.pending_trials.to_arrow(int(positions[0]), int(positions[-1]) + 1))
+
+        for record, trial_id in zip(records, trial_ids.tolist()):
+            key = record.cache_key
+            if record.fidelity == FIDELITY_FULL:
+                self.key_to_trial_id[key] = trial_id
+                self.screened_keys.pop(key, None)
+            elif record.fidelity == FIDELITY_SURROGATE_DEFERRED:
+                self.deferred_keys[key] = trial_id
+            else:
+                self.screened_keys[key] = trial_id
+        self.trigger_reuse_count += sum(1 for r in records if r.reused)
+        for phase in (r.phase for r in records if r.fidelity not in (FIDELITY_PRUNED, FIDELITY_SURROGATE_DEFERRED)):
+            self.telemetry.record_evaluations(phase=phase)
+
+        # Window rows hash their own start date, so they never collide with full-range entries.
+        hashed = feasible & np.isin(fidelity, [FIDELITY_FULL, FIDELITY_RECENT_WINDOW])
+        for i in np.flatnonzero(hashed):
+            trigger_hash = records[i].trigger_hash
+            if isinstance(trigger_hash, str) and trigger_hash:
+                self.trigger_metrics.setdefault(trigger_hash, dict(zip(METRIC_KEYS, metrics[i].tolist())))
+        if self.frontier is not None:
+            totals = metrics[:, METRIC_KEYS.index("total")]
+            observed = (
+                feasible
+                & np.isin(fidelity, [FIDELITY_FULL, FIDELITY_TRIGGER_COUNT])
+                & (totals <= self.frontier.floor)
+            )
+            for i in np.flatnonzero(observed):
+                self.frontier.observe(self._compose_knobs(records[i].params), float(totals[i]))
+
+        full = np.flatnonzero(fidelity == FIDELITY_FULL)
+        if full.size:
+            batch_columns = {f"metric__{name}": metrics[:, i] for i, name in enumerate(METRIC_KEYS)}
+            best = int(self._lexsort_rank(lambda column, default: batch_columns[column], full)[0])
+            self._update_best(self.pending_trials.row(int(positions[best])))
+        return positions
+
+    @staticmethod
+    def _evaluation_record(
         params: Dict[str, float],
+        key: str,
+        evaluation: WorkerEvaluation,
+        *,
         phase: str,
-        parent_trial_id: Optional[int],
-        seed_rank: Optional[int],
-        feasible: bool,
-        metrics: Dict[str, float],
-        objective_score: float,
-    ) -> Dict[str, Any]:
-        cache_key = self._cache_key(params)
-        row: Dict[str, Any] = {
-            "trial_id": int(self.next_trial_id),
-            "cache_key": cache_key,
-            "symbol": self.context.symbol,
-            "side": self.context.side,
-            "start_date": self.context.start_date,
-            "end_date": self.context.end_date,
-            "phase": phase,
-            "parent_trial_id": float(parent_trial_id) if parent_trial_id is not None else np.nan,
-            "seed_rank": float(seed_rank) if seed_rank is not None else np.nan,
-            "feasible": int(feasible),
-            "objective_score": float(objective_score),
-        }
-        for name in self.dim_specs:
-            row[f"param__{name}"] = float(params[name])
-        for k in METRIC_KEYS:
-            row[f"metric__{k}"] = float(metrics.get(k, 0.0))
-        self.next_trial_id += 1
-        self.key_to_trial_id[cache_key] = int(row["trial_id"])
-        return row
+        parent_trial_id: Optional[int] = None,
+        seed_rank: Optional[int] = None,
+        fidelity: str = FIDELITY_FULL,
+        fidelity_start_date: Optional[str] = None,
+    ) -> TrialRecord:
+        deferred = fidelity == FIDELITY_SURROGATE_DEFERRED
+        return TrialRecord(
+            params=params,
+            cache_key=key,
+            phase=phase,
+            feasible=evaluation.feasible,
+            metrics=evaluation.metrics,
+            parent_trial_id=parent_trial_id,
+            seed_rank=seed_rank,
+            objective_score=float("nan") if deferred else None,
+            fidelity=fidelity,
+            fidelity_start_date=fidelity_start_date,
+            trigger_hash=None if deferred else evaluation.trigger_hash,
+            reused=False if deferred else evaluation.reused,
+        )
 
     def _submit_candidates(self, candidates: Iterable[CandidateRun], *, phase_label: str) -> Tuple[int, int]:
         submitted = 0
@@ -539,24 +1579,29 @@ class Orchestrator:
         in_flight_keys: set[str] = set()
         futures: Dict[Future[Any], Tuple[Dict[str, float], str, Optional[int], Optional[int], str]] = {}
 
-        with ProcessPoolExecutor(
-            max_workers=self.workers,
-            mp_context=mp.get_context("fork"),
-            initializer=_process_worker_initializer,
-        ) as executor:
+        with self._executor_scope() as executor:
             for cand in candidates:
                 params = dict(cand.params)
                 key = self._cache_key(params)
                 if key in self.key_to_trial_id or key in in_flight_keys:
                     cache_hits += 1
+                    self.telemetry.record_cache_hits(phase=cand.phase)
+                    continue
+                if self.frontier is not None and self.frontier.dominated(self._compose_knobs(params)):
+                    self._record_pruned(
+                        params,
+                        phase=cand.phase,
+                        parent_trial_id=cand.parent_trial_id,
+                        seed_rank=cand.seed_rank,
+                    )
                     continue
 
-                future = executor.submit(_process_worker_backtest, params)
+                future = self._submit_backtest(executor, params)
                 futures[future] = (params, cand.phase, cand.parent_trial_id, cand.seed_rank, key)
                 in_flight_keys.add(key)
                 submitted += 1
 
-                if len(futures) >= self.workers * 2:
+                if len(futures) >= self._inflight_cap():
                     self._drain_some_futures(futures, in_flight_keys=in_flight_keys)
 
                 self._maybe_checkpoint(force=False)
@@ -577,49 +1622,319 @@ class Orchestrator:
         *,
         in_flight_keys: Optional[set[str]] = None,
     ) -> None:
+        self._observe_dispatch(len(futures))
         done, _ = wait(list(futures.keys()), timeout=0.2, return_when=FIRST_COMPLETED)
         if not done:
             return
-        for future in done:
-            params, phase, parent_trial_id, seed_rank, cache_key = futures.pop(future)
-            try:
-                feasible, metrics = future.result()
-            finally:
-                if in_flight_keys is not None:
-                    in_flight_keys.discard(cache_key)
-            row = self._row_from_worker_result(
-                params=params,
-                phase=phase,
-                parent_trial_id=parent_trial_id,
-                seed_rank=seed_rank,
-                feasible=feasible,
-                metrics=metrics,
-                objective_score=float(self._objective_from_metrics(metrics)),
+        records: List[TrialRecord] = []
+        try:
+            for future in done:
+                params, phase, parent_trial_id, seed_rank, cache_key = futures.pop(future)
+                try:
+                    evaluation = future.result()
+                    self._observe_worker_caches(evaluation)
+                finally:
+                    if in_flight_keys is not None:
+                        in_flight_keys.discard(cache_key)
+                records.append(
+                    self._evaluation_record(
+                        params,
+                        cache_key,
+                        evaluation,
+                        phase=phase,
+                        parent_trial_id=parent_trial_id,
+                        seed_rank=seed_rank,
+                    )
+                )
+        finally:
+            self._ingest(records)
+
+    def _merge_phase1_results(
+        self,
+        results: Sequence[Phase1Result],
+        survivors: HalvingRung,
+    ) -> int:
+        duplicates = 0
+        records: List[TrialRecord] = []
+        window: List[Tuple[Dict[str, float], str, WorkerEvaluation]] = []
+        # Keys recorded by this batch, which the indexes only learn once it is ingested.
+        batch_keys: set[str] = set()
+        batch_deferred: set[str] = set()
+        for result in results:
+            params, key, evaluation, fidelity = result.params, result.key, result.evaluation, result.fidelity
+            # Another range may already have produced the same key (integer rounding collisions).
+            if key in self.key_to_trial_id or key in self.screened_keys or key in batch_keys:
+                duplicates += 1
+                continue
+            self._record_surrogate_outcome(result)
+            if fidelity == FIDELITY_SURROGATE_DEFERRED:
+                if key not in self.deferred_keys and key not in batch_deferred:
+                    batch_deferred.add(key)
+                    records.append(self._evaluation_record(params, key, evaluation, phase="phase1", fidelity=fidelity))
+                continue
+            batch_keys.add(key)
+            if fidelity == FIDELITY_RECENT_WINDOW:
+                # Recorded now, ranked against every other survivor once all ranges are back.
+                window.append((params, key, evaluation))
+                continue
+            if fidelity == FIDELITY_TRIGGER_COUNT:
+                self.screening_stats.trigger_screened += 1
+            if fidelity == FIDELITY_PRUNED:
+                self.pruned_count += 1
+                records.append(self._pruned_record(params, key, phase="phase1", parent_trial_id=None, seed_rank=None))
+                continue
+            records.append(self._evaluation_record(params, key, evaluation, phase="phase1", fidelity=fidelity))
+        self._ingest(records)
+        if window:
+            self._ingest_window_results(window, self.screening.window_starts[0], survivors)
+        return duplicates
+
+    def _record_surrogate_outcome(self, result: Phase1Result) -> None:
+        if self.surrogate is None or result.surrogate_prob is None:
+            return
+        stats = self.surrogate_stats
+        stats.scored += 1
+        predicted = result.surrogate_prob >= self.surrogate.cutoff
+        if result.fidelity == FIDELITY_SURROGATE_DEFERRED:
+            stats.deferred += 1
+            return
+        if not predicted:
+            stats.explored += 1
+        if result.fidelity == FIDELITY_FULL:
+            stats.record(
+                predicted=predicted,
+                actual=self._is_seed_eligible(self._metric_row(result.evaluation.metrics)),
             )
-            self.pending_rows.append(row)
-            self._update_best(row)
+        elif result.fidelity in {FIDELITY_TRIGGER_COUNT, FIDELITY_PRUNED}:
+            stats.record(predicted=predicted, actual=False)
+
+    @staticmethod
+    def _metric_row(metrics: Dict[str, float]) -> Dict[str, float]:
+        return {f"metric__{k}": float(v) for k, v in metrics.items()}
+
+    def _surrogate_training_set(self) -> Tuple[np.ndarray, np.ndarray]:
+        # Trigger-count and pruned rows are exact negatives; window and deferred rows carry no label.
+        labeled_fidelities = [FIDELITY_FULL, FIDELITY_TRIGGER_COUNT, FIDELITY_PRUNED]
+        frames = [df for df in (self.df, self.pending_trials.to_arrow().to_pandas()) if not df.empty]
+        if not frames:
+            return self._params_matrix_normalized(pd.DataFrame()), np.zeros(0, dtype=int)
+        df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+        fidelity = df["fidelity"] if "fidelity" in df.columns else pd.Series(FIDELITY_FULL, index=df.index)
+        df = df[fidelity.isin(labeled_fidelities).to_numpy(dtype=bool)]
+        full = (fidelity.loc[df.index] == FIDELITY_FULL).to_numpy(dtype=bool)
+        labels = (full & self._seed_eligible_mask(df)).astype(int)
+        return self._params_matrix_normalized(df), labels
+
+    def _maybe_refit_surrogate(self, *, force: bool = False) -> None:
+        if self.surrogate is None:
+            return
+        observed = len(self.df) + len(self.pending_trials)
+        if not force and observed - self.surrogate_observed_at_fit < int(self.args.surrogate_refit_every):
+            return
+        x, y = self._surrogate_training_set()
+        if len(y) < int(self.args.surrogate_min_train):
+            return
+        self.surrogate_observed_at_fit = observed
+        if self.surrogate.fit(x, y):
+            self.surrogate_stats.fits += 1
+
+    def _window_screened_record(
+        self,
+        params: Dict[str, float],
+        key: str,
+        evaluation: WorkerEvaluation,
+        window_start: str,
+    ) -> TrialRecord:
+        return self._evaluation_record(
+            params,
+            key,
+            evaluation,
+            phase="phase1",
+            fidelity=FIDELITY_RECENT_WINDOW,
+            fidelity_start_date=window_start,
+        )
+
+    def _ingest_window_results(
+        self,
+        results: Sequence[Tuple[Dict[str, float], str, WorkerEvaluation]],
+        window_start: str,
+        rung: HalvingRung,
+    ) -> None:
+        records = [self._window_screened_record(params, key, ev, window_start) for params, key, ev in results]
+        positions = self._ingest(records)
+        for record, trial_id in zip(records, self.pending_trials.column("trial_id")[positions].tolist()):
+            rung.add(record.cache_key, trial_id, record.metrics)
+
+    def _trial_params(self, trial_ids: Sequence[int]) -> List[Dict[str, float]]:
+        """:meth:`_row_params` for stored trials, read column-wise from the pending buffer or ``self.df``."""
+        ids = np.asarray(trial_ids, dtype=np.int64)
+        found = [self.pending_trials.find(int(trial_id)) for trial_id in ids.tolist()]
+        buffered = np.array([position is not None for position in found], dtype=bool)
+        buffer_positions = np.array([position for position in found if position is not None], dtype=int)
+        stored_positions = np.zeros(0, dtype=int)
+        if not buffered.all():
+            stored = self._metric_values(self.df, "trial_id", -1.0).astype(np.int64)
+            order = np.argsort(stored, kind="stable")
+            stored_positions = order[np.searchsorted(stored, ids[~buffered], sorter=order)]
+        names = list(self.dim_specs)
+        values = np.zeros((len(ids), len(names)), dtype=float)
+        for i, (name, spec) in enumerate(self.dim_specs.items()):
+            column = f"param__{name}"
+            values[buffered, i] = self.pending_trials.column(column)[buffer_positions]
+            values[~buffered, i] = self._metric_values(self.df, column, float(spec.low))[stored_positions]
+            if spec.is_int:
+                values[:, i] = np.round(values[:, i])
+        return [dict(zip(names, row)) for row in values.tolist()]
+
+    def _evaluate_window(self, rung: HalvingRung, promoted: np.ndarray, window_start: str) -> HalvingRung:
+        """Backtest the ``promoted`` points of ``rung`` on the next window, ingesting results as they arrive."""
+        out = HalvingRung()
+        keys = [rung.keys[i] for i in promoted.tolist()]
+        params_rows = self._trial_params([rung.trial_ids[i] for i in promoted.tolist()])
+        backlog: Deque[Tuple[str, Dict[str, float]]] = deque(zip(keys, params_rows))
+        futures: Dict[Future[Any], Tuple[str, Dict[str, float]]] = {}
+        with self._executor_scope() as executor:
+            while backlog or futures:
+                while backlog and len(futures) < self._inflight_cap():
+                    key, params = backlog.popleft()
+                    future = self._submit_backtest(executor, params, window_start)
+                    futures[future] = (key, params)
+                self._observe_dispatch(len(futures), queued=len(backlog))
+                done, _ = wait(list(futures.keys()), timeout=0.2, return_when=FIRST_COMPLETED)
+                finished: List[Tuple[Dict[str, float], str, WorkerEvaluation]] = []
+                for future in done:
+                    key, params = futures.pop(future)
+                    evaluation = future.result()
+                    self._observe_worker_caches(evaluation)
+                    finished.append((params, key, evaluation))
+                self._ingest_window_results(finished, window_start, out)
+                self._maybe_checkpoint(force=False)
+                self._log_progress(prefix="phase1")
+        self.screening_stats.window_evaluations += len(out)
+        return out
+
+    def _run_screening_rounds(self, survivors: HalvingRung) -> None:
+        """Successive halving over the recent windows; the last rung's survivors get full backtests.
+
+        Each rung keeps at least the --seed-top-ratio share that _sorted_seed_rows would take.
+        """
+        window_starts = self.screening.window_starts
+        keep_ratio = max(1.0 / float(self.args.screen_eta), float(self.args.seed_top_ratio))
+        current = survivors
+        promoted = np.arange(len(current))
+        for rung, window_start in enumerate(window_starts):
+            # ITM expiries accumulate as the window widens, so the seed cap is already spent.
+            eligible = np.flatnonzero(current.column("metric__itm_expiries", 0.0) < float(self.args.max_seed_itm))
+            self.screening_stats.window_pruned_itm += len(current) - eligible.size
+            # Ties rank by cache key, descending; the rank sort is stable.
+            eligible = eligible[np.argsort(np.asarray(current.keys, dtype=object)[eligible])[::-1]]
+            ranked = self._lexsort_rank(current.column, eligible)
+            keep = int(math.ceil(ranked.size * keep_ratio))
+            self.screening_stats.window_demoted += ranked.size - keep
+            promoted = ranked[:keep]
+            if rung + 1 == len(window_starts):
+                break
+            current = self._evaluate_window(current, promoted, window_starts[rung + 1])
+            promoted = np.arange(len(current))
+
+        params_rows = self._trial_params([current.trial_ids[i] for i in promoted.tolist()])
+        submitted, _ = self._submit_candidates(
+            (
+                CandidateRun(params=params, phase="phase1", parent_trial_id=None, seed_rank=None)
+                for params in params_rows
+            ),
+            phase_label="phase1",
+        )
+        self.screening_stats.promoted_full += submitted
 
     def _run_phase1(self) -> None:
-        print(
-            f"[phase1] start sobol_samples={self.args.sobol_samples} seed={self.args.seed} workers={self.workers}",
-            flush=True,
+        total = int(self.args.sobol_samples)
+        chunk_size = max(1, int(self.args.phase1_chunk_size))
+        self._emit(
+            f"[phase1] start sobol_samples={total} seed={self.args.seed} workers={self.workers} "
+            f"chunk_size={chunk_size}"
         )
-        phase_points = self.sobol.sample_phase1(int(self.args.sobol_samples)).params
-        candidates = [
-            CandidateRun(params=point, phase="phase1", parent_trial_id=None, seed_rank=None)
-            for point in phase_points
-        ]
-        submitted, cache_hits = self._submit_candidates(candidates, phase_label="phase1")
-        print(
-            f"[phase1] complete total={len(candidates)} submitted={submitted} cache_hits={cache_hits}",
-            flush=True,
+        # Workers generate their own index ranges and check this snapshot, so the parent never
+        # materializes the candidate list and only merges results.
+        if self.shared_executor is None:
+            _install_worker_known_keys(self.context.label, self._phase1_known_keys())
+        survivors = HalvingRung()
+        self._maybe_refit_surrogate(force=True)
+        evaluated = 0
+        cache_hits = 0
+        chunks = 0
+        futures: Dict[Future[Any], int] = {}
+        starts = iter(range(0, total, chunk_size))
+        exhausted = False
+        try:
+            with self._executor_scope() as executor:
+                while futures or not exhausted:
+                    while not exhausted and len(futures) < self._inflight_cap():
+                        start = next(starts, None)
+                        if start is None:
+                            exhausted = True
+                            break
+                        future = executor.submit(
+                            _process_worker_sobol_range,
+                            self.context.label,
+                            start,
+                            min(chunk_size, total - start),
+                            self.surrogate if self.surrogate is not None and self.surrogate.fitted else None,
+                        )
+                        futures[future] = start
+                        chunks += 1
+                    if not futures:
+                        break
+                    self._observe_dispatch(len(futures))
+                    done, _ = wait(list(futures.keys()), timeout=0.2, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        futures.pop(future)
+                        results, skipped = future.result()
+                        for result in results:
+                            self._observe_worker_caches(result.evaluation)
+                        duplicates = self._merge_phase1_results(results, survivors)
+                        evaluated += len(results)
+                        cache_hits += skipped + duplicates
+                        self.telemetry.record_cache_hits(skipped + duplicates, phase="phase1")
+                    self._maybe_refit_surrogate()
+                    self._maybe_checkpoint(force=False)
+                    self._log_progress(prefix="phase1")
+        finally:
+            if self.shared_executor is None:
+                _install_worker_known_keys(self.context.label, ())
+
+        if len(survivors):
+            self._run_screening_rounds(survivors)
+
+        self._maybe_checkpoint(force=True)
+        self._log_progress(force=True, prefix="phase1")
+        self._emit(
+            f"[phase1] complete total={total} chunks={chunks} submitted={evaluated} cache_hits={cache_hits}",
         )
+        if self.surrogate is not None:
+            stats = self.surrogate_stats
+            self._emit(
+                f"[phase1] surrogate fits={stats.fits} scored={stats.scored} deferred={stats.deferred} "
+                f"explored={stats.explored} precision={stats.precision():.3f} "
+                f"recall={stats.recall(self.surrogate.explore_rate):.3f} evaluations_saved={stats.deferred}"
+            )
+        if self.screening.mode != "off":
+            stats = self.screening_stats
+            self._emit(
+                f"[phase1] screening mode={self.screening.mode} windows={len(self.screening.window_starts)} "
+                f"trigger_screened={stats.trigger_screened} window_evaluations={stats.window_evaluations} "
+                f"window_pruned_itm={stats.window_pruned_itm} window_demoted={stats.window_demoted} "
+                f"promoted_full={stats.promoted_full}"
+            )
 
-    def _params_matrix_normalized(self) -> np.ndarray:
-        if self.df.empty:
+    def _params_matrix_normalized(self, df: Optional[pd.DataFrame] = None) -> np.ndarray:
+        df = self.df if df is None else df
+        if df.empty:
             return np.zeros((0, len(self.dim_specs)), dtype=float)
         cols = [f"param__{name}" for name in self.dim_specs]
-        data = self.df[cols].astype(float).to_numpy(dtype=float)
+        return self._normalize_param_matrix(df[cols].astype(float).to_numpy(dtype=float))
+
+    def _normalize_param_matrix(self, data: np.ndarray) -> np.ndarray:
         out = np.zeros_like(data, dtype=float)
         for i, spec in enumerate(self.dim_specs.values()):
             width = float(spec.high - spec.low)
@@ -629,28 +1944,50 @@ class Orchestrator:
                 out[:, i] = (data[:, i] - float(spec.low)) / width
         return np.clip(out, 0.0, 1.0)
 
+    def _neighborhood_index(self) -> TrialNeighborhoodIndex:
+        # self.df only changes at checkpoints, so the tree is rebuilt at most once per checkpoint.
+        if self.neighborhood.size != len(self.df):
+            self.neighborhood.rebuild(self._params_matrix_normalized())
+        return self.neighborhood
+
+    def _pending_params_normalized(self) -> np.ndarray:
+        if not len(self.pending_trials):
+            return np.zeros((0, len(self.dim_specs)), dtype=float)
+        columns = [self.pending_trials.column(f"param__{name}") for name in self.dim_specs]
+        return self._normalize_param_matrix(np.column_stack(columns))
+
+    def _seed_neighbor_count(self, center: np.ndarray, radius: float) -> int:
+        return self._neighborhood_index().count_within(center, radius, extra=self._pending_params_normalized())
+
     def _sorted_seed_rows(self) -> List[Dict[str, Any]]:
         if self.df.empty:
             return []
+        df = self.df
+        keep = self._full_fidelity_mask(df) & self._seed_eligible_mask(df)
         allowed_phases = self._allowed_seed_phases()
-        eligible: List[Dict[str, Any]] = []
-        for row in self.df.to_dict(orient="records"):
-            if allowed_phases is not None and str(row.get("phase", "")) not in allowed_phases:
-                continue
-            total = float(row.get("metric__total", 0.0))
-            itm = float(row.get("metric__itm_expiries", 0.0))
-            total_pnl = float(row.get("metric__total_pnl", 0.0))
-            if (
-                total > float(self.args.min_seed_trades)
-                and itm < float(self.args.max_seed_itm)
-                and total_pnl > 0.0
-            ):
-                eligible.append(row)
-        eligible.sort(key=lambda r: self._rank_tuple(r), reverse=True)
-        if not eligible:
+        if allowed_phases is not None:
+            raw_phases = df["phase"] if "phase" in df.columns else pd.Series("", index=df.index)
+            phases = raw_phases.astype(str).astype("category")
+            codes = [code for code, name in enumerate(phases.cat.categories) if name in allowed_phases]
+            keep &= np.isin(phases.cat.codes.to_numpy(), codes)
+        eligible = np.flatnonzero(keep)
+        if eligible.size == 0:
             return []
-        take = max(1, int(math.ceil(len(eligible) * float(self.args.seed_top_ratio))))
-        return eligible[:take]
+        take = max(1, int(math.ceil(eligible.size * float(self.args.seed_top_ratio))))
+        return self._records_at(df, self._rank_order(df, eligible)[:take])
+
+    def _seed_eligible_mask(self, df: pd.DataFrame) -> np.ndarray:
+        """Columnar :meth:`_is_seed_eligible`; NaN metrics fail every comparison, as they do per row."""
+        total = self._metric_values(df, "metric__total", 0.0)
+        itm = self._metric_values(df, "metric__itm_expiries", 0.0)
+        total_pnl = self._metric_values(df, "metric__total_pnl", 0.0)
+        return (total > float(self.args.min_seed_trades)) & (itm < float(self.args.max_seed_itm)) & (total_pnl > 0.0)
+
+    def _is_seed_eligible(self, row: Dict[str, Any]) -> bool:
+        total = float(row.get("metric__total", 0.0))
+        itm = float(row.get("metric__itm_expiries", 0.0))
+        total_pnl = float(row.get("metric__total_pnl", 0.0))
+        return total > float(self.args.min_seed_trades) and itm < float(self.args.max_seed_itm) and total_pnl > 0.0
 
     def _allowed_seed_phases(self) -> Optional[set[str]]:
         raw = str(self.args.seed_phases).strip().lower()
@@ -667,9 +2004,10 @@ class Orchestrator:
             return
 
         radius = float(self.args.local_radius)
-        per_seed = int(self.args.local_probe_per_seed)
-        if per_seed <= 0:
+        base_per_seed = int(self.args.local_probe_per_seed)
+        if base_per_seed <= 0:
             return
+        density_mode = str(self.args.phase2_density_mode)
 
         for idx, seed_row in enumerate(seed_rows, start=1):
             stats.seeds_seen = idx
@@ -677,6 +2015,21 @@ class Orchestrator:
             seed_tid = int(seed_row["trial_id"])
             center = self._normalize_params(seed_params)
 
+            per_seed = base_per_seed
+            if density_mode != "off":
+                existing = self._seed_neighbor_count(center, radius)
+                if density_mode == "skip" and existing >= base_per_seed:
+                    stats.seeds_skipped_dense += 1
+                    stats.seeds_completed += 1
+                    continue
+                if density_mode == "shrink":
+                    per_seed = max(0, base_per_seed - existing)
+                    stats.probes_shrunk_dense += base_per_seed - per_seed
+                    if per_seed == 0:
+                        stats.seeds_skipped_dense += 1
+                        stats.seeds_completed += 1
+                        continue
+
             stats.candidate_target += per_seed
             generated_for_seed = 0
             generated_keys_for_seed: set[str] = set()
@@ -724,25 +2077,23 @@ class Orchestrator:
     def _run_phase2(self) -> List[Dict[str, Any]]:
         seed_rows = self._sorted_seed_rows()
         if not seed_rows:
-            print("[phase2] skipped no eligible seeds", flush=True)
+            self._emit("[phase2] skipped no eligible seeds")
             return []
-        print(
+        self._emit(
             f"[phase2] eligible_seeds={len(seed_rows)} top_ratio={self.args.seed_top_ratio:.3f} "
             f"seed_phases={self.args.seed_phases} "
-            f"min_seed_trades>{self.args.min_seed_trades} max_seed_itm<{self.args.max_seed_itm}",
-            flush=True,
+            f"min_seed_trades>{self.args.min_seed_trades} max_seed_itm<{self.args.max_seed_itm}"
         )
         max_candidates = len(seed_rows) * int(self.args.local_probe_per_seed)
-        print(
+        self._emit(
             f"[phase2] streaming_local_candidates seeds={len(seed_rows)} "
             f"per_seed={int(self.args.local_probe_per_seed)} "
-            f"max_candidates={max_candidates} radius={float(self.args.local_radius):.6f}",
-            flush=True,
+            f"max_candidates={max_candidates} radius={float(self.args.local_radius):.6f}"
         )
         stats = Phase2CandidateStats()
         candidates = self._iter_phase2_local_candidates(seed_rows, stats)
         submitted, cache_hits = self._submit_candidates(candidates, phase_label="phase2")
-        print(
+        self._emit(
             f"[phase2] local_candidates={stats.candidates_generated} "
             f"reused_candidates={stats.candidates_reused} "
             f"target_new_candidates={stats.candidate_target} "
@@ -750,12 +2101,13 @@ class Orchestrator:
             f"seeds_completed={stats.seeds_completed} "
             f"cache_or_duplicate_skips={stats.cache_or_duplicate_skips} "
             f"draws_attempted={stats.draws_attempted} "
-            f"shortfall={stats.candidate_shortfall}",
-            flush=True,
+            f"shortfall={stats.candidate_shortfall} "
+            f"density_mode={self.args.phase2_density_mode} "
+            f"seeds_skipped_dense={stats.seeds_skipped_dense} "
+            f"probes_shrunk_dense={stats.probes_shrunk_dense}"
         )
-        print(
+        self._emit(
             f"[phase2] complete submitted={submitted} cache_hits={cache_hits}",
-            flush=True,
         )
         return seed_rows
 
@@ -775,180 +2127,227 @@ class Orchestrator:
                 return row
 
         feasible, metrics, extra = self._worker_backtest(params)
-        row = self._row_from_worker_result(
+        record = TrialRecord(
             params=params,
+            cache_key=key,
             phase=phase,
-            parent_trial_id=parent_trial_id,
-            seed_rank=seed_rank,
             feasible=feasible,
             metrics=metrics,
+            parent_trial_id=parent_trial_id,
+            seed_rank=seed_rank,
             objective_score=float(extra["objective_score"]),
         )
-        self.pending_rows.append(row)
-        self._update_best(row)
+        row = self.pending_trials.row(int(self._ingest([record])[0]))
         self._maybe_checkpoint(force=False)
         self._log_progress(prefix="gradient")
         return row
 
-    def _evaluate_gradient_batch_cached(
+    def _row_objective(self, row: Dict[str, Any]) -> float:
+        metrics = {k: float(row.get(f"metric__{k}", 0.0)) for k in METRIC_KEYS}
+        return self._objective_from_metrics(metrics)
+
+    def _normalized_lattice(self) -> np.ndarray:
+        """Normalized spacing of each dimension's value grid; 0 for continuous dimensions."""
+        out = np.zeros(len(self.dim_specs), dtype=float)
+        for i, spec in enumerate(self.dim_specs.values()):
+            width = float(spec.high - spec.low)
+            if width <= 0:
+                continue
+            if spec.step:
+                out[i] = float(spec.step) / width
+            elif spec.is_int:
+                out[i] = 1.0 / width
+        return out
+
+    def _make_local_optimizer(self, seed_rank: int, seed_row: Dict[str, Any]) -> LocalOptimizer:
+        x0 = self._normalize_params(self._row_params(seed_row))
+        steps = int(self.args.gradient_steps)
+        step_size = float(self.args.gradient_step_size)
+        mode = str(self.args.local_optimizer)
+        if mode == "pattern":
+            return CompassSearch(
+                x0,
+                lattice=self._normalized_lattice(),
+                initial_step=step_size,
+                max_iterations=steps,
+                x0_value=self._row_objective(seed_row),
+            )
+        if mode == "cmaes":
+            return BatchCMAES(
+                x0,
+                lattice=self._normalized_lattice(),
+                sigma0=float(self.args.cmaes_sigma),
+                max_generations=steps,
+                popsize=int(self.args.cmaes_popsize) or None,
+                seed=int(self.args.seed) + seed_rank,
+            )
+        return FiniteDifferenceAscent(
+            x0,
+            step_size=step_size,
+            learning_rate=float(self.args.gradient_learning_rate),
+            max_steps=steps,
+            lattice=self._normalized_lattice(),
+            key=lambda point: self._cache_key(self._denormalize_params(point)),
+        )
+
+    def _enqueue_gradient_step(
         self,
+        state: GradientSeedState,
         *,
-        requests: Sequence[Tuple[Dict[str, float], int, int]],
-        executor: ProcessPoolExecutor,
-    ) -> List[Dict[str, Any]]:
-        rows_by_key: Dict[str, Dict[str, Any]] = {}
-        futures: Dict[Future[Any], Tuple[Dict[str, float], int, int, str]] = {}
-        in_flight_keys: set[str] = set()
-        ordered_keys: List[str] = []
+        waiters: Dict[str, List[GradientSeedState]],
+        backlog: Deque[Tuple[Dict[str, float], str, GradientSeedState]],
+    ) -> None:
+        requests = [self._denormalize_params(point) for point in state.optimizer.ask()]
+        if not requests:
+            state.done = True
+            return
 
-        for params_in, parent_trial_id, seed_rank in requests:
-            params = dict(params_in)
-            key = self._cache_key(params)
-            ordered_keys.append(key)
-            if key in rows_by_key:
-                self.gradient_cache_hits += 1
-                continue
-            if key in in_flight_keys:
+        state.keys = [self._cache_key(params) for params in requests]
+        state.rows = {}
+        for params, key in zip(requests, state.keys):
+            if key in state.rows or key in state.pending:
                 self.gradient_cache_hits += 1
+                self.telemetry.record_cache_hits(phase="gradient")
                 continue
             trial_id = self.key_to_trial_id.get(key)
             if trial_id is not None:
                 row = self._find_row_by_trial_id(trial_id)
                 if row is not None:
-                    rows_by_key[key] = row
+                    state.rows[key] = row
                     self.gradient_cache_hits += 1
+                    self.telemetry.record_cache_hits(phase="gradient")
                     continue
-            future = executor.submit(_process_worker_backtest, params)
-            futures[future] = (params, parent_trial_id, seed_rank, key)
-            in_flight_keys.add(key)
-            self.gradient_submitted += 1
-
-        while futures:
-            done, _ = wait(list(futures.keys()), timeout=0.2, return_when=FIRST_COMPLETED)
-            if not done:
-                self._maybe_checkpoint(force=False)
-                self._log_progress(prefix="gradient")
+            state.pending.add(key)
+            if key in waiters:
+                # Another seed already dispatched this probe; share its result.
+                waiters[key].append(state)
+                self.gradient_cache_hits += 1
+                self.telemetry.record_cache_hits(phase="gradient")
                 continue
-            for future in done:
-                params, parent_trial_id, seed_rank, key = futures.pop(future)
-                in_flight_keys.discard(key)
-                feasible, metrics = future.result()
-                row = self._row_from_worker_result(
-                    params=params,
-                    phase="gradient",
-                    parent_trial_id=parent_trial_id,
-                    seed_rank=seed_rank,
-                    feasible=feasible,
-                    metrics=metrics,
-                    objective_score=float(self._objective_from_metrics(metrics)),
-                )
-                self.pending_rows.append(row)
-                self._update_best(row)
-                rows_by_key[key] = row
-            self._maybe_checkpoint(force=False)
-            self._log_progress(prefix="gradient")
+            waiters[key] = [state]
+            backlog.append((params, key, state))
+            self.gradient_submitted += 1
 
-        self._maybe_checkpoint(force=False)
-        self._log_progress(prefix="gradient")
-        return [rows_by_key[key] for key in ordered_keys]
+    def _advance_gradient_state(self, state: GradientSeedState) -> None:
+        best_before = state.optimizer.best_value
+        state.optimizer.tell([self._row_objective(state.rows[key]) for key in state.keys])
+        state.evaluations += len(set(state.keys))
+        if state.optimizer.best_value > best_before:
+            state.evaluations_to_best = state.evaluations
+        state.keys = []
+        state.done = state.optimizer.done
 
-    def _row_objective(self, row: Dict[str, Any]) -> float:
-        metrics = {k: float(row.get(f"metric__{k}", 0.0)) for k in METRIC_KEYS}
-        return self._objective_from_metrics(metrics)
+    def _pump_gradient_state(
+        self,
+        state: GradientSeedState,
+        *,
+        waiters: Dict[str, List[GradientSeedState]],
+        backlog: Deque[Tuple[Dict[str, float], str, GradientSeedState]],
+    ) -> None:
+        # Advance through every step whose probes are already cached, stopping at the first one
+        # that has to wait for workers.
+        while not state.done and not state.pending:
+            if state.keys:
+                self._advance_gradient_state(state)
+                if state.done:
+                    break
+            self._enqueue_gradient_step(state, waiters=waiters, backlog=backlog)
 
     def _run_gradient(self, seed_rows: List[Dict[str, Any]]) -> None:
         if int(self.args.gradient_steps) <= 0 or not seed_rows:
-            print("[gradient] skipped", flush=True)
+            self._emit("[gradient] skipped")
             return
 
-        print(
-            f"[gradient] start seeds={len(seed_rows)} steps={self.args.gradient_steps} "
-            f"step_size={self.args.gradient_step_size} lr={self.args.gradient_learning_rate}",
-            flush=True,
+        self._emit(
+            f"[gradient] start optimizer={self.args.local_optimizer} seeds={len(seed_rows)} "
+            f"steps={self.args.gradient_steps} step_size={self.args.gradient_step_size} "
+            f"lr={self.args.gradient_learning_rate}"
         )
 
-        steps = int(self.args.gradient_steps)
-        step_size = float(self.args.gradient_step_size)
-        learning_rate = float(self.args.gradient_learning_rate)
-        dim = len(self.dim_specs)
         self.gradient_submitted = 0
         self.gradient_cache_hits = 0
-
-        with ProcessPoolExecutor(
-            max_workers=self.workers,
-            mp_context=mp.get_context("fork"),
-            initializer=_process_worker_initializer,
-        ) as executor:
-            for seed_idx, seed_row in enumerate(seed_rows, start=1):
-                seed_tid = int(seed_row["trial_id"])
-                x = self._normalize_params(self._row_params(seed_row))
-
-                for step_index in range(steps + 1):
-                    requests: List[Tuple[Dict[str, float], int, int]] = [
-                        (self._denormalize_params(x), seed_tid, seed_idx)
-                    ]
-                    probe_pairs: List[Tuple[int, int, int]] = []
-
-                    if step_index < steps:
-                        for dim_index in range(dim):
-                            offset = np.zeros(dim, dtype=float)
-                            offset[dim_index] = step_size
-                            plus_idx = len(requests)
-                            requests.append((self._denormalize_params(np.clip(x + offset, 0.0, 1.0)), seed_tid, seed_idx))
-                            minus_idx = len(requests)
-                            requests.append((self._denormalize_params(np.clip(x - offset, 0.0, 1.0)), seed_tid, seed_idx))
-                            probe_pairs.append((dim_index, plus_idx, minus_idx))
-
-                    rows = self._evaluate_gradient_batch_cached(requests=requests, executor=executor)
-
-                    if step_index == steps:
-                        break
-
-                    gradient = np.zeros(dim, dtype=float)
-                    denominator = max(2.0 * step_size, 1e-12)
-                    for dim_index, plus_idx, minus_idx in probe_pairs:
-                        y_plus = self._row_objective(rows[plus_idx])
-                        y_minus = self._row_objective(rows[minus_idx])
-                        gradient[dim_index] = (y_plus - y_minus) / denominator
-
-                    gradient_norm = float(np.linalg.norm(gradient))
-                    if gradient_norm <= 0:
-                        break
-
-                    x = np.clip(x + learning_rate * (gradient / gradient_norm), 0.0, 1.0)
+        states = [
+            GradientSeedState(
+                seed_rank=seed_idx,
+                seed_trial_id=int(seed_row["trial_id"]),
+                optimizer=self._make_local_optimizer(seed_idx, seed_row),
+            )
+            for seed_idx, seed_row in enumerate(seed_rows, start=1)
+        ]
+        waiters: Dict[str, List[GradientSeedState]] = {}
+        backlog: Deque[Tuple[Dict[str, float], str, GradientSeedState]] = deque()
+        futures: Dict[Future[Any], Tuple[Dict[str, float], str, GradientSeedState]] = {}
+
+        # Every seed is a small state machine; probes from all seeds share one queue so the pool
+        # stays saturated, and each seed advances as soon as its own probes are back.
+        with self._executor_scope() as executor:
+            for state in states:
+                self._pump_gradient_state(state, waiters=waiters, backlog=backlog)
+
+            while futures or backlog:
+                while backlog and len(futures) < self._inflight_cap():
+                    params, key, owner = backlog.popleft()
+                    future = self._submit_backtest(executor, params)
+                    futures[future] = (params, key, owner)
+
+                self._observe_dispatch(len(futures), queued=len(backlog))
+                done, _ = wait(list(futures.keys()), timeout=0.2, return_when=FIRST_COMPLETED)
+                records: List[TrialRecord] = []
+                for future in done:
+                    params, key, owner = futures.pop(future)
+                    evaluation = future.result()
+                    self._observe_worker_caches(evaluation)
+                    records.append(
+                        self._evaluation_record(
+                            params,
+                            key,
+                            evaluation,
+                            phase="gradient",
+                            parent_trial_id=owner.seed_trial_id,
+                            seed_rank=owner.seed_rank,
+                        )
+                    )
+                for record, position in zip(records, self._ingest(records)):
+                    row = self.pending_trials.row(int(position))
+                    for state in waiters.pop(record.cache_key, []):
+                        state.rows[record.cache_key] = row
+                        state.pending.discard(record.cache_key)
+                        self._pump_gradient_state(state, waiters=waiters, backlog=backlog)
+                self._maybe_checkpoint(force=False)
+                self._log_progress(prefix="gradient")
 
         self._maybe_checkpoint(force=True)
         self._log_progress(force=True, prefix="gradient")
-        print(
-            f"[gradient] complete submitted={self.gradient_submitted} cache_hits={self.gradient_cache_hits}",
-            flush=True,
+        self.gradient_states = states
+        evaluations_to_best = float(np.mean([s.evaluations_to_best for s in states]))
+        self._emit(
+            f"[gradient] complete seeds_done={sum(1 for s in states if s.done)} "
+            f"submitted={self.gradient_submitted} cache_hits={self.gradient_cache_hits} "
+            f"mean_evaluations_to_best={evaluations_to_best:.1f} "
+            f"stencil_saved={sum(s.optimizer.saved_evaluations for s in states)}"
         )
 
-    def _rows_in_seed_areas(self, seed_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def _seed_area_mask(self, seed_rows: List[Dict[str, Any]]) -> np.ndarray:
         if self.df.empty or not seed_rows:
-            return []
+            return np.zeros(len(self.df), dtype=bool)
 
-        matrix = self._params_matrix_normalized()
-        if matrix.shape[0] == 0:
-            return []
+        index = self._neighborhood_index()
+        if index.size == 0:
+            return np.zeros(len(self.df), dtype=bool)
 
         radius = float(self.args.local_radius)
-        keep = np.zeros(matrix.shape[0], dtype=bool)
-        for seed_row in seed_rows:
-            seed_params = self._row_params(seed_row)
-            center = self._normalize_params(seed_params)
-            distances = np.max(np.abs(matrix - center[None, :]), axis=1)
-            keep |= distances <= radius
+        centers = np.vstack([self._normalize_params(self._row_params(seed_row)) for seed_row in seed_rows])
+        return index.mask_within(centers, radius) & self._full_fidelity_mask(self.df)
 
-        kept_df = self.df[keep]
-        return kept_df.to_dict(orient="records")
+    def _rows_in_seed_areas(self, seed_rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return self._records_at(self.df, np.flatnonzero(self._seed_area_mask(seed_rows)))
 
     def _write_final_json(self, seed_rows: List[Dict[str, Any]]) -> None:
-        area_rows = self._rows_in_seed_areas(seed_rows)
-        area_rows.sort(key=lambda row: self._rank_tuple(row), reverse=True)
+        order = self._rank_order(self.df, np.flatnonzero(self._seed_area_mask(seed_rows)))
         top_n = int(self.args.final_top_n)
         if top_n > 0:
-            area_rows = area_rows[:top_n]
+            order = order[:top_n]
+        area_rows = self._records_at(self.df, order)
 
         out_rows: List[Dict[str, Any]] = []
         for row in area_rows:
@@ -992,22 +2391,29 @@ class Orchestrator:
         out_path = Path(self.args.final_results_json)
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_text(json.dumps(payload, indent=2, sort_keys=True))
-        print(f"[final] wrote json path={out_path} rows={len(out_rows)}", flush=True)
+        self._emit(f"[final] wrote json path={out_path} rows={len(out_rows)}")
 
     def run(self) -> None:
-        print(
+        self._emit(
             f"[run] symbol={self.context.symbol} side={self.context.side} sobol_samples={self.args.sobol_samples} "
-            f"workers={self.workers} parquet={self.parquet_path}",
-            flush=True,
+            f"workers={self.workers} parquet={self.parquet_path}"
         )
 
+        self.telemetry.set_phase("phase1")
         self._run_phase1()
+        self.telemetry.set_phase("phase2")
         seed_rows = self._run_phase2()
+        self.telemetry.set_phase("gradient")
         self._run_gradient(seed_rows)
 
         self._maybe_checkpoint(force=True)
+        self.trials_store.compact()
+        self.ledger_store.compact(unique="ledger_key")
         self._log_progress(force=True, prefix="run")
+        self._emit(f"[workers] {self._worker_cache_summary()}")
         self._write_final_json(seed_rows)
+        self._observe_dispatch(0)
+        self._emit(f"[telemetry] {summary_line(self.telemetry.finish())}")
 
 
 def _symbol_side_scoped_path(base_path: str, *, symbol: str, side: str) -> str:
@@ -1022,7 +2428,146 @@ def _symbol_side_scoped_path(base_path: str, *, symbol: str, side: str) -> str:
     return str(path.with_name(f"{path.stem}_{clean_side}.{clean_symbol}{path.suffix}"))
 
 
-def parse_args() -> argparse.Namespace:
+def _universe_pairs(path: str) -> List[Tuple[str, str]]:
+    pairs: List[Tuple[str, str]] = []
+    for strategy in load_signal_strategy_dicts(path):
+        pair = (str(strategy["symbol"]).upper().strip(), str(strategy["side"]).lower().strip())
+        if pair not in pairs:
+            pairs.append(pair)
+    return pairs
+
+
+def _scoped_pair_args(args: argparse.Namespace, *, symbol: str, side: str) -> argparse.Namespace:
+    pair_args = argparse.Namespace(**vars(args))
+    pair_args.symbol = symbol
+    pair_args.side = side
+    pair_args.trials_parquet = _symbol_side_scoped_path(args.trials_parquet_base, symbol=symbol, side=side)
+    pair_args.final_results_json = _symbol_side_scoped_path(args.final_results_json_base, symbol=symbol, side=side)
+    if args.telemetry_path:
+        pair_args.telemetry_path = _symbol_side_scoped_path(args.telemetry_path, symbol=symbol, side=side)
+    return pair_args
+
+
+def run_universe(args: argparse.Namespace) -> List[Orchestrator]:
+    """Run every (symbol, side) pair in ``args.universe`` against one feature load and one worker pool."""
+    pairs = _universe_pairs(args.universe)
+    backtester = PrecomputedFeatureBacktester.from_parquet(
+        args.features_parquet,
+        trigger_cache_size=int(args.backtest_cache_size),
+    )
+    workers = Orchestrator._resolve_workers(args.workers)
+    fair_share = PoolFairShare(budget=workers * 2, active=len(pairs))
+    orchestrators = [
+        Orchestrator(
+            _scoped_pair_args(args, symbol=symbol, side=side),
+            backtester=backtester,
+            fair_share=fair_share,
+            log_label=f"{side}.{symbol}",
+        )
+        for symbol, side in pairs
+    ]
+    print(
+        f"[universe] pairs={len(pairs)} workers={workers} "
+        f"labels={','.join(o.context.label for o in orchestrators)}",
+        flush=True,
+    )
+
+    errors: List[BaseException] = []
+
+    def _run_pair(orchestrator: Orchestrator) -> None:
+        try:
+            orchestrator.run()
+        except BaseException as exc:  # noqa: BLE001 - re-raised on the main thread
+            errors.append(exc)
+        finally:
+            fair_share.release()
+
+    if args.coordinator_listen:
+        scope = _coordinator_scope(args, backtester)
+    else:
+        scope = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=mp.get_context("fork"),
+            initializer=_process_worker_initializer,
+        )
+    with scope as executor:
+        if not args.coordinator_listen:
+            # Fork every worker before any pair thread starts so children inherit all pair states
+            # and never fork a process that holds a thread-owned lock.
+            for future in [executor.submit(os.getpid) for _ in range(workers)]:
+                future.result()
+        threads = []
+        for orchestrator in orchestrators:
+            orchestrator.shared_executor = executor
+            thread = threading.Thread(target=_run_pair, args=(orchestrator,), name=orchestrator.context.label)
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+
+    if errors:
+        raise errors[0]
+    return orchestrators
+
+
+@contextmanager
+def _coordinator_scope(
+    args: argparse.Namespace,
+    backtester: PrecomputedFeatureBacktester,
+) -> Iterator[WorkQueueExecutor]:
+    host, port = parse_address(args.coordinator_listen)
+    with WorkQueueExecutor(
+        host,
+        port,
+        lease_seconds=float(args.lease_seconds),
+        authkey=authkey_from_env(args.authkey_env),
+        allow_unauthenticated=bool(args.allow_unauthenticated_workers),
+    ) as executor:
+        executor.publish(REMOTE_FEATURE_VERSION_ENTRY, backtester.feature_data_version)
+        print(
+            f"[coordinator] listening={executor.address[0]}:{executor.address[1]} "
+            f"lease_seconds={executor.lease_seconds:g}",
+            flush=True,
+        )
+        try:
+            yield executor
+        finally:
+            print(
+                f"[coordinator] completed={executor.completed} reissued={executor.reissued} "
+                f"connected={executor.connected}",
+                flush=True,
+            )
+
+
+def run_remote_workers(args: argparse.Namespace) -> None:
+    """Serve a --coordinator-listen run: ``--workers`` processes on this host pull tasks over TCP."""
+    address = parse_address(args.worker_connect)
+    backtester = PrecomputedFeatureBacktester.from_parquet(
+        args.features_parquet,
+        trigger_cache_size=int(args.backtest_cache_size),
+    )
+    workers = Orchestrator._resolve_workers(args.workers)
+    print(
+        f"[worker] coordinator={address[0]}:{address[1]} processes={workers} "
+        f"feature_data_version={backtester.feature_data_version}",
+        flush=True,
+    )
+    kwargs = {
+        "install_state": partial(_install_remote_worker_state, backtester),
+        "authkey": authkey_from_env(args.authkey_env),
+    }
+    if workers == 1:
+        run_worker(address, **kwargs)
+        return
+    ctx = mp.get_context("fork")
+    processes = [ctx.Process(target=run_worker, args=(address,), kwargs=kwargs) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Two-phase Sobol + cached gradient backtest orchestration.")
 
     parser.add_argument("--features-parquet", default="data/features/option_strategy_features.parquet")
@@ -1044,14 +2589,166 @@ def parse_args() -> argparse.Namespace:
         ),
     )
 
-    parser.add_argument("--symbol", required=True)
-    parser.add_argument("--side", required=True, choices=["put", "call"])
+    parser.add_argument("--symbol", default=None)
+    parser.add_argument("--side", default=None, choices=["put", "call"])
+    parser.add_argument(
+        "--universe",
+        default=None,
+        help=(
+            "Signal config YAML (for example data/option_signal_notifier.yaml). Optimizes every enabled "
+            "(symbol, side) pair in one process with a shared feature load and worker pool."
+        ),
+    )
     parser.add_argument("--start-date", default=None)
     parser.add_argument("--end-date", default=None)
 
     parser.add_argument("--sobol-samples", type=int, default=3000)
     parser.add_argument("--seed", type=int, default=42)
-    parser.add_argument("--workers", type=int, default=0)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=0,
+        help=(
+            "Worker processes (0 = all CPUs, negative = leave that many free). With --coordinator-listen "
+            "this is the total across all worker hosts and only sizes the in-flight budget."
+        ),
+    )
+    parser.add_argument(
+        "--routing",
+        choices=["off", "window_pair"],
+        default="off",
+        help=(
+            "window_pair: pin each integer window pair to one worker process by consistent hashing (idle "
+            "workers steal queued pairs) and backtest phase-1 chunks grouped by window pair, so worker "
+            "trigger caches stay warm. Applies to the run's own pool, not --universe or --coordinator-listen."
+        ),
+    )
+    parser.add_argument(
+        "--coordinator-listen",
+        default=None,
+        metavar="HOST:PORT",
+        help=(
+            "Serve candidate chunks over TCP to --worker-connect processes instead of a local process pool. "
+            "Only this process reads or writes the trials parquet. Binding a non-loopback HOST needs the "
+            "--authkey-env secret (or --allow-unauthenticated-workers)."
+        ),
+    )
+    parser.add_argument(
+        "--worker-connect",
+        default=None,
+        metavar="HOST:PORT",
+        help=(
+            "Run --workers worker processes for the coordinator at HOST:PORT and exit when it finishes. "
+            "Needs the same --features-parquet as the coordinator; run options come from the coordinator."
+        ),
+    )
+    parser.add_argument(
+        "--authkey-env",
+        default="SOBOL_WORK_QUEUE_AUTHKEY",
+        metavar="NAME",
+        help=(
+            "Environment variable holding the shared secret --coordinator-listen and --worker-connect "
+            "processes authenticate each other with (HMAC challenge) before exchanging any pickled data. "
+            "Set it to the same value on every host."
+        ),
+    )
+    parser.add_argument(
+        "--allow-unauthenticated-workers",
+        action="store_true",
+        help=(
+            "Let --coordinator-listen bind a non-loopback address without an --authkey-env secret. Anyone "
+            "who can reach the port can then run arbitrary code in the coordinator; trusted networks only."
+        ),
+    )
+    parser.add_argument(
+        "--lease-seconds",
+        type=float,
+        default=600.0,
+        help="Reissue a work-queue task to another worker if its result is not back within this many seconds.",
+    )
+    parser.add_argument(
+        "--phase1-chunk-size",
+        type=int,
+        default=64,
+        help="Sobol indices generated and backtested per worker task in phase 1.",
+    )
+
+    parser.add_argument(
+        "--phase1-screening",
+        choices=["off", "trigger", "halving"],
+        default="off",
+        help=(
+            "Cheaper phase-1 fidelities before a full backtest. 'trigger' counts trades without pricing and "
+            "records points that cannot exceed --min-seed-trades; 'halving' also runs successive halving "
+            "over recent date windows before the full-range backtest."
+        ),
+    )
+    parser.add_argument(
+        "--screen-window-days",
+        type=float,
+        default=182.0,
+        help="Calendar days in the first (shortest) halving window, ending at the last feature date.",
+    )
+    parser.add_argument(
+        "--screen-eta",
+        type=float,
+        default=2.0,
+        help="Halving factor: each rung widens the window and keeps 1/eta of the survivors.",
+    )
+
+    parser.add_argument(
+        "--monotone-pruning",
+        choices=["off", "on"],
+        default="off",
+        help=(
+            "Skip phase-1/phase-2 candidates that are at least as strict as a trial with no more than "
+            "--min-seed-trades trades for the same windows and comparators. Gradient probes are never pruned."
+        ),
+    )
+
+    parser.add_argument(
+        "--surrogate",
+        choices=["off", "on"],
+        default="off",
+        help=(
+            "Score phase-1 Sobol points with a gradient-boosted classifier trained on the trials so far "
+            "and defer those unlikely to become seeds."
+        ),
+    )
+    parser.add_argument("--surrogate-cutoff", type=float, default=0.2)
+    parser.add_argument(
+        "--surrogate-explore",
+        type=float,
+        default=0.05,
+        help="Share of below-cutoff points evaluated anyway; also used to estimate recall.",
+    )
+    parser.add_argument("--surrogate-min-train", type=int, default=500)
+    parser.add_argument("--surrogate-refit-every", type=int, default=1000)
+    parser.add_argument(
+        "--ledger-cache",
+        choices=["off", "on"],
+        default="off",
+        help=(
+            "Keep a date-agnostic full-history trade ledger per knob set next to the trials parquet "
+            "(<trials>.ledgers.parquet) and derive each window's metrics by slicing it, so re-running "
+            "on a shifted or extended date range reuses earlier pricing."
+        ),
+    )
+    parser.add_argument(
+        "--ledger-cache-size",
+        type=int,
+        default=DEFAULT_LEDGER_CACHE_SIZE,
+        help="Most recently used ledgers each process keeps in memory under --ledger-cache on.",
+    )
+    parser.add_argument(
+        "--backtest-cache-size",
+        type=int,
+        default=DEFAULT_TRIGGER_CACHE_SIZE,
+        help=(
+            "Per-process LRU of priced trade sets keyed by the exact trigger bitmap, so knob sets that "
+            "trigger on the same rows skip entry selection and pricing. 0 disables it."
+        ),
+    )
 
     parser.add_argument("--min-seed-trades", type=float, default=3.0)
     parser.add_argument("--max-seed-itm", type=float, default=2.0)
@@ -1066,13 +2763,61 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument("--local-probe-per-seed", type=int, default=100)
     parser.add_argument("--local-radius", type=float, default=0.08)
+    parser.add_argument(
+        "--phase2-density-mode",
+        choices=["off", "skip", "shrink"],
+        default="off",
+        help=(
+            "How phase 2 treats seeds whose --local-radius neighborhood already holds trials: "
+            "'skip' drops seeds with at least --local-probe-per-seed neighbors, 'shrink' only tops "
+            "the neighborhood up to --local-probe-per-seed."
+        ),
+    )
 
     parser.add_argument("--gradient-steps", type=int, default=6)
     parser.add_argument("--gradient-step-size", type=float, default=0.03)
     parser.add_argument("--gradient-learning-rate", type=float, default=0.45)
+    parser.add_argument(
+        "--local-optimizer",
+        choices=["gradient", "pattern", "cmaes"],
+        default="gradient",
+        help=(
+            "Local search run from each seed. gradient: central finite differences. pattern: "
+            "integer-aware compass search that only proposes new lattice points. cmaes: batch "
+            "CMA-ES, one generation per batch. --gradient-steps bounds the iterations/generations "
+            "and --gradient-step-size is the initial compass step."
+        ),
+    )
+    parser.add_argument("--cmaes-sigma", type=float, default=0.1)
+    parser.add_argument("--cmaes-popsize", type=int, default=0, help="0 picks 4 + 3 ln(dims).")
 
     parser.add_argument("--progress-seconds", type=float, default=5.0)
     parser.add_argument("--checkpoint-seconds", type=float, default=5.0)
+    parser.add_argument(
+        "--journal",
+        choices=["off", "on"],
+        default="on",
+        help=(
+            "Append every completed trial to <trials>.journal.arrow between checkpoints. A journal left by "
+            "a crashed run is replayed into the trials parquet on startup either way."
+        ),
+    )
+    parser.add_argument(
+        "--journal-sync-seconds",
+        type=float,
+        default=1.0,
+        help="Minimum seconds between journal fsyncs (0 = every batch). Appends always reach the OS at once.",
+    )
+    parser.add_argument(
+        "--telemetry-path",
+        default="",
+        help=(
+            "Rewrite run telemetry (evals/sec, worker utilization, queue depth, parent CPU share, per-phase "
+            "cache-hit ratios, checkpoint latency) to this file every --telemetry-seconds. A .prom suffix "
+            "selects Prometheus text format, anything else JSON. Scoped per symbol/side with --universe."
+        ),
+    )
+    parser.add_argument("--telemetry-seconds", type=float, default=5.0)
     parser.add_argument("--final-top-n", type=int, default=100)
 
     parser.add_argument("--roc-window-default", type=int, default=2)
@@ -1092,26 +2837,72 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--min-pricing-vol", type=float, default=0.10)
     parser.add_argument("--contract-size", type=int, default=100)
 
-    args = parser.parse_args()
-
-    args.symbol = str(args.symbol).upper().strip()
-    args.side = str(args.side).lower().strip()
-
-    if args.trials_parquet is None:
-        args.trials_parquet = _symbol_side_scoped_path(
-            "data/sobol_gradient_trials.parquet",
-            symbol=args.symbol,
-            side=args.side,
-        )
-    if args.final_results_json is None:
-        args.final_results_json = _symbol_side_scoped_path(
-            "data/sobol_gradient_top_runs.json",
-            symbol=args.symbol,
-            side=args.side,
-        )
+    args = parser.parse_args(argv)
+
+    if args.coordinator_listen and args.worker_connect:
+        parser.error("--coordinator-listen cannot be combined with --worker-connect")
+    if args.worker_connect:
+        parse_address(args.worker_connect)
+        return args
+
+    if args.universe is not None:
+        if args.symbol is not None or args.side is not None:
+            parser.error("--universe cannot be combined with --symbol/--side")
+        args.trials_parquet_base = args.trials_parquet or "data/sobol_gradient_trials.parquet"
+        args.final_results_json_base = args.final_results_json or "data/sobol_gradient_top_runs.json"
+    else:
+        if args.symbol is None or args.side is None:
+            parser.error("--symbol and --side are required unless --universe is given")
+        args.symbol = str(args.symbol).upper().strip()
+        args.side = str(args.side).lower().strip()
+
+        if args.trials_parquet is None:
+            args.trials_parquet = _symbol_side_scoped_path(
+                "data/sobol_gradient_trials.parquet",
+                symbol=args.symbol,
+                side=args.side,
+            )
+        if args.final_results_json is None:
+            args.final_results_json = _symbol_side_scoped_path(
+                "data/sobol_gradient_top_runs.json",
+                symbol=args.symbol,
+                side=args.side,
+            )
 
     if args.sobol_samples <= 0:
         raise ValueError("--sobol-samples must be > 0")
+    if args.phase1_chunk_size <= 0:
+        raise ValueError("--phase1-chunk-size must be > 0")
+    if args.screen_window_days <= 0:
+        raise ValueError("--screen-window-days must be > 0")
+    if args.screen_eta <= 1.0:
+        raise ValueError("--screen-eta must be > 1")
+    if not (0.0 <= float(args.surrogate_cutoff) <= 1.0):
+        raise ValueError("--surrogate-cutoff must be in [0, 1]")
+    if not (0.0 <= float(args.surrogate_explore) <= 1.0):
+        raise ValueError("--surrogate-explore must be in [0, 1]")
+    if args.surrogate_min_train <= 0:
+        raise ValueError("--surrogate-min-train must be > 0")
+    if args.surrogate_refit_every <= 0:
+        raise ValueError("--surrogate-refit-every must be > 0")
+    if args.backtest_cache_size < 0:
+        raise ValueError("--backtest-cache-size must be >= 0")
+    if args.ledger_cache_size <= 0:
+        raise ValueError("--ledger-cache-size must be > 0")
+    if args.telemetry_seconds < 0:
+        raise ValueError("--telemetry-seconds must be >= 0")
+    if args.lease_seconds <= 0:
+        raise ValueError("--lease-seconds must be > 0")
+    if args.journal_sync_seconds < 0:
+        raise ValueError("--journal-sync-seconds must be >= 0")
+    if args.coordinator_listen:
+        host, _port = parse_address(args.coordinator_listen)
+        unauthenticated = authkey_from_env(args.authkey_env) is None and not args.allow_unauthenticated_workers
+        if not is_loopback(host) and unauthenticated:
+            parser.error(
+                f"--coordinator-listen {args.coordinator_listen} is reachable from other hosts; set the "
+                f"${args.authkey_env} secret or pass --allow-unauthenticated-workers"
+            )
     if not (0.0 < float(args.seed_top_ratio) <= 1.0):
         raise ValueError("--seed-top-ratio must be in (0, 1]")
     if args.local_probe_per_seed < 0:
@@ -1122,6 +2913,10 @@ def parse_args() -> argparse.Namespace:
         raise ValueError("--local-radius must be in [0, 1]")
     if args.gradient_steps < 0:
         raise ValueError("--gradient-steps must be >= 0")
+    if args.cmaes_sigma <= 0:
+        raise ValueError("--cmaes-sigma must be > 0")
+    if args.cmaes_popsize < 0:
+        raise ValueError("--cmaes-popsize must be >= 0")
     if args.final_top_n < 0:
         raise ValueError("--final-top-n must be >= 0")
 
@@ -1130,7 +2925,18 @@ def parse_args() -> argparse.Namespace:
 
 def main() -> None:
     args = parse_args()
+    if args.worker_connect:
+        run_remote_workers(args)
+        return
+    if args.universe is not None:
+        run_universe(args)
+        return
     orchestrator = Orchestrator(args)
+    if args.coordinator_listen:
+        with _coordinator_scope(args, orchestrator.backtester) as executor:
+            orchestrator.shared_executor = executor
+            orchestrator.run()
+        return
     orchestrator.run()
 
 
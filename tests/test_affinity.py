@@ -0,0 +1,58 @@
+import multiprocessing as mp
+import os
+import time
+import unittest
+
+from optimization.affinity import AffinityExecutor, HashRing
+
+
+def _pid_after(seconds, value):
+    time.sleep(seconds)
+    return os.getpid(), value
+
+
+def _fail(message):
+    raise ValueError(message)
+
+
+class HashRingTests(unittest.TestCase):
+    def test_keys_are_sticky_and_mostly_stay_put_when_a_slot_is_added(self):
+        keys = [(roc, vol) for roc in range(2, 40) for vol in range(2, 30)]
+        four = HashRing(4)
+        five = HashRing(5)
+        self.assertEqual([four.slot(k) for k in keys], [HashRing(4).slot(k) for k in keys])
+        self.assertEqual({four.slot(k) for k in keys}, {0, 1, 2, 3})
+        moved = sum(four.slot(k) != five.slot(k) for k in keys)
+        self.assertLess(moved, len(keys) * 0.35)
+        self.assertTrue(all(five.slot(k) == 4 for k in keys if four.slot(k) != five.slot(k)))
+
+
+class AffinityExecutorTests(unittest.TestCase):
+    def test_same_key_runs_on_one_worker_and_idle_workers_steal(self):
+        ring = HashRing(3)
+        keys = {}
+        for key in [(roc, 2) for roc in range(2, 60)]:
+            keys.setdefault(ring.slot(key), key)
+        with AffinityExecutor(3, mp_context=mp.get_context("fork")) as executor:
+            pids = {}
+            for _ in range(4):
+                for slot in range(3):
+                    pid, _ = executor.submit_routed(keys[slot], _pid_after, 0.0, slot).result(timeout=30)
+                    pids.setdefault(slot, set()).add(pid)
+            self.assertTrue(all(len(p) == 1 for p in pids.values()))
+            self.assertEqual(len(set.union(*pids.values())), 3)
+            self.assertEqual(executor.stolen, 0)
+
+            # Every task shares one key, so the other workers only get work by stealing it.
+            hot = [executor.submit_routed(keys[0], _pid_after, 0.05, i) for i in range(24)]
+            self.assertEqual([f.result(timeout=30)[1] for f in hot], list(range(24)))
+            self.assertGreater(len({f.result()[0] for f in hot}), 1)
+            self.assertGreater(executor.stolen, 0)
+
+            with self.assertRaisesRegex(ValueError, "boom"):
+                executor.submit(_fail, "boom").result(timeout=30)
+        self.assertEqual(sum(executor.dispatched), 12 + 24 + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -104,6 +104,93 @@ class SobolGradientBacktestTests(unittest.TestCase):
         self.assertFalse(result.feasible)
         self.assertIn("roc_range_low > roc_range_high", str(result.infeasible_reason))
 
+    def test_count_trades_matches_evaluate(self):
+        backtester = PrecomputedFeatureBacktester(_sample_feature_frame())
+        for roc_threshold in (0.0, 0.1, 0.2, 0.25):
+            for vol_threshold in (0.0, 0.35, 0.5):
+                knobs = {
+                    "side": "put",
+                    "roc_window_size": 2,
+                    "roc_comparator": "below",
+                    "roc_threshold": roc_threshold,
+                    "vol_window_size": 2,
+                    "vol_comparator": "above",
+                    "vol_threshold": vol_threshold,
+                }
+                result = backtester.evaluate(knobs_input=knobs, symbol="SPY")
+                self.assertEqual(backtester.count_trades(knobs_input=knobs, symbol="SPY"), len(result.trades_df))
+        self.assertIsNone(
+            backtester.count_trades(
+                knobs_input={"side": "put", "roc_window_size": 9, "vol_window_size": 2},
+                symbol="SPY",
+            )
+        )
+
+    def test_trigger_cache_reuses_identical_trigger_sets(self):
+        backtester = PrecomputedFeatureBacktester(_sample_feature_frame(), trigger_cache_size=8)
+        knobs = {"side": "put", "roc_window_size": 2, "roc_comparator": "below", "roc_threshold": 0.2}
+        first = backtester.evaluate(knobs_input={**knobs, "vol_threshold": 0.33}, symbol="SPY")
+        # Every row already clears 0.33, so 0.34 triggers on exactly the same rows.
+        second = backtester.evaluate(knobs_input={**knobs, "vol_threshold": 0.34}, symbol="SPY")
+
+        self.assertEqual((backtester.trigger_cache_hits, backtester.trigger_cache_misses), (1, 1))
+        self.assertEqual(first.metrics, second.metrics)
+        pd.testing.assert_frame_equal(first.trades_df, second.trades_df)
+        self.assertEqual(second.resolved_knobs["vol_threshold"], 0.34)
+        plan = backtester.entry_plan(knobs_input={**knobs, "vol_threshold": 0.3}, symbol="SPY")
+        self.assertEqual(len(plan.entries), len(first.trades_df))
+        self.assertEqual(backtester.trigger_cache_hits, 2)
+
+        uncached = PrecomputedFeatureBacktester(_sample_feature_frame(), trigger_cache_size=0)
+        result = uncached.evaluate(knobs_input={**knobs, "vol_threshold": 0.34}, symbol="SPY")
+        self.assertEqual((uncached.trigger_cache_hits, uncached.trigger_cache_misses), (0, 0))
+        self.assertEqual(result.metrics, second.metrics)
+        self.assertEqual(uncached.entry_plan(knobs_input={**knobs, "vol_threshold": 0.3}, symbol="SPY"), plan)
+
+    def test_evaluate_prices_an_entry_plan_without_a_second_trigger_pass(self):
+        backtester = PrecomputedFeatureBacktester(_sample_feature_frame(), trigger_cache_size=8)
+        knobs = {"side": "put", "roc_window_size": 2, "roc_comparator": "below", "roc_threshold": 0.2}
+        plan = backtester.entry_plan(knobs_input=knobs, symbol="SPY")
+        counters = (backtester.trigger_cache_hits, backtester.trigger_cache_misses)
+        planned = backtester.evaluate(knobs_input=knobs, symbol="SPY", plan=plan)
+        self.assertEqual((backtester.trigger_cache_hits, backtester.trigger_cache_misses), counters)
+
+        fresh = PrecomputedFeatureBacktester(_sample_feature_frame()).evaluate(knobs_input=knobs, symbol="SPY")
+        self.assertEqual(planned.metrics, fresh.metrics)
+        self.assertEqual(planned.resolved_knobs, fresh.resolved_knobs)
+        pd.testing.assert_frame_equal(planned.trades_df, fresh.trades_df)
+
+    def test_trigger_cache_evicts_least_recently_used(self):
+        backtester = PrecomputedFeatureBacktester(_sample_feature_frame(), trigger_cache_size=1)
+        knobs = {"side": "put", "roc_window_size": 2, "roc_comparator": "below", "vol_threshold": 0.0}
+        for roc_threshold in (0.2, 0.1, 0.2):
+            backtester.evaluate(knobs_input={**knobs, "roc_threshold": roc_threshold}, symbol="SPY")
+        self.assertEqual((backtester.trigger_cache_hits, backtester.trigger_cache_misses), (0, 3))
+        backtester.evaluate(knobs_input={**knobs, "roc_threshold": 0.2}, symbol="SPY")
+        self.assertEqual(backtester.trigger_cache_hits, 1)
+        with self.assertRaises(ValueError):
+            PrecomputedFeatureBacktester(_sample_feature_frame(), trigger_cache_size=-1)
+
+    def test_ledger_slices_match_windowed_evaluate(self):
+        backtester = PrecomputedFeatureBacktester(_sample_feature_frame())
+        knobs = {"side": "put", "roc_window_size": 2, "roc_comparator": "below", "roc_threshold": 0.25}
+        ledger = backtester.trade_ledger(knobs_input=knobs, symbol="SPY")
+        self.assertEqual(ledger.history_rows, backtester.history_rows("SPY"))
+        # Wednesday starts/ends cut the first and last weeks, whose ledger entries fall outside the window.
+        windows = [(None, None), ("2026-01-07", "2026-01-14"), ("2026-01-06", None), ("2026-01-17", None)]
+        for start_date, end_date in windows:
+            expected = backtester.evaluate(knobs_input=knobs, symbol="SPY", start_date=start_date, end_date=end_date)
+            result = backtester.evaluate_ledger(
+                ledger, knobs_input=knobs, symbol="SPY", start_date=start_date, end_date=end_date
+            )
+            self.assertEqual(result.feasible, expected.feasible)
+            self.assertEqual(result.metrics, expected.metrics)
+            pd.testing.assert_frame_equal(result.trades_df, expected.trades_df)
+
+        stale = backtester.trade_ledger(knobs_input=knobs, symbol="SPY")
+        shorter = PrecomputedFeatureBacktester(_sample_feature_frame().iloc[:-1])
+        self.assertIsNone(shorter.evaluate_ledger(stale, knobs_input=knobs, symbol="SPY"))
+
     def test_required_trade_and_metric_fields(self):
         backtester = PrecomputedFeatureBacktester(_sample_feature_frame())
         result = backtester.evaluate(
@@ -1,9 +1,20 @@
+import os
+import signal
 import tempfile
 import unittest
 from pathlib import Path
 
-from optimization.constrained_bo import ConstrainedBayesianOptimizer, ParamSpec, extract_region_summary
-from optimization.goal_registry import build_goals
+import numpy as np
+import pandas as pd
+
+from optimization.constrained_bo import (
+    ConstrainedBayesianOptimizer,
+    ParamSpec,
+    TrialResult,
+    TrialTable,
+    extract_region_summary,
+)
+from optimization.goal_registry import GoalEvaluation, build_goals
 
 
 class ConstrainedBORegionTests(unittest.TestCase):
@@ -67,6 +78,184 @@ class ConstrainedBORegionTests(unittest.TestCase):
             self.assertIsNotNone(summary["selected_component"])
             self.assertGreaterEqual(summary["feasible_trial_count"], 1)
 
+    def test_incremental_gp_mode_refits_periodically_and_logs_iteration_time(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            goals = build_goals([{"name": "avg_pnl", "kind": "objective", "direction": "max", "target": None}])
+            messages = []
+            opt = ConstrainedBayesianOptimizer(
+                search_space={"x": ParamSpec(low=0.0, high=1.0), "y": ParamSpec(low=0.0, high=1.0)},
+                goals=goals,
+                evaluator=lambda p: {"avg_pnl": 100.0 - 400.0 * ((p["x"] - 0.55) ** 2 + (p["y"] - 0.3) ** 2)},
+                trials_parquet=str(Path(tmp_dir) / "trials.parquet"),
+                seed=3,
+                n_random_init=8,
+                candidate_pool_size=256,
+                progress_interval_seconds=1e-9,
+                logger=messages.append,
+                gp_mode="incremental",
+                gp_max_active=12,
+                gp_refit_every=5,
+            )
+            trials = opt.run(n_trials=30)
+
+            self.assertEqual(len(trials), 30)
+            self.assertEqual(opt._gp.refits, 5)
+            self.assertLessEqual(opt._gp.active_size, 12 + 5)
+            self.assertGreater(max(t.metrics["avg_pnl"] for t in trials), 90.0)
+            self.assertIn("iter_ms=", next(m for m in messages if m.startswith("[bo] progress")))
+
+    def test_batches_are_spread_out_and_evaluated_on_a_worker_pool(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            goals = build_goals([{"name": "avg_pnl", "kind": "objective", "direction": "max", "target": None}])
+            parent = os.getpid()
+            opt = ConstrainedBayesianOptimizer(
+                search_space={"x": ParamSpec(low=0.0, high=1.0), "y": ParamSpec(low=0.0, high=1.0)},
+                goals=goals,
+                evaluator=lambda p: {
+                    "avg_pnl": 100.0 - 400.0 * ((p["x"] - 0.55) ** 2 + (p["y"] - 0.3) ** 2),
+                    "in_worker": float(os.getpid() != parent),
+                },
+                trials_parquet=str(Path(tmp_dir) / "trials.parquet"),
+                seed=5,
+                n_random_init=8,
+                candidate_pool_size=256,
+                progress_interval_seconds=0,
+                logger=lambda message: None,
+                workers=2,
+                batch_size=4,
+            )
+            trials = opt.run(n_trials=24)
+
+            self.assertEqual([t.trial_id for t in trials], list(range(24)))
+            self.assertTrue(all(t.metrics["in_worker"] == 1.0 for t in trials))
+            self.assertGreater(max(t.metrics["avg_pnl"] for t in trials), 90.0)
+            for start in range(8, 24, 4):
+                batch = np.array([[t.params["x"], t.params["y"]] for t in trials[start : start + 4]])
+                gaps = np.linalg.norm(batch[:, None, :] - batch[None, :, :], axis=-1)
+                self.assertGreater(gaps[np.triu_indices(4, 1)].min(), 1e-3)
+
+    def test_checkpoints_append_parts_and_sigterm_flushes_before_exit(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            goals = build_goals([{"name": "avg_pnl", "kind": "objective", "direction": "max", "target": None}])
+            trials_parquet = Path(tmp_dir) / "trials.parquet"
+            eval_cache_parquet = Path(tmp_dir) / "eval_cache.parquet"
+            calls = []
+
+            def evaluator(params):
+                calls.append(params)
+                if len(calls) == 13:
+                    os.kill(os.getpid(), signal.SIGTERM)
+                metrics = dict.fromkeys(["total", "wins", "win_rate", "itm_expiries", "itm_rate", "total_pnl"], 0.0)
+                metrics.update(median_pnl=0.0, avg_return_on_spot=0.0, max_drawdown=0.0)
+                metrics["avg_pnl"] = -abs(params["x"] - 0.4)
+                return metrics
+
+            def optimizer():
+                return ConstrainedBayesianOptimizer(
+                    search_space={"x": ParamSpec(low=0.0, high=1.0)},
+                    goals=goals,
+                    evaluator=evaluator,
+                    trials_parquet=str(trials_parquet),
+                    eval_cache_parquet=str(eval_cache_parquet),
+                    n_random_init=20,
+                    progress_interval_seconds=0,
+                    logger=lambda message: None,
+                    checkpoint_seconds=0,
+                    checkpoint_trials=5,
+                )
+
+            with self.assertRaises(SystemExit):
+                optimizer().run(n_trials=20)
+            self.assertEqual(len(list(Path(f"{trials_parquet}.parts").glob("part-*.parquet"))), 3)
+            self.assertEqual(len(pd.read_parquet(trials_parquet.with_name("trials.parquet.parts")).index), 12)
+
+            resumed = optimizer()
+            trials = resumed.run(n_trials=20)
+            self.assertEqual([t.trial_id for t in trials], list(range(20)))
+            # Appended rows are released; only their count is kept.
+            self.assertEqual((resumed._trial_rows, resumed._persisted_rows), ([], 8))
+            self.assertFalse(Path(f"{trials_parquet}.parts").exists())
+            self.assertEqual(pd.read_parquet(trials_parquet)["trial_id"].tolist(), list(range(20)))
+            # The resumed run replays the same seeded draws, which the flushed cache now serves.
+            self.assertEqual(len(calls), 13)
+            self.assertEqual(len(pd.read_parquet(eval_cache_parquet).index), 12)
+
+    def test_resume_reads_trials_column_wise_and_builds_only_the_rows_it_needs(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            goals = build_goals(
+                [
+                    {"name": "itm_expiries", "kind": "constraint", "direction": "min", "target": 0.0},
+                    {"name": "avg_pnl", "kind": "objective", "direction": "max", "target": None},
+                ]
+            )
+
+            def evaluator(params):
+                metrics = dict.fromkeys(["total", "wins", "win_rate", "itm_rate", "total_pnl", "median_pnl"], 1.0)
+                metrics.update(avg_return_on_spot=0.0, max_drawdown=-1.0)
+                metrics["itm_expiries"] = float(params["x"] > 0.7)
+                metrics["avg_pnl"] = -abs(params["x"] - 0.4)
+                return metrics
+
+            def optimizer():
+                return ConstrainedBayesianOptimizer(
+                    search_space={"x": ParamSpec(low=0.0, high=1.0)},
+                    goals=goals,
+                    evaluator=evaluator,
+                    trials_parquet=str(Path(tmp_dir) / "trials.parquet"),
+                    n_random_init=40,
+                    progress_interval_seconds=0,
+                    logger=lambda message: None,
+                )
+
+            first = list(optimizer().run(n_trials=30))
+            loaded = optimizer().load_existing_trials()
+            self.assertIsInstance(loaded, TrialTable)
+            self.assertEqual(loaded.built_count, 0)
+            self.assertEqual(list(loaded), first)
+
+            resumed = optimizer().run(n_trials=32)
+            self.assertEqual(len(resumed), 32)
+            self.assertLessEqual(resumed.built_count, 3)
+            self.assertEqual(resumed[:30], first)
+
+    def test_region_summary_splits_separated_clusters_into_components(self):
+        rng = np.random.default_rng(0)
+        trials = []
+        # Two tight clusters far apart in x; the later-numbered one scores slightly better.
+        for trial_id in range(60):
+            center = 0.2 if trial_id % 2 == 0 else 0.8
+            x = float(center + rng.uniform(-0.02, 0.02))
+            objective = 1.0 + 0.01 * (center > 0.5) + 0.001 * rng.uniform()
+            trials.append(
+                TrialResult(
+                    trial_id=trial_id,
+                    params={"x": x, "y": 3.0},
+                    metrics={},
+                    goals=GoalEvaluation(values={}, violations={}, feasible=True, objective_score=objective),
+                    penalized_score=objective,
+                )
+            )
+
+        summary = extract_region_summary(
+            trials,
+            search_space={"x": ParamSpec(low=0.0, high=1.0), "y": ParamSpec(low=3.0, high=3.0)},
+            performance_tolerance_pct=5.0,
+            min_component_fraction=0.1,
+        )
+        components = summary["components"]
+        self.assertEqual(sorted(c["component_id"] for c in components), [0, 1])
+        by_id = {c["component_id"]: c for c in components}
+        xs = np.asarray([t.params["x"] for t in trials])
+        self.assertEqual(by_id[0]["size"], 30)
+        self.assertAlmostEqual(by_id[0]["bounds"]["x"]["min"], float(xs[::2].min()))
+        self.assertAlmostEqual(by_id[1]["bounds"]["x"]["max"], float(xs[1::2].max()))
+        self.assertAlmostEqual(by_id[1]["local_width_by_dim"]["x"], float(np.ptp(xs[1::2])))
+        self.assertEqual(by_id[1]["local_width_by_dim"]["y"], 0.0)
+        objectives = np.asarray([t.goals.objective_score for t in trials[1::2]])
+        self.assertAlmostEqual(by_id[1]["objective_mean"], float(objectives.mean()))
+        self.assertAlmostEqual(by_id[1]["objective_drift_within_component"], float(objectives.std()))
+        self.assertEqual(summary["selected_component"]["component_id"], 1)
+
 
 if __name__ == "__main__":
     unittest.main()
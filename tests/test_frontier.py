@@ -0,0 +1,50 @@
+import unittest
+
+from optimization.frontier import ThresholdFrontier
+
+
+def _knobs(**overrides):
+    knobs = {
+        "roc_window_size": 2,
+        "vol_window_size": 3,
+        "roc_comparator": "below",
+        "vol_comparator": "above",
+        "roc_threshold": 0.0,
+        "vol_threshold": 0.2,
+        "roc_range_enabled": 0,
+        "roc_range_low": 0.0,
+        "roc_range_high": 0.0,
+        "vol_range_enabled": 0,
+        "vol_range_low": 0.0,
+        "vol_range_high": 0.0,
+    }
+    knobs.update(overrides)
+    return knobs
+
+
+class ThresholdFrontierTests(unittest.TestCase):
+    def test_only_stricter_points_in_the_same_group_are_dominated(self):
+        frontier = ThresholdFrontier(floor=3)
+        frontier.observe(_knobs(), 4)
+        self.assertFalse(frontier.dominated(_knobs(roc_threshold=-0.1)))
+
+        frontier.observe(_knobs(), 3)
+        self.assertTrue(frontier.dominated(_knobs(roc_threshold=-0.1, vol_threshold=0.3)))
+        self.assertFalse(frontier.dominated(_knobs(roc_threshold=0.1)))
+        self.assertFalse(frontier.dominated(_knobs(vol_threshold=0.1)))
+        self.assertFalse(frontier.dominated(_knobs(roc_threshold=-0.1, vol_window_size=4)))
+        self.assertFalse(frontier.dominated(_knobs(roc_threshold=-0.1, roc_comparator="above")))
+
+        frontier.observe(_knobs(roc_threshold=0.1), 0)
+        frontier.observe(_knobs(roc_threshold=-0.2), 1)
+        self.assertEqual(frontier.size, 1)
+
+    def test_narrower_ranges_are_dominated(self):
+        frontier = ThresholdFrontier(floor=3)
+        frontier.observe(_knobs(roc_range_enabled=1, roc_range_low=-0.1, roc_range_high=0.1), 2)
+        self.assertTrue(frontier.dominated(_knobs(roc_range_enabled=1, roc_range_low=-0.05, roc_range_high=0.1)))
+        self.assertFalse(frontier.dominated(_knobs(roc_range_enabled=1, roc_range_low=-0.2, roc_range_high=0.05)))
+
+
+if __name__ == "__main__":
+    unittest.main()
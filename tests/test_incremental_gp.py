@@ -0,0 +1,50 @@
+import unittest
+
+import numpy as np
+from sklearn.gaussian_process import GaussianProcessRegressor
+
+from optimization.incremental_gp import IncrementalGP, select_active_set
+
+
+def _objective(x):
+    return np.sin(6.0 * x[:, 0]) + 0.5 * x[:, 1]
+
+
+class SelectActiveSetTests(unittest.TestCase):
+    def test_keeps_the_best_points_and_covers_the_rest_of_the_space(self):
+        rng = np.random.default_rng(0)
+        x = np.vstack([rng.uniform(0.0, 0.1, size=(90, 2)), [[0.9, 0.9], [0.9, 0.1], [0.1, 0.9]]])
+        y = np.concatenate([np.arange(90.0), [-1.0, -2.0, -3.0]])
+        active = select_active_set(x, y, 10)
+        self.assertEqual(len(active), 10)
+        self.assertTrue(set(range(85, 90)) <= set(active))
+        self.assertTrue({90, 91, 92} <= set(active))
+        np.testing.assert_array_equal(select_active_set(x[:6], y[:6], 10), np.arange(6))
+
+
+class IncrementalGPTests(unittest.TestCase):
+    def test_rank_one_updates_match_an_exact_fit_with_the_same_kernel(self):
+        rng = np.random.default_rng(1)
+        x = rng.uniform(size=(40, 2))
+        y = _objective(x)
+        gp = IncrementalGP(max_active=16, random_state=0)
+        gp.refit(x[:30], y[:30])
+        self.assertEqual(gp.active_size, 16)
+        for row, value in zip(x[30:], y[30:]):
+            self.assertTrue(gp.add(row, value))
+        self.assertEqual(gp.active_size, 26)
+
+        exact = GaussianProcessRegressor(kernel=gp.kernel_, optimizer=None)
+        exact.fit(gp._x, (gp._y - gp._y_mean) / gp._y_std)
+        probe = rng.uniform(size=(50, 2))
+        mean, std = gp.predict(probe, return_std=True)
+        exact_mean, exact_std = exact.predict(probe, return_std=True)
+        np.testing.assert_allclose(mean, exact_mean * gp._y_std + gp._y_mean, atol=1e-6)
+        np.testing.assert_allclose(std, exact_std * gp._y_std, atol=1e-6)
+
+        gp.refit(x, y)
+        self.assertEqual((gp.refits, gp.active_size), (2, 16))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pyarrow as pa
+
+from optimization.journal import ArrowJournal, read_journal
+
+SCHEMA = pa.schema([("trial_id", pa.int64()), ("cache_key", pa.string())])
+
+
+def _batch(start, count):
+    ids = list(range(start, start + count))
+    return pa.table({"trial_id": ids, "cache_key": [f"k{i}" if i % 2 else None for i in ids]}, schema=SCHEMA)
+
+
+class ArrowJournalTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "trials.journal.arrow"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def test_appends_are_readable_before_close_and_torn_tail_is_dropped(self):
+        journal = ArrowJournal(self.path, SCHEMA, sync_seconds=0)
+        for start in (0, 3, 6):
+            journal.append(_batch(start, 3))
+        journal.append(_batch(9, 0))
+        self.assertEqual(journal.rows, 9)
+        self.assertEqual(journal.syncs, 3)
+        self.assertEqual(read_journal(self.path).column("trial_id").to_pylist(), list(range(9)))
+
+        data = self.path.read_bytes()
+        self.path.write_bytes(data[:-10])
+        self.assertEqual(read_journal(self.path).column("trial_id").to_pylist(), list(range(6)))
+        self.path.write_bytes(data[:4])
+        self.assertIsNone(read_journal(self.path))
+        journal.close()
+
+    def test_reset_removes_the_file_and_next_append_starts_a_new_stream(self):
+        journal = ArrowJournal(self.path, SCHEMA, sync_seconds=60)
+        journal.append(_batch(0, 2))
+        self.assertEqual(journal.syncs, 0)
+        journal.reset()
+        self.assertFalse(self.path.exists())
+        self.assertIsNone(read_journal(self.path))
+
+        journal.append(_batch(5, 2))
+        journal.close()
+        self.assertEqual(journal.syncs, 1)
+        self.assertEqual(read_journal(self.path).column("trial_id").to_pylist(), [5, 6])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,115 @@
+import unittest
+
+import numpy as np
+
+from optimization.local_search import (
+    BatchCMAES,
+    CompassSearch,
+    FiniteDifferenceAscent,
+    central_difference_stencil,
+    snap_to_lattice,
+)
+
+# Two integer dimensions with 59 levels (like roc_window_size 2..60) and one continuous dimension.
+LATTICE = np.array([1.0 / 58.0, 1.0 / 58.0, 0.0])
+OPTIMUM = np.array([17.0 / 58.0, 41.0 / 58.0, 0.62])
+
+
+def _objective(point: np.ndarray) -> float:
+    return -float(np.sum((np.asarray(point) - OPTIMUM) ** 2))
+
+
+def _run(optimizer, budget: int = 1000) -> list:
+    asked = []
+    while not optimizer.done and len(asked) < budget:
+        batch = optimizer.ask()
+        if not batch:
+            break
+        asked.extend(batch)
+        optimizer.tell([_objective(point) for point in batch])
+    return asked
+
+
+class CompassSearchTests(unittest.TestCase):
+    def test_proposals_are_distinct_lattice_points(self):
+        optimizer = CompassSearch(
+            np.array([0.5, 0.5, 0.5]),
+            lattice=LATTICE,
+            initial_step=0.03,
+            max_iterations=200,
+        )
+        asked = _run(optimizer)
+        keys = [tuple(np.round(point, 9)) for point in asked]
+        self.assertEqual(len(keys), len(set(keys)))
+        for point in asked:
+            np.testing.assert_allclose(point[:2], snap_to_lattice(point, LATTICE)[:2])
+        np.testing.assert_allclose(optimizer.best_x[:2], OPTIMUM[:2])
+        self.assertAlmostEqual(optimizer.best_x[2], OPTIMUM[2], delta=2e-3)
+
+    def test_known_start_value_skips_center_evaluation(self):
+        x0 = np.array([0.5, 0.5, 0.5])
+        optimizer = CompassSearch(x0, lattice=LATTICE, initial_step=0.03, max_iterations=1, x0_value=_objective(x0))
+        self.assertEqual(len(optimizer.ask()), 6)
+
+
+class BatchCMAESTests(unittest.TestCase):
+    def test_generation_batches_improve_on_the_start(self):
+        x0 = np.array([0.1, 0.9, 0.1])
+        optimizer = BatchCMAES(x0, lattice=LATTICE, sigma0=0.2, max_generations=40, seed=3)
+        batch = optimizer.ask()
+        self.assertEqual(len(batch), optimizer.popsize)
+        self.assertEqual(len({tuple(np.round(point, 9)) for point in batch}), len(batch))
+        optimizer.tell([_objective(point) for point in batch])
+        _run(optimizer)
+        self.assertTrue(optimizer.done)
+        self.assertGreater(optimizer.best_value, -1e-3)
+        self.assertGreater(optimizer.best_value, _objective(x0))
+
+
+class FiniteDifferenceAscentTests(unittest.TestCase):
+    def test_zero_gradient_on_integer_dimensions_stops_the_search(self):
+        # A 0.03 step around an integer center rounds back onto it, so the probes see no slope.
+        optimizer = FiniteDifferenceAscent(np.array([0.5, 0.5, 0.5]), step_size=0.03, learning_rate=0.45, max_steps=6)
+        batch = optimizer.ask()
+        self.assertEqual(len(batch), 7)
+        optimizer.tell([0.0] * len(batch))
+        self.assertTrue(optimizer.done)
+
+    def test_lattice_probes_find_the_integer_slope(self):
+        optimizer = FiniteDifferenceAscent(
+            np.array([0.5, 0.5, 0.5]), step_size=0.03, learning_rate=0.1, max_steps=6, lattice=LATTICE
+        )
+        asked = _run(optimizer)
+        self.assertGreater(optimizer.step_index, 1)
+        self.assertGreater(optimizer.best_value, _objective(np.array([0.5, 0.5, 0.5])))
+        self.assertEqual(len(asked), 7 * optimizer.step_index + 1)
+
+
+class CentralDifferenceStencilTests(unittest.TestCase):
+    def test_integer_dimensions_move_at_least_one_lattice_step(self):
+        stencil = central_difference_stencil(np.array([0.5, 0.5, 0.5]), step_size=0.005, lattice=LATTICE)
+        self.assertEqual(len(stencil.points), 6)
+        for dim_index, plus_index, minus_index, distance in stencil.pairs[:2]:
+            self.assertAlmostEqual(distance, 2 * LATTICE[dim_index])
+            self.assertNotEqual(stencil.points[plus_index][dim_index], stencil.center[dim_index])
+
+    def test_probes_with_equal_keys_are_evaluated_once(self):
+        # The last dimension does not reach the parameters, and the first is clipped at the upper bound.
+        center = np.array([1.0, 0.5, 0.5])
+        stencil = central_difference_stencil(
+            center,
+            step_size=0.05,
+            key=lambda point: tuple(np.round(point[:2], 9)),
+            include_center=True,
+        )
+        self.assertEqual(stencil.requested, 7)
+        self.assertEqual(len(stencil.points), 4)
+        self.assertEqual(stencil.saved, 3)
+        self.assertEqual([pair[0] for pair in stencil.pairs], [0, 1])
+        self.assertAlmostEqual(stencil.pairs[0][3], 0.05)
+        gradient = stencil.gradient([float(point[0] + 2.0 * point[1]) for point in stencil.points])
+        np.testing.assert_allclose(gradient, [1.0, 2.0, 0.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+
+import numpy as np
+
+from optimization.neighborhood import TrialNeighborhoodIndex
+
+
+def _chebyshev_within(points, center, radius):
+    return np.max(np.abs(points - center[None, :]), axis=1) <= radius
+
+
+class TrialNeighborhoodIndexTests(unittest.TestCase):
+    def test_counts_and_masks_match_a_dense_chebyshev_scan(self):
+        rng = np.random.default_rng(3)
+        points = rng.uniform(size=(200, 3))
+        extra = rng.uniform(size=(25, 3))
+        index = TrialNeighborhoodIndex(dim=3)
+        index.rebuild(points)
+
+        centers = points[:4]
+        expected = np.zeros(len(points), dtype=bool)
+        for center in centers:
+            dense = _chebyshev_within(points, center, 0.15)
+            expected |= dense
+            self.assertEqual(index.count_within(center, 0.15), int(dense.sum()))
+            self.assertEqual(
+                index.count_within(center, 0.15, extra=extra),
+                int(dense.sum() + _chebyshev_within(extra, center, 0.15).sum()),
+            )
+        np.testing.assert_array_equal(index.mask_within(centers, 0.15), expected)
+
+    def test_empty_index_only_counts_extra_rows(self):
+        index = TrialNeighborhoodIndex(dim=2)
+        index.rebuild(np.empty((0, 2)))
+        center = np.array([0.5, 0.5])
+        self.assertEqual(index.count_within(center, 0.1), 0)
+        self.assertEqual(index.count_within(center, 0.1, extra=np.array([[0.55, 0.45], [0.9, 0.5]])), 1)
+        self.assertEqual(index.mask_within(center[None, :], 0.1).shape, (0,))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 
-from optimization.goal_registry import build_goals, evaluate_goals
+import numpy as np
+
+from optimization.goal_registry import GoalEngine, build_goals, evaluate_goals, evaluate_goals_batch
 
 
 class OptimizationGoalTests(unittest.TestCase):
@@ -23,6 +25,46 @@ class OptimizationGoalTests(unittest.TestCase):
         self.assertGreater(ev_bad.violations["itm_expiries"], 0)
         self.assertGreater(ev_bad.violations["max_drawdown_abs"], 0)
 
+    def test_batch_evaluation_matches_row_by_row(self):
+        goals = build_goals(
+            [
+                {"name": "itm_expiries", "kind": "constraint", "direction": "min", "target": 1},
+                {"name": "win_rate", "kind": "objective", "direction": "min", "target": None},
+                {"name": "avg_pnl", "kind": "objective", "direction": "max", "target": None},
+            ]
+        )
+        rng = np.random.default_rng(3)
+        columns = {
+            "itm_expiries": rng.integers(0, 3, size=40).astype(float),
+            "win_rate": rng.uniform(size=40),
+            "avg_pnl": rng.normal(size=40),
+        }
+        batch = evaluate_goals_batch(goals, columns)
+        for i in range(40):
+            expected = evaluate_goals(goals, {name: float(values[i]) for name, values in columns.items()})
+            self.assertEqual(batch.row(i), expected)
+        self.assertEqual(int(batch.feasible.sum()), int((columns["itm_expiries"] <= 1).sum()))
+
+    def test_engine_matrix_matches_row_by_row(self):
+        goals = build_goals(
+            [
+                {"name": "max_drawdown_abs", "kind": "constraint", "direction": "min", "target": 50},
+                {"name": "win_rate", "kind": "constraint", "direction": "max", "target": 0.5},
+                {"name": "total_pnl", "kind": "objective", "direction": "max", "target": None},
+            ]
+        )
+        engine = GoalEngine(goals)
+        self.assertEqual(engine.columns, ("max_drawdown", "win_rate", "total_pnl"))
+        rng = np.random.default_rng(5)
+        # total_pnl is absent from the matrix and reads as 0, like a missing key in the metrics dict.
+        columns = ("win_rate", "max_drawdown", "avg_pnl")
+        matrix = np.column_stack([rng.uniform(size=30), rng.normal(scale=60.0, size=30), rng.normal(size=30)])
+        batch = engine.evaluate(matrix, columns)
+        records = [dict(zip(columns, (float(v) for v in row))) for row in matrix]
+        for i, record in enumerate(records):
+            self.assertEqual(batch.row(i), evaluate_goals(goals, record))
+        np.testing.assert_array_equal(engine.evaluate_records(records).feasible, batch.feasible)
+        np.testing.assert_allclose(batch.penalized(10.0), batch.objective_score - 10.0 * batch.total_violation())
 
 if __name__ == "__main__":
     unittest.main()
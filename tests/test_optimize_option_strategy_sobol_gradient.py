@@ -0,0 +1,718 @@
+import contextlib
+import io
+import json
+import multiprocessing as mp
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from optimization.part_store import ParquetPartStore
+from optimize_option_strategy_sobol_gradient import (
+    CandidateRun,
+    Orchestrator,
+    Phase2CandidateStats,
+    _coordinator_scope,
+    _process_worker_backtest,
+    parse_args,
+    run_remote_workers,
+    run_universe,
+)
+
+
+def _write_feature_parquet(path: Path, periods: int = 160) -> None:
+    rng = np.random.default_rng(5)
+    dates = pd.bdate_range("2025-01-06", periods=periods, freq="B")
+    close = 100.0 + np.cumsum(rng.normal(0.0, 1.0, size=periods))
+    data = {
+        "symbol": ["SPY"] * periods,
+        "date": dates,
+        "open": close,
+        "high": close + 1.0,
+        "low": close - 1.0,
+        "close": close,
+        "volume": [1_000_000] * periods,
+        "realized_vol_close_w21": [0.25] * periods,
+    }
+    for window in range(2, 7):
+        data[f"roc_close_w{window}"] = rng.normal(0.0, 0.05, size=periods)
+        data[f"downside_vol_w{window}"] = rng.uniform(0.0, 0.6, size=periods)
+        data[f"upside_vol_w{window}"] = rng.uniform(0.0, 0.6, size=periods)
+    pd.DataFrame(data).to_parquet(path, index=False)
+
+
+def _write_window_yaml(path: Path) -> None:
+    path.write_text(
+        "\n".join(
+            [
+                "optimization:",
+                "  dimensions:",
+                "    roc_window:",
+                "      min: 2",
+                "      max: 6",
+                "      type: int",
+                "    vol_window:",
+                "      min: 2",
+                "      max: 6",
+                "      type: int",
+                "    roc_threshold:",
+                "      min: -0.10",
+                "      max: 0.10",
+                "      type: float",
+                "    vol_threshold:",
+                "      min: 0.0",
+                "      max: 0.6",
+                "      type: float",
+            ]
+        )
+    )
+
+
+class OrchestratorTestCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.features = self.tmp / "features.parquet"
+        self.windows = self.tmp / "windows.yaml"
+        _write_feature_parquet(self.features)
+        _write_window_yaml(self.windows)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _args(self, *extra: str):
+        return parse_args(
+            [
+                "--symbol",
+                "spy",
+                "--side",
+                "put",
+                "--features-parquet",
+                str(self.features),
+                "--window-config-yaml",
+                str(self.windows),
+                "--trials-parquet",
+                str(self.tmp / "trials.parquet"),
+                "--final-results-json",
+                str(self.tmp / "top.json"),
+                "--workers",
+                "2",
+                "--progress-seconds",
+                "0",
+                "--checkpoint-seconds",
+                "0",
+                *extra,
+            ]
+        )
+
+
+class Phase1WorkerSobolTests(OrchestratorTestCase):
+    def test_phase1_matches_parent_side_sampling_and_reuses_cache(self):
+        args = self._args("--sobol-samples", "40", "--phase1-chunk-size", "7")
+        orchestrator = Orchestrator(args)
+        orchestrator._run_phase1()
+
+        expected_keys = {orchestrator._cache_key(p) for p in orchestrator.sobol.sample_params(40)}
+        self.assertEqual(set(orchestrator.key_to_trial_id), expected_keys)
+        self.assertEqual(len(orchestrator.df), len(expected_keys))
+        self.assertEqual(sorted(orchestrator.df["trial_id"].astype(int)), list(range(len(expected_keys))))
+
+        rerun = Orchestrator(self._args("--sobol-samples", "40", "--phase1-chunk-size", "5"))
+        rerun._run_phase1()
+        self.assertEqual(len(rerun.df), len(expected_keys))
+
+
+class NeighborhoodIndexTests(OrchestratorTestCase):
+    def test_seed_area_rows_match_dense_chebyshev_scan(self):
+        orchestrator = Orchestrator(self._args("--sobol-samples", "60"))
+        orchestrator._run_phase1()
+        seeds = orchestrator.df.head(3).to_dict(orient="records")
+
+        matrix = orchestrator._params_matrix_normalized()
+        expected = np.zeros(matrix.shape[0], dtype=bool)
+        for seed in seeds:
+            center = orchestrator._normalize_params(orchestrator._row_params(seed))
+            expected |= np.max(np.abs(matrix - center[None, :]), axis=1) <= orchestrator.args.local_radius
+            self.assertEqual(
+                orchestrator._seed_neighbor_count(center, orchestrator.args.local_radius),
+                int(np.sum(np.max(np.abs(matrix - center[None, :]), axis=1) <= orchestrator.args.local_radius)),
+            )
+
+        rows = orchestrator._rows_in_seed_areas(seeds)
+        self.assertEqual(
+            sorted(int(r["trial_id"]) for r in rows),
+            sorted(orchestrator.df.loc[expected, "trial_id"].astype(int)),
+        )
+
+    def test_skip_mode_drops_densely_covered_seeds(self):
+        orchestrator = Orchestrator(
+            self._args(
+                "--sobol-samples",
+                "60",
+                "--local-probe-per-seed",
+                "1",
+                "--local-radius",
+                "1.0",
+                "--phase2-density-mode",
+                "skip",
+            )
+        )
+        orchestrator._run_phase1()
+        seeds = orchestrator.df.head(2).to_dict(orient="records")
+        stats = Phase2CandidateStats()
+        self.assertEqual(list(orchestrator._iter_phase2_local_candidates(seeds, stats)), [])
+        self.assertEqual(stats.seeds_skipped_dense, 2)
+
+
+class JournalTests(OrchestratorTestCase):
+    def test_unpersisted_results_are_replayed_once_after_a_crash(self):
+        orchestrator = Orchestrator(self._args("--sobol-samples", "40"))
+        orchestrator._persist_trials = lambda: None  # killed before any checkpoint completes
+        orchestrator._run_phase1()
+        journal = orchestrator.journal_path
+        self.assertFalse((self.tmp / "trials.parquet").exists())
+        self.assertEqual(orchestrator.journal.rows, len(orchestrator.pending_trials))
+        expected = orchestrator.pending_trials.to_arrow().to_pandas()
+
+        # Crash before any checkpoint: every result survives through the journal alone.
+        recovered = Orchestrator(self._args("--sobol-samples", "40"))
+        self.assertFalse(journal.exists())
+        pd.testing.assert_frame_equal(recovered.df, expected)
+        pd.testing.assert_frame_equal(ParquetPartStore(self.tmp / "trials.parquet").read(), expected)
+        self.assertEqual(recovered.next_trial_id, len(expected))
+
+        # Crash after the parquet write but before the journal reset: nothing is stored twice.
+        recovered._persist_trials = lambda: None
+        recovered._run_gradient(recovered._run_phase2())
+        stale = journal.read_bytes()
+        del recovered._persist_trials
+        recovered._maybe_checkpoint(force=True)
+        self.assertFalse(journal.exists())
+        journal.write_bytes(stale)
+        self.assertGreater(len(recovered.df), len(expected))
+        again = Orchestrator(self._args("--sobol-samples", "40"))
+        self.assertFalse(journal.exists())
+        self.assertEqual(len(again.df), len(recovered.df))
+        self.assertEqual(again.df["trial_id"].tolist(), recovered.df["trial_id"].tolist())
+
+
+class ColumnarRankingTests(OrchestratorTestCase):
+    def test_lexsort_ranking_matches_record_sort(self):
+        orchestrator = Orchestrator(
+            self._args("--sobol-samples", "80", "--seed-top-ratio", "1.0", "--seed-phases", "all")
+        )
+        orchestrator._run_phase1()
+        orchestrator._maybe_checkpoint(force=True)
+        # Duplicate rows under a second phase to create exact ties and exercise phase filtering.
+        copies = orchestrator.df.assign(phase="phase2", trial_id=lambda d: d["trial_id"] + 1000)
+        orchestrator.df = pd.concat([orchestrator.df, copies], ignore_index=True)
+
+        records = orchestrator.df.to_dict(orient="records")
+        eligible = [r for r in records if orchestrator._is_full_fidelity(r) and orchestrator._is_seed_eligible(r)]
+        expected = sorted(eligible, key=orchestrator._rank_tuple, reverse=True)
+        self.assertGreater(len(expected), 1)
+        self.assertEqual(
+            [int(r["trial_id"]) for r in orchestrator._sorted_seed_rows()],
+            [int(r["trial_id"]) for r in expected],
+        )
+        self.assertEqual(
+            int(orchestrator._compute_best_from_df(orchestrator.df)["trial_id"]),
+            int(max(records, key=orchestrator._rank_tuple)["trial_id"]),
+        )
+
+        orchestrator.args.seed_phases = "phase2"
+        self.assertEqual(
+            [int(r["trial_id"]) for r in orchestrator._sorted_seed_rows()],
+            [int(r["trial_id"]) for r in expected if r["phase"] == "phase2"],
+        )
+
+
+class ConcurrentGradientTests(OrchestratorTestCase):
+    def _gradient_keys(self, workers: str, trials_name: str) -> set:
+        args = self._args("--sobol-samples", "200", "--min-seed-trades", "2", "--gradient-steps", "3")
+        args.workers = int(workers)
+        args.trials_parquet = str(self.tmp / trials_name)
+        orchestrator = Orchestrator(args)
+        orchestrator._run_phase1()
+        seeds = orchestrator._sorted_seed_rows()
+        self.assertGreater(len(seeds), 1)
+        orchestrator._run_gradient(seeds)
+        gradient = orchestrator.df[orchestrator.df["phase"] == "gradient"]
+        return set(gradient["cache_key"])
+
+    def test_interleaved_seeds_visit_the_same_points_for_any_worker_count(self):
+        self.assertEqual(self._gradient_keys("1", "serial.parquet"), self._gradient_keys("3", "parallel.parquet"))
+
+
+class LocalOptimizerTests(OrchestratorTestCase):
+    def _local_search(self, optimizer: str) -> Orchestrator:
+        args = self._args(
+            "--sobol-samples",
+            "200",
+            "--min-seed-trades",
+            "2",
+            "--gradient-steps",
+            "6",
+            "--local-optimizer",
+            optimizer,
+            "--trials-parquet",
+            str(self.tmp / f"{optimizer}.parquet"),
+        )
+        orchestrator = Orchestrator(args)
+        orchestrator._run_phase1()
+        self.seeds[optimizer] = {int(row["trial_id"]): row for row in orchestrator._sorted_seed_rows()}
+        orchestrator._run_gradient(list(self.seeds[optimizer].values()))
+        return orchestrator
+
+    def test_pattern_and_cmaes_reach_at_least_the_gradient_best(self):
+        self.seeds = {}
+        runs = {name: self._local_search(name) for name in ("gradient", "pattern", "cmaes")}
+        best = {name: max(state.optimizer.best_value for state in run.gradient_states) for name, run in runs.items()}
+        self.assertGreaterEqual(best["pattern"], best["gradient"])
+        self.assertGreaterEqual(best["cmaes"], best["gradient"])
+        for name, run in runs.items():
+            for state in run.gradient_states:
+                seed_value = run._row_objective(self.seeds[name][state.seed_trial_id])
+                self.assertTrue(state.done, name)
+                self.assertGreaterEqual(state.optimizer.best_value, seed_value, name)
+                self.assertLessEqual(state.evaluations_to_best, state.evaluations, name)
+
+
+class Phase1ScreeningTests(OrchestratorTestCase):
+    def _phase1(self, name: str, *extra: str) -> Orchestrator:
+        args = self._args("--sobol-samples", "120", "--min-seed-trades", "8", "--max-seed-itm", "1000", *extra)
+        args.trials_parquet = str(self.tmp / f"{name}.parquet")
+        orchestrator = Orchestrator(args)
+        orchestrator._run_phase1()
+        return orchestrator
+
+    def test_trigger_screening_keeps_full_rows_and_seeds(self):
+        baseline = self._phase1("off")
+        screened = self._phase1("trigger", "--phase1-screening", "trigger")
+
+        by_fidelity = screened.df.groupby("fidelity")["cache_key"].apply(set).to_dict()
+        self.assertTrue(by_fidelity["trigger_count"])
+        self.assertEqual(by_fidelity["trigger_count"] | by_fidelity["full"], set(baseline.df["cache_key"]))
+        self.assertEqual(set(screened.key_to_trial_id), by_fidelity["full"])
+        trigger_rows = screened.df[screened.df["fidelity"] == "trigger_count"]
+        self.assertTrue((trigger_rows["metric__total"] <= 8).all())
+        expected_totals = baseline.df.set_index("cache_key").loc[trigger_rows["cache_key"], "metric__total"]
+        self.assertEqual(list(trigger_rows["metric__total"]), list(expected_totals))
+
+        self.assertEqual(
+            [row["cache_key"] for row in screened._sorted_seed_rows()],
+            [row["cache_key"] for row in baseline._sorted_seed_rows()],
+        )
+
+        rerun = self._phase1("trigger", "--phase1-screening", "trigger")
+        self.assertEqual(len(rerun.df), len(screened.df))
+
+    def test_halving_records_each_rung_as_it_is_evaluated(self):
+        screened = self._phase1("halving", "--phase1-screening", "halving", "--screen-window-days", "40")
+        window_starts = screened.screening.window_starts
+        self.assertEqual(len(window_starts), 3)
+        self.assertFalse(screened.df.duplicated(["cache_key", "fidelity", "fidelity_start_date"]).any())
+        counts = screened.df["fidelity"].value_counts().to_dict()
+        self.assertEqual(set(counts), {"full", "trigger_count", "recent_window"})
+        self.assertEqual(counts["full"], screened.screening_stats.promoted_full)
+        window_rows = screened.df[screened.df["fidelity"] == "recent_window"]
+        self.assertTrue(window_rows["fidelity_start_date"].isin(window_starts).all())
+        first_rung = window_rows["fidelity_start_date"] == window_starts[0]
+        self.assertEqual(int((~first_rung).sum()), screened.screening_stats.window_evaluations)
+        # A promoted point was screened on every window before its full backtest.
+        full_keys = set(screened.df.loc[screened.df["fidelity"] == "full", "cache_key"])
+        rungs = window_rows[window_rows["cache_key"].isin(full_keys)].groupby("cache_key")["fidelity_start_date"]
+        self.assertTrue((rungs.nunique() == len(window_starts)).all())
+        self.assertTrue(all(row["fidelity"] == "full" for row in screened._sorted_seed_rows()))
+
+        # Screened keys stay out of the metric cache, so later phases re-run them at full fidelity.
+        screened_key = window_rows["cache_key"].iloc[0]
+        self.assertNotIn(screened_key, screened.key_to_trial_id)
+        self.assertIn(screened_key, screened.screened_keys)
+
+
+class MonotonePruningTests(OrchestratorTestCase):
+    def _phase1(self, name: str, *extra: str) -> Orchestrator:
+        args = self._args("--sobol-samples", "120", "--min-seed-trades", "8", "--max-seed-itm", "1000", *extra)
+        args.trials_parquet = str(self.tmp / f"{name}.parquet")
+        orchestrator = Orchestrator(args)
+        orchestrator._run_phase1()
+        orchestrator._maybe_checkpoint(force=True)
+        return orchestrator
+
+    def test_pruned_points_never_clear_the_trade_floor(self):
+        baseline = self._phase1("off")
+        pruned = self._phase1("pruned", "--monotone-pruning", "on", "--workers", "1")
+
+        pruned_rows = pruned.df[pruned.df["fidelity"] == "pruned"]
+        self.assertGreater(len(pruned_rows), 0)
+        self.assertTrue((pruned_rows["prune_reason"] == "dominated_trade_floor").all())
+        self.assertTrue(pruned_rows["metric__total"].isna().all())
+        totals = baseline.df.set_index("cache_key")["metric__total"]
+        self.assertTrue((totals.loc[pruned_rows["cache_key"]] <= 8).all())
+        self.assertEqual(
+            [row["cache_key"] for row in pruned._sorted_seed_rows()],
+            [row["cache_key"] for row in baseline._sorted_seed_rows()],
+        )
+
+        low = pruned.df[(pruned.df["fidelity"] == "full") & (pruned.df["metric__total"] <= 8)].iloc[0]
+        params = pruned._row_params(low.to_dict())
+        params["roc_threshold"] = max(pruned.dim_specs["roc_threshold"].low, params["roc_threshold"] - 0.01)
+        params["vol_threshold"] = min(pruned.dim_specs["vol_threshold"].high, params["vol_threshold"] + 0.01)
+        before = pruned.pruned_count
+        submitted, _ = pruned._submit_candidates(
+            [CandidateRun(params=params, phase="phase2", parent_trial_id=None, seed_rank=None)],
+            phase_label="phase2",
+        )
+        self.assertEqual(submitted, 0)
+        self.assertEqual(pruned.pruned_count, before + 1)
+        self.assertEqual(pruned.df.iloc[-1]["phase"], "phase2")
+        self.assertEqual(pruned.df.iloc[-1]["fidelity"], "pruned")
+
+        # A rerun relearns the same frontier from the stored columns.
+        reloaded = Orchestrator(pruned.args)
+        self.assertGreater(reloaded.frontier.size, 0)
+        self.assertEqual(
+            {group: sorted(map(tuple, points)) for group, points in reloaded.frontier._minimal.items()},
+            {group: sorted(map(tuple, points)) for group, points in pruned.frontier._minimal.items()},
+        )
+
+
+class SurrogatePrefilterTests(OrchestratorTestCase):
+    def test_deferred_points_are_recorded_and_rescored_on_rerun(self):
+        extra = (
+            "--sobol-samples",
+            "400",
+            "--phase1-chunk-size",
+            "16",
+            "--min-seed-trades",
+            "8",
+            "--max-seed-itm",
+            "1000",
+            "--surrogate",
+            "on",
+            "--surrogate-min-train",
+            "60",
+            "--surrogate-refit-every",
+            "60",
+        )
+        orchestrator = Orchestrator(self._args(*extra))
+        orchestrator._run_phase1()
+        orchestrator._maybe_checkpoint(force=True)
+
+        stats = orchestrator.surrogate_stats
+        self.assertGreater(stats.fits, 0)
+        deferred = orchestrator.df[orchestrator.df["fidelity"] == "surrogate_deferred"]
+        self.assertEqual(len(deferred), stats.deferred)
+        self.assertGreater(len(deferred), 0)
+        self.assertTrue((deferred["prune_reason"] == "surrogate_low_probability").all())
+        self.assertTrue(deferred["metric__total"].isna().all())
+        self.assertTrue(all(row["fidelity"] == "full" for row in orchestrator._sorted_seed_rows()))
+
+        rerun = Orchestrator(self._args(*extra))
+        self.assertEqual(set(rerun.deferred_keys), set(deferred["cache_key"]))
+        self.assertTrue(set(rerun.deferred_keys).isdisjoint(rerun._phase1_known_keys()))
+        rerun._run_phase1()
+        rerun._maybe_checkpoint(force=True)
+        self.assertEqual(rerun.surrogate_stats.scored, len(deferred))
+        self.assertEqual(int((rerun.df["fidelity"] == "surrogate_deferred").sum()), len(deferred))
+
+
+class QuantizationTests(OrchestratorTestCase):
+    def test_steps_snap_params_and_trigger_hash_reuses_backtests(self):
+        config = self.windows.read_text()
+        config = config.replace("max: 0.10\n      type: float", "max: 0.10\n      type: float\n      step: 0.02")
+        config = config.replace("max: 0.6\n      type: float", "max: 0.6\n      type: float\n      step: 0.25")
+        self.windows.write_text(config)
+        orchestrator = Orchestrator(self._args("--sobol-samples", "150", "--workers", "1"))
+        self.assertEqual(orchestrator.dim_specs["roc_threshold"].step, 0.02)
+        orchestrator._run_phase1()
+        orchestrator._maybe_checkpoint(force=True)
+        df = orchestrator.df
+
+        roc_steps = (df["param__roc_threshold"] + 0.10) / 0.02
+        self.assertTrue(np.allclose(roc_steps, roc_steps.round()))
+        self.assertTrue(set(df["param__vol_threshold"].round(12)) <= {0.0, 0.25, 0.5})
+        self.assertLess(len(df), 150)
+        self.assertGreater(orchestrator.trigger_reuse_count, 0)
+
+        metric_cols = [c for c in df.columns if c.startswith("metric__")]
+        shared = df[df.duplicated("trigger_hash", keep=False)]
+        self.assertGreater(len(shared), 0)
+        for _, group in shared.groupby("trigger_hash"):
+            self.assertEqual(len(group[metric_cols].drop_duplicates()), 1)
+        row = shared.iloc[-1].to_dict()
+        _, direct, _ = orchestrator._worker_backtest(orchestrator._row_params(row))
+        for key, value in direct.items():
+            self.assertAlmostEqual(float(row[f"metric__{key}"]), value, places=9)
+
+        rerun = Orchestrator(self._args("--sobol-samples", "150", "--workers", "1"))
+        self.assertEqual(set(rerun.trigger_metrics), set(df["trigger_hash"].dropna()))
+        self.assertTrue(_process_worker_backtest(rerun.context.label, rerun._row_params(row)).reused)
+
+        # Stored metrics were priced at the old rate; a resume with another rate must not reuse them.
+        repriced = Orchestrator(self._args("--sobol-samples", "150", "--workers", "1", "--risk-free-rate", "0.09"))
+        self.assertEqual(set(repriced.trigger_metrics), set(df["trigger_hash"].dropna()))
+        evaluation = _process_worker_backtest(repriced.context.label, repriced._row_params(row))
+        self.assertFalse(evaluation.reused)
+        self.assertNotIn(evaluation.trigger_hash, set(df["trigger_hash"].dropna()))
+
+
+class BacktestCacheTests(OrchestratorTestCase):
+    def test_worker_cache_counters_reach_parent_and_match_uncached_metrics(self):
+        orchestrator = Orchestrator(self._args("--sobol-samples", "80"))
+        orchestrator._run_phase1()
+        orchestrator._maybe_checkpoint(force=True)
+        self.assertGreater(orchestrator.backtest_cache_hits, 0)
+        self.assertGreater(orchestrator.backtest_cache_misses, 0)
+        self.assertIn(
+            f"bt_cache_hits={orchestrator.backtest_cache_hits} bt_cache_misses={orchestrator.backtest_cache_misses}",
+            orchestrator._backtest_cache_summary(),
+        )
+
+        disabled = Orchestrator(
+            self._args(
+                "--sobol-samples",
+                "80",
+                "--backtest-cache-size",
+                "0",
+                "--trials-parquet",
+                str(self.tmp / "uncached.parquet"),
+            )
+        )
+        disabled._run_phase1()
+        disabled._maybe_checkpoint(force=True)
+        self.assertEqual((disabled.backtest_cache_hits, disabled.backtest_cache_misses), (0, 0))
+        metric_cols = [c for c in orchestrator.df.columns if c.startswith("metric__")]
+        cached = orchestrator.df.set_index("cache_key").sort_index()[metric_cols]
+        uncached = disabled.df.set_index("cache_key").sort_index()[metric_cols]
+        pd.testing.assert_frame_equal(cached, uncached)
+
+
+class LedgerCacheTests(OrchestratorTestCase):
+    def _phase1(self, *extra: str) -> Orchestrator:
+        orchestrator = Orchestrator(self._args("--sobol-samples", "60", *extra))
+        orchestrator._run_phase1()
+        orchestrator._maybe_checkpoint(force=True)
+        return orchestrator
+
+    def test_extended_date_range_reads_ledgers_and_matches_direct_backtests(self):
+        first = self._phase1("--ledger-cache", "on", "--start-date", "2025-02-05", "--end-date", "2025-05-14")
+        self.assertEqual(first.ledger_reads, 0)
+        self.assertGreater(len(first.ledgers), 0)
+        # Checkpoints append only the ledgers built since the previous one; run() compacts them.
+        self.assertEqual(first.pending_ledgers, {})
+        self.assertEqual(first.ledger_store.read()["ledger_key"].tolist(), list(first.ledgers))
+        parts = first.ledger_store.parts_written
+        first._persist_ledgers()
+        self.assertEqual(first.ledger_store.parts_written, parts)
+        self.assertFalse(first.ledger_path.exists())
+
+        # Wednesday-to-Wednesday windows cut a week at both ends.
+        extended = ("--start-date", "2025-01-22", "--end-date", "2025-06-18")
+        rerun = self._phase1("--ledger-cache", "on", *extended)
+        self.assertEqual(set(rerun.ledgers), set(first.ledgers))
+        self.assertEqual(rerun.ledger_reads, len(rerun.df[rerun.df["start_date"] == "2025-01-22"]))
+
+        direct = self._phase1(*extended, "--trials-parquet", str(self.tmp / "direct.parquet"))
+        metric_cols = [c for c in direct.df.columns if c.startswith("metric__")]
+        ledger_rows = rerun.df[rerun.df["start_date"] == "2025-01-22"].set_index("cache_key").sort_index()
+        direct_rows = direct.df.set_index("cache_key").sort_index()
+        pd.testing.assert_frame_equal(ledger_rows[metric_cols], direct_rows[metric_cols])
+
+    def test_ledger_cache_size_caps_memory_but_every_ledger_is_stored(self):
+        capped = self._phase1("--ledger-cache", "on", "--ledger-cache-size", "5")
+        stored = capped.ledger_store.read()
+        self.assertGreater(len(stored), 5)
+        self.assertEqual(stored["ledger_key"].nunique(), len(stored))
+        self.assertEqual(list(capped.ledgers), stored["ledger_key"].tolist()[-5:])
+
+        row = capped.df.iloc[0].to_dict()
+        evaluation = _process_worker_backtest(capped.context.label, capped._row_params(row))
+        self.assertIsNotNone(evaluation.ledger)
+        self.assertEqual(len(capped.ledgers), 5)
+        self.assertEqual(next(reversed(capped.ledgers)), evaluation.ledger_key)
+
+        capped.ledger_store.compact(unique="ledger_key")
+        self.assertFalse(capped.ledger_store.parts_dir.exists())
+        rerun = Orchestrator(self._args("--ledger-cache", "on", "--ledger-cache-size", "5"))
+        self.assertEqual(list(rerun.ledgers), stored["ledger_key"].tolist()[-5:])
+
+    def test_remote_ledger_deltas_send_new_keys_the_lru_still_holds(self):
+        capped = self._phase1("--ledger-cache", "on", "--ledger-cache-size", "5", "--coordinator-listen", "127.0.0.1:0")
+        self.assertEqual(len(capped.remote_ledger_keys), len(capped.ledger_store.read()))
+        published = {}
+        capped._publish_remote_state(mock.Mock(publish=published.__setitem__))
+        self.assertEqual(published["put.SPY"].ledgers, {})
+        deltas = [value for name, value in published.items() if name.startswith("put.SPY/ledgers/")]
+        self.assertEqual(deltas, [dict(capped.ledgers)])
+        self.assertEqual(capped.remote_ledger_keys, [])
+
+
+class TelemetryTests(OrchestratorTestCase):
+    def test_run_writes_final_telemetry_matching_trials(self):
+        path = self.tmp / "telemetry.json"
+        orchestrator = Orchestrator(
+            self._args("--sobol-samples", "40", "--gradient-steps", "2", "--telemetry-path", str(path))
+        )
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            orchestrator.run()
+
+        payload = json.loads(path.read_text())
+        self.assertTrue(payload["final"])
+        self.assertEqual(payload["run"], "put.SPY")
+        self.assertEqual(payload["evaluations"], len(orchestrator.df))
+        phase_rows = orchestrator.df["phase"].value_counts().to_dict()
+        for phase, values in payload["phases"].items():
+            self.assertEqual(values["evaluations"], phase_rows.get(phase, 0))
+        self.assertGreater(payload["checkpoints"], 0)
+        self.assertGreaterEqual(payload["worker_utilization"], 0.0)
+        self.assertEqual(payload["in_flight"], 0)
+        self.assertIn("bt_cache_hits", payload["counters"])
+        self.assertIn("[telemetry] evaluations=", out.getvalue())
+
+
+class RoutingTests(OrchestratorTestCase):
+    def test_window_pair_routing_evaluates_the_same_trials_and_reports_worker_hit_rates(self):
+        extra = ("--sobol-samples", "40", "--local-probe-per-seed", "4", "--gradient-steps", "1")
+        plain = Orchestrator(self._args(*extra))
+        plain.run()
+
+        args = self._args(*extra, "--routing", "window_pair")
+        args.trials_parquet = str(self.tmp / "routed.parquet")
+        routed = Orchestrator(args)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            routed.run()
+
+        self.assertEqual(set(routed.df["cache_key"]), set(plain.df["cache_key"]))
+        self.assertGreater(len(routed.worker_cache_stats), 0)
+        self.assertEqual(
+            sum(hits + misses for hits, misses in routed.worker_cache_stats.values()),
+            routed.backtest_cache_hits + routed.backtest_cache_misses,
+        )
+        self.assertIn("[workers] routing=window_pair", out.getvalue())
+
+
+class WorkQueueTests(OrchestratorTestCase):
+    @mock.patch.dict(os.environ, {"TEST_SOBOL_WORK_QUEUE_AUTHKEY": "shared-secret"})
+    def test_coordinator_with_remote_workers_matches_local_pool(self):
+        extra = ("--sobol-samples", "40", "--local-probe-per-seed", "4", "--gradient-steps", "1")
+        local = Orchestrator(self._args(*extra))
+        local.run()
+
+        auth = ("--authkey-env", "TEST_SOBOL_WORK_QUEUE_AUTHKEY")
+        args = self._args(*extra, *auth, "--coordinator-listen", "127.0.0.1:0", "--lease-seconds", "60")
+        args.trials_parquet = str(self.tmp / "remote.parquet")
+        remote = Orchestrator(args)
+        with contextlib.redirect_stdout(io.StringIO()), _coordinator_scope(args, remote.backtester) as executor:
+            self.assertEqual(executor.authkey, b"shared-secret")
+            worker_args = parse_args(
+                [
+                    "--worker-connect",
+                    f"{executor.address[0]}:{executor.address[1]}",
+                    "--features-parquet",
+                    str(self.features),
+                    "--workers",
+                    "2",
+                    *auth,
+                ]
+            )
+            worker = mp.get_context("fork").Process(target=run_remote_workers, args=(worker_args,))
+            worker.start()
+            published = {}
+            publish = executor.publish
+            executor.publish = lambda name, value: (published.setdefault(name, value), publish(name, value))
+            remote.shared_executor = executor
+            remote.run()
+        worker.join(timeout=30)
+        self.assertEqual(worker.exitcode, 0)
+        self.assertGreater(executor.completed, 0)
+        # The pair state is published once; later scopes only send trigger-metric entries they have not sent.
+        self.assertEqual(published["put.SPY"].trigger_metrics, {})
+        deltas = [value for name, value in published.items() if name.startswith("put.SPY/trigger_metrics/")]
+        sent = {key for delta in deltas for key in delta}
+        self.assertGreater(len(deltas), 1)
+        self.assertEqual(sum(len(delta) for delta in deltas), len(sent))
+        self.assertLessEqual(sent, set(remote.trigger_metrics))
+
+        columns = ["cache_key", "phase", "fidelity", "objective_score", "metric__total", "metric__total_pnl"]
+        expected = local.df[columns].sort_values("cache_key", ignore_index=True)
+        actual = pd.read_parquet(args.trials_parquet)[columns].sort_values("cache_key", ignore_index=True)
+        pd.testing.assert_frame_equal(actual, expected)
+
+    def test_non_loopback_coordinator_needs_an_authkey_or_an_opt_in(self):
+        listen = ("--coordinator-listen", "0.0.0.0:0", "--authkey-env", "TEST_SOBOL_WORK_QUEUE_AUTHKEY")
+        with mock.patch.dict(os.environ), contextlib.redirect_stderr(io.StringIO()):
+            os.environ.pop("TEST_SOBOL_WORK_QUEUE_AUTHKEY", None)
+            with self.assertRaises(SystemExit):
+                self._args(*listen)
+            self.assertTrue(self._args(*listen, "--allow-unauthenticated-workers").allow_unauthenticated_workers)
+            os.environ["TEST_SOBOL_WORK_QUEUE_AUTHKEY"] = "shared-secret"
+            self.assertEqual(self._args(*listen).coordinator_listen, "0.0.0.0:0")
+
+
+class UniverseTests(OrchestratorTestCase):
+    def test_universe_writes_per_pair_trials_matching_single_runs(self):
+        universe = self.tmp / "universe.yaml"
+        universe.write_text(
+            "\n".join(
+                [
+                    "strategy_sets:",
+                    "  - symbol: spy",
+                    "    side: put",
+                    "    strategies:",
+                    "      - {name: a, roc_window_size: 2, roc_comparator: below, roc_threshold: 0.0,"
+                    " vol_window_size: 2, vol_comparator: above, vol_threshold: 0.0}",
+                    "      - {name: b, roc_window_size: 3, roc_comparator: below, roc_threshold: 0.0,"
+                    " vol_window_size: 3, vol_comparator: above, vol_threshold: 0.0}",
+                    "  - symbol: SPY",
+                    "    side: call",
+                    "    strategies:",
+                    "      - {name: c, roc_window_size: 2, roc_comparator: above, roc_threshold: 0.0,"
+                    " vol_window_size: 2, vol_comparator: above, vol_threshold: 0.0}",
+                ]
+            )
+        )
+        extra = ("--sobol-samples", "30", "--local-probe-per-seed", "4", "--gradient-steps", "1")
+        args = parse_args(
+            [
+                "--universe",
+                str(universe),
+                "--features-parquet",
+                str(self.features),
+                "--window-config-yaml",
+                str(self.windows),
+                "--trials-parquet",
+                str(self.tmp / "universe.parquet"),
+                "--final-results-json",
+                str(self.tmp / "universe.json"),
+                "--workers",
+                "2",
+                "--progress-seconds",
+                "0",
+                "--checkpoint-seconds",
+                "0",
+                *extra,
+            ]
+        )
+        orchestrators = run_universe(args)
+        self.assertEqual([o.context.label for o in orchestrators], ["put.SPY", "call.SPY"])
+
+        for side in ("put", "call"):
+            trials = self.tmp / f"universe_{side}.SPY.parquet"
+            self.assertTrue(trials.exists())
+            self.assertTrue((self.tmp / f"universe_{side}.SPY.json").exists())
+            single_args = self._args(*extra)
+            single_args.side = side
+            single_args.trials_parquet = str(self.tmp / f"single_{side}.parquet")
+            single = Orchestrator(single_args)
+            single.run()
+            self.assertEqual(set(pd.read_parquet(trials)["cache_key"]), set(single.df["cache_key"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
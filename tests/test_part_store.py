@@ -0,0 +1,44 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import pandas as pd
+
+from optimization.part_store import ParquetPartStore
+
+
+class ParquetPartStoreTests(unittest.TestCase):
+    def test_appends_read_back_in_order_and_compact_into_one_file(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "trials.parquet"
+            store = ParquetPartStore(path)
+            self.assertIsNone(store.read())
+            pd.DataFrame({"trial_id": [0, 1]}).to_parquet(path, index=False)
+            store.append(pd.DataFrame({"trial_id": [2]}))
+            store.append(pd.DataFrame({"trial_id": []}))
+            store.append(pd.DataFrame({"trial_id": [3, 4]}))
+            self.assertEqual(store.parts_written, 2)
+            self.assertEqual(pd.read_parquet(path)["trial_id"].tolist(), [0, 1])
+            self.assertEqual(store.read()["trial_id"].tolist(), [0, 1, 2, 3, 4])
+
+            store.compact()
+            self.assertFalse(store.parts_dir.exists())
+            self.assertEqual(pd.read_parquet(path)["trial_id"].tolist(), [0, 1, 2, 3, 4])
+
+            store.append(pd.DataFrame({"trial_id": [5]}))
+            store.clear()
+            self.assertIsNone(store.read())
+
+    def test_compact_can_keep_the_last_row_per_key(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            store = ParquetPartStore(Path(tmp_dir) / "ledgers.parquet")
+            store.append(pd.DataFrame({"ledger_key": ["a", "b"], "rows": [1, 2]}))
+            store.append(pd.DataFrame({"ledger_key": ["a", "c"], "rows": [3, 4]}))
+            store.compact(unique="ledger_key")
+            compacted = pd.read_parquet(store.path)
+            self.assertEqual(compacted["ledger_key"].tolist(), ["b", "a", "c"])
+            self.assertEqual(compacted["rows"].tolist(), [2, 3, 4])
+
+
+if __name__ == "__main__":
+    unittest.main()
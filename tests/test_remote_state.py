@@ -0,0 +1,54 @@
+import unittest
+
+from optimization.remote_state import RemotePairPublisher, apply_entries, delta_entry, split_entry
+
+
+class _RecordingExecutor:
+    def __init__(self):
+        self.published = {}
+
+    def publish(self, name, value):
+        self.published[name] = value
+
+
+class RemoteStateTests(unittest.TestCase):
+    def test_entry_names_round_trip(self):
+        self.assertEqual(delta_entry("put.SPY", "ledgers", 3), "put.SPY/ledgers/3")
+        self.assertEqual(split_entry("put.SPY/ledgers/3"), ("put.SPY", "ledgers"))
+        self.assertEqual(split_entry("put.SPY"), ("put.SPY", None))
+
+    def test_state_is_published_once_and_caches_as_numbered_deltas(self):
+        executor = _RecordingExecutor()
+        publisher = RemotePairPublisher("put.SPY")
+        cache = {"a": 1}
+        publisher.publish_state(executor, {"version": 1})
+        publisher.publish_grown(executor, "trigger_metrics", cache)
+        publisher.publish_state(executor, {"version": 2})
+        publisher.publish_grown(executor, "trigger_metrics", cache)
+        cache.update(b=2, c=3)
+        publisher.publish_grown(executor, "trigger_metrics", cache)
+        publisher.publish_delta(executor, "ledgers", {})
+        publisher.publish_delta(executor, "ledgers", {"k": "ledger"})
+
+        self.assertEqual(
+            executor.published,
+            {
+                "put.SPY": {"version": 1},
+                "put.SPY/trigger_metrics/0": {"a": 1},
+                "put.SPY/trigger_metrics/1": {"b": 2, "c": 3},
+                "put.SPY/ledgers/2": {"k": "ledger"},
+            },
+        )
+
+        states, caches = {}, []
+        apply_entries(
+            executor.published,
+            install_state=states.__setitem__,
+            extend_cache=lambda pair, name, entries: caches.append((pair, name, entries)),
+        )
+        self.assertEqual(states, {"put.SPY": {"version": 1}})
+        self.assertEqual([name for _, name, _ in caches], ["trigger_metrics", "trigger_metrics", "ledgers"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,10 +1,13 @@
+import os
 import tempfile
 import threading
 import time
 import unittest
 from pathlib import Path
 
-from optimization.constrained_bo import ParamSpec
+import pandas as pd
+
+from optimization.constrained_bo import ParamSpec, TrialTable
 from optimization.goal_registry import build_goals
 from optimization.sobol_gradient_descent import ConstrainedSobolGradientOptimizer
 
@@ -83,6 +86,158 @@ class SobolGradientOptimizerTests(unittest.TestCase):
             self.assertTrue(trials_parquet.exists())
             self.assertTrue(eval_cache_parquet.exists())
 
+    def test_integer_gradient_probes_are_deduplicated(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            calls = []
+
+            def evaluator(params):
+                calls.append(dict(params))
+                n = float(params["n"])
+                avg_pnl = 100.0 - (n - 7.0) ** 2
+                return {
+                    "total": 20.0,
+                    "wins": 10.0,
+                    "win_rate": 0.5,
+                    "itm_expiries": 0.0,
+                    "itm_rate": 0.0,
+                    "total_pnl": avg_pnl * 20.0,
+                    "avg_pnl": avg_pnl,
+                    "median_pnl": avg_pnl,
+                    "avg_return_on_spot": avg_pnl / 1000.0,
+                    "max_drawdown": -40.0,
+                }
+
+            goals = build_goals([{"name": "avg_pnl", "kind": "objective", "direction": "max"}])
+            opt = ConstrainedSobolGradientOptimizer(
+                search_space={
+                    "n": ParamSpec(low=2.0, high=20.0, is_int=True),
+                    "fixed": ParamSpec(low=1.0, high=1.0, is_int=False),
+                },
+                goals=goals,
+                evaluator=evaluator,
+                trials_parquet=str(Path(tmp_dir) / "trials.parquet"),
+                max_eval_cache_entries=0,
+                seed=5,
+                sobol_samples=8,
+                local_probe_per_seed=0,
+                gradient_steps=1,
+                gradient_step_size=0.01,
+                progress_interval_seconds=0.0,
+                logger=lambda message: None,
+            )
+            payload = opt.run()
+
+            probes = [t for t in payload["trials"] if t.trial_id >= 8]
+            seeds = len(payload["top_seed_trial_ids"])
+            self.assertGreater(seeds, 0)
+            # Per seed: two integer probes one step apart and one gradient step; the zero-width dimension costs nothing.
+            self.assertEqual(len(probes), seeds * 3)
+            self.assertEqual(payload["stencil_saved_evaluations"], seeds * 2)
+            self.assertEqual(len(calls), 8 + seeds * 3)
+
+    def test_process_backend_keeps_the_eval_cache_in_the_parent(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            calls_log = Path(tmp_dir) / "calls.log"
+
+            def evaluator(params):
+                with open(calls_log, "a") as handle:
+                    handle.write(f"{os.getpid()} {int(params['n'])}\n")
+                avg_pnl = -abs(float(params["n"]) - 4.0)
+                return {
+                    "total": 20.0,
+                    "wins": 10.0,
+                    "win_rate": 0.5,
+                    "itm_expiries": 0.0,
+                    "itm_rate": 0.0,
+                    "total_pnl": avg_pnl * 20.0,
+                    "avg_pnl": avg_pnl,
+                    "median_pnl": avg_pnl,
+                    "avg_return_on_spot": 0.0,
+                    "max_drawdown": -40.0,
+                }
+
+            def optimizer():
+                return ConstrainedSobolGradientOptimizer(
+                    search_space={"n": ParamSpec(low=2.0, high=6.0, is_int=True)},
+                    goals=build_goals([{"name": "avg_pnl", "kind": "objective", "direction": "max"}]),
+                    evaluator=evaluator,
+                    trials_parquet=str(Path(tmp_dir) / "trials.parquet"),
+                    eval_cache_parquet=str(Path(tmp_dir) / "eval_cache.parquet"),
+                    seed=3,
+                    sobol_samples=16,
+                    local_probe_per_seed=2,
+                    gradient_steps=1,
+                    workers=2,
+                    parallel_backend="process",
+                    progress_interval_seconds=0.0,
+                    logger=lambda message: None,
+                )
+
+            opt = optimizer()
+            payload = opt.run()
+
+            calls = [line.split() for line in calls_log.read_text().splitlines()]
+            # Only the five distinct integer points are ever evaluated, some of them in worker processes.
+            self.assertEqual(sorted(n for _pid, n in calls), sorted({n for _pid, n in calls}))
+            self.assertLessEqual(len(calls), 5)
+            self.assertTrue(any(int(pid) != os.getpid() for pid, _n in calls))
+            self.assertEqual(len(opt._eval_cache), len(calls))
+            self.assertEqual(payload["cache_hits"], len(payload["trials"]) - len(calls))
+
+            payload = optimizer().run()
+            self.assertEqual(len(calls_log.read_text().splitlines()), len(calls))
+
+    def test_resume_recomputes_a_partial_seed_from_the_trial_columns(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            trials_parquet = Path(tmp_dir) / "trials.parquet"
+
+            def evaluator(params):
+                x = float(params["x"])
+                avg_pnl = 100.0 - 200.0 * ((x - 0.4) ** 2)
+                return {
+                    "total": 20.0,
+                    "wins": 10.0,
+                    "win_rate": 0.5,
+                    "itm_expiries": float(x > 0.8),
+                    "itm_rate": 0.0,
+                    "total_pnl": avg_pnl * 20.0,
+                    "avg_pnl": avg_pnl,
+                    "median_pnl": avg_pnl,
+                    "avg_return_on_spot": 0.0,
+                    "max_drawdown": -10.0 - x,
+                }
+
+            def optimizer():
+                return ConstrainedSobolGradientOptimizer(
+                    search_space={"x": ParamSpec(low=0.0, high=1.0, is_int=False)},
+                    goals=build_goals([{"name": "avg_pnl", "kind": "objective", "direction": "max"}]),
+                    evaluator=evaluator,
+                    trials_parquet=str(trials_parquet),
+                    seed=7,
+                    sobol_samples=16,
+                    local_probe_per_seed=3,
+                    gradient_steps=1,
+                    progress_interval_seconds=0.0,
+                    logger=lambda message: None,
+                )
+
+            first = optimizer().run()
+            df = pd.read_parquet(trials_parquet)
+            last_seed = df["parent_trial_id"].dropna().iloc[-1]
+            children = df.index[df["parent_trial_id"] == last_seed]
+            df.drop(children[1:]).to_parquet(trials_parquet, index=False)
+
+            resumed = optimizer().run()
+            self.assertIsInstance(resumed["trials"], TrialTable)
+            self.assertEqual(len(resumed["trials"]), len(first["trials"]))
+            self.assertEqual(resumed["top_seed_trial_ids"], first["top_seed_trial_ids"])
+            self.assertEqual(resumed["best_feasible"].trial_id, first["best_feasible"].trial_id)
+
+            stored = pd.read_parquet(trials_parquet)
+            self.assertFalse(stored["trial_id"].duplicated().any())
+            self.assertEqual(len(stored), len(first["trials"]))
+            self.assertEqual(int((stored["parent_trial_id"] == last_seed).sum()), len(children))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+import numpy as np
+
+from optimization.surrogate import SeedSurrogate, SurrogateStats
+
+
+class SeedSurrogateTests(unittest.TestCase):
+    def test_fit_separates_a_simple_region(self):
+        rng = np.random.default_rng(0)
+        x = rng.uniform(0.0, 1.0, size=(400, 2))
+        y = (x[:, 0] > 0.7).astype(int)
+        surrogate = SeedSurrogate(cutoff=0.5, explore_rate=0.0)
+        self.assertTrue(np.all(surrogate.predict_proba(x[:3]) == 1.0))
+
+        self.assertTrue(surrogate.fit(x, y))
+        probs = surrogate.predict_proba(np.array([[0.95, 0.5], [0.1, 0.5]]))
+        self.assertGreater(probs[0], 0.5)
+        self.assertLess(probs[1], 0.5)
+
+    def test_single_class_keeps_previous_model(self):
+        surrogate = SeedSurrogate(cutoff=0.5, explore_rate=0.1)
+        self.assertFalse(surrogate.fit(np.zeros((10, 2)), np.zeros(10)))
+        self.assertFalse(surrogate.fitted)
+
+    def test_exploration_draw_is_deterministic(self):
+        surrogate = SeedSurrogate(cutoff=0.5, explore_rate=0.25)
+        keys = [f"key-{i}" for i in range(2000)]
+        draws = [surrogate.should_explore(key) for key in keys]
+        self.assertEqual(draws, [surrogate.should_explore(key) for key in keys])
+        self.assertAlmostEqual(sum(draws) / len(keys), 0.25, delta=0.03)
+
+    def test_recall_scales_explored_misses(self):
+        stats = SurrogateStats()
+        for _ in range(8):
+            stats.record(predicted=True, actual=True)
+        for _ in range(2):
+            stats.record(predicted=True, actual=False)
+        stats.record(predicted=False, actual=True)
+        self.assertAlmostEqual(stats.precision(), 0.8)
+        self.assertAlmostEqual(stats.recall(explore_rate=0.5), 8.0 / 10.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from optimization.telemetry import RunTelemetry, format_prometheus
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RunTelemetryTests(unittest.TestCase):
+    def _telemetry(self, path=None, **kwargs):
+        clock = FakeClock()
+        cpu = FakeClock()
+        telemetry = RunTelemetry(path, run="put.SPY", workers=4, clock=clock, cpu_clock=cpu, **kwargs)
+        return telemetry, clock, cpu
+
+    def test_throughput_utilization_and_hit_ratio(self):
+        telemetry, clock, cpu = self._telemetry()
+        telemetry.set_phase("phase1")
+        telemetry.set_dispatch(4, queued=10)
+        clock.now = 5.0
+        telemetry.set_dispatch(2)
+        telemetry.record_evaluations(30)
+        telemetry.record_cache_hits(10)
+        clock.now = 10.0
+        cpu.now = 2.5
+        telemetry.record_evaluations(20, phase="gradient")
+        telemetry.record_checkpoint(0.25)
+        telemetry.record_checkpoint(0.75)
+
+        snapshot = telemetry.finish()
+        self.assertTrue(snapshot["final"])
+        self.assertEqual(snapshot["evaluations"], 50)
+        self.assertAlmostEqual(snapshot["evals_per_sec"], 5.0)
+        # Four of four workers for 5s, then two of four for 5s.
+        self.assertAlmostEqual(snapshot["worker_utilization"], 0.75)
+        self.assertAlmostEqual(snapshot["parent_cpu_share"], 0.25)
+        self.assertEqual(snapshot["max_in_flight"], 4)
+        self.assertAlmostEqual(snapshot["phases"]["phase1"]["cache_hit_ratio"], 0.25)
+        self.assertAlmostEqual(snapshot["checkpoint_seconds_max"], 0.75)
+        self.assertEqual(snapshot["checkpoints"], 2)
+
+    def test_file_is_rewritten_on_interval_and_finalized(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "telemetry.json"
+            telemetry, clock, _ = self._telemetry(str(path), interval_seconds=5.0)
+            telemetry.record_evaluations(3)
+            telemetry.maybe_write()
+            clock.now = 1.0
+            telemetry.record_evaluations(3)
+            telemetry.maybe_write()
+            self.assertEqual(json.loads(path.read_text())["evaluations"], 3)
+
+            clock.now = 6.0
+            telemetry.maybe_write()
+            self.assertEqual(json.loads(path.read_text())["evaluations"], 6)
+
+            telemetry.finish()
+            payload = json.loads(path.read_text())
+            self.assertTrue(payload["final"])
+            self.assertEqual(telemetry.writes, 3)
+            self.assertEqual([p.name for p in Path(tmp_dir).iterdir()], ["telemetry.json"])
+
+    def test_prometheus_suffix_selects_text_format(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = Path(tmp_dir) / "telemetry.prom"
+            telemetry, _, _ = self._telemetry(str(path))
+            telemetry.record_evaluations(7, phase="phase1")
+            telemetry.set_counter("bt_cache_hits", 3)
+            snapshot = telemetry.finish()
+            text = path.read_text()
+            self.assertEqual(text, format_prometheus(snapshot))
+            self.assertIn('optimizer_evaluations{run="put.SPY"} 7\n', text)
+            self.assertIn('optimizer_final{run="put.SPY"} 1\n', text)
+            self.assertIn('optimizer_phase_evaluations{run="put.SPY",phase="phase1"} 7\n', text)
+            self.assertIn('optimizer_counter{run="put.SPY",name="bt_cache_hits"} 3\n', text)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,31 @@
+import unittest
+
+from optimization.trial_buffer import TrialColumnBuffer
+
+
+class TrialColumnBufferTests(unittest.TestCase):
+    def test_append_grows_and_round_trips_through_arrow(self):
+        buffer = TrialColumnBuffer(
+            ["trial_id", "symbol", "cache_key", "total_pnl", "feasible"], constants={"symbol": "SPY"}, capacity=2
+        )
+        buffer.append({"trial_id": [0, 1], "cache_key": ["a", "b"], "total_pnl": [1.5, -2.0], "feasible": [1, 0]}, 2)
+        buffer.append({"trial_id": [2, 3, 4], "cache_key": ["c", "d", "e"], "total_pnl": [0.0, 3.0, 4.0]}, 3)
+
+        self.assertEqual(len(buffer), 5)
+        self.assertEqual(buffer.row(buffer.find(3)), {
+            "trial_id": 3, "symbol": "SPY", "cache_key": "d", "total_pnl": 3.0, "feasible": 0,
+        })
+        self.assertIsNone(buffer.find(9))
+        self.assertIsNone(buffer.find(-1))
+        frame = buffer.to_arrow().to_pandas()
+        self.assertEqual(list(frame.columns), ["trial_id", "symbol", "cache_key", "total_pnl", "feasible"])
+        self.assertEqual(frame["cache_key"].tolist(), ["a", "b", "c", "d", "e"])
+        self.assertEqual(frame["symbol"].unique().tolist(), ["SPY"])
+
+        buffer.clear()
+        self.assertEqual(len(buffer), 0)
+        self.assertEqual(len(buffer.to_arrow()), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
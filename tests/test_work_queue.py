@@ -0,0 +1,161 @@
+import multiprocessing as mp
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from optimization.work_queue import (
+    AuthenticationError,
+    WorkQueueExecutor,
+    authkey_from_env,
+    parse_address,
+    run_worker,
+)
+
+_STATE = {}
+
+
+def _install(entries):
+    _STATE.update(entries)
+
+
+def _add_offset(value):
+    return value + _STATE["offset"]
+
+
+def _fail(message):
+    raise ValueError(message)
+
+
+def _hang_once(marker):
+    path = Path(marker)
+    if not path.exists():
+        path.write_text(str(os.getpid()))
+        time.sleep(60)
+    return "done"
+
+
+def _exit_once(marker):
+    path = Path(marker)
+    if not path.exists():
+        path.write_text(str(os.getpid()))
+        os._exit(1)
+    return "done"
+
+
+def _stall_then_exit(marker):
+    path = Path(marker)
+    runs = path.with_suffix(".runs")
+    if not path.exists():
+        path.write_text(str(os.getpid()))
+        # Hold the expired lease until another worker has picked the task up, then drop the connection.
+        deadline = time.monotonic() + 30
+        while not runs.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        os._exit(1)
+    with open(runs, "a") as handle:
+        handle.write(f"{os.getpid()}\n")
+    time.sleep(1.0)
+    return "done"
+
+
+class WorkQueueExecutorTests(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = Path(self._tmp.name)
+        self.processes = []
+
+    def tearDown(self):
+        for process in self.processes:
+            process.terminate()
+            process.join()
+        self._tmp.cleanup()
+
+    def _start_workers(self, executor, count, authkey=None):
+        ctx = mp.get_context("fork")
+        kwargs = {"install_state": _install, "authkey": authkey}
+        for _ in range(count):
+            process = ctx.Process(target=run_worker, args=(executor.address,), kwargs=kwargs)
+            process.start()
+            self.processes.append(process)
+
+    def test_parse_address(self):
+        self.assertEqual(parse_address("10.0.0.5:7000"), ("10.0.0.5", 7000))
+        self.assertEqual(parse_address(":7000"), ("127.0.0.1", 7000))
+        with self.assertRaises(ValueError):
+            parse_address("localhost")
+
+    @mock.patch.dict(os.environ, {"TEST_WORK_QUEUE_AUTHKEY": "s3cret", "TEST_WORK_QUEUE_EMPTY": ""})
+    def test_authkey_from_env(self):
+        self.assertEqual(authkey_from_env("TEST_WORK_QUEUE_AUTHKEY"), b"s3cret")
+        self.assertIsNone(authkey_from_env("TEST_WORK_QUEUE_EMPTY"))
+        self.assertIsNone(authkey_from_env("TEST_WORK_QUEUE_UNSET"))
+
+    def test_workers_run_tasks_with_published_state(self):
+        with WorkQueueExecutor(lease_seconds=30) as executor:
+            executor.publish("offset", 10)
+            self._start_workers(executor, 3)
+            futures = [executor.submit(_add_offset, i) for i in range(40)]
+            self.assertEqual([f.result(timeout=30) for f in futures], [i + 10 for i in range(40)])
+
+            executor.publish("offset", 100)
+            self.assertEqual(executor.submit(_add_offset, 1).result(timeout=30), 101)
+            with self.assertRaisesRegex(ValueError, "boom"):
+                executor.submit(_fail, "boom").result(timeout=30)
+        for process in self.processes:
+            process.join(timeout=10)
+            self.assertEqual(process.exitcode, 0)
+        self.assertEqual(executor.completed, 42)
+        self.assertEqual(executor.reissued, 0)
+
+    def test_expired_lease_is_reissued_to_another_worker(self):
+        with WorkQueueExecutor(lease_seconds=0.5) as executor:
+            self._start_workers(executor, 2)
+            future = executor.submit(_hang_once, str(self.tmp / "hang"))
+            self.assertEqual(future.result(timeout=30), "done")
+            self.assertGreaterEqual(executor.reissued, 1)
+
+    def test_dropped_connection_requeues_its_task(self):
+        with WorkQueueExecutor(lease_seconds=600) as executor:
+            self._start_workers(executor, 2)
+            future = executor.submit(_exit_once, str(self.tmp / "exit"))
+            self.assertEqual(future.result(timeout=30), "done")
+            self.assertEqual(executor.reissued, 1)
+
+    def test_disconnect_after_expiry_leaves_the_reissued_lease_alone(self):
+        marker = self.tmp / "stall"
+        now = [0.0]
+        with WorkQueueExecutor(lease_seconds=10, clock=lambda: now[0]) as executor:
+            self._start_workers(executor, 3)
+            future = executor.submit(_stall_then_exit, str(marker))
+            deadline = time.monotonic() + 30
+            while not marker.exists() and time.monotonic() < deadline:
+                time.sleep(0.01)
+            now[0] = 100.0
+            self.assertEqual(future.result(timeout=30), "done")
+        self.assertEqual(executor.reissued, 1)
+        self.assertEqual(len(marker.with_suffix(".runs").read_text().splitlines()), 1)
+
+    def test_workers_must_hold_the_authkey(self):
+        with WorkQueueExecutor(lease_seconds=30, authkey=b"secret") as executor:
+            with self.assertRaises(AuthenticationError):
+                run_worker(executor.address, install_state=_install, authkey=b"wrong", connect_timeout=5)
+            with self.assertRaises(AuthenticationError):
+                run_worker(executor.address, install_state=_install, connect_timeout=5, authkey=b"")
+            executor.publish("offset", 1)
+            self._start_workers(executor, 2, authkey=b"secret")
+            self.assertEqual(executor.submit(_add_offset, 1).result(timeout=30), 2)
+
+    def test_non_loopback_bind_needs_an_authkey_or_an_explicit_opt_in(self):
+        with self.assertRaisesRegex(ValueError, "without an authkey"):
+            WorkQueueExecutor("0.0.0.0", 0)
+        with WorkQueueExecutor("0.0.0.0", 0, authkey=b"secret"):
+            pass
+        with WorkQueueExecutor("0.0.0.0", 0, allow_unauthenticated=True):
+            pass
+
+
+if __name__ == "__main__":
+    unittest.main()